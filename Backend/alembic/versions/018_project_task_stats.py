@@ -0,0 +1,94 @@
+"""Materialized per-project task counters (project_task_stats).
+
+Revision ID: 018_project_task_stats
+Revises: 017_canonical_lifecycle_templates
+Create Date: 2026-10-19
+
+Why this migration exists
+-------------------------
+Project lists, the admin projects table, team progress and the Phase
+Progress chart all re-scanned ``tasks ⋈ board_columns`` on every load.
+``project_task_stats`` keeps total / todo / in_progress / done / points per
+project (``phase_id = ''``) and per phase; the task repository maintains it
+in the same transaction as each task write and ``reconcile_task_stats_job``
+repairs drift hourly.
+
+The backfill below uses the same bucket rules as
+``app/infrastructure/database/util/task_stats.py`` (terminal column →
+done, ``category='in_progress'`` → in_progress, everything else → todo).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "018_project_task_stats"
+down_revision = "017_canonical_lifecycle_templates"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema='public' AND table_name=:t"
+        ),
+        {"t": name},
+    )
+    return result.scalar() > 0
+
+
+_BACKFILL_SQL = """
+INSERT INTO project_task_stats (project_id, phase_id, total, todo, in_progress, done, points)
+SELECT t.project_id,
+       {phase_expr} AS phase_id,
+       COUNT(t.id),
+       SUM(CASE WHEN COALESCE(bc.is_terminal, false) OR bc.category = 'done' THEN 0
+                WHEN bc.category = 'in_progress' THEN 0 ELSE 1 END),
+       SUM(CASE WHEN COALESCE(bc.is_terminal, false) OR bc.category = 'done' THEN 0
+                WHEN bc.category = 'in_progress' THEN 1 ELSE 0 END),
+       SUM(CASE WHEN COALESCE(bc.is_terminal, false) OR bc.category = 'done' THEN 1 ELSE 0 END),
+       COALESCE(SUM(t.points), 0)
+FROM tasks t
+LEFT JOIN board_columns bc ON bc.id = t.column_id
+WHERE t.is_deleted = false {phase_filter}
+GROUP BY t.project_id{phase_group}
+ON CONFLICT (project_id, phase_id) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    if _table_exists("project_task_stats"):
+        return
+    op.create_table(
+        "project_task_stats",
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("phase_id", sa.String(20), primary_key=True, server_default=sa.text("''")),
+        sa.Column("total", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("todo", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("in_progress", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("done", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("points", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()")),
+    )
+    # Project-wide rows, then one row per (project, phase).
+    op.execute(_BACKFILL_SQL.format(phase_expr="''", phase_filter="", phase_group=""))
+    op.execute(
+        _BACKFILL_SQL.format(
+            phase_expr="t.phase_id",
+            phase_filter="AND t.phase_id IS NOT NULL AND t.phase_id <> ''",
+            phase_group=", t.phase_id",
+        )
+    )
+
+
+def downgrade() -> None:
+    if _table_exists("project_task_stats"):
+        op.drop_table("project_task_stats")
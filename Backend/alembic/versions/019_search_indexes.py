@@ -0,0 +1,63 @@
+"""Trigram + full-text indexes backing global search.
+
+Revision ID: 019_search_indexes
+Revises: 018_project_task_stats
+Create Date: 2026-10-19
+
+Why this migration exists
+-------------------------
+Navbar search built one ``title ILIKE '%word%'`` per word. A leading
+wildcard cannot use a b-tree, so every keystroke was a sequential scan of
+``tasks``. pg_trgm GIN indexes make those ILIKE predicates indexable (for
+words of 3+ characters — ``extract_search_words`` already drops shorter
+ones), and the ``to_tsvector('simple', …)`` expression indexes serve the
+ranked full-text match in SqlAlchemySearchRepository. The expressions here
+MUST stay identical to ``_TASK_DOCUMENT`` / ``_COMMENT_DOCUMENT`` in
+``app/infrastructure/database/repositories/search_repo.py`` or the planner
+will not pick the index.
+
+``CREATE EXTENSION`` needs a role allowed to create pg_trgm (superuser or,
+on PG13+, a database owner since pg_trgm is a trusted extension). When it is
+missing the repository still works — it skips the similarity() ranking term.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "019_search_indexes"
+down_revision = "018_project_task_stats"
+branch_labels = None
+depends_on = None
+
+
+_TRGM_INDEXES = (
+    ("ix_tasks_title_trgm", "tasks", "title"),
+    ("ix_tasks_task_key_trgm", "tasks", "task_key"),
+    ("ix_projects_name_trgm", "projects", "name"),
+    ("ix_comments_content_trgm", "comments", "content"),
+)
+
+_FTS_INDEXES = (
+    (
+        "ix_tasks_search_tsv",
+        "tasks",
+        "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))",
+    ),
+    ("ix_comments_search_tsv", "comments", "to_tsvector('simple', coalesce(content, ''))"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in _TRGM_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)"
+        )
+    for name, table, expression in _FTS_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (({expression}))")
+
+
+def downgrade() -> None:
+    for name, _, _ in _FTS_INDEXES + _TRGM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    # The extension is left installed: other objects may depend on it.
@@ -0,0 +1,186 @@
+"""audit_log.project_id + monthly RANGE partitioning on timestamp.
+
+Revision ID: 020_audit_log_partitioning
+Revises: 019_search_indexes
+Create Date: 2026-10-19
+
+Why this migration exists
+-------------------------
+The project / user activity feeds scoped task events with
+``entity_id IN (SELECT id FROM tasks WHERE project_id = …)`` inside an OR,
+over an append-only table that grows without bound. This revision:
+
+1. adds ``project_id`` and backfills it (same statements as
+   ``app/infrastructure/database/util/audit_scope.BACKFILL_SQL``);
+2. rebuilds ``audit_log`` as ``PARTITION BY RANGE (timestamp)`` with one
+   partition per month from the oldest row to the newest one (at least
+   three months ahead) plus a
+   DEFAULT partition, keeping the ``audit_log_id_seq`` sequence (ids are
+   preserved). The primary key becomes ``(id, timestamp)`` — a partitioned
+   table's unique constraints must include the partition key;
+3. creates ``(project_id, timestamp DESC)`` and ``(user_id, timestamp
+   DESC)`` indexes (propagated to every partition) next to the existing
+   ``entity_id`` / ``id`` indexes.
+
+Future partitions and retention (DETACH of expired months) are handled by
+``audit_partition_maintenance_job``. The rewrite copies every row once, so
+run it in a maintenance window on large installations.
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "020_audit_log_partitioning"
+down_revision = "019_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+_SCOPED_TABLES = {
+    "task": "tasks",
+    "milestone": "milestones",
+    "artifact": "artifacts",
+    "phase_report": "phase_reports",
+    "sprint": "sprints",
+    "project_join_request": "project_join_requests",
+}
+
+_COLUMNS = "id, entity_type, entity_id, field_name, old_value, new_value, user_id, action, timestamp, metadata, project_id"
+
+_INDEXES = (
+    ("ix_audit_log_id", "(id)"),
+    ("ix_audit_log_entity_id", "(entity_id)"),
+    ("ix_audit_log_project_ts", "(project_id, timestamp DESC)"),
+    ("ix_audit_log_user_ts", "(user_id, timestamp DESC)"),
+)
+
+
+def _is_partitioned() -> bool:
+    conn = op.get_bind()
+    return bool(conn.execute(sa.text(
+        "SELECT COUNT(*) FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = 'audit_log'"
+    )).scalar())
+
+
+def _column_exists(table: str, column: str) -> bool:
+    conn = op.get_bind()
+    return bool(conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.columns "
+        "WHERE table_schema='public' AND table_name=:t AND column_name=:c"
+    ), {"t": table, "c": column}).scalar())
+
+
+def _add_month(d: date, n: int = 1) -> date:
+    y, m = divmod(d.month - 1 + n, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def upgrade() -> None:
+    if not _column_exists("audit_log", "project_id"):
+        op.add_column("audit_log", sa.Column("project_id", sa.Integer(), nullable=True))
+
+    op.execute(
+        "UPDATE audit_log SET project_id = entity_id "
+        "WHERE project_id IS NULL AND entity_type = 'project'"
+    )
+    for entity_type, table in _SCOPED_TABLES.items():
+        op.execute(
+            f"UPDATE audit_log a SET project_id = s.project_id FROM {table} s "
+            f"WHERE a.project_id IS NULL AND a.entity_type = '{entity_type}' AND s.id = a.entity_id"
+        )
+    op.execute(
+        "UPDATE audit_log a SET project_id = t.project_id FROM comments c JOIN tasks t ON t.id = c.task_id "
+        "WHERE a.project_id IS NULL AND a.entity_type = 'comment' AND c.id = a.entity_id"
+    )
+    op.execute(
+        "UPDATE audit_log SET project_id = CAST(metadata->>'project_id' AS INTEGER) "
+        "WHERE project_id IS NULL AND metadata->>'project_id' ~ '^[0-9]+$'"
+    )
+
+    if _is_partitioned():
+        return
+
+    op.execute("UPDATE audit_log SET timestamp = now() WHERE timestamp IS NULL")
+    conn = op.get_bind()
+    oldest, newest = conn.execute(
+        sa.text("SELECT min(timestamp)::date, max(timestamp)::date FROM audit_log")
+    ).one()
+    today = date.today().replace(day=1)
+    start = (oldest or today).replace(day=1)
+
+    op.execute("ALTER SEQUENCE IF EXISTS audit_log_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE audit_log_partitioned (
+            id INTEGER NOT NULL DEFAULT nextval('audit_log_id_seq'),
+            entity_type VARCHAR(50) NOT NULL,
+            entity_id INTEGER NOT NULL,
+            field_name VARCHAR(100) NOT NULL,
+            old_value TEXT,
+            new_value TEXT,
+            user_id INTEGER,
+            action VARCHAR(50) NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL DEFAULT now(),
+            metadata JSONB,
+            project_id INTEGER
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    month = start
+    end = max(_add_month(today, 3), (newest or today).replace(day=1))
+    while month <= end:
+        op.execute(
+            f"CREATE TABLE audit_log_p{month:%Y%m} PARTITION OF audit_log_partitioned "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_month(month).isoformat()}')"
+        )
+        month = _add_month(month)
+    op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log_partitioned DEFAULT")
+
+    op.execute(f"INSERT INTO audit_log_partitioned ({_COLUMNS}) SELECT {_COLUMNS} FROM audit_log")
+    op.execute("DROP TABLE audit_log")
+    op.execute("ALTER TABLE audit_log_partitioned RENAME TO audit_log")
+    op.execute("ALTER SEQUENCE IF EXISTS audit_log_id_seq OWNED BY audit_log.id")
+    op.execute("ALTER TABLE audit_log ADD CONSTRAINT audit_log_pkey PRIMARY KEY (id, timestamp)")
+    op.execute(
+        "ALTER TABLE audit_log ADD CONSTRAINT audit_log_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL"
+    )
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON audit_log {columns}")
+
+
+def downgrade() -> None:
+    if _is_partitioned():
+        op.execute("ALTER SEQUENCE IF EXISTS audit_log_id_seq OWNED BY NONE")
+        op.execute(
+            """
+            CREATE TABLE audit_log_flat (
+                id INTEGER NOT NULL DEFAULT nextval('audit_log_id_seq') PRIMARY KEY,
+                entity_type VARCHAR(50) NOT NULL,
+                entity_id INTEGER NOT NULL,
+                field_name VARCHAR(100) NOT NULL,
+                old_value TEXT,
+                new_value TEXT,
+                user_id INTEGER REFERENCES users(id) ON DELETE SET NULL,
+                action VARCHAR(50) NOT NULL,
+                timestamp TIMESTAMPTZ DEFAULT now(),
+                metadata JSONB,
+                project_id INTEGER
+            )
+            """
+        )
+        op.execute(f"INSERT INTO audit_log_flat ({_COLUMNS}) SELECT {_COLUMNS} FROM audit_log")
+        # Dropping the parent drops its attached partitions; detached
+        # (archived) months are left alone.
+        op.execute("DROP TABLE audit_log")
+        op.execute("ALTER TABLE audit_log_flat RENAME TO audit_log")
+        op.execute("ALTER TABLE audit_log RENAME CONSTRAINT audit_log_flat_pkey TO audit_log_pkey")
+        op.execute("ALTER SEQUENCE IF EXISTS audit_log_id_seq OWNED BY audit_log.id")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_id ON audit_log (id)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_entity_id ON audit_log (entity_id)")
+    if _column_exists("audit_log", "project_id"):
+        op.drop_column("audit_log", "project_id")
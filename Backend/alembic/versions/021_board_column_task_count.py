@@ -0,0 +1,56 @@
+"""Materialized per-column task counter (board_columns.task_count).
+
+Revision ID: 021_board_column_task_count
+Revises: 020_audit_log_partitioning
+Create Date: 2026-10-19
+
+Why this migration exists
+-------------------------
+GET /projects/{id}/columns ran one ``COUNT(*)`` per column and every WIP
+check ran another. ``task_count`` holds the number of non-deleted tasks in
+the column; ``app/infrastructure/database/util/task_stats.py`` moves it in
+the same transaction as each task write (next to ``project_task_stats``) and
+``reconcile_task_stats_job`` repairs drift hourly.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "021_board_column_task_count"
+down_revision = "020_audit_log_partitioning"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(table: str, column: str) -> bool:
+    conn = op.get_bind()
+    return bool(conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.columns "
+        "WHERE table_schema='public' AND table_name=:t AND column_name=:c"
+    ), {"t": table, "c": column}).scalar())
+
+
+def upgrade() -> None:
+    if _column_exists("board_columns", "task_count"):
+        return
+    op.add_column(
+        "board_columns",
+        sa.Column("task_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        """
+        UPDATE board_columns bc SET task_count = c.n
+        FROM (
+            SELECT column_id, COUNT(*) AS n FROM tasks
+            WHERE is_deleted = false AND column_id IS NOT NULL
+            GROUP BY column_id
+        ) c
+        WHERE c.column_id = bc.id
+        """
+    )
+
+
+def downgrade() -> None:
+    if _column_exists("board_columns", "task_count"):
+        op.drop_column("board_columns", "task_count")
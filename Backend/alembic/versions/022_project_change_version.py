@@ -0,0 +1,46 @@
+"""Per-project change version for conditional GETs (projects.change_version).
+
+Revision ID: 022_project_change_version
+Revises: 021_board_column_task_count
+Create Date: 2026-10-19
+
+Why this migration exists
+-------------------------
+Board, task-list and chart polling re-ran the full queries even when nothing
+in the project had changed. ``change_version`` is bumped in the same
+transaction as every task / column / sprint / comment write
+(``app/infrastructure/database/util/change_version.py``); read endpoints
+derive a weak ETag from it and answer ``If-None-Match`` with 304 after a
+single primary-key lookup.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "022_project_change_version"
+down_revision = "021_board_column_task_count"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(table: str, column: str) -> bool:
+    conn = op.get_bind()
+    return bool(conn.execute(sa.text(
+        "SELECT COUNT(*) FROM information_schema.columns "
+        "WHERE table_schema='public' AND table_name=:t AND column_name=:c"
+    ), {"t": table, "c": column}).scalar())
+
+
+def upgrade() -> None:
+    if _column_exists("projects", "change_version"):
+        return
+    op.add_column(
+        "projects",
+        sa.Column("change_version", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+
+
+def downgrade() -> None:
+    if _column_exists("projects", "change_version"):
+        op.drop_column("projects", "change_version")
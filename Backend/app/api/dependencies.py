@@ -30,6 +30,7 @@ from app.api.deps.notification import (  # noqa: F401
     get_notification_repo,
     get_notification_preference_repo,
     get_notification_service,
+    get_bulk_task_notifier,
 )
 from app.api.deps.password_reset import get_password_reset_repo  # noqa: F401
 from app.api.deps.process_template import get_process_template_repo  # noqa: F401
@@ -16,7 +16,10 @@ from app.api.deps.password_reset import *  # noqa: F401, F403
 from app.api.deps.process_template import *  # noqa: F401, F403
 from app.api.deps.system_config import *  # noqa: F401, F403
 from app.api.deps.report import *  # noqa: F401, F403
+from app.api.deps.search import *  # noqa: F401, F403
 from app.api.deps.security import *  # noqa: F401, F403
+from app.api.deps.parallel import *  # noqa: F401, F403
+from app.api.deps.conditional import *  # noqa: F401, F403
 # Phase 9 new entity deps (stubs populated by plans 09-05, 09-06, 09-07):
 from app.api.deps.milestone import *  # noqa: F401, F403
 from app.api.deps.artifact import *  # noqa: F401, F403
@@ -68,6 +68,7 @@ def get_ai_workflow_port() -> IAIWorkflowSuggestionPort:
             return GeminiWorkflowAdapter(
                 api_key=settings.GOOGLE_API_KEY,
                 model=settings.GEMINI_MODEL,
+                replay_paced=settings.AI_CACHE_REPLAY_PACED,
             )
         except ImportError as e:
             logger.error(
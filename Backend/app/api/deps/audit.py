@@ -1,12 +1,17 @@
 """Audit log repository DI factory.
 
 Split from app.api.dependencies per D-31 (BACK-07).
+``get_audit_read_repo`` serves chart aggregates from ``get_read_session``
+(replica or the primary's analytics pool); it must not be used to write.
 Legacy import path `from app.api.dependencies import X` still works via shim.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_db_session, get_read_session, read_session_scope
 from app.domain.repositories.audit_repository import IAuditRepository
 from app.infrastructure.database.repositories.audit_repo import SqlAlchemyAuditRepository
 
@@ -15,4 +20,15 @@ def get_audit_repo(session: AsyncSession = Depends(get_db_session)) -> IAuditRep
     return SqlAlchemyAuditRepository(session)
 
 
-__all__ = ["get_audit_repo"]
+def get_audit_read_repo(session: AsyncSession = Depends(get_read_session)) -> IAuditRepository:
+    return SqlAlchemyAuditRepository(session)
+
+
+@asynccontextmanager
+async def audit_read_repo_scope() -> AsyncIterator[IAuditRepository]:
+    """Read-only audit repository on its own session, for streamed exports."""
+    async with read_session_scope() as session:
+        yield SqlAlchemyAuditRepository(session)
+
+
+__all__ = ["get_audit_repo", "get_audit_read_repo", "audit_read_repo_scope"]
@@ -7,6 +7,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 
+from app.application.services import request_metrics
 from app.infrastructure.database.database import get_db_session
 from app.infrastructure.config import settings
 from app.domain.entities.user import User
@@ -46,6 +47,8 @@ async def get_current_user(
     # Admin users keep working via _is_admin(user) short-circuit in
     # _has_permission (Admin super-role bypasses the empty list).
     user.permissions = list(payload.get("permissions") or [])
+    # Access log / metrics reuse this principal instead of re-decoding the JWT.
+    request_metrics.set_principal(user.id)
     return user
 
 
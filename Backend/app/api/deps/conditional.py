@@ -0,0 +1,85 @@
+"""Conditional GET for project-scoped reads (weak ETag over projects.change_version).
+
+Board / task-list / chart polling mostly re-fetches unchanged data. Every
+write that can change those payloads bumps ``projects.change_version`` in
+its own transaction (app/infrastructure/database/util/change_version.py), so
+``W/"<project>.<version>.<digest>"`` identifies a response without running
+the read: the digest covers the path and query string (and, for charts whose
+window slides with the calendar, the UTC date).
+
+The dependency runs after the member gate and before the route body; a
+matching ``If-None-Match`` short-circuits with a bodiless 304 after one
+primary-key lookup. Routes opt in with ``_etag=Depends(project_etag)``.
+
+Routes that read through ``get_read_session`` use the ``analytics_*``
+variants, which read the version on that same session. With a lagging
+replica the tag then never names a newer version than the body it
+validates.
+"""
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from app.api.deps.project import get_project_member, get_project_read_repo, get_project_repo
+from app.domain.entities.user import User
+from app.domain.repositories.project_repository import IProjectRepository
+
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(project_id: int, version: int, path: str, query: str = "", day: str = "") -> str:
+    digest = hashlib.blake2b(f"{path}?{query}|{day}".encode(), digest_size=6).hexdigest()
+    return f'W/"{project_id}.{version}.{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2) against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _conditional(daily: bool, repo_dependency=get_project_repo):
+    async def dependency(
+        project_id: int,
+        request: Request,
+        response: Response,
+        _member: User = Depends(get_project_member),
+        project_repo: IProjectRepository = Depends(repo_dependency),
+    ) -> Optional[str]:
+        version = await project_repo.get_change_version(project_id)
+        if version is None:
+            return None
+        day = datetime.now(timezone.utc).date().isoformat() if daily else ""
+        etag = build_etag(project_id, version, request.url.path, request.url.query, day)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return etag
+
+    return dependency
+
+
+# Module-level instances so FastAPI's per-request dependency cache applies.
+project_etag = _conditional(daily=False)
+daily_project_etag = _conditional(daily=True)
+analytics_project_etag = _conditional(daily=False, repo_dependency=get_project_read_repo)
+daily_analytics_project_etag = _conditional(daily=True, repo_dependency=get_project_read_repo)
+
+
+__all__ = [
+    "project_etag",
+    "daily_project_etag",
+    "analytics_project_etag",
+    "daily_analytics_project_etag",
+]
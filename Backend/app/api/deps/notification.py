@@ -4,7 +4,7 @@ Lazy imports kept inside functions to avoid circular import at module load time.
 Split from app.api.dependencies per D-31 (BACK-07).
 Legacy import path `from app.api.dependencies import X` still works via shim.
 """
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.database import get_db_session
@@ -30,4 +30,53 @@ def get_notification_service(
     return PollingNotificationService(notification_repo, pref_repo)
 
 
-__all__ = ["get_notification_repo", "get_notification_preference_repo", "get_notification_service"]
+def get_bulk_task_notifier(
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db_session),
+    notification_service=Depends(get_notification_service),
+    pref_repo: INotificationPreferenceRepository = Depends(get_notification_preference_repo),
+):
+    """BulkTaskNotifier for POST /tasks/bulk, wired to the request's session,
+    SMTP (via ``background_tasks``) and the project integration webhooks."""
+    from sqlalchemy import select
+
+    from app.api.v1.projects import _fire_integration_event
+    from app.application.services.bulk_task_notifier import BulkTaskNotifier
+    from app.infrastructure.database.models.task_watcher import TaskWatcherModel
+    from app.infrastructure.database.repositories.project_repo import SqlAlchemyProjectRepository
+    from app.infrastructure.database.repositories.user_repo import SqlAlchemyUserRepository
+    from app.infrastructure.email.email_service import send_notification_email
+
+    async def watchers_of(task_ids):
+        result = await session.execute(
+            select(TaskWatcherModel.task_id, TaskWatcherModel.user_id)
+            .where(TaskWatcherModel.task_id.in_(task_ids))
+        )
+        watchers = {}
+        for task_id, user_id in result.all():
+            watchers.setdefault(task_id, []).append(user_id)
+        return watchers
+
+    async def send_email(to_email, subject, template_name, body):
+        await send_notification_email(
+            background_tasks=background_tasks, to_email=to_email, subject=subject,
+            template_name=template_name, body=body,
+        )
+
+    return BulkTaskNotifier(
+        notification_service,
+        SqlAlchemyUserRepository(session),
+        pref_repo,
+        SqlAlchemyProjectRepository(session),
+        watchers_of=watchers_of,
+        send_email=send_email,
+        fire_event=_fire_integration_event,
+    )
+
+
+__all__ = [
+    "get_notification_repo",
+    "get_notification_preference_repo",
+    "get_notification_service",
+    "get_bulk_task_notifier",
+]
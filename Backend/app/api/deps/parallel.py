@@ -0,0 +1,64 @@
+"""ParallelQueryExecutor DI factories (see app/application/services/parallel_queries.py).
+
+Branches get their own ``AsyncSessionLocal`` session only when the request
+session is a plain pool session on the app engine. A session bound to an
+outer connection (the transactional test session, or any caller that wraps
+the request in its own transaction) may hold uncommitted rows a fresh session
+would not see — branches then run sequentially on it.
+"""
+from contextlib import asynccontextmanager
+from typing import Callable, TypeVar
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.parallel_queries import BranchRepos, ParallelQueryExecutor
+from app.infrastructure.config import settings
+from app.infrastructure.database.database import AsyncSessionLocal, engine, get_db_session
+from app.infrastructure.database.repositories.audit_repo import SqlAlchemyAuditRepository
+from app.infrastructure.database.repositories.project_repo import SqlAlchemyProjectRepository
+from app.infrastructure.database.repositories.task_repo import SqlAlchemyTaskRepository
+
+
+S = TypeVar("S")
+
+
+def _build_executor(session: AsyncSession, build: Callable[[AsyncSession], S]) -> ParallelQueryExecutor[S]:
+    limits = dict(
+        max_concurrency=settings.PARALLEL_QUERY_MAX_CONCURRENCY,
+        timeout_s=settings.PARALLEL_QUERY_TIMEOUT_S,
+    )
+    if session.bind is not engine:
+        return ParallelQueryExecutor(shared=build(session), **limits)
+
+    @asynccontextmanager
+    async def open_branch():
+        async with AsyncSessionLocal() as branch_session:
+            yield build(branch_session)
+
+    return ParallelQueryExecutor(open_branch=open_branch, **limits)
+
+
+def _branch_repos(session: AsyncSession) -> BranchRepos:
+    return BranchRepos(
+        project_repo=SqlAlchemyProjectRepository(session),
+        audit_repo=SqlAlchemyAuditRepository(session),
+        task_repo=SqlAlchemyTaskRepository(session),
+    )
+
+
+def get_query_executor(
+    session: AsyncSession = Depends(get_db_session),
+) -> ParallelQueryExecutor[BranchRepos]:
+    """Branches receive a :class:`BranchRepos` bundle."""
+    return _build_executor(session, _branch_repos)
+
+
+def get_session_executor(
+    session: AsyncSession = Depends(get_db_session),
+) -> ParallelQueryExecutor[AsyncSession]:
+    """Branches receive a bare ``AsyncSession`` (inline router loaders)."""
+    return _build_executor(session, lambda s: s)
+
+
+__all__ = ["get_query_executor", "get_session_executor"]
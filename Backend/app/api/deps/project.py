@@ -3,10 +3,13 @@
 Split from app.api.dependencies per D-31 (BACK-07).
 Legacy import path `from app.api.dependencies import X` still works via shim.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import AsyncSessionLocal, get_db_session, get_read_session
 from app.domain.entities.user import User
 from app.domain.repositories.project_repository import IProjectRepository
 from app.infrastructure.database.repositories.project_repo import SqlAlchemyProjectRepository
@@ -17,6 +20,19 @@ def get_project_repo(session: AsyncSession = Depends(get_db_session)) -> IProjec
     return SqlAlchemyProjectRepository(session)
 
 
+def get_project_read_repo(session: AsyncSession = Depends(get_read_session)) -> IProjectRepository:
+    """Read-only project repository on the analytics session."""
+    return SqlAlchemyProjectRepository(session)
+
+
+@asynccontextmanager
+async def project_repo_scope() -> AsyncIterator[IProjectRepository]:
+    """Project repository on its own session, for background work that
+    outlives the request (e.g. parallel template-apply batches)."""
+    async with AsyncSessionLocal() as session:
+        yield SqlAlchemyProjectRepository(session)
+
+
 async def get_project_member(
     project_id: int,
     current_user: User = Depends(get_current_user),
@@ -61,4 +77,4 @@ async def get_project_member(
     return current_user
 
 
-__all__ = ["get_project_repo", "get_project_member"]
+__all__ = ["get_project_repo", "get_project_read_repo", "project_repo_scope", "get_project_member"]
@@ -1,19 +1,32 @@
 """Report repository DI factory.
 
 Lazy import inside function to avoid circular deps at module load time.
+Reports are analytics reads: the session comes from ``get_read_session``
+(replica or the primary's analytics pool).
 Split from app.api.dependencies per D-31 (BACK-07).
 Legacy import path `from app.api.dependencies import X` still works via shim.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_read_session, read_session_scope
 from app.domain.repositories.report_repository import IReportRepository
 
 
-def get_report_repo(session: AsyncSession = Depends(get_db_session)) -> IReportRepository:
+def get_report_repo(session: AsyncSession = Depends(get_read_session)) -> IReportRepository:
     from app.infrastructure.database.repositories.report_repo import SqlAlchemyReportRepository
     return SqlAlchemyReportRepository(session)
 
 
-__all__ = ["get_report_repo"]
+@asynccontextmanager
+async def report_repo_scope() -> AsyncIterator[IReportRepository]:
+    """Report repository on its own read session, for streamed exports."""
+    from app.infrastructure.database.repositories.report_repo import SqlAlchemyReportRepository
+    async with read_session_scope() as session:
+        yield SqlAlchemyReportRepository(session)
+
+
+__all__ = ["get_report_repo", "report_repo_scope"]
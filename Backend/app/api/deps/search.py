@@ -0,0 +1,17 @@
+"""Global search repository DI factory.
+
+Lazy import inside function to avoid circular deps at module load time.
+"""
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.database import get_db_session
+from app.domain.repositories.search_repository import ISearchRepository
+
+
+def get_search_repo(session: AsyncSession = Depends(get_db_session)) -> ISearchRepository:
+    from app.infrastructure.database.repositories.search_repo import SqlAlchemySearchRepository
+    return SqlAlchemySearchRepository(session)
+
+
+__all__ = ["get_search_repo"]
@@ -0,0 +1,138 @@
+"""Fast JSON path for large list responses (opt-in per route).
+
+A route that returns DTOs with ``response_model=...`` pays for the payload
+three times: the use case builds the DTOs, FastAPI re-validates them against
+the response model, and ``jsonable_encoder`` walks the result in Python
+before ``json.dumps``. For a 5,000-task project list that is most of the
+request time.
+
+:func:`fast_json` returns a ready ``Response`` instead, so FastAPI skips the
+re-validation and encoder. ``pydantic_core.to_json`` serializes DTOs, dicts,
+datetimes and enums in one Rust pass, using the same wire format as the
+default path. Routes keep ``response_model`` for OpenAPI.
+
+- Row mappings (repository dicts) can be passed as they are, with no
+  intermediate DTOs. :func:`rows_as` trims each dict to the DTO's fields,
+  so the wire shape stays defined by the DTO.
+- Arrays of at least ``FAST_JSON_STREAM_MIN_ITEMS`` items are streamed in
+  batches rather than built as one bytes object.
+- Bodies of at least ``FAST_JSON_GZIP_MIN_BYTES`` are gzipped when the
+  client's ``Accept-Encoding`` allows gzip (:func:`accepts_gzip`; ``q=0``
+  refuses it). Streamed bodies are gzipped incrementally.
+
+Headers set on the injected ``Response`` by dependencies (ETag,
+Cache-Control) are NOT merged into a returned Response by FastAPI. Routes
+pass it as ``inherit=`` so those headers are copied over.
+"""
+import gzip
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Type
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.infrastructure.config import settings
+
+_MEDIA_TYPE = "application/json"
+_STREAM_BATCH = 500
+_NOT_INHERITED = {b"content-length", b"content-type", b"content-encoding"}
+
+
+def rows_as(dto: Type[BaseModel], rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Project row mappings onto ``dto``'s fields without validating them."""
+    fields = tuple(dto.model_fields)
+    return [{f: row.get(f) for f in fields} for row in rows]
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Whether ``Accept-Encoding`` allows gzip, honouring q-values.
+
+    An explicit ``gzip`` / ``x-gzip`` entry decides; otherwise ``*`` does.
+    ``q=0`` means "not acceptable", so ``gzip;q=0`` keeps the body plain.
+    Shared with app/api/streaming_export.py.
+    """
+    explicit: Optional[float] = None
+    wildcard: Optional[float] = None
+    for entry in request.headers.get("accept-encoding", "").lower().split(","):
+        coding, *params = (part.strip() for part in entry.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            explicit = max(q, explicit or 0.0)
+        elif coding == "*":
+            wildcard = q
+    if explicit is not None:
+        return explicit > 0
+    return wildcard is not None and wildcard > 0
+
+
+def _stream(
+    content: Any, items_key: Optional[str], items: Sequence[Any], compress: bool
+) -> Iterator[bytes]:
+    if items_key is None:
+        head, tail = b"[", b"]"
+    else:
+        rest = {k: v for k, v in content.items() if k != items_key}
+        head = to_json(rest)[:-1] + (b"," if rest else b"") + to_json(items_key) + b":["
+        tail = b"]}"
+
+    def chunks() -> Iterator[bytes]:
+        yield head
+        for start in range(0, len(items), _STREAM_BATCH):
+            batch = to_json(items[start:start + _STREAM_BATCH])[1:-1]
+            yield batch if start == 0 else b"," + batch
+        yield tail
+
+    if not compress:
+        yield from chunks()
+        return
+    encoder = zlib.compressobj(5, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks():
+        out = encoder.compress(chunk)
+        if out:
+            yield out
+    yield encoder.flush()
+
+
+def fast_json(
+    request: Request,
+    content: Any,
+    *,
+    items_key: Optional[str] = None,
+    inherit: Optional[Response] = None,
+    status_code: int = 200,
+) -> Response:
+    """Serialize ``content``: a list, or a dict / model whose ``items_key`` is the list."""
+    if isinstance(content, BaseModel):
+        content = dict(content)  # shallow: items stay DTOs, serialized below
+    items = content if items_key is None else content[items_key]
+    headers: Dict[str, str] = {"Vary": "Accept-Encoding"}
+    if inherit is not None:
+        headers.update(
+            (k.decode("latin-1"), v.decode("latin-1"))
+            for k, v in inherit.headers.raw
+            if k.lower() not in _NOT_INHERITED
+        )
+    compress = accepts_gzip(request)
+    if len(items) >= settings.FAST_JSON_STREAM_MIN_ITEMS:
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(
+            _stream(content, items_key, items, compress),
+            status_code=status_code,
+            media_type=_MEDIA_TYPE,
+            headers=headers,
+        )
+    body = to_json(content)
+    if compress and len(body) >= settings.FAST_JSON_GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    return Response(body, status_code=status_code, media_type=_MEDIA_TYPE, headers=headers)
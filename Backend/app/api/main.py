@@ -1,6 +1,4 @@
 import sys
-import json
-import time
 import logging
 from pathlib import Path
 from contextlib import asynccontextmanager
@@ -12,8 +10,6 @@ sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -26,8 +22,12 @@ from app.api.v1.board_columns import router as board_columns_router
 from app.api.v1.labels import router as labels_router
 from app.api.v1.notifications import router as notifications_router
 from app.api.v1.notification_preferences import router as notification_preferences_router
-from app.infrastructure.database.database import AsyncSessionLocal, engine
-from app.infrastructure.database.seeder import seed_data
+from app.api.middleware.request_metrics import RequestMetricsMiddleware
+from app.infrastructure.database.database import ENGINES, engine
+from app.infrastructure.database.util.pool_metrics import install_pool_listeners
+from app.infrastructure.database.util.query_metrics import install_query_listeners
+from app.infrastructure.database.startup import default_steps, run_startup
+from app.infrastructure.database.util import audit_sink
 from app.infrastructure.config import settings
 
 # ---------------------------------------------------------------------------
@@ -43,46 +43,6 @@ logging.basicConfig(
 logger = logging.getLogger("spms")
 
 
-# ---------------------------------------------------------------------------
-# RequestLoggingMiddleware — emits one JSON log line per HTTP request
-# ---------------------------------------------------------------------------
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start = time.monotonic()
-        response = await call_next(request)
-        duration_ms = round((time.monotonic() - start) * 1000, 2)
-
-        # Optionally extract user_id from JWT without blocking the response
-        user_id = None
-        try:
-            auth_header = request.headers.get("Authorization", "")
-            if auth_header.startswith("Bearer "):
-                from jose import jwt as _jwt
-                token = auth_header.split(" ", 1)[1]
-                payload = _jwt.decode(
-                    token,
-                    settings.JWT_SECRET,
-                    algorithms=[settings.JWT_ALGORITHM],
-                    options={"verify_exp": False},
-                )
-                user_id = payload.get("sub")
-        except Exception:
-            pass  # Never fail a request due to logging
-
-        log_record = {
-            "event": "http_request",
-            "method": request.method,
-            "path": request.url.path,
-            "status": response.status_code,
-            "duration_ms": duration_ms,
-        }
-        if user_id is not None:
-            log_record["user_id"] = user_id
-
-        logger.info(json.dumps(log_record))
-        return response
-
-
 def _validate_startup_secrets(s) -> None:
     """Raise RuntimeError if insecure default secrets are detected."""
     if s.JWT_SECRET == "supersecretkey":
@@ -109,31 +69,39 @@ async def lifespan(app: FastAPI):
     # Base.metadata.create_all (no alembic_version row) aren't blocked.
     from app.infrastructure.database._alembic_check import assert_schema_at_head
     await assert_schema_at_head(engine, strict=not settings.DEBUG)
-    # Startup: Seed database
-    async with AsyncSessionLocal() as session:
-        await seed_data(session)
-    # Startup: runtime-only data backfills. The old Python migrations 004
-    # (Phase 5 notifications), 005 (Phase 7 process_config / system_config)
-    # and 006 (files.task_id nullable) were redundant with alembic 004,
-    # 005+015 and 010 respectively — they were removed once the alembic
-    # head check (assert_schema_at_head above) made it safe to assume the
-    # schema is current. Only the runtime backfills that have NO alembic
-    # equivalent stay here:
+    # Startup: seed + runtime-only data backfills. The old Python migrations
+    # 004 (Phase 5 notifications), 005 (Phase 7 process_config /
+    # system_config) and 006 (files.task_id nullable) were redundant with
+    # alembic 004, 005+015 and 010 respectively — they were removed once the
+    # alembic head check above made it safe to assume the schema is current.
+    # Only the runtime backfills that have NO alembic equivalent remain:
     #   - migration_007 backfills projects.process_template_id
     #   - migration_008 backfills board_columns engine fields
-    from app.infrastructure.database.migrations.migration_007 import upgrade as upgrade_007
-    await upgrade_007(engine)
-    from app.infrastructure.database.migrations.migration_008 import upgrade as upgrade_008
-    await upgrade_008(engine)
+    # Steps whose fingerprint in system_config still matches are skipped;
+    # the backfills run in the background once the app is serving
+    # (STARTUP_MODE=full restores the run-everything-inline boot).
+    backfills = await run_startup(engine, default_steps(engine), mode=settings.STARTUP_MODE)
     # Startup: Register and start APScheduler jobs
-    from app.scheduler.jobs import scheduler, deadline_alert_job, purge_notifications_job
+    from app.scheduler.jobs import (
+        scheduler,
+        deadline_alert_job,
+        purge_notifications_job,
+        reconcile_task_stats_job,
+        audit_partition_maintenance_job,
+    )
     from apscheduler.triggers.cron import CronTrigger
     scheduler.add_job(deadline_alert_job, CronTrigger(hour=8, minute=0))
     scheduler.add_job(purge_notifications_job, CronTrigger(hour=3, minute=0))
+    scheduler.add_job(reconcile_task_stats_job, CronTrigger(minute=15))
+    scheduler.add_job(audit_partition_maintenance_job, CronTrigger(hour=2, minute=30))
     scheduler.start()
     yield
-    # Shutdown: stop scheduler
+    # Shutdown: stop scheduler; an unfinished backfill reruns next boot;
+    # buffered audit rows are flushed before the engine goes away
     scheduler.shutdown()
+    if backfills is not None and not backfills.done():
+        backfills.cancel()
+    await audit_sink.shutdown()
 
 app = FastAPI(title="SPMS API", version="1.0.0", lifespan=lifespan)
 
@@ -144,8 +112,12 @@ limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Structured request logging middleware (SAFE-03)
-app.add_middleware(RequestLoggingMiddleware)
+# Structured request logging + per-route latency histograms (SAFE-03).
+# Pure ASGI; DB statement counts come from the engine listeners below.
+for _name, _engine in ENGINES.items():
+    install_query_listeners(_engine)
+    install_pool_listeners(_name, _engine)
+app.add_middleware(RequestMetricsMiddleware)
 
 # Configure CORS — origins read from env var
 app.add_middleware(
@@ -184,6 +156,12 @@ app.include_router(users_router.router, prefix="/api/v1", tags=["users"])
 from app.api.v1 import charts as charts_router
 app.include_router(charts_router.router, prefix="/api/v1", tags=["charts"])
 
+from app.api.v1 import search as search_router
+app.include_router(search_router.router, prefix="/api/v1", tags=["Search"])
+
+from app.api.v1 import health as health_router
+app.include_router(health_router.router, tags=["Health"])
+
 from app.api.v1 import milestones as milestones_router
 from app.api.v1 import artifacts as artifacts_router
 from app.api.v1 import phase_reports as phase_reports_router
@@ -198,12 +176,13 @@ app.include_router(ai_workflow_router.router, prefix="/api/v1/ai", tags=["AI Wor
 # Phase 14 Plan 14-01 — admin panel routers (5 NEW, all under /api/v1 with
 # Depends(require_admin) gate; PM-side join-request create endpoint uses
 # require_project_transition_authority).
-from app.api.v1 import admin_join_requests, admin_users, admin_audit, admin_stats, admin_summary
+from app.api.v1 import admin_join_requests, admin_users, admin_audit, admin_stats, admin_summary, admin_metrics
 app.include_router(admin_join_requests.router, prefix="/api/v1", tags=["Admin"])
 app.include_router(admin_users.router, prefix="/api/v1", tags=["Admin"])
 app.include_router(admin_audit.router, prefix="/api/v1", tags=["Admin"])
 app.include_router(admin_stats.router, prefix="/api/v1", tags=["Admin"])
 app.include_router(admin_summary.router, prefix="/api/v1", tags=["Admin"])
+app.include_router(admin_metrics.router, prefix="/api/v1", tags=["Admin"])
 
 # Phase 15 Plan 15-06 — RBAC admin routers (CRUD + matrix). Each router
 # carries its own /admin/roles or /admin/permissions prefix; the router
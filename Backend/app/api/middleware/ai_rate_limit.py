@@ -9,6 +9,10 @@ Tiers (from plan §17 D-05):
     USER_DAILY_LIMIT   = 25   — heavy-tester ceiling per user
     PROJECT_DAILY_LIMIT = 400 — Gemini free-tier guard (500 RPD * 80%)
 
+Requests the provider answers from its generation cache, or by joining an
+identical in-flight generation (``upstream=False``), still count against the
+user tiers but neither check nor consume the project ceiling.
+
 Failure modes:
     user_hourly  → HTTP 429, Retry-After in seconds, frontend State 6 toast
     user_daily   → HTTP 429, Retry-After until UTC midnight, frontend State 6
@@ -68,14 +72,14 @@ class _RateLimiter:
         )
         return int((midnight - now).total_seconds())
 
-    def check_and_increment(self, user_id: str) -> None:
+    def check_and_increment(self, user_id: str, upstream: bool = True) -> None:
         """Raise HTTPException if any tier is exceeded; otherwise record the call.
 
         Three tiers checked in increasing scope. The first one that's hit wins —
         the call isn't recorded, so retries after window slide naturally succeed.
         AI_RATE_LIMIT_DISABLED env flag bypasses user-tier checks; the project
         ceiling still runs because we never want to silently burn through the
-        Gemini free-tier quota.
+        Gemini free-tier quota. ``upstream=False`` skips the project tier.
         """
         now = time()
 
@@ -91,7 +95,7 @@ class _RateLimiter:
         if _LIMITER_DISABLED:
             # Dev/demo bypass — still track the project ceiling so we don't
             # accidentally drain the day's Gemini quota.
-            if len(self.project_day) >= PROJECT_DAILY_LIMIT:
+            if upstream and len(self.project_day) >= PROJECT_DAILY_LIMIT:
                 reset_in = self._seconds_until_utc_midnight()
                 raise HTTPException(
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -104,7 +108,8 @@ class _RateLimiter:
             # Record but don't enforce user tiers
             self.user_hour[user_id].append(now)
             self.user_day[user_id].append(now)
-            self.project_day.append(now)
+            if upstream:
+                self.project_day.append(now)
             return
 
         # Tier 1: user hourly
@@ -141,7 +146,7 @@ class _RateLimiter:
             )
 
         # Tier 3: project ceiling
-        if len(self.project_day) >= PROJECT_DAILY_LIMIT:
+        if upstream and len(self.project_day) >= PROJECT_DAILY_LIMIT:
             reset_in = self._seconds_until_utc_midnight()
             logger.warning(
                 "Rate limit hit: project_quota reset_in=%ds (free-tier ceiling)",
@@ -159,7 +164,8 @@ class _RateLimiter:
         # All clear — record this call
         self.user_hour[user_id].append(now)
         self.user_day[user_id].append(now)
-        self.project_day.append(now)
+        if upstream:
+            self.project_day.append(now)
 
 
 # Module-level singleton — one in-memory store per backend process
@@ -0,0 +1,84 @@
+"""Pure-ASGI request instrumentation (SAFE-03 access log + latency histograms).
+
+Replaces the former ``BaseHTTPMiddleware``-based RequestLoggingMiddleware:
+
+- no per-request anyio task / body re-streaming overhead of BaseHTTPMiddleware;
+- the JWT is no longer decoded a second time just to log ``user_id`` —
+  ``get_current_user`` tags the request via ``request_metrics.set_principal``;
+- latency is folded into a per-route histogram keyed by the route TEMPLATE
+  (``scope["route"].path`` once Starlette's router matched), together with the
+  number of DB statements and DB time the request spent;
+- requests slower than ``settings.SLOW_REQUEST_MS`` log a ``slow_request``
+  warning in addition to the regular ``http_request`` line;
+- a ``settings.QUERY_BUDGET_SAMPLE_RATE`` share of requests collect their
+  statement texts; a sampled request that ran more statements than its
+  route's query budget (app/api/query_budget.py) logs a
+  ``query_budget_exceeded`` warning naming the statements that repeated.
+
+Non-HTTP scopes (lifespan, websocket) pass through untouched.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.query_budget import budget_for
+from app.application.services import request_metrics
+from app.infrastructure.config import settings
+
+logger = logging.getLogger("spms")
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rate = settings.QUERY_BUDGET_SAMPLE_RATE
+        stats = request_metrics.begin_request(scope, sample_statements=rate > 0 and random.random() < rate)
+        status_code = 500  # an exception before http.response.start is a 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            stats.route_label()  # resolve the matched template, if any
+            slow = request_metrics.record_request(
+                stats, status_code, duration_ms, settings.SLOW_REQUEST_MS
+            )
+            log_record = {
+                "event": "http_request",
+                "method": stats.method,
+                "path": stats.path,
+                "route": stats.route,
+                "status": status_code,
+                "duration_ms": round(duration_ms, 2),
+                "db_queries": stats.db_queries,
+                "db_time_ms": round(stats.db_time_ms, 2),
+                "db_rows": stats.db_rows,
+            }
+            if stats.user_id is not None:
+                log_record["user_id"] = stats.user_id
+            logger.info(json.dumps(log_record))
+            if slow:
+                logger.warning(json.dumps({**log_record, "event": "slow_request"}))
+            violation = request_metrics.check_budget(
+                stats, budget_for(scope, settings.QUERY_BUDGET_DEFAULT)
+            )
+            if violation is not None:
+                logger.warning(json.dumps({"event": "query_budget_exceeded", "path": stats.path, **violation}))
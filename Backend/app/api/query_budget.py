@@ -0,0 +1,42 @@
+"""Per-endpoint SQL query budgets (opt-in per route).
+
+A budget is the most statements one request to the route may run — a
+ceiling, not an exact count: it has headroom for auth, membership and
+optional branches, but a loop issuing a query per row (N+1) blows through it
+as soon as the data grows past a handful of rows.
+
+    @router.get("/{project_id}/columns", ...)
+    @query_budget(8)
+    async def list_columns(...): ...
+
+The decorator only tags the endpoint function (FastAPI registers the same
+object). ``RequestMetricsMiddleware`` reads the tag from the matched route
+via :func:`budget_for` and hands it to ``request_metrics.check_budget``;
+routes without one fall back to ``settings.QUERY_BUDGET_DEFAULT`` (0 = no
+budget). The ``max_queries`` test fixture enforces the same numbers.
+"""
+from typing import Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+_ATTR = "__query_budget__"
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    if max_queries < 1:
+        raise ValueError("query budget must be at least 1")
+
+    def tag(endpoint: F) -> F:
+        setattr(endpoint, _ATTR, max_queries)
+        return endpoint
+
+    return tag
+
+
+def budget_for(scope: dict, default: int = 0) -> Optional[int]:
+    """Budget of the route matched for ``scope`` (None when it has none)."""
+    endpoint = getattr(scope.get("route"), "endpoint", None)
+    budget = getattr(endpoint, _ATTR, None)
+    if budget is None and default > 0:
+        return default
+    return budget
@@ -1,17 +1,24 @@
 """API-02 Activity feed router.
 
 Mounted at /api/v1 prefix so full path is /api/v1/projects/{project_id}/activity.
+``/projects/{project_id}/activity.csv`` / ``.ndjson`` stream the whole
+filtered feed (app/api/streaming_export.py).
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from datetime import datetime
 
 from app.api.deps.project import get_project_member
-from app.api.deps.audit import get_audit_repo
+from app.api.deps.audit import audit_read_repo_scope, get_audit_repo
 from app.api.deps.auth import require_permission
 from app.application.use_cases.get_project_activity import GetProjectActivityUseCase
 from app.application.use_cases.get_global_activity import GetGlobalActivityUseCase
-from app.application.dtos.activity_dtos import ActivityResponseDTO
+from app.api.fast_json import fast_json, rows_as
+from app.api.streaming_export import (
+    AUDIT_COLUMNS, ExportFormat, audit_cursor, decode_cursor, export_response,
+)
+from app.application.dtos.activity_dtos import ActivityItemDTO, ActivityResponseDTO
 
 
 router = APIRouter()
@@ -23,6 +30,7 @@ router = APIRouter()
     summary="Global activity feed (Dashboard widget, admin only)",
 )
 async def get_global_activity(
+    request: Request,
     limit: int = Query(default=20, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     _user=Depends(require_permission("admin.access")),
@@ -44,7 +52,10 @@ async def get_global_activity(
     Page size capped at 200 (T-10-02-04 DoS mitigation, default 20).
     """
     use_case = GetGlobalActivityUseCase(audit_repo)
-    return await use_case.execute(limit=limit, offset=offset)
+    items, total = await use_case.execute_rows(limit=limit, offset=offset)
+    return fast_json(
+        request, {"items": rows_as(ActivityItemDTO, items), "total": total}, items_key="items"
+    )
 
 
 @router.get(
@@ -53,6 +64,7 @@ async def get_global_activity(
 )
 async def get_project_activity(
     project_id: int,
+    request: Request,
     type: Optional[List[str]] = Query(default=None, alias="type[]"),
     user_id: Optional[int] = Query(default=None),
     date_from: Optional[datetime] = Query(default=None),
@@ -73,7 +85,7 @@ async def get_project_activity(
     Page size capped at 200 (T-09-09-03 DoS mitigation).
     """
     use_case = GetProjectActivityUseCase(audit_repo)
-    return await use_case.execute(
+    items, total = await use_case.execute_rows(
         project_id=project_id,
         types=type,
         user_id=user_id,
@@ -82,3 +94,38 @@ async def get_project_activity(
         limit=limit,
         offset=offset,
     )
+    # Repository rows go straight to JSON (app/api/fast_json.py).
+    return fast_json(
+        request, {"items": rows_as(ActivityItemDTO, items), "total": total}, items_key="items"
+    )
+
+
+@router.get("/projects/{project_id}/activity.{fmt}")
+async def export_project_activity(
+    project_id: int,
+    fmt: ExportFormat,
+    request: Request,
+    type: Optional[List[str]] = Query(default=None, alias="type[]"),
+    user_id: Optional[int] = Query(default=None),
+    date_from: Optional[datetime] = Query(default=None),
+    date_to: Optional[datetime] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    _member=Depends(get_project_member),
+) -> StreamingResponse:
+    """CSV / NDJSON export of the project activity feed, same filters and
+    membership check as the paginated feed but without a page size.
+    ``cursor`` resumes after the last row of an interrupted download."""
+    after = decode_cursor(cursor)
+
+    async def rows():
+        async with audit_read_repo_scope() as repo:
+            async for row in repo.stream_audit(
+                project_id=project_id, types=type, actor_id=user_id,
+                date_from=date_from, date_to=date_to, after=after,
+            ):
+                yield row
+
+    return export_response(
+        request, rows(), fmt=fmt, columns=AUDIT_COLUMNS, cursor_of=audit_cursor,
+        filename=f"activity-{project_id}", resumed=after is not None,
+    )
@@ -1,22 +1,27 @@
 """Phase 14 Plan 14-01 / Phase 15 Plan 15-07 — Admin audit router.
 
-2 endpoints (Plan 15-07 D-1.4 perm migration):
-- GET /admin/audit         — paginated list (admin.audit.read)
-- GET /admin/audit.json    — JSON-array export with 50k cap (admin.audit.export)
+3 endpoints (Plan 15-07 D-1.4 perm migration):
+- GET /admin/audit          — paginated list (admin.audit.read)
+- GET /admin/audit.json     — JSON-array export with 50k cap (admin.audit.export)
+- GET /admin/audit.{fmt}    — csv / ndjson streamed export, no cap (admin.audit.export)
 
 The 50k hard cap is enforced inside audit_repo.get_global_audit; this router
 just surfaces the truncated flag to the frontend so it can render the
-AlertBanner above the table.
+AlertBanner above the table. The csv / ndjson exports stream off a cursor
+instead (app/api/streaming_export.py) and are resumable.
 """
 import json
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 
-from app.api.deps.audit import get_audit_repo
+from app.api.deps.audit import audit_read_repo_scope, get_audit_repo
 from app.api.deps.auth import require_permission
+from app.api.streaming_export import (
+    AUDIT_COLUMNS, ExportFormat, audit_cursor, decode_cursor, export_response,
+)
 from app.application.dtos.admin_audit_dtos import AdminAuditResponseDTO
 from app.application.use_cases.get_global_audit import GetGlobalAuditUseCase
 from app.domain.entities.user import User
@@ -87,3 +92,37 @@ async def export_admin_audit_json(
         media_type="application/json; charset=utf-8",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+
+
+# Declared after /admin/audit.json so "json" never reaches the fmt pattern.
+@router.get("/admin/audit.{fmt}")
+async def export_admin_audit_stream(
+    fmt: ExportFormat,
+    request: Request,
+    date_from: Optional[datetime] = Query(default=None),
+    date_to: Optional[datetime] = Query(default=None),
+    actor_id: Optional[int] = Query(default=None),
+    action_prefix: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    admin: User = Depends(require_permission("admin.audit.export")),
+) -> StreamingResponse:
+    """CSV / NDJSON export of the whole filtered audit log, newest first.
+
+    No 50k cap: rows are streamed from a server-side cursor on the export's
+    own read session. ``cursor`` (the value of the last row received)
+    resumes an interrupted download.
+    """
+    after = decode_cursor(cursor)
+
+    async def rows():
+        async with audit_read_repo_scope() as repo:
+            async for row in repo.stream_audit(
+                actor_id=actor_id, action_prefix=action_prefix,
+                date_from=date_from, date_to=date_to, after=after,
+            ):
+                yield row
+
+    return export_response(
+        request, rows(), fmt=fmt, columns=AUDIT_COLUMNS, cursor_of=audit_cursor,
+        filename=f"audit-{datetime.utcnow().strftime('%Y-%m-%d')}", resumed=after is not None,
+    )
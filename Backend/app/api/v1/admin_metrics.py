@@ -0,0 +1,32 @@
+"""Admin metrics router — GET /admin/metrics.
+
+Serves the in-memory request instrumentation (per-route latency histograms,
+DB statements per request, recent slow requests / slow queries) collected by
+RequestMetricsMiddleware + the SQLAlchemy engine listeners, and connection
+pool usage per workload class under ``db_pools``. Numbers are for THIS
+worker since its start (or since the last ``?reset=true``).
+"""
+from fastapi import APIRouter, Depends
+
+from app.api.deps.auth import require_permission
+from app.application.services import request_metrics
+from app.domain.entities.user import User
+from app.infrastructure.database.database import ENGINES
+from app.infrastructure.database.util import pool_metrics
+
+router = APIRouter()
+
+
+@router.get("/admin/metrics")
+async def get_admin_metrics(
+    reset: bool = False,
+    admin: User = Depends(require_permission("admin.stats.read")),
+):
+    """Snapshot of the request metrics; ``reset=true`` starts a new window
+    after taking the snapshot (handy around a load test)."""
+    payload = request_metrics.snapshot()
+    payload["db_pools"] = pool_metrics.snapshot(ENGINES)
+    if reset:
+        request_metrics.reset()
+        pool_metrics.reset()
+    return payload
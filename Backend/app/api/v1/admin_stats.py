@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends
 
 from app.api.deps.audit import get_audit_repo
 from app.api.deps.auth import require_permission
+from app.api.deps.parallel import get_query_executor
 from app.api.deps.project import get_project_repo
 from app.application.dtos.admin_stats_dtos import AdminStatsResponseDTO
 from app.application.use_cases.get_admin_stats import GetAdminStatsUseCase
@@ -23,6 +24,7 @@ async def get_admin_stats(
     admin: User = Depends(require_permission("admin.stats.read")),
     audit_repo=Depends(get_audit_repo),
     project_repo=Depends(get_project_repo),
+    executor=Depends(get_query_executor),
 ):
     """D-A7 composite stats endpoint. Single round trip; backend has no
     cache layer in v2.0 (frontend uses TanStack Query staleTime: 60s)."""
@@ -30,5 +32,7 @@ async def get_admin_stats(
     # aggregation reuse is a Plan 14-08 enhancement (UI-side of stats tab).
     # Passing None preserves the composite shape; velocity_history defaults
     # to [] per project so the chart renders empty bars rather than crashing.
-    uc = GetAdminStatsUseCase(audit_repo, project_repo, velocity_resolver=None)
+    uc = GetAdminStatsUseCase(
+        audit_repo, project_repo, velocity_resolver=None, executor=executor
+    )
     return await uc.execute()
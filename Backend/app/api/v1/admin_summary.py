@@ -4,7 +4,8 @@ GET /admin/summary.pdf — rate-limited 30s per user (Phase 12 D-58 reuse).
 Composes a 1-page A4 portrait summary using Phase 12 fpdf2 service.
 
 Data loader is inline so the use case stays decoupled from the SQLAlchemy
-session. Builds:
+session. Its seven independent reads run through ParallelQueryExecutor, one
+session per branch. Builds:
 - User count + delta (last 30d)
 - Active project count + total
 - Top 5 most-active projects (audit_log entries last 30d)
@@ -21,11 +22,12 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps.auth import require_permission
+from app.api.deps.parallel import get_session_executor
 from app.application.use_cases.generate_admin_summary_pdf import (
     GenerateAdminSummaryPDFUseCase,
 )
+from app.application.services.parallel_queries import ParallelQueryExecutor
 from app.domain.entities.user import User
-from app.infrastructure.database.database import get_db_session
 from app.infrastructure.database.models.audit_log import AuditLogModel
 from app.infrastructure.database.models.project import ProjectModel
 from app.infrastructure.database.models.role import RoleModel
@@ -35,115 +37,122 @@ limiter = Limiter(key_func=get_remote_address)
 router = APIRouter()
 
 
-def _make_loader(session: AsyncSession):
-    async def load() -> dict:
-        # Total user count
-        user_count = (await session.execute(
-            select(sqlfunc.count(UserModel.id))
-            .where(UserModel.is_deleted == False)  # noqa: E712
-        )).scalar() or 0
+async def _count(session: AsyncSession, stmt) -> int:
+    return int((await session.execute(stmt)).scalar() or 0)
 
-        # New users in last 30 days
-        cutoff = datetime.utcnow() - timedelta(days=30)
-        new_users_30d = (await session.execute(
-            select(sqlfunc.count(UserModel.id))
-            .where(
-                UserModel.is_deleted == False,  # noqa: E712
-                UserModel.created_at >= cutoff,
-            )
-        )).scalar() or 0
 
-        # Role split — distinct user counts per role
-        role_split: dict = {}
-        role_rows = await session.execute(
-            select(RoleModel.name, sqlfunc.count(UserModel.id))
-            .join(UserModel, UserModel.role_id == RoleModel.id, isouter=True)
-            .where(UserModel.is_deleted == False)  # noqa: E712
-            .group_by(RoleModel.name)
-        )
-        for name, cnt in role_rows.all():
-            role_split[str(name)] = int(cnt or 0)
-
-        # Project counts
-        active_project_count = (await session.execute(
-            select(sqlfunc.count(ProjectModel.id))
-            .where(
-                ProjectModel.is_deleted == False,  # noqa: E712
-                ProjectModel.status == "ACTIVE",
+async def _role_split(session: AsyncSession) -> dict:
+    """Distinct user counts per role."""
+    role_rows = await session.execute(
+        select(RoleModel.name, sqlfunc.count(UserModel.id))
+        .join(UserModel, UserModel.role_id == RoleModel.id, isouter=True)
+        .where(UserModel.is_deleted == False)  # noqa: E712
+        .group_by(RoleModel.name)
+    )
+    return {str(name): int(cnt or 0) for name, cnt in role_rows.all()}
+
+
+async def _top_projects(session: AsyncSession, cutoff: datetime) -> list:
+    """Top 5 active projects by audit_log entries last 30d."""
+    try:
+        top_rows = await session.execute(
+            select(
+                ProjectModel.id,
+                ProjectModel.key,
+                ProjectModel.name,
+                sqlfunc.count(AuditLogModel.id).label("events"),
             )
-        )).scalar() or 0
-        total_project_count = (await session.execute(
-            select(sqlfunc.count(ProjectModel.id))
-            .where(ProjectModel.is_deleted == False)  # noqa: E712
-        )).scalar() or 0
-
-        # Top 5 active projects by audit_log entries last 30d
-        top_projects: list = []
-        try:
-            top_rows = await session.execute(
-                select(
-                    ProjectModel.id,
-                    ProjectModel.key,
-                    ProjectModel.name,
-                    sqlfunc.count(AuditLogModel.id).label("events"),
-                )
-                .select_from(ProjectModel)
-                .join(
-                    AuditLogModel,
-                    (AuditLogModel.entity_type == "project")
-                    & (AuditLogModel.entity_id == ProjectModel.id)
-                    & (AuditLogModel.timestamp >= cutoff),
-                    isouter=True,
-                )
-                .group_by(ProjectModel.id, ProjectModel.key, ProjectModel.name)
-                .order_by(sqlfunc.count(AuditLogModel.id).desc())
-                .limit(5)
+            .select_from(ProjectModel)
+            .join(
+                AuditLogModel,
+                (AuditLogModel.entity_type == "project")
+                & (AuditLogModel.entity_id == ProjectModel.id)
+                & (AuditLogModel.timestamp >= cutoff),
+                isouter=True,
             )
-            for r in top_rows.all():
-                top_projects.append({
-                    "key": r._mapping["key"],
-                    "name": r._mapping["name"],
-                    "events": int(r._mapping["events"] or 0),
-                })
-        except Exception:
-            # Defensive fallback — older audit_log rows may have NULL entity_id;
-            # PDF still renders without the section.
-            top_projects = []
-
-        # Top 5 active users by audit_log entries last 30d
-        top_users: list = []
-        try:
-            user_rows = await session.execute(
-                select(
-                    UserModel.full_name,
-                    sqlfunc.count(AuditLogModel.id).label("events"),
-                )
-                .select_from(UserModel)
-                .join(
-                    AuditLogModel,
-                    (AuditLogModel.user_id == UserModel.id)
-                    & (AuditLogModel.timestamp >= cutoff),
-                    isouter=True,
-                )
-                .where(UserModel.is_deleted == False)  # noqa: E712
-                .group_by(UserModel.id, UserModel.full_name)
-                .order_by(sqlfunc.count(AuditLogModel.id).desc())
-                .limit(5)
+            .group_by(ProjectModel.id, ProjectModel.key, ProjectModel.name)
+            .order_by(sqlfunc.count(AuditLogModel.id).desc())
+            .limit(5)
+        )
+        return [
+            {
+                "key": r._mapping["key"],
+                "name": r._mapping["name"],
+                "events": int(r._mapping["events"] or 0),
+            }
+            for r in top_rows.all()
+        ]
+    except Exception:
+        # Defensive fallback — older audit_log rows may have NULL entity_id;
+        # PDF still renders without the section.
+        return []
+
+
+async def _top_users(session: AsyncSession, cutoff: datetime) -> list:
+    """Top 5 active users by audit_log entries last 30d."""
+    try:
+        user_rows = await session.execute(
+            select(
+                UserModel.full_name,
+                sqlfunc.count(AuditLogModel.id).label("events"),
+            )
+            .select_from(UserModel)
+            .join(
+                AuditLogModel,
+                (AuditLogModel.user_id == UserModel.id)
+                & (AuditLogModel.timestamp >= cutoff),
+                isouter=True,
             )
-            for r in user_rows.all():
-                top_users.append({
-                    "full_name": r._mapping["full_name"],
-                    "events": int(r._mapping["events"] or 0),
-                })
-        except Exception:
-            top_users = []
+            .where(UserModel.is_deleted == False)  # noqa: E712
+            .group_by(UserModel.id, UserModel.full_name)
+            .order_by(sqlfunc.count(AuditLogModel.id).desc())
+            .limit(5)
+        )
+        return [
+            {
+                "full_name": r._mapping["full_name"],
+                "events": int(r._mapping["events"] or 0),
+            }
+            for r in user_rows.all()
+        ]
+    except Exception:
+        return []
 
+
+def _make_loader(executor: ParallelQueryExecutor[AsyncSession]):
+    async def load() -> dict:
+        cutoff = datetime.utcnow() - timedelta(days=30)
+        live_users = UserModel.is_deleted == False  # noqa: E712
+        live_projects = ProjectModel.is_deleted == False  # noqa: E712
+        (
+            user_count,
+            new_users_30d,
+            role_split,
+            active_project_count,
+            total_project_count,
+            top_projects,
+            top_users,
+        ) = await executor.run(
+            lambda s: _count(s, select(sqlfunc.count(UserModel.id)).where(live_users)),
+            lambda s: _count(
+                s,
+                select(sqlfunc.count(UserModel.id)).where(live_users, UserModel.created_at >= cutoff),
+            ),
+            _role_split,
+            lambda s: _count(
+                s,
+                select(sqlfunc.count(ProjectModel.id)).where(live_projects, ProjectModel.status == "ACTIVE"),
+            ),
+            lambda s: _count(s, select(sqlfunc.count(ProjectModel.id)).where(live_projects)),
+            lambda s: _top_projects(s, cutoff),
+            lambda s: _top_users(s, cutoff),
+        )
         return {
-            "user_count": int(user_count),
-            "new_users_30d": int(new_users_30d),
+            "user_count": user_count,
+            "new_users_30d": new_users_30d,
             "role_split": role_split,
-            "active_project_count": int(active_project_count),
-            "total_project_count": int(total_project_count),
+            "active_project_count": active_project_count,
+            "total_project_count": total_project_count,
             "top_projects": top_projects,
             "top_users": top_users,
         }
@@ -155,10 +164,10 @@ def _make_loader(session: AsyncSession):
 async def generate_admin_summary_pdf(
     request: Request,
     admin: User = Depends(require_permission("admin.summary.export")),
-    session: AsyncSession = Depends(get_db_session),
+    executor: ParallelQueryExecutor[AsyncSession] = Depends(get_session_executor),
 ):
     """D-B6 — 1-page admin summary PDF, 30s per-user rate limit."""
-    uc = GenerateAdminSummaryPDFUseCase(load_summary_data=_make_loader(session))
+    uc = GenerateAdminSummaryPDFUseCase(load_summary_data=_make_loader(executor))
     pdf_buf = await uc.execute()
     filename = f"SPMS_Admin_Summary_{datetime.utcnow().strftime('%Y-%m-%d')}.pdf"
     return StreamingResponse(
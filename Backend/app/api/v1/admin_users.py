@@ -6,21 +6,24 @@ gate to endpoint-specific ``Depends(require_permission('<key>'))``:
 - GET    /admin/users                    list  → admin.access
 - POST   /admin/users                    invite → admin.users.invite
 - POST   /admin/users/bulk-invite        bulk invite → admin.users.invite
+                                          (?background=true → 202 + job id)
+- GET    /admin/users/bulk-jobs/{job_id} bulk job progress → admin.users.invite
 - POST   /admin/users/{id}/password-reset reset email link → admin.users.invite
 - PATCH  /admin/users/{id}/role          role flip → admin.users.role_change
 - PATCH  /admin/users/{id}/deactivate    toggle is_active → admin.users.deactivate
-- POST   /admin/users/bulk-action        per-user txn → admin.users.bulk
+- POST   /admin/users/bulk-action        set-based txn → admin.users.bulk
                                           (umbrella; use case adds dynamic
                                           SUB_PERM_MAP check D-1.16)
 - GET    /admin/users.csv                CSV export → admin.access
 """
 import csv
 import io
+import logging
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status as http_status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status as http_status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,10 +41,13 @@ from app.application.dtos.admin_user_dtos import (
     BulkActionResponseDTO,
     BulkInviteRequestDTO,
     BulkInviteResponseDTO,
+    BulkJobAcceptedDTO,
+    BulkJobStatusDTO,
     InviteUserRequestDTO,
     InviteUserResponseDTO,
     RoleChangeRequestDTO,
 )
+from app.application.services import bulk_job_registry
 from app.application.use_cases.bulk_action_user import BulkActionUserUseCase
 from app.application.use_cases.bulk_invite_user import BulkInviteUserUseCase
 from app.application.use_cases.change_user_role import ChangeUserRoleUseCase
@@ -56,11 +62,17 @@ from app.domain.exceptions import (
     UserNotFoundError,
 )
 from app.domain.repositories.role_repository import IRoleRepository
+from app.infrastructure.adapters.security_adapter import SecurityAdapter
 from app.infrastructure.config import settings
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import AsyncSessionLocal, get_db_session
 from app.infrastructure.database.models.user import UserModel
+from app.infrastructure.database.repositories.audit_repo import SqlAlchemyAuditRepository
+from app.infrastructure.database.repositories.password_reset_repo import SqlAlchemyPasswordResetRepository
+from app.infrastructure.database.repositories.role_repo import SqlAlchemyRoleRepository
+from app.infrastructure.database.repositories.user_repo import SqlAlchemyUserRepository
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -214,38 +226,118 @@ async def invite_user(
         )
 
 
+def _bulk_invite_use_case(
+    session: AsyncSession, user_repo, pwd_reset_repo, audit_repo, security,
+) -> BulkInviteUserUseCase:
+    # The repositories share ``session``; a failed chunk rolls it back.
+    return BulkInviteUserUseCase(
+        InviteUserUseCase(
+            user_repo=user_repo,
+            password_reset_repo=pwd_reset_repo,
+            audit_repo=audit_repo,
+            security=security,
+            invite_token_ttl_days=settings.INVITE_TOKEN_TTL_DAYS,
+            frontend_url=settings.FRONTEND_URL,
+        ),
+        rollback=session.rollback,
+    )
+
+
+async def _run_bulk_invite_job(job_id: str, dto: BulkInviteRequestDTO, admin_id: int) -> None:
+    """Background runner — owns its session; the request session is closed by now."""
+    try:
+        async with AsyncSessionLocal() as session:
+            bulk_uc = _bulk_invite_use_case(
+                session,
+                SqlAlchemyUserRepository(session),
+                SqlAlchemyPasswordResetRepository(session),
+                SqlAlchemyAuditRepository(session),
+                SecurityAdapter(),
+            )
+            result = await bulk_uc.execute(
+                dto, admin_id=admin_id,
+                role_id_resolver=_resolve_role_id_via_repo(SqlAlchemyRoleRepository(session)),
+                progress=lambda n: bulk_job_registry.report_progress(job_id, n),
+            )
+        bulk_job_registry.complete(job_id, result.model_dump(mode="json"))
+    except Exception as exc:
+        logger.exception("bulk invite job %s failed", job_id)
+        bulk_job_registry.fail(job_id, str(exc))
+
+
 @router.post(
     "/admin/users/bulk-invite",
     response_model=BulkInviteResponseDTO,
+    responses={202: {"model": BulkJobAcceptedDTO}},
 )
 async def bulk_invite(
     dto: BulkInviteRequestDTO,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(default=False),
     admin: User = Depends(require_permission("admin.users.invite")),
     user_repo=Depends(get_user_repo),
     pwd_reset_repo=Depends(get_password_reset_repo),
     audit_repo=Depends(get_audit_repo),
     security=Depends(get_security_service),
     role_repo: IRoleRepository = Depends(get_role_repo),
+    session: AsyncSession = Depends(get_db_session),
 ):
     """D-B4 bulk invite — 500-row server-side hard cap via Pydantic.
 
     Phase 15 Plan 15-06: role-name → id resolution via IRoleRepository.
+
+    ``?background=true`` returns 202 with a job id immediately and runs the
+    batch after the response; poll GET /admin/users/bulk-jobs/{job_id} for
+    progress and the final {successful, failed} payload.
     """
-    invite_uc = InviteUserUseCase(
-        user_repo=user_repo,
-        password_reset_repo=pwd_reset_repo,
-        audit_repo=audit_repo,
-        security=security,
-        invite_token_ttl_days=settings.INVITE_TOKEN_TTL_DAYS,
-        frontend_url=settings.FRONTEND_URL,
-    )
-    bulk_uc = BulkInviteUserUseCase(invite_uc)
+    if background:
+        job = bulk_job_registry.create("bulk_invite", owner_id=admin.id, total=len(dto.rows))
+        background_tasks.add_task(_run_bulk_invite_job, job.job_id, dto, admin.id)
+        accepted = BulkJobAcceptedDTO(
+            job_id=job.job_id,
+            total=job.total,
+            status_url=f"/api/v1/admin/users/bulk-jobs/{job.job_id}",
+        )
+        return JSONResponse(
+            status_code=http_status.HTTP_202_ACCEPTED,
+            content=accepted.model_dump(),
+            background=background_tasks,
+        )
+
+    bulk_uc = _bulk_invite_use_case(session, user_repo, pwd_reset_repo, audit_repo, security)
     return await bulk_uc.execute(
         dto, admin_id=admin.id,
         role_id_resolver=_resolve_role_id_via_repo(role_repo),
     )
 
 
+@router.get(
+    "/admin/users/bulk-jobs/{job_id}",
+    response_model=BulkJobStatusDTO,
+)
+async def get_bulk_job(
+    job_id: str,
+    admin: User = Depends(require_permission("admin.users.invite")),
+):
+    """Progress of a background bulk job. Only the admin who started it can
+    see it; unknown, expired and foreign jobs are all 404."""
+    job = bulk_job_registry.get(job_id)
+    if job is None or job.owner_id != admin.id:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"Bulk job {job_id} not found",
+        )
+    return BulkJobStatusDTO(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        result=job.result,
+        error=job.error,
+    )
+
+
 @router.post("/admin/users/{user_id}/password-reset", status_code=http_status.HTTP_204_NO_CONTENT)
 async def reset_user_password(
     user_id: int,
@@ -348,9 +440,8 @@ async def bulk_action(
     user_repo=Depends(get_user_repo),
     role_repo: IRoleRepository = Depends(get_role_repo),
     audit_repo=Depends(get_audit_repo),
-    session: AsyncSession = Depends(get_db_session),
 ):
-    """D-B7 per-user transaction; per-user audit row.
+    """D-B7 set-based update (one UPDATE + one audit INSERT); per-user audit row.
 
     Phase 15 Plan 15-06: ChangeUserRoleUseCase now takes IRoleRepository +
     role_id: int. The bulk-action `payload.role_id` (legacy callers may pass
@@ -364,22 +455,13 @@ async def bulk_action(
     without mutating any rows (Pitfall 17 — no partial success). The router
     wires ``_has_permission`` as the DIP-preserving callable injection.
     """
-    deactivate_uc = DeactivateUserUseCase(
-        user_repo=user_repo,
-        audit_repo=audit_repo,
-        toggle_active=_make_toggle_active(session),
-    )
-    role_uc = ChangeUserRoleUseCase(
-        user_repo=user_repo,
-        role_repo=role_repo,
-        audit_repo=audit_repo,
-    )
     # D-1.16 — DIP-preserving callable injection. Application layer never
     # imports `_has_permission`; the API layer (which legitimately knows about
     # auth dependencies) wires it at construction time.
     uc = BulkActionUserUseCase(
-        deactivate_uc,
-        role_uc,
+        user_repo,
+        role_repo,
+        audit_repo,
         permission_check=_has_permission,
     )
     try:
@@ -3,6 +3,8 @@
 Two streaming endpoints, both SSE (Server-Sent Events) via FastAPI's
 StreamingResponse. Authentication required (uses existing get_current_user).
 Rate limiting is added in Wave 5 (D-05) — Wave 1 ships endpoints unlimited.
+Requests the provider serves from its generation cache (or by joining an
+identical in-flight generation) skip the project-day quota.
 
 Plan reference: .planning/ai-workflow-generator-plan.md §4.4.2
 """
@@ -22,6 +24,7 @@ from app.application.dtos.ai_workflow_dto import (
 from app.application.ports.ai_workflow_suggestion_port import (
     IAIWorkflowSuggestionPort,
 )
+from app.application.services import ai_workflow_cache
 from app.application.use_cases.generate_lifecycle_workflow_use_case import (
     GenerateLifecycleWorkflowUseCase,
 )
@@ -60,7 +63,10 @@ async def generate_lifecycle(
     # Raises HTTPException 429/503 if any tier is exceeded; FastAPI returns
     # the body before any stream events fire, so the frontend never sees an
     # empty SSE stream — it sees a clean 429/503 it can map to State 6 / 5.
-    _ai_limiter.check_and_increment(str(current_user.email))
+    _ai_limiter.check_and_increment(
+        str(current_user.email),
+        upstream=not ai_workflow_cache.is_served(ai_port.cache_key(form, "tr")),
+    )
 
     use_case = GenerateLifecycleWorkflowUseCase(ai_port)
 
@@ -104,7 +110,10 @@ async def generate_task_status(
     current_user=Depends(get_current_user),
 ):
     # See generate_lifecycle for rate-limit rationale.
-    _ai_limiter.check_and_increment(str(current_user.email))
+    _ai_limiter.check_and_increment(
+        str(current_user.email),
+        upstream=not ai_workflow_cache.is_served(ai_port.cache_key(form, "tr")),
+    )
 
     use_case = GenerateTaskStatusWorkflowUseCase(ai_port)
 
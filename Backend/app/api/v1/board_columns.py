@@ -9,7 +9,9 @@ from app.api.dependencies import (
     get_project_repo,
     get_board_column_repo,
     _is_admin,
+    project_etag,
 )
+from app.api.query_budget import query_budget
 from app.application.dtos.board_column_dtos import (
     BoardColumnDTO,
     CreateColumnDTO,
@@ -29,10 +31,12 @@ router = APIRouter()
 
 
 @router.get("/{project_id}/columns", response_model=List[BoardColumnDTO])
+@query_budget(8)
 async def list_columns(
     project_id: int,
     current_user: User = Depends(get_project_member),
     column_repo: IBoardColumnRepository = Depends(get_board_column_repo),
+    _etag=Depends(project_etag),
 ):
     """Return all board columns for a project ordered by order_index."""
     use_case = ListColumnsUseCase(column_repo)
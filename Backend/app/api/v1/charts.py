@@ -1,11 +1,12 @@
 """Phase 13 + Reports migration v2 chart aggregation router. Mounted at /api/v1.
 
-5 endpoints, all read-only and project-member gated:
+6 endpoints, all read-only and project-member gated:
 - GET /projects/{project_id}/charts/cfd             (D-X1, range 7|30|90)
 - GET /projects/{project_id}/charts/lead-cycle      (D-X2, range 7|30|90)
 - GET /projects/{project_id}/charts/iteration       (D-X3, count 3|4|6)
 - GET /projects/{project_id}/charts/phase-progress  (Reports v2, Strategy D)
 - GET /projects/{project_id}/chart-capabilities     (Reports v2, Strategy D)
+- GET /projects/{project_id}/charts/bundle          (capabilities + ?charts=...)
 
 Strategy D removed the iteration endpoint's methodology gate — capability
 gating happens FE-side via /chart-capabilities. Empty data on iteration =
@@ -15,16 +16,23 @@ Phase 9 error taxonomy: 422 with `error_code` body on range/count validation
 failures. Member gate inherits from `Depends(get_project_member)` →
 non-member returns 403 (T-13-01-01 mitigation).
 """
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 
-from app.api.deps.project import get_project_member, get_project_repo
-from app.api.deps.audit import get_audit_repo
+from app.api.deps.project import get_project_member, get_project_read_repo, get_project_repo
+from app.api.deps.conditional import (
+    analytics_project_etag,
+    daily_analytics_project_etag,
+    project_etag,
+)
+from app.api.fast_json import fast_json
+from app.api.deps.audit import get_audit_read_repo
 from app.api.deps.task import get_task_repo
 from app.api.deps.report import get_report_repo
 from app.application.use_cases.get_project_cfd import GetProjectCFDUseCase
 from app.application.use_cases.get_project_lead_cycle import GetProjectLeadCycleUseCase
 from app.application.use_cases.get_project_iteration import GetProjectIterationUseCase
 from app.application.use_cases.get_chart_capabilities import GetChartCapabilitiesUseCase
+from app.application.use_cases.get_chart_bundle import BUNDLE_CHARTS, GetChartBundleUseCase
 from app.application.use_cases.get_project_phase_progress import (
     GetProjectPhaseProgressUseCase,
 )
@@ -34,6 +42,7 @@ from app.application.dtos.chart_dtos import (
     IterationResponseDTO,
     ChartCapabilitiesResponseDTO,
     PhaseProgressResponseDTO,
+    ChartBundleResponseDTO,
 )
 from app.domain.exceptions import ProjectNotFoundError
 
@@ -44,20 +53,24 @@ router = APIRouter()
 @router.get("/projects/{project_id}/charts/cfd", response_model=CFDResponseDTO)
 async def get_project_cfd(
     project_id: int,
+    request: Request,
+    response: Response,
     range: int = Query(default=30),
     _member=Depends(get_project_member),
-    audit_repo=Depends(get_audit_repo),
+    _etag=Depends(daily_analytics_project_etag),
+    audit_repo=Depends(get_audit_read_repo),
     task_repo=Depends(get_task_repo),
 ) -> CFDResponseDTO:
     """D-X1 CFD daily snapshot, member-gated, range-validated to {7, 30, 90}."""
     use_case = GetProjectCFDUseCase(audit_repo, task_repo)
     try:
-        return await use_case.execute(project_id=project_id, range_days=range)
+        result = await use_case.execute(project_id=project_id, range_days=range)
     except ValueError as e:
         raise HTTPException(
             status_code=422,
             detail={"error_code": "INVALID_RANGE", "message": str(e)},
         )
+    return fast_json(request, result, items_key="days", inherit=response)
 
 
 @router.get("/projects/{project_id}/charts/lead-cycle", response_model=LeadCycleResponseDTO)
@@ -65,7 +78,8 @@ async def get_project_lead_cycle(
     project_id: int,
     range: int = Query(default=30),
     _member=Depends(get_project_member),
-    audit_repo=Depends(get_audit_repo),
+    _etag=Depends(daily_analytics_project_etag),
+    audit_repo=Depends(get_audit_read_repo),
 ) -> LeadCycleResponseDTO:
     """D-X2 Lead/Cycle aggregation, member-gated, range-validated to {7, 30, 90}."""
     use_case = GetProjectLeadCycleUseCase(audit_repo)
@@ -83,7 +97,8 @@ async def get_project_iteration(
     project_id: int,
     count: int = Query(default=4),
     _member=Depends(get_project_member),
-    audit_repo=Depends(get_audit_repo),
+    _etag=Depends(analytics_project_etag),
+    audit_repo=Depends(get_audit_read_repo),
 ) -> IterationResponseDTO:
     """D-X3 Last-N sprints. Strategy D: no methodology gate — empty data when no sprints."""
     use_case = GetProjectIterationUseCase(audit_repo)
@@ -108,6 +123,7 @@ async def get_project_iteration(
 async def get_chart_capabilities_endpoint(
     project_id: int,
     _member=Depends(get_project_member),
+    _etag=Depends(project_etag),
     project_repo=Depends(get_project_repo),
 ) -> ChartCapabilitiesResponseDTO:
     """Per-chart visibility flags for the project. Computed from project
@@ -134,6 +150,7 @@ async def get_chart_capabilities_endpoint(
 async def get_project_phase_progress(
     project_id: int,
     _member=Depends(get_project_member),
+    _etag=Depends(analytics_project_etag),
     project_repo=Depends(get_project_repo),
     report_repo=Depends(get_report_repo),
 ) -> PhaseProgressResponseDTO:
@@ -152,3 +169,37 @@ async def get_project_phase_progress(
             status_code=404,
             detail={"error_code": "PROJECT_NOT_FOUND", "project_id": project_id},
         )
+
+
+@router.get("/projects/{project_id}/charts/bundle", response_model=ChartBundleResponseDTO)
+async def get_project_chart_bundle(
+    project_id: int,
+    charts: str = Query(default=",".join(BUNDLE_CHARTS)),
+    range: int = Query(default=30),
+    count: int = Query(default=4),
+    _member=Depends(get_project_member),
+    _etag=Depends(daily_analytics_project_etag),
+    project_repo=Depends(get_project_read_repo),
+    audit_repo=Depends(get_audit_read_repo),
+    report_repo=Depends(get_report_repo),
+) -> ChartBundleResponseDTO:
+    """Capability flags plus each requested chart (comma-separated ``charts``)
+    whose flag is true, in one round trip. ``range`` applies to cfd /
+    lead_cycle and ``count`` to iteration, with the same validation as the
+    standalone endpoints."""
+    use_case = GetChartBundleUseCase(project_repo, audit_repo, report_repo)
+    requested = [c.strip() for c in charts.split(",") if c.strip()]
+    try:
+        return await use_case.execute(
+            project_id=project_id, charts=requested, range_days=range, count=count,
+        )
+    except ProjectNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail={"error_code": "PROJECT_NOT_FOUND", "project_id": project_id},
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={"error_code": "INVALID_CHART_QUERY", "message": str(e)},
+        )
@@ -0,0 +1,28 @@
+"""Health router — GET /health/live and GET /health/ready (unauthenticated).
+
+Liveness only says the process answers. Readiness reports the boot steps
+tracked by app/infrastructure/database/startup.py for THIS worker: 503
+until the blocking steps finished, then 200 with the per-step state,
+including backfills still running in the background.
+
+Unauthenticated, so each step reports its state only; why a step failed
+is in the server log.
+"""
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.infrastructure.database import startup
+
+router = APIRouter()
+
+
+@router.get("/health/live")
+async def live():
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+async def ready():
+    payload = startup.progress.snapshot()
+    payload["steps"] = {name: {"state": info["state"]} for name, info in payload["steps"].items()}
+    return JSONResponse(payload, status_code=200 if payload["ready"] else 503)
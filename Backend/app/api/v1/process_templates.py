@@ -1,13 +1,21 @@
+import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user, get_process_template_repo
 from app.api.deps.auth import require_permission
-from app.api.deps.project import get_project_repo
-from app.infrastructure.database.database import get_db_session
+from app.api.deps.project import get_project_repo, project_repo_scope
+from app.application.dtos.admin_user_dtos import BulkJobAcceptedDTO, BulkJobStatusDTO
+from app.application.services import bulk_job_registry
+from app.infrastructure.config import settings
+from app.infrastructure.database.database import AsyncSessionLocal
+from app.infrastructure.database.repositories.process_template_repo import (
+    SqlAlchemyProcessTemplateRepository,
+)
+from app.infrastructure.database.repositories.project_repo import SqlAlchemyProjectRepository
 from app.application.dtos.process_template_dtos import (
     ProcessTemplateCreateDTO,
     ProcessTemplateResponseDTO,
@@ -23,6 +31,8 @@ from app.application.use_cases.apply_process_template import ApplyProcessTemplat
 from app.domain.entities.user import User
 from app.domain.exceptions import DomainError
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -116,22 +126,105 @@ async def delete_template(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.post("/{template_id}/apply")
+def _apply_template_use_case(project_repo, template_repo, repo_scope=None) -> ApplyProcessTemplateUseCase:
+    return ApplyProcessTemplateUseCase(
+        project_repo,
+        template_repo,
+        repo_scope=repo_scope,
+        batch_size=settings.TEMPLATE_APPLY_BATCH_SIZE,
+        concurrency=settings.TEMPLATE_APPLY_CONCURRENCY,
+        lock_retries=settings.TEMPLATE_APPLY_LOCK_RETRIES,
+        retry_delay_s=settings.TEMPLATE_APPLY_RETRY_DELAY_S,
+    )
+
+
+async def _run_apply_template_job(job_id: str, template_id: int, dto: ApplyTemplateDTO) -> None:
+    """Background runner — owns its sessions; the request session is closed by now.
+    Batches run in parallel, each on a session from ``project_repo_scope``."""
+    try:
+        async with AsyncSessionLocal() as session:
+            uc = _apply_template_use_case(
+                SqlAlchemyProjectRepository(session),
+                SqlAlchemyProcessTemplateRepository(session),
+                repo_scope=project_repo_scope,
+            )
+            result = await uc.execute(
+                template_id, dto.project_ids, dto.require_pm_approval,
+                progress=lambda n: bulk_job_registry.report_progress(job_id, n),
+            )
+        bulk_job_registry.complete(job_id, result)
+    except Exception as exc:
+        logger.exception("template apply job %s failed", job_id)
+        bulk_job_registry.fail(job_id, str(exc))
+
+
+@router.post("/{template_id}/apply", responses={202: {"model": BulkJobAcceptedDTO}})
 async def apply_template(
     template_id: int,
     dto: ApplyTemplateDTO,
-    _admin: User = Depends(require_permission("admin.access")),
+    background_tasks: BackgroundTasks,
+    background: bool = Query(default=False),
+    admin: User = Depends(require_permission("admin.access")),
     template_repo=Depends(get_process_template_repo),
     project_repo=Depends(get_project_repo),
-    session: AsyncSession = Depends(get_db_session),
 ):
     """D-44: Apply process template to a list of projects with per-project advisory lock.
 
     Returns {"applied": [...project_ids], "failed": [{project_id, error}]}.
     Partial success is intentional (D-44) — 200 OK even if some projects failed.
+
+    ``?background=true`` returns 202 with a job id once the template is
+    known to exist and applies the batches in parallel after the response;
+    poll GET /process-templates/apply-jobs/{job_id} for progress and the
+    same {applied, failed} payload.
     """
-    uc = ApplyProcessTemplateUseCase(project_repo, template_repo, session)
+    if background:
+        if await template_repo.get_by_id(template_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"ProcessTemplate {template_id} not found",
+            )
+        job = bulk_job_registry.create(
+            "template_apply", owner_id=admin.id, total=len(set(dto.project_ids)),
+        )
+        background_tasks.add_task(_run_apply_template_job, job.job_id, template_id, dto)
+        accepted = BulkJobAcceptedDTO(
+            job_id=job.job_id,
+            total=job.total,
+            status_url=f"/api/v1/process-templates/apply-jobs/{job.job_id}",
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=accepted.model_dump(),
+            background=background_tasks,
+        )
+
+    uc = _apply_template_use_case(project_repo, template_repo)
     try:
         return await uc.execute(template_id, dto.project_ids, dto.require_pm_approval)
     except DomainError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get("/apply-jobs/{job_id}", response_model=BulkJobStatusDTO)
+async def get_apply_job(
+    job_id: str,
+    admin: User = Depends(require_permission("admin.access")),
+):
+    """Progress of a background template apply. Only the admin who started
+    it can see it; unknown, expired and foreign jobs are all 404."""
+    job = bulk_job_registry.get(job_id)
+    if job is None or job.owner_id != admin.id or job.kind != "template_apply":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Template apply job {job_id} not found",
+        )
+    return BulkJobStatusDTO(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        result=job.result,
+        error=job.error,
+    )
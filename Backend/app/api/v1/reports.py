@@ -1,8 +1,9 @@
 import io
 import logging
+import tempfile
 from datetime import date as date_type, datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from pathlib import Path
 
@@ -14,7 +15,11 @@ from app.api.dependencies import (
     get_report_repo,
     _is_admin,
 )
+from app.api.deps.report import report_repo_scope
+from app.api.query_budget import query_budget
+from app.api.streaming_export import ExportFormat, decode_cursor, export_response
 from app.application.dtos.report_dtos import (
+    TaskExportRow,
     SummaryDTO,
     BurndownDTO,
     VelocityDTO,
@@ -35,6 +40,19 @@ from app.infrastructure.pdf.unicode_font import find_unicode_font, to_ascii
 
 router = APIRouter()
 
+# Excel exports larger than this are spooled to a temporary file.
+_EXPORT_SPOOL_BYTES = 8 * 1024 * 1024
+_EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _file_chunks(fh):
+    """Yield a binary file in fixed-size chunks, closing it at the end."""
+    try:
+        while chunk := fh.read(_EXPORT_CHUNK_BYTES):
+            yield chunk
+    finally:
+        fh.close()
+
 
 def _parse_assignee_ids(assignee_ids: Optional[str]) -> Optional[List[int]]:
     """Parse comma-separated assignee IDs string into a list of ints.
@@ -156,6 +174,7 @@ async def get_distribution(
 
 
 @router.get("/performance", response_model=PerformanceDTO)
+@query_budget(10)
 async def get_performance(
     project_id: int,
     assignee_ids: Optional[str] = Query(None),
@@ -190,7 +209,8 @@ async def export_pdf(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
         parsed_ids = _parse_assignee_ids(assignee_ids)
-        tasks = await report_repo.get_tasks_for_export(project_id, parsed_ids, date_from, date_to)
+        # Rows are written as the cursor yields them — no list of DTOs.
+        tasks = report_repo.stream_tasks_for_export(project_id, parsed_ids, date_from, date_to)
 
         filter_parts = []
         if parsed_ids:
@@ -271,7 +291,7 @@ async def export_pdf(
         pdf.set_text_color(0, 0, 0)
         pdf.set_font(fn, size=8)
         alt = False
-        for task in tasks:
+        async for task in tasks:
             pdf.set_fill_color(248, 248, 248) if alt else pdf.set_fill_color(255, 255, 255)
             row_vals = [
                 _task_code(task),
@@ -326,19 +346,22 @@ async def export_excel(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
         parsed_ids = _parse_assignee_ids(assignee_ids)
-        tasks = await report_repo.get_tasks_for_export(project_id, parsed_ids, date_from, date_to)
+        tasks = report_repo.stream_tasks_for_export(project_id, parsed_ids, date_from, date_to)
 
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.worksheet.worksheet import Worksheet
 
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "SPMS Raporu"
+        # Write-only workbook: rows go straight to the sheet XML as the
+        # cursor yields them instead of building an in-memory cell grid.
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("SPMS Raporu")
 
         # Print settings: landscape A4, fit all columns on one page width
-        ws.page_setup.orientation = ws.ORIENTATION_LANDSCAPE
-        ws.page_setup.paperSize = ws.PAPERSIZE_A4
-        ws.page_setup.fitToPage = True
+        ws.page_setup.orientation = Worksheet.ORIENTATION_LANDSCAPE
+        ws.page_setup.paperSize = Worksheet.PAPERSIZE_A4
+        ws.sheet_properties.pageSetUpPr.fitToPage = True
         ws.page_setup.fitToWidth = 1
         ws.page_setup.fitToHeight = 0
 
@@ -350,14 +373,17 @@ async def export_excel(
                    "Sprint", "Puan", "Olusturulma", "Bitis", "Guncelleme", "Raporlayan"]
         col_widths = [12, 38, 14, 22, 12, 18, 7, 16, 14, 16, 20]
 
+        header_cells = []
         for col_idx, (header, width) in enumerate(zip(headers, col_widths), 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
+            cell = WriteOnlyCell(ws, value=header)
             cell.fill = header_fill
             cell.font = header_font
             cell.alignment = header_alignment
+            header_cells.append(cell)
             ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = width
 
         ws.row_dimensions[1].height = 20
+        ws.append(header_cells)
 
         # Same task_key fallback as PDF — see _task_code in the PDF export
         # endpoint above. Mirrored verbatim here so Excel doesn't render
@@ -375,7 +401,13 @@ async def export_excel(
             return ""
 
         data_alignment = Alignment(horizontal="left", vertical="center")
-        for row_idx, task in enumerate(tasks, 2):
+
+        def _cell(value):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.alignment = data_alignment
+            return cell
+
+        async for task in tasks:
             row_data = [
                 _excel_task_code(task),
                 task.title,
@@ -389,11 +421,10 @@ async def export_excel(
                 task.updated_at.strftime("%Y-%m-%d") if task.updated_at else "",
                 task.reporter or "",
             ]
-            ws.append(row_data)
-            for col_idx in range(1, len(row_data) + 1):
-                ws.cell(row=row_idx, column=col_idx).alignment = data_alignment
+            ws.append([_cell(v) for v in row_data])
 
-        buffer = io.BytesIO()
+        # Large workbooks spill to disk instead of being held as one buffer.
+        buffer = tempfile.SpooledTemporaryFile(max_size=_EXPORT_SPOOL_BYTES)
         wb.save(buffer)
         buffer.seek(0)
 
@@ -401,7 +432,7 @@ async def export_excel(
         filename = f"SPMS_Report_{project_key}_{date_type.today()}.xlsx"
 
         return StreamingResponse(
-            buffer,
+            _file_chunks(buffer),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f'attachment; filename="{filename}"'},
         )
@@ -413,3 +444,38 @@ async def export_excel(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Excel olusturulamadi: {type(exc).__name__}: {exc}",
         )
+
+
+@router.get("/export/tasks.{fmt}")
+async def export_tasks_stream(
+    fmt: ExportFormat,
+    request: Request,
+    project_id: int,
+    assignee_ids: Optional[str] = Query(None),
+    date_from: Optional[date_type] = Query(None),
+    date_to: Optional[date_type] = Query(None),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user),
+    project_repo: IProjectRepository = Depends(get_project_repo),
+):
+    """Raw task rows as CSV / NDJSON, newest first, streamed off a cursor.
+
+    Same filters and access check as the Excel / PDF exports. ``cursor``
+    resumes an interrupted download after the last row received.
+    """
+    await _ensure_project_access(project_id, current_user, project_repo)
+    parsed_ids = _parse_assignee_ids(assignee_ids)
+    after = decode_cursor(cursor)
+
+    async def rows():
+        async with report_repo_scope() as repo:
+            async for task in repo.stream_tasks_for_export(
+                project_id, parsed_ids, date_from, date_to, after=after
+            ):
+                yield task._asdict()
+
+    return export_response(
+        request, rows(), fmt=fmt, columns=TaskExportRow._fields,
+        cursor_of=lambda row: (row["created_at"], row["task_id"]),
+        filename=f"tasks-{project_id}", resumed=after is not None,
+    )
@@ -0,0 +1,41 @@
+"""Global search router — GET /search.
+
+Ranked search across tasks, projects and comments backed by the pg_trgm /
+full-text indexes of alembic 019. Any authenticated user may call it; the use
+case scopes results to the caller's projects (admins see everything).
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps.auth import get_current_user, _is_admin
+from app.api.deps.project import get_project_repo
+from app.api.deps.search import get_search_repo
+from app.application.dtos.search_dtos import SearchKind, SearchResponseDTO
+from app.application.use_cases.global_search import GlobalSearchUseCase
+from app.domain.entities.user import User
+from app.domain.repositories.project_repository import IProjectRepository
+from app.domain.repositories.search_repository import ISearchRepository
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=SearchResponseDTO)
+async def global_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[List[SearchKind]] = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=50),
+    search_repo: ISearchRepository = Depends(get_search_repo),
+    project_repo: IProjectRepository = Depends(get_project_repo),
+    current_user: User = Depends(get_current_user),
+):
+    """``types`` may repeat (``?types=task&types=comment``); default is all
+    kinds. Highlights are ``[start, end)`` offsets into title / snippet."""
+    use_case = GlobalSearchUseCase(search_repo, project_repo)
+    return await use_case.execute(
+        query=q,
+        user_id=current_user.id,  # type: ignore
+        is_admin=_is_admin(current_user),
+        kinds=types,
+        limit=limit,
+    )
@@ -1,6 +1,6 @@
 import asyncio
 from typing import List, Any, Dict
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select as sa_select, text
 from app.api.dependencies import (
@@ -13,20 +13,27 @@ from app.api.dependencies import (
     get_audit_repo,
     get_dependency_repo,
     get_notification_service,
+    get_bulk_task_notifier,
     get_user_repo,
     get_notification_preference_repo,
+    project_etag,
 )
 from app.api.deps.auth import require_permission, _is_admin  # Phase 15 D-1.4 / D-1.14 — perm DSL tier 1
+from app.api.fast_json import fast_json
+from app.api.query_budget import query_budget
 from app.domain.repositories.user_repository import IUserRepository
 from app.domain.repositories.notification_preference_repository import INotificationPreferenceRepository
 from app.infrastructure.email.email_service import send_notification_email
 from app.application.dtos.task_dtos import (
     TaskCreateDTO,
     TaskUpdateDTO,
+    BulkTaskUpdateDTO,
     TaskResponseDTO,
     TaskDependencyCreateDTO,
     TaskDependencySummaryDTO,
     PaginatedResponse,
+    SubtaskNodeDTO,
+    SubtaskRollupDTO,
 )
 from app.application.use_cases.manage_tasks import (
     CreateTaskUseCase,
@@ -35,7 +42,12 @@ from app.application.use_cases.manage_tasks import (
     ListBacklogTasksUseCase,
     ListMyTasksUseCase,
     GetTaskUseCase,
+    GetTaskSubtreeUseCase,
+    GetSubtaskSummaryUseCase,
+    SUBTREE_DEFAULT_DEPTH,
+    SUBTREE_MAX_DEPTH,
     UpdateTaskUseCase,
+    BulkUpdateTasksUseCase,
     DeleteTaskUseCase,
     SearchSimilarTasksUseCase,
     GlobalTaskSearchUseCase,
@@ -45,7 +57,8 @@ from app.application.use_cases.manage_task_dependencies import (
     RemoveDependencyUseCase,
     ListDependenciesUseCase,
 )
-from app.application.services.notification_service import PollingNotificationService
+from app.application.services.bulk_task_notifier import BulkTaskNotifier
+from app.application.services.notification_service import PollingNotificationService, PendingNotification
 from app.domain.entities.notification import NotificationType
 from app.domain.repositories.task_repository import ITaskRepository
 from app.domain.repositories.project_repository import IProjectRepository
@@ -54,6 +67,7 @@ from app.domain.entities.user import User
 from app.domain.exceptions import (
     TaskNotFoundError,
     ProjectNotFoundError,
+    ProjectAccessDeniedError,
     DependencyAlreadyExistsError,
     InvalidColumnMoveError,
     WipLimitExceededError,
@@ -88,6 +102,55 @@ async def create_task(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+@router.post("/bulk", response_model=List[TaskResponseDTO])
+async def bulk_update_tasks(
+    dto: BulkTaskUpdateDTO,
+    _perm: User = Depends(require_permission("task.change_status")),  # same gate as PUT/PATCH
+    task_repo: ITaskRepository = Depends(get_task_repo),
+    project_repo: IProjectRepository = Depends(get_project_repo),
+    current_user: User = Depends(get_current_user),
+    notifier: BulkTaskNotifier = Depends(get_bulk_task_notifier),
+):
+    """Apply many task updates in ONE transaction (all or nothing).
+
+    Same validation and error contract as PUT /tasks/{id} (404 / 403 / 400
+    INVALID_COLUMN_MOVE / 409 WIP_LIMIT_EXCEEDED); the first violation rejects
+    the whole batch. Notifications are collected and written with a single
+    insert, assignment e-mails go out once per assignee and integration events
+    once per project instead of once per task (BulkTaskNotifier).
+    """
+    try:
+        use_case = BulkUpdateTasksUseCase(task_repo, project_repo, notifier=notifier)
+        updated_tasks = await use_case.execute(
+            dto, current_user.id, is_admin=_is_admin(current_user), actor=current_user,  # type: ignore
+        )
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ProjectAccessDeniedError:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied to this project")
+    except InvalidColumnMoveError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
+            "error_code": "INVALID_COLUMN_MOVE",
+            "from_column_id": e.from_id,
+            "to_column_id": e.to_id,
+            "reason": e.reason,
+        })
+    except WipLimitExceededError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail={
+            "error_code": "WIP_LIMIT_EXCEEDED",
+            "column_id": e.column_id,
+            "column_name": e.column_name,
+            "limit": e.limit,
+            "current": e.current,
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return updated_tasks
+
+
 @router.get("/", response_model=List[TaskResponseDTO])
 async def list_tasks(
     assignee_id: int = Query(..., ge=1, description="Filter tasks by assignee user_id (Phase 13 D-C4 — profile Tasks tab)"),
@@ -99,8 +162,11 @@ async def list_tasks(
 
 
 @router.get("/project/{project_id}", response_model=PaginatedResponse)
+@query_budget(10)
 async def list_project_tasks(
     project_id: int,
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     phase_id: str = Query(default=None, description="API-05: filter tasks by phase_id (nd_xxx)"),
@@ -108,20 +174,40 @@ async def list_project_tasks(
     exclude_done: bool = Query(default=False, description="Backlog: exclude completed tasks"),
     task_repo: ITaskRepository = Depends(get_task_repo),
     current_user: User = Depends(get_project_member),
+    _etag=Depends(project_etag),
 ):
+    # Backlog and phase lists return every matching task (thousands on large
+    # projects) — serialized via the fast JSON path, see app/api/fast_json.py.
     # Backlog filter: when either backlog param is set, use the backlog use case
     if no_sprint or exclude_done:
         use_case = ListBacklogTasksUseCase(task_repo)
         items = await use_case.execute(project_id, no_sprint=no_sprint, exclude_done=exclude_done)
-        return PaginatedResponse(items=items, total=len(items), page=1, page_size=len(items))
+        result = PaginatedResponse(items=items, total=len(items), page=1, page_size=len(items))
+        return fast_json(request, result, items_key="items", inherit=response)
     # API-05: if phase_id provided, use the phase-aware query
     if phase_id is not None:
         from app.application.use_cases.manage_tasks import map_task_to_response_dto
         items = await task_repo.list_by_project_and_phase(project_id, phase_id)
         task_dtos = [map_task_to_response_dto(t) for t in items]
-        return PaginatedResponse(items=task_dtos, total=len(task_dtos), page=page, page_size=page_size)
+        result = PaginatedResponse(items=task_dtos, total=len(task_dtos), page=page, page_size=page_size)
+        return fast_json(request, result, items_key="items", inherit=response)
     use_case = ListProjectTasksPaginatedUseCase(task_repo)
-    return await use_case.execute(project_id, page, page_size)
+    result = await use_case.execute(project_id, page, page_size)
+    return fast_json(request, result, items_key="items", inherit=response)
+
+@router.get("/project/{project_id}/subtask-summary", response_model=List[SubtaskRollupDTO])
+@query_budget(8)
+async def get_subtask_summary(
+    project_id: int,
+    parent_ids: List[int] = Query(..., min_length=1, max_length=200),
+    depth: int = Query(SUBTREE_DEFAULT_DEPTH, ge=1, le=SUBTREE_MAX_DEPTH),
+    task_repo: ITaskRepository = Depends(get_task_repo),
+    current_user: User = Depends(get_project_member),
+):
+    """Subtask counts and done ratio for a page of list rows
+    (``?parent_ids=1&parent_ids=2``), one recursive query for all of them."""
+    use_case = GetSubtaskSummaryUseCase(task_repo)
+    return await use_case.execute(project_id, parent_ids, depth)
 
 @router.get("/my-tasks", response_model=List[TaskResponseDTO])
 async def list_my_tasks(
@@ -202,7 +288,50 @@ async def get_task(
     except TaskNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+@router.get("/{task_id}/subtree", response_model=SubtaskNodeDTO)
+@query_budget(10)
+async def get_task_subtree(
+    task_id: int,
+    depth: int = Query(SUBTREE_DEFAULT_DEPTH, ge=1, le=SUBTREE_MAX_DEPTH),
+    task_repo: ITaskRepository = Depends(get_task_repo),
+    current_user: User = Depends(get_task_project_member),
+):
+    """The task and its subtasks down to ``depth`` levels, nested."""
+    try:
+        use_case = GetTaskSubtreeUseCase(task_repo)
+        return await use_case.execute(task_id, depth)
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+async def _notify_status_change(session, notif_service, task, actor_id: int) -> None:
+    """Assignee + watchers of a moved task, as one ``notify_many`` batch.
+
+    Per-recipient ``notify`` cost two queries and a commit per watcher; the
+    assignee is notified once even when they also watch the task.
+    """
+    result = await session.execute(
+        sa_select(TaskWatcherModel.user_id).where(TaskWatcherModel.task_id == task.id)
+    )
+    recipients = set(result.scalars().all())
+    if task.assignee_id:
+        recipients.add(task.assignee_id)
+    recipients.discard(actor_id)
+    await notif_service.notify_many([
+        PendingNotification(
+            user_id=uid,
+            type=NotificationType.STATUS_CHANGE,
+            message=f"'{task.title}' görevinin durumu değiştirildi",
+            related_entity_id=task.id,
+            related_entity_type="task",
+            actor_id=actor_id,
+        )
+        for uid in sorted(recipients)
+    ])
+
+
 @router.put("/{task_id}", response_model=TaskResponseDTO)
+@query_budget(30)
 async def update_task(
     task_id: int,
     dto: TaskUpdateDTO,
@@ -285,30 +414,7 @@ async def update_task(
     # PATCH/PUT and produced a 500 with no CORS headers, which surfaced as a
     # cryptic "blocked by CORS policy" in the browser.
     if dto.column_id is not None:
-        if updated_task.assignee_id and updated_task.assignee_id != current_user.id:
-            await notif_service.notify(
-                user_id=updated_task.assignee_id,
-                type=NotificationType.STATUS_CHANGE,
-                message=f"'{updated_task.title}' görevinin durumu değiştirildi",
-                related_entity_id=updated_task.id,
-                related_entity_type="task",
-                actor_id=current_user.id,
-            )
-        # Notify watchers for status change
-        result = await session.execute(
-            sa_select(TaskWatcherModel).where(TaskWatcherModel.task_id == task_id)
-        )
-        watchers = result.scalars().all()
-        for w in watchers:
-            if w.user_id != current_user.id:
-                await notif_service.notify(
-                    user_id=w.user_id,
-                    type=NotificationType.STATUS_CHANGE,
-                    message=f"'{updated_task.title}' görevinin durumu değiştirildi",
-                    related_entity_id=updated_task.id,
-                    related_entity_type="task",
-                    actor_id=current_user.id,
-                )
+        await _notify_status_change(session, notif_service, updated_task, current_user.id)
 
     # Integration event: task.status_changed (EXT-01, D-16)
     if dto.column_id is not None:
@@ -353,6 +459,7 @@ async def update_task(
     return updated_task
 
 @router.patch("/{task_id}", response_model=TaskResponseDTO)
+@query_budget(30)
 async def patch_task(
     task_id: int,
     dto: TaskUpdateDTO,
@@ -430,30 +537,7 @@ async def patch_task(
     # PATCH/PUT and produced a 500 with no CORS headers, which surfaced as a
     # cryptic "blocked by CORS policy" in the browser.
     if dto.column_id is not None:
-        if updated_task.assignee_id and updated_task.assignee_id != current_user.id:
-            await notif_service.notify(
-                user_id=updated_task.assignee_id,
-                type=NotificationType.STATUS_CHANGE,
-                message=f"'{updated_task.title}' görevinin durumu değiştirildi",
-                related_entity_id=updated_task.id,
-                related_entity_type="task",
-                actor_id=current_user.id,
-            )
-        # Notify watchers for status change
-        result = await session.execute(
-            sa_select(TaskWatcherModel).where(TaskWatcherModel.task_id == task_id)
-        )
-        watchers = result.scalars().all()
-        for w in watchers:
-            if w.user_id != current_user.id:
-                await notif_service.notify(
-                    user_id=w.user_id,
-                    type=NotificationType.STATUS_CHANGE,
-                    message=f"'{updated_task.title}' görevinin durumu değiştirildi",
-                    related_entity_id=updated_task.id,
-                    related_entity_type="task",
-                    actor_id=current_user.id,
-                )
+        await _notify_status_change(session, notif_service, updated_task, current_user.id)
 
     # Integration event: task.status_changed (EXT-01, D-16)
     if dto.column_id is not None:
@@ -33,6 +33,7 @@ from app.application.dtos.team_dtos import (
 from app.application.dtos.auth_dtos import UserListDTO
 from app.api.dependencies import get_current_user, get_user_repo, get_team_repo
 from app.api.deps.auth import require_admin, require_admin_or_project_manager
+from app.api.query_budget import query_budget
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
@@ -252,6 +253,7 @@ async def set_team_leader(
 # ---------------------------------------------------------------
 
 @router.get("/{team_id}/projects", response_model=List[TeamProjectDTO])
+@query_budget(8)
 async def get_team_projects(
     team_id: int,
     current_user: User = Depends(get_current_user),
@@ -10,6 +10,7 @@ from app.api.deps.project import get_project_repo
 from app.api.deps.audit import get_audit_repo
 from app.api.deps.task import get_task_repo
 from app.api.deps.team import get_team_repo
+from app.api.deps.parallel import get_query_executor
 from app.application.use_cases.get_user_summary import GetUserSummaryUseCase
 from app.application.use_cases.manage_teams import GetLedTeamsUseCase
 from app.application.use_cases.get_user_activity import GetUserActivityUseCase
@@ -44,13 +45,15 @@ async def get_user_summary(
     project_repo=Depends(get_project_repo),
     audit_repo=Depends(get_audit_repo),
     task_repo=Depends(get_task_repo),
+    executor=Depends(get_query_executor),
 ) -> UserSummaryResponseDTO:
-    """D-48 / D-49: user stats + projects + recent activity via asyncio.gather.
+    """D-48 / D-49: user stats + projects + recent activity, read concurrently
+    on per-branch sessions (ParallelQueryExecutor).
 
     Authorization: any authenticated user (T-09-09-02 accepted — admin/self use only;
     hardening deferred per SUMMARY.md).
     """
-    uc = GetUserSummaryUseCase(user_repo, project_repo, audit_repo, task_repo)
+    uc = GetUserSummaryUseCase(user_repo, project_repo, audit_repo, task_repo, executor=executor)
     return await uc.execute(user_id=user_id, include_archived=include_archived)
 
 
@@ -65,6 +65,29 @@ class BulkInviteResponseDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BulkJobAcceptedDTO(BaseModel):
+    """202 body for ``?background=true`` bulk requests — poll ``status_url``."""
+    job_id: str
+    total: int
+    status_url: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BulkJobStatusDTO(BaseModel):
+    """GET /admin/users/bulk-jobs/{job_id}. ``result`` is the same payload the
+    synchronous endpoint returns, present once ``status == 'completed'``."""
+    job_id: str
+    kind: str
+    status: Literal["running", "completed", "failed"]
+    total: int
+    processed: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class RoleChangeRequestDTO(BaseModel):
     """PATCH /admin/users/{id}/role body.
 
@@ -83,8 +106,9 @@ class RoleChangeRequestDTO(BaseModel):
 
 
 class BulkActionRequestDTO(BaseModel):
-    """POST /admin/users/bulk-action body — D-B7. Per-user transaction; audit
-    row written per user (NOT per batch)."""
+    """POST /admin/users/bulk-action body — D-B7. Users that fail validation
+    are skipped individually; the rest are written set-based in one
+    transaction. Audit row written per user (NOT per batch)."""
     user_ids: List[int] = Field(default_factory=list, max_length=500)
     action: Literal["deactivate", "activate", "role_change"]
     payload: Optional[Dict[str, Any]] = None  # e.g., {"role": "Member"} for role_change
@@ -16,7 +16,9 @@ class BoardColumnDTO(BaseModel):
     name: str
     order_index: int
     wip_limit: int = 0
-    task_count: int = 0  # computed from repo.count_tasks
+    task_count: int = 0  # BoardColumn.task_count (maintained counter)
+    # task_count / wip_limit; None when the column has no WIP limit (0).
+    wip_utilization: Optional[float] = None
 
     # Phase 17 — workflow engine fields (defaults match BoardColumn entity).
     category: ColumnCategory = "todo"
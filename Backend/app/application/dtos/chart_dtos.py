@@ -5,7 +5,7 @@ DTO shapes. snake_case fields per Phase 9 D-46 convention; the Frontend2
 chart-service layer maps to camelCase before consumers see them.
 """
 from pydantic import BaseModel, ConfigDict
-from typing import List
+from typing import List, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -155,3 +155,25 @@ class PhaseProgressResponseDTO(BaseModel):
     phases: List[PhaseProgressEntryDTO]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ---------------------------------------------------------------------------
+# Chart bundle — capabilities + requested chart payloads in one response
+# ---------------------------------------------------------------------------
+#
+# ``GET /api/v1/projects/{id}/charts/bundle?charts=cfd,iteration`` lets the
+# reports page render from one round trip. A chart field is filled only when
+# it was requested AND its capability flag is true; otherwise it is null and
+# the FE shows the capability gate exactly as with the separate endpoints.
+
+
+class ChartBundleResponseDTO(BaseModel):
+    """Capability flags plus the payload of every requested, enabled chart."""
+
+    capabilities: ChartCapabilitiesResponseDTO
+    cfd: Optional[CFDResponseDTO] = None
+    lead_cycle: Optional[LeadCycleResponseDTO] = None
+    iteration: Optional[IterationResponseDTO] = None
+    phase_progress: Optional[PhaseProgressResponseDTO] = None
+
+    model_config = ConfigDict(from_attributes=True)
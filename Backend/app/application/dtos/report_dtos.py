@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 from datetime import date, datetime
 
 
@@ -89,3 +89,23 @@ class TaskExportRowDTO(BaseModel):
     due_date: Optional[datetime]
     updated_at: Optional[datetime]
     reporter: Optional[str]  # full_name
+
+
+class TaskExportRow(NamedTuple):
+    """Streaming twin of :class:`TaskExportRowDTO`: same fields, plain tuple.
+
+    ``stream_tasks_for_export`` yields these so a large export does not pay
+    for one validated Pydantic object per task.
+    """
+    task_id: Optional[int]
+    task_key: Optional[str]
+    title: str
+    status: Optional[str]
+    assignee: Optional[str]
+    priority: Optional[str]
+    sprint: Optional[str]
+    points: Optional[int]
+    created_at: Optional[datetime]
+    due_date: Optional[datetime]
+    updated_at: Optional[datetime]
+    reporter: Optional[str]
@@ -0,0 +1,46 @@
+"""Global search DTOs (GET /search).
+
+``SearchHitDTO`` is what the repository returns (raw text + rank);
+``SearchResultDTO`` is the API shape with highlight spans. Highlights are
+``[start, end)`` character offsets into ``title`` / ``snippet`` rather than
+pre-rendered markup, so the frontend never has to inject HTML.
+"""
+from typing import List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+
+SearchKind = Literal["task", "project", "comment"]
+
+
+class SearchHitDTO(BaseModel):
+    kind: SearchKind
+    id: int
+    title: str
+    body: Optional[str] = None  # description / comment text the snippet is cut from
+    project_id: int
+    project_key: Optional[str] = None
+    task_id: Optional[int] = None
+    task_key: Optional[str] = None
+    score: float = 0.0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SearchResultDTO(BaseModel):
+    kind: SearchKind
+    id: int
+    title: str
+    title_highlights: List[Tuple[int, int]] = []
+    snippet: Optional[str] = None
+    snippet_highlights: List[Tuple[int, int]] = []
+    project_id: int
+    project_key: Optional[str] = None
+    task_id: Optional[int] = None
+    task_key: Optional[str] = None
+    score: float = 0.0
+
+
+class SearchResponseDTO(BaseModel):
+    query: str
+    results: List[SearchResultDTO]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Generic, TypeVar
 from datetime import datetime
 from app.domain.entities.task import TaskPriority
@@ -44,6 +44,29 @@ class SubTaskSummaryDTO(BaseModel):
     priority: TaskPriority
     model_config = ConfigDict(from_attributes=True)
 
+
+class SubtaskNodeDTO(BaseModel):
+    """One node of GET /tasks/{id}/subtree; ``subtasks`` nest down to the requested depth."""
+    id: int
+    title: str
+    key: str
+    status: str
+    is_done: bool
+    priority: TaskPriority
+    points: Optional[int] = None
+    assignee_id: Optional[int] = None
+    parent_task_id: Optional[int] = None
+    subtasks: List["SubtaskNodeDTO"] = []
+
+
+class SubtaskRollupDTO(BaseModel):
+    """Subtask counts of one parent for list views (GET /tasks/project/{id}/subtask-summary)."""
+    parent_id: int
+    children: int = 0  # direct subtasks
+    total: int = 0  # every descendant within the depth
+    done: int = 0
+    done_ratio: float = 0.0
+
 class TaskCreateDTO(BaseModel):
     title: str
     description: Optional[str] = None
@@ -76,6 +99,15 @@ class TaskUpdateDTO(BaseModel):
     reporter_id: Optional[int] = None
     parent_task_id: Optional[int] = None
 
+class BulkTaskUpdateItemDTO(BaseModel):
+    task_id: int
+    changes: TaskUpdateDTO
+
+class BulkTaskUpdateDTO(BaseModel):
+    """POST /tasks/bulk — every item is applied in one transaction (all or nothing).
+    Cap mirrors the admin bulk endpoints (500 rows)."""
+    updates: List[BulkTaskUpdateItemDTO] = Field(min_length=1, max_length=500)
+
 class TaskResponseDTO(BaseModel):
     id: int
     title: str
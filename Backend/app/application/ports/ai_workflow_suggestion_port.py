@@ -9,7 +9,7 @@ Plan reference: .planning/ai-workflow-generator-plan.md §4.2.1
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional, Union
 
 from app.application.dtos.ai_workflow_dto import (
     LifecycleFormDTO,
@@ -46,3 +46,16 @@ class IAIWorkflowSuggestionPort(ABC):
     ) -> AsyncIterator[WorkflowEventDTO]:
         """Stream events for task status workflow generation."""
         ...
+
+    def cache_key(
+        self,
+        form: Union[LifecycleFormDTO, TaskStatusFormDTO],
+        language: str,
+    ) -> Optional[str]:
+        """Content key under which this provider caches / coalesces the form.
+
+        None (the default) = every request reaches the provider. The HTTP
+        layer uses the key to skip the project-day quota for requests the
+        provider will answer from cache or from an in-flight generation.
+        """
+        return None
@@ -0,0 +1,148 @@
+"""Content-addressed cache + request coalescing for AI workflow generation.
+
+A generation is keyed by a SHA-256 of the canonical form (validated DTO
+fields, sorted-key JSON, defaults dropped so new optional fields don't
+invalidate old entries), the form kind, the language and the provider
+model. Two layers:
+
+- ``lookup`` / ``store``: the validated suggestion, kept ``TTL_SECONDS``
+  and bounded to ``MAX_ENTRIES`` (least recently used evicted). The
+  adapter replays a hit through its own event pacing — no provider call,
+  no project quota.
+- ``shared_stream``: concurrent requests for a key that is not cached yet
+  share ONE producer. The first caller starts it as a task; every caller
+  (including late joiners, who first get the events already published)
+  reads the same event sequence. The producer runs to completion even if
+  its first caller disconnects, so the quota it spent still fills the cache.
+
+Caveat: in-memory only; clears on app restart; does NOT cross
+process/worker boundaries (same trade-off as idempotency_cache).
+"""
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+TTL_SECONDS = 6 * 3600
+MAX_ENTRIES = 256
+
+# Bump when prompt builders / validators change what a form produces.
+KEY_VERSION = 1
+
+_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+
+class _Flight:
+    """One in-progress producer and the events it has published so far."""
+
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+        self.finished = False
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def publish(self, event: Any) -> None:
+        self.events.append(event)
+        self._wake()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.finished = True
+        self.error = error
+        self._wake()
+
+    def _wake(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self) -> None:
+        await self._changed.wait()
+
+
+_in_flight: Dict[str, _Flight] = {}
+
+
+def make_key(form: BaseModel, language: str, model: str) -> str:
+    canonical = json.dumps(
+        {
+            "v": KEY_VERSION,
+            "kind": type(form).__name__,
+            "form": form.model_dump(mode="json", exclude_defaults=True),
+            "language": language,
+            "model": model,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Optional[Any]:
+    """Return the cached suggestion for ``key`` if still within TTL."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    if monotonic() - entry[0] > TTL_SECONDS:
+        _cache.pop(key, None)
+        return None
+    _cache.move_to_end(key)
+    return entry[1]
+
+
+def store(key: str, value: Any) -> None:
+    _cache[key] = (monotonic(), value)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def is_served(key: Optional[str]) -> bool:
+    """True when a request for ``key`` will not reach the provider (hit or in flight)."""
+    if key is None:
+        return False
+    return key in _in_flight or lookup(key) is not None
+
+
+async def _pump(key: str, flight: _Flight, events: AsyncIterator[Any]) -> None:
+    error: Optional[BaseException] = None
+    try:
+        async for event in events:
+            flight.publish(event)
+    except Exception as e:  # noqa: BLE001 — re-raised in every subscriber
+        error = e
+    finally:
+        _in_flight.pop(key, None)
+        flight.finish(error)
+
+
+async def shared_stream(
+    key: str, produce: Callable[[], AsyncIterator[Any]],
+) -> AsyncIterator[Any]:
+    """Yield ``produce()``'s events, running it once for all concurrent callers."""
+    flight = _in_flight.get(key)
+    if flight is None:
+        flight = _Flight()
+        _in_flight[key] = flight
+        flight.task = asyncio.create_task(_pump(key, flight, produce()))
+    seen = 0
+    while True:
+        while seen < len(flight.events):
+            yield flight.events[seen]
+            seen += 1
+        if flight.finished:
+            if flight.error is not None:
+                raise flight.error
+            return
+        await flight.wait()
+
+
+def reset_for_tests() -> None:
+    """Test hook: clear the cache and forget in-flight producers. Never call from production code."""
+    _cache.clear()
+    _in_flight.clear()
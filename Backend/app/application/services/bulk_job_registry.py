@@ -0,0 +1,80 @@
+"""In-memory progress registry for long-running admin bulk operations.
+
+POST /admin/users/bulk-invite?background=true returns 202 + a job id right
+away; the batch runs after the response and reports progress here, and
+GET /admin/users/bulk-jobs/{job_id} polls it. Finished jobs are kept for
+TTL_MINUTES so a slow poller still sees the result.
+
+Caveat: in-memory only; clears on app restart; does NOT cross process/worker
+boundaries (same trade-off as idempotency_cache) — the poll must reach the
+worker that accepted the job.
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+
+TTL_MINUTES = 30
+
+
+@dataclass
+class BulkJob:
+    job_id: str
+    kind: str
+    owner_id: int
+    total: int
+    processed: int = 0
+    status: str = "running"  # running | completed | failed
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+
+_jobs: dict[str, BulkJob] = {}
+
+
+def _purge_expired() -> None:
+    cutoff = datetime.utcnow() - timedelta(minutes=TTL_MINUTES)
+    for job_id in [j.job_id for j in _jobs.values() if j.status != "running" and j.updated_at < cutoff]:
+        _jobs.pop(job_id, None)
+
+
+def create(kind: str, owner_id: int, total: int) -> BulkJob:
+    _purge_expired()
+    job = BulkJob(job_id=uuid.uuid4().hex, kind=kind, owner_id=owner_id, total=total)
+    _jobs[job.job_id] = job
+    return job
+
+
+def get(job_id: str) -> Optional[BulkJob]:
+    return _jobs.get(job_id)
+
+
+def report_progress(job_id: str, processed: int) -> None:
+    job = _jobs.get(job_id)
+    if job is not None:
+        job.processed = processed
+        job.updated_at = datetime.utcnow()
+
+
+def complete(job_id: str, result: Any) -> None:
+    job = _jobs.get(job_id)
+    if job is not None:
+        job.status = "completed"
+        job.processed = job.total
+        job.result = result
+        job.updated_at = datetime.utcnow()
+
+
+def fail(job_id: str, error: str) -> None:
+    job = _jobs.get(job_id)
+    if job is not None:
+        job.status = "failed"
+        job.error = error
+        job.updated_at = datetime.utcnow()
+
+
+def reset_for_tests() -> None:
+    """Test hook: clear the registry. Never call from production code."""
+    _jobs.clear()
@@ -0,0 +1,157 @@
+"""Notifications, assignment e-mails and integration events after POST /tasks/bulk.
+
+Batched counterpart of the per-task notifications in the PUT / PATCH routes:
+
+- in-app notifications (assignments + status changes to assignee and
+  watchers) are collected and written with one ``notify_many``;
+- the watchers of every moved task come from ONE lookup;
+- assignment e-mail goes out once per assignee, listing all their tasks;
+- integration events fire once per project and event type, not per task.
+
+Status changes are conveyed via ``column_id`` (a column IS a status bucket).
+
+DIP — the watcher lookup, the e-mail sender and the integration-event firer
+are infrastructure; the router injects them as callables. No infrastructure
+imports here.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.application.dtos.task_dtos import TaskResponseDTO, TaskUpdateDTO
+from app.application.services.notification_service import INotificationService, PendingNotification
+from app.domain.entities.notification import NotificationType
+from app.domain.entities.user import User
+from app.domain.repositories.notification_preference_repository import INotificationPreferenceRepository
+from app.domain.repositories.project_repository import IProjectRepository
+from app.domain.repositories.user_repository import IUserRepository
+
+# task ids -> {task_id: [watcher user ids]}
+WatchersLookup = Callable[[List[int]], Awaitable[Dict[int, List[int]]]]
+# (to_email, subject, template_name, body)
+EmailSender = Callable[[str, str, str, Dict[str, Any]], Awaitable[None]]
+# (process_config, event_type, payload) — fire-and-forget, never raises
+EventFirer = Callable[[Optional[Dict[str, Any]], str, Dict[str, Any]], Awaitable[None]]
+
+
+class BulkTaskNotifier:
+    def __init__(
+        self,
+        notification_service: INotificationService,
+        user_repo: IUserRepository,
+        pref_repo: INotificationPreferenceRepository,
+        project_repo: IProjectRepository,
+        *,
+        watchers_of: WatchersLookup,
+        send_email: EmailSender,
+        fire_event: EventFirer,
+    ):
+        self.notification_service = notification_service
+        self.user_repo = user_repo
+        self.pref_repo = pref_repo
+        self.project_repo = project_repo
+        self._watchers_of = watchers_of
+        self._send_email = send_email
+        self._fire_event = fire_event
+
+    async def notify(
+        self,
+        changes: Dict[int, TaskUpdateDTO],
+        updated: List[TaskResponseDTO],
+        actor: User,
+    ) -> None:
+        """``changes`` is the batch as submitted, keyed by task id."""
+        pending: List[PendingNotification] = []
+        assigned: Dict[int, List[TaskResponseDTO]] = {}
+        status_changed = [t for t in updated if changes[t.id].column_id is not None]
+
+        for t in updated:
+            assignee_id = changes[t.id].assignee_id
+            if assignee_id and assignee_id != actor.id:
+                assigned.setdefault(assignee_id, []).append(t)
+                pending.append(PendingNotification(
+                    user_id=assignee_id,
+                    type=NotificationType.TASK_ASSIGNED,
+                    message=f"{actor.full_name} sizi '{t.title}' görevine atadı",
+                    related_entity_id=t.id,
+                    related_entity_type="task",
+                    actor_id=actor.id,
+                ))
+
+        if status_changed:
+            watchers_by_task = await self._watchers_of([t.id for t in status_changed])
+            for t in status_changed:
+                recipients = set(watchers_by_task.get(t.id, []))
+                if t.assignee_id:
+                    recipients.add(t.assignee_id)
+                recipients.discard(actor.id)
+                for uid in sorted(recipients):
+                    pending.append(PendingNotification(
+                        user_id=uid,
+                        type=NotificationType.STATUS_CHANGE,
+                        message=f"'{t.title}' görevinin durumu değiştirildi",
+                        related_entity_id=t.id,
+                        related_entity_type="task",
+                        actor_id=actor.id,
+                    ))
+
+        await self.notification_service.notify_many(pending)
+        await self._email_assignees(assigned, actor)
+        await self._fire_project_events(changes, updated, status_changed)
+
+    async def _email_assignees(self, assigned: Dict[int, List[TaskResponseDTO]], actor: User) -> None:
+        """One message per assignee listing every task they received."""
+        if not assigned:
+            return
+        prefs = await self.pref_repo.get_by_users(list(assigned))
+        for assignee_id, tasks_for_user in assigned.items():
+            pref = prefs.get(assignee_id)
+            email_ok = (pref is None or pref.email_enabled) and (
+                pref is None or pref.preferences.get("TASK_ASSIGNED", {}).get("email", True)
+            )
+            if not email_ok:
+                continue
+            recipient = await self.user_repo.get_by_id(assignee_id)
+            if recipient is None:
+                continue
+            await self._send_email(
+                str(recipient.email),
+                f"SPMS: {len(tasks_for_user)} göreve atandınız",
+                "task_assigned.html",
+                {
+                    "task_title": ", ".join(t.title for t in tasks_for_user),
+                    "assigner_name": actor.full_name,
+                    "task_id": tasks_for_user[0].id,
+                },
+            )
+
+    async def _fire_project_events(
+        self,
+        changes: Dict[int, TaskUpdateDTO],
+        updated: List[TaskResponseDTO],
+        status_changed: List[TaskResponseDTO],
+    ) -> None:
+        """Integration events (EXT-01, D-16): one summary per project and event type."""
+        moved_by_project: Dict[int, int] = {}
+        for t in status_changed:
+            moved_by_project[t.project_id] = moved_by_project.get(t.project_id, 0) + 1
+        assigned_by_project: Dict[int, int] = {}
+        for t in updated:
+            if changes[t.id].assignee_id is not None:
+                assigned_by_project[t.project_id] = assigned_by_project.get(t.project_id, 0) + 1
+
+        for project_id in sorted(set(moved_by_project) | set(assigned_by_project)):
+            project = await self.project_repo.get_by_id(project_id)
+            if not project:
+                continue
+            if project_id in moved_by_project:
+                asyncio.create_task(self._fire_event(
+                    project.process_config,
+                    "task.status_changed",
+                    {"message": f"{moved_by_project[project_id]} gorevin durumu toplu olarak guncellendi."},
+                ))
+            if project_id in assigned_by_project:
+                asyncio.create_task(self._fire_event(
+                    project.process_config,
+                    "task.assigned",
+                    {"message": f"\U0001f464 {assigned_by_project[project_id]} gorev toplu olarak atandi."},
+                ))
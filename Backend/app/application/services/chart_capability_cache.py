@@ -0,0 +1,51 @@
+"""Per-project cache of resolved chart capabilities (GET /chart-capabilities).
+
+The reports page asks for the capability flags on every load. Resolving
+them takes the project row plus ``get_capability_inputs``: six COUNT /
+EXISTS subqueries over sprints, columns and members. Each entry is stored
+under the project's ``change_version``. Sprint, column, member, task and
+project writes all bump that version in their own transaction, so those
+write paths invalidate entries without calling into this module. A lookup
+with a newer version misses and overwrites the entry. Unlike a TTL cache,
+this invalidation crosses worker boundaries, because every worker reads
+the same version.
+
+Caveat: in-memory only; clears on app restart; bounded to ``MAX_ENTRIES``
+projects (least recently used evicted).
+"""
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+MAX_ENTRIES = 2048
+
+_cache: "OrderedDict[int, Tuple[int, Dict[str, bool]]]" = OrderedDict()
+
+
+def lookup(project_id: int, version: int) -> Optional[Dict[str, bool]]:
+    """Return a copy of the cached flags if they were stored at ``version``."""
+    entry = _cache.get(project_id)
+    if entry is None or entry[0] != version:
+        return None
+    _cache.move_to_end(project_id)
+    return dict(entry[1])
+
+
+def store(project_id: int, version: int, flags: Dict[str, bool]) -> None:
+    _cache[project_id] = (version, dict(flags))
+    _cache.move_to_end(project_id)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def invalidate(project_id: Optional[int] = None) -> None:
+    """Drop one project's entry (or all). Writes that bypass change_version only."""
+    if project_id is None:
+        _cache.clear()
+    else:
+        _cache.pop(project_id, None)
+
+
+def reset_for_tests() -> None:
+    """Test hook: clear the cache. Never call from production code."""
+    _cache.clear()
@@ -1,11 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import Optional
-from app.domain.entities.notification import NotificationType
+from dataclasses import dataclass
+from typing import List, Optional
+from app.domain.entities.notification import Notification, NotificationType
 from app.domain.repositories.notification_repository import INotificationRepository
 from app.domain.repositories.notification_preference_repository import INotificationPreferenceRepository
 from app.application.use_cases.manage_notifications import CreateNotificationUseCase
 
 
+@dataclass
+class PendingNotification:
+    """One ``notify()`` call, queued for :meth:`INotificationService.notify_many`."""
+    user_id: int
+    type: NotificationType
+    message: str
+    related_entity_id: Optional[int] = None
+    related_entity_type: Optional[str] = None
+    actor_id: Optional[int] = None
+
+
 class INotificationService(ABC):
     """Abstraction layer — allows future migration to WebSocket/GraphQL delivery
     without changing the API layer. The API layer calls notify(); delivery mechanism
@@ -22,6 +34,21 @@ class INotificationService(ABC):
         actor_id: Optional[int] = None,  # if set, suppresses self-notification
     ) -> None: ...
 
+    async def notify_many(self, pending: List[PendingNotification]) -> None:
+        """Deliver a batch with the same suppression rules as ``notify``.
+
+        Default implementation loops; implementations override to batch I/O.
+        """
+        for n in pending:
+            await self.notify(
+                user_id=n.user_id,
+                type=n.type,
+                message=n.message,
+                related_entity_id=n.related_entity_id,
+                related_entity_type=n.related_entity_type,
+                actor_id=n.actor_id,
+            )
+
 
 class PollingNotificationService(INotificationService):
     """Polling-based implementation: persists notification to DB.
@@ -62,3 +89,26 @@ class PollingNotificationService(INotificationService):
             related_entity_id=related_entity_id,
             related_entity_type=related_entity_type,
         )
+
+    async def notify_many(self, pending: List[PendingNotification]) -> None:
+        """Batched ``notify``: one preference query for every recipient and one
+        multi-row insert + commit, instead of 2 queries and a commit per row."""
+        pending = [n for n in pending if n.actor_id is None or n.actor_id != n.user_id]
+        if not pending:
+            return
+        prefs = await self._pref_repo.get_by_users(sorted({n.user_id for n in pending}))
+        rows = []
+        for n in pending:
+            pref = prefs.get(n.user_id)
+            if pref is not None and not pref.preferences.get(n.type.value, {}).get("in_app", True):
+                continue
+            rows.append(
+                Notification(
+                    user_id=n.user_id,
+                    type=n.type,
+                    message=n.message,
+                    related_entity_id=n.related_entity_id,
+                    related_entity_type=n.related_entity_type,
+                )
+            )
+        await self._notification_repo.create_many(rows)
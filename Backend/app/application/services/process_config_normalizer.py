@@ -1,29 +1,38 @@
-"""Batch migration helper for process_config schema_version.
+"""Batch write-back of process_config to the current schema_version.
 
-Normally, Project._normalize_process_config runs lazily on read via
-@model_validator(mode='before'). This module provides an eager, one-shot
-migration for admin scripts when the schema_version is bumped and lazy
-migration is too slow (e.g., millions of projects).
+Project._normalize_process_config runs lazily on read via
+@model_validator(mode='before'), but a migrated config used to live only in
+memory: legacy rows were migrated again on every read until someone ran
+this helper by hand. It now runs once per schema change as the deferred
+``process_config_schema`` boot step (app/infrastructure/database/startup.py),
+so after a deploy every stored row is current and reads take the entity's
+fast path.
 """
-from app.domain.entities.project import _normalize_process_config
+from app.domain.entities.project import CURRENT_SCHEMA_VERSION, _normalize_process_config
 from app.domain.repositories.project_repository import IProjectRepository
 
 
-async def migrate_all_projects_to_current_schema(project_repo: IProjectRepository) -> int:
-    """Walk every project, normalize its process_config, and write back.
+BATCH_SIZE = 500
 
-    Returns the number of projects whose config was modified.
-    Intended as a one-shot admin script, not a request-time operation.
+
+async def migrate_all_projects_to_current_schema(
+    project_repo: IProjectRepository, batch_size: int = BATCH_SIZE
+) -> int:
+    """Normalize every stale stored process_config and write it back.
+
+    Walks the stale rows by id in ``batch_size`` pages; one read and one
+    executemany write (own commit) per page. Idempotent — a second run finds
+    nothing. Returns the number of projects whose config was rewritten.
     """
-    projects = await project_repo.get_all()
+    current = CURRENT_SCHEMA_VERSION
     count = 0
-    for p in projects:
-        if p.process_config is None:
-            continue
-        original = p.process_config
-        normalized = _normalize_process_config(original)
-        if normalized != original:
-            p.process_config = normalized
-            await project_repo.update(p)
-            count += 1
-    return count
+    after_id = 0
+    while True:
+        rows = await project_repo.list_stale_process_configs(current, after_id, batch_size)
+        if not rows:
+            return count
+        await project_repo.write_process_configs(
+            {pid: _normalize_process_config(cfg) for pid, cfg in rows}, current,
+        )
+        count += len(rows)
+        after_id = rows[-1][0]
@@ -0,0 +1,324 @@
+"""Process-wide HTTP request timing histograms + slow-query log.
+
+Fed by two producers:
+- ``RequestMetricsMiddleware`` (app/api/middleware/request_metrics.py) opens a
+  :class:`RequestStats` for every HTTP request, and records it under the
+  matched route TEMPLATE (``/api/v1/tasks/{task_id}``, never the raw path —
+  otherwise every task id would become its own series) when the response is
+  done.
+- The SQLAlchemy engine listeners (util/query_metrics.py) add each statement's
+  duration — and the rows it returned — to the current request's counters
+  via :func:`record_query`.
+
+``get_current_user`` tags the current request with the resolved user id via
+:func:`set_principal`, so the access log no longer decodes the JWT itself.
+
+Query budgets: the middleware hands every finished request to
+:func:`check_budget` together with its route's budget (``@query_budget`` in
+app/api/query_budget.py). Requests over budget are counted per route; on a
+sampled request (statement texts collected while it ran) the violation is
+also kept with the statements that repeated — the N+1 signature. Tests use
+:func:`capture_queries` (the ``max_queries`` fixture) to assert the same
+budgets without sampling.
+
+GET /admin/metrics serves :func:`snapshot`.
+
+Caveat: in-memory only; clears on app restart; does NOT cross process/worker
+boundaries (same trade-off as idempotency_cache) — each worker reports its
+own share of the traffic.
+"""
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+
+# Upper bounds (ms) of the latency buckets; the implicit last bucket is +Inf.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# How many slow requests / slow queries are kept for the admin endpoint.
+SLOW_LOG_SIZE = 100
+# Slow-query statements are truncated to keep the log bounded.
+STATEMENT_MAX_CHARS = 500
+# A budget violation keeps this many of its most repeated statements.
+BUDGET_TOP_STATEMENTS = 5
+
+
+@dataclass
+class RequestStats:
+    """Mutable per-request accumulator shared through :data:`_current`.
+
+    A mutable holder (rather than re-setting the ContextVar) is what makes
+    values written inside dependencies and engine hooks visible to the
+    middleware: those run in copied contexts, but they see the same object.
+    """
+    method: str
+    path: str
+    route: Optional[str] = None
+    user_id: Optional[int] = None
+    db_queries: int = 0
+    db_time_ms: float = 0.0
+    db_rows: int = 0
+    # Normalised statement -> executions; only collected on sampled requests.
+    statements: Optional[Counter] = field(default=None, repr=False)
+    # The ASGI scope; the router stores the matched route in it mid-request,
+    # which lets queries logged before the response still name the template.
+    scope: Optional[dict] = field(default=None, repr=False)
+
+    def route_label(self) -> str:
+        if self.route is None and self.scope is not None:
+            self.route = getattr(self.scope.get("route"), "path", None)
+        return self.route or self.path
+
+
+@dataclass
+class RouteHistogram:
+    count: int = 0
+    errors: int = 0  # responses with status >= 500
+    over_budget: int = 0  # requests that ran more statements than their budget
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    db_queries: int = 0
+    db_time_ms: float = 0.0
+    db_rows: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe(self, duration_ms: float, status: int, stats: RequestStats) -> None:
+        self.count += 1
+        if status >= 500:
+            self.errors += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.db_queries += stats.db_queries
+        self.db_time_ms += stats.db_time_ms
+        self.db_rows += stats.db_rows
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("spms_request_stats", default=None)
+_routes: Dict[Tuple[str, str], RouteHistogram] = {}
+_slow_requests: Deque[dict] = deque(maxlen=SLOW_LOG_SIZE)
+_slow_queries: Deque[dict] = deque(maxlen=SLOW_LOG_SIZE)
+_budget_violations: Deque[dict] = deque(maxlen=SLOW_LOG_SIZE)
+_started_at = datetime.utcnow()
+_db_queries_outside_requests = 0
+
+
+def begin_request(scope: dict, sample_statements: bool = False) -> RequestStats:
+    stats = RequestStats(method=scope["method"], path=scope["path"], scope=scope)
+    if sample_statements:
+        stats.statements = Counter()
+    _current.set(stats)
+    return stats
+
+
+def current() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def set_principal(user_id: Optional[int]) -> None:
+    """Attach the authenticated user to the in-flight request (no-op outside one)."""
+    stats = _current.get()
+    if stats is not None:
+        stats.user_id = user_id
+
+
+def record_query(statement: str, duration_ms: float, slow_threshold_ms: float, rows: int = 0) -> bool:
+    """Count one executed statement (``rows`` = rows it returned); True when it crossed the threshold."""
+    global _db_queries_outside_requests
+    stats = _current.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_time_ms += duration_ms
+        stats.db_rows += rows
+        if stats.statements is not None:
+            stats.statements[_normalize(statement)] += 1
+    else:
+        _db_queries_outside_requests += 1
+    for capture in _captures:
+        capture.statements[_normalize(statement)] += 1
+    if duration_ms < slow_threshold_ms:
+        return False
+    _slow_queries.append({
+        "at": datetime.utcnow().isoformat(),
+        "duration_ms": round(duration_ms, 2),
+        "route": stats.route_label() if stats is not None else None,
+        "statement": _normalize(statement),
+    })
+    return True
+
+
+def _normalize(statement: str) -> str:
+    return " ".join(statement.split())[:STATEMENT_MAX_CHARS]
+
+
+def repeated_statements(statements: Counter) -> List[dict]:
+    """Statements executed more than once, most repeated first (N+1 suspects)."""
+    return [
+        {"count": n, "statement": text}
+        for text, n in statements.most_common(BUDGET_TOP_STATEMENTS)
+        if n > 1
+    ]
+
+
+def record_request(stats: RequestStats, status: int, duration_ms: float, slow_threshold_ms: float) -> bool:
+    """Fold a finished request into its route histogram; True when it was slow.
+
+    Requests that matched no route (404s, static files) share one
+    ``<unmatched>`` series so scanners cannot grow the registry unbounded.
+    """
+    key = (stats.method, stats.route or "<unmatched>")
+    _routes.setdefault(key, RouteHistogram()).observe(duration_ms, status, stats)
+    if duration_ms < slow_threshold_ms:
+        return False
+    _slow_requests.append({
+        "at": datetime.utcnow().isoformat(),
+        "method": stats.method,
+        "route": key[1],
+        "path": stats.path,
+        "status": status,
+        "duration_ms": round(duration_ms, 2),
+        "db_queries": stats.db_queries,
+        "db_time_ms": round(stats.db_time_ms, 2),
+        "db_rows": stats.db_rows,
+        "user_id": stats.user_id,
+    })
+    return True
+
+
+def check_budget(stats: RequestStats, budget: Optional[int]) -> Optional[dict]:
+    """Compare a finished request with its query budget (None = unbudgeted).
+
+    Call after :func:`record_request`. Every request over budget is counted
+    on its route; the violation record — returned, and kept for the admin
+    endpoint — is only built for sampled requests, since the repeated
+    statements are what makes it actionable.
+    """
+    for capture in _captures:
+        capture.requests.append((stats.method, stats.route_label(), stats.db_queries, budget))
+    if budget is None or stats.db_queries <= budget:
+        return None
+    histogram = _routes.get((stats.method, stats.route or "<unmatched>"))
+    if histogram is not None:
+        histogram.over_budget += 1
+    if stats.statements is None:
+        return None
+    violation = {
+        "at": datetime.utcnow().isoformat(),
+        "method": stats.method,
+        "route": stats.route_label(),
+        "db_queries": stats.db_queries,
+        "budget": budget,
+        "user_id": stats.user_id,
+        "repeated": repeated_statements(stats.statements),
+    }
+    _budget_violations.append(violation)
+    return violation
+
+
+@dataclass
+class QueryCapture:
+    """Statements (and finished requests) seen while :func:`capture_queries` is open."""
+    statements: Counter = field(default_factory=Counter)
+    # (method, route, db_queries, budget) per request that finished inside the block
+    requests: List[Tuple[str, str, int, Optional[int]]] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return sum(self.statements.values())
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements"]
+        lines += [f"  {r['count']}x {r['statement']}" for r in repeated_statements(self.statements)]
+        return "\n".join(lines)
+
+
+_captures: List[QueryCapture] = []
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryCapture]:
+    """Count every statement executed inside the block, in or out of a request.
+
+    Process-wide rather than context-scoped, so it sees statements issued
+    inside an in-process ASGI app too — meant for tests and benchmarks, not
+    for concurrent production traffic.
+    """
+    capture = QueryCapture()
+    _captures.append(capture)
+    try:
+        yield capture
+    finally:
+        _captures.remove(capture)
+
+
+def snapshot() -> dict:
+    """JSON-ready view of every histogram plus the recent slow entries."""
+    routes = []
+    for (method, route), h in sorted(_routes.items(), key=lambda kv: -kv[1].total_ms):
+        routes.append({
+            "method": method,
+            "route": route,
+            "count": h.count,
+            "errors": h.errors,
+            "over_budget": h.over_budget,
+            "avg_ms": round(h.total_ms / h.count, 2) if h.count else 0.0,
+            "max_ms": round(h.max_ms, 2),
+            "p50_ms": _quantile(h, 0.50),
+            "p95_ms": _quantile(h, 0.95),
+            "p99_ms": _quantile(h, 0.99),
+            "avg_db_queries": round(h.db_queries / h.count, 2) if h.count else 0.0,
+            "avg_db_time_ms": round(h.db_time_ms / h.count, 2) if h.count else 0.0,
+            "avg_db_rows": round(h.db_rows / h.count, 2) if h.count else 0.0,
+            "buckets": {
+                **{f"le_{int(b)}": n for b, n in zip(LATENCY_BUCKETS_MS, h.buckets)},
+                "le_inf": h.buckets[-1],
+            },
+        })
+    return {
+        "since": _started_at.isoformat(),
+        "routes": routes,
+        "db_queries_outside_requests": _db_queries_outside_requests,
+        "slow_requests": list(reversed(_slow_requests)),
+        "slow_queries": list(reversed(_slow_queries)),
+        "budget_violations": list(reversed(_budget_violations)),
+    }
+
+
+def _quantile(h: RouteHistogram, q: float) -> Optional[float]:
+    """Bucket upper bound containing the q-quantile (None when it is +Inf).
+
+    Histogram quantiles are an upper-bound estimate; exact values would need
+    every sample retained.
+    """
+    if not h.count:
+        return None
+    target = q * h.count
+    seen = 0
+    for bound, n in zip(LATENCY_BUCKETS_MS, h.buckets):
+        seen += n
+        if seen >= target:
+            return float(bound)
+    return None
+
+
+def reset() -> None:
+    """Start a new measurement window (GET /admin/metrics?reset=true)."""
+    global _db_queries_outside_requests, _started_at
+    _routes.clear()
+    _slow_requests.clear()
+    _slow_queries.clear()
+    _budget_violations.clear()
+    _db_queries_outside_requests = 0
+    _started_at = datetime.utcnow()
+
+
+def reset_for_tests() -> None:
+    """Test hook: clear every series and the current request. Never call from production code."""
+    reset()
+    _current.set(None)
@@ -0,0 +1,54 @@
+"""Short-TTL per-user cache for the Teams page stats strip (GET /teams/stats).
+
+The stats aggregate is one query, but the Teams page re-requests it on every
+navigation; a 30 s window keeps the page constant-cost for users on dozens of
+teams. Invalidated wholesale on team membership / team-project changes and on
+every committed task write (hooked into the shared counter path,
+infrastructure/database/util/task_stats.py) — the stats of *every* user on a
+team change when one member moves a task, so per-user invalidation would miss
+entries.
+
+Caveat: in-memory only; clears on app restart; does NOT cross process/worker
+boundaries (same trade-off as idempotency_cache). Staleness across workers is
+bounded by TTL_SECONDS.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+
+TTL_SECONDS = 30
+
+
+@dataclass
+class CachedStats:
+    value: dict
+    stored_at: datetime
+
+
+_cache: dict[int, CachedStats] = {}
+
+
+def lookup(user_id: int) -> Optional[dict]:
+    """Return a copy of the cached stats for ``user_id`` if still within TTL."""
+    entry = _cache.get(user_id)
+    if entry is None:
+        return None
+    if datetime.utcnow() - entry.stored_at > timedelta(seconds=TTL_SECONDS):
+        _cache.pop(user_id, None)
+        return None
+    return dict(entry.value)
+
+
+def store(user_id: int, value: dict) -> None:
+    _cache[user_id] = CachedStats(dict(value), datetime.utcnow())
+
+
+def invalidate() -> None:
+    """Drop every cached entry. Called from team membership and task write paths."""
+    _cache.clear()
+
+
+def reset_for_tests() -> None:
+    """Test hook: clear the cache. Never call from production code."""
+    _cache.clear()
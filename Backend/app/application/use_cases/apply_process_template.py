@@ -1,11 +1,20 @@
 """D-44 ApplyProcessTemplateUseCase.
 
-For each project_id:
-1. Acquire per-project advisory lock (wait up to 5s; if still held, add to failed list with advisory_lock_timeout).
-2. Fetch project + template.
-3. Apply template defaults (process_template_id, default_workflow if present, default_phase_criteria if present).
-4. Write back via project_repo.update().
-5. Lock auto-releases at transaction commit (pg_advisory_xact_lock semantics).
+Applies a ProcessTemplate to many projects in batches of ``batch_size``:
+
+1. Each batch try-locks its projects (``pg_try_advisory_xact_lock``, never
+   waits) and stamps the locked ones with ONE UPDATE — process_template_id
+   plus the template defaults merged into process_config (default_workflow
+   → ``phase_workflow``, default_phase_criteria, schema_version=2) — see
+   ``IProjectRepository.apply_template_batch``.
+2. Locks auto-release when the batch commits.
+3. Projects whose lock was held are retried as one pass after
+   ``retry_delay_s``, up to ``lock_retries`` passes; whatever is still locked
+   fails with advisory_lock_timeout.
+
+With ``repo_scope`` (a factory of per-batch repositories, each on its own
+session) up to ``concurrency`` batches run at once — the background job
+path. Without it, batches run one after another on ``project_repo``.
 
 Returns {"applied": [project_ids], "failed": [{"project_id": id, "error": msg}], "require_pm_approval": bool}.
 
@@ -14,18 +23,39 @@ Distinct from Phase Gate key: hash("phase_gate:{project_id}") — parallel ops o
 """
 import asyncio
 import copy
-from typing import List
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional
 
+from app.domain.exceptions import DomainError
 from app.domain.repositories.project_repository import IProjectRepository
 
 
+BATCH_SIZE = 50
+CONCURRENCY = 4
+LOCK_RETRIES = 5
+RETRY_DELAY_S = 1.0
+
+
 def _tpl_apply_lock_key(project_id: int) -> int:
     """63-bit advisory lock key for template apply (distinct from phase_gate key)."""
     return hash(f"template_apply:{project_id}") & 0x7FFFFFFFFFFFFFFF
 
 
+def _config_patch(template) -> Dict[str, Any]:
+    """Top-level process_config keys the template sets.
+
+    C1: V2 schema — write into `phase_workflow` (was `workflow` in V1) and
+    stamp schema_version=2. Deep copy: the entity normalizer mutates nested
+    dicts in place; a shared reference would bleed across projects.
+    """
+    patch: Dict[str, Any] = {}
+    if getattr(template, "default_workflow", None):
+        patch["phase_workflow"] = copy.deepcopy(template.default_workflow)
+    if getattr(template, "default_phase_criteria", None):
+        patch["phase_completion_criteria"] = copy.deepcopy(template.default_phase_criteria)
+    patch["schema_version"] = 2
+    return patch
+
+
 class ApplyProcessTemplateUseCase:
     """D-44: Apply a ProcessTemplate to multiple projects with per-project advisory lock."""
 
@@ -33,68 +63,85 @@ class ApplyProcessTemplateUseCase:
         self,
         project_repo: IProjectRepository,
         template_repo,
-        session: AsyncSession,
+        repo_scope: Optional[Callable[[], AsyncContextManager[IProjectRepository]]] = None,
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = CONCURRENCY,
+        lock_retries: int = LOCK_RETRIES,
+        retry_delay_s: float = RETRY_DELAY_S,
     ):
         self.project_repo = project_repo
         self.template_repo = template_repo
-        self.session = session
+        self.repo_scope = repo_scope
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.lock_retries = max(1, lock_retries)
+        self.retry_delay_s = retry_delay_s
 
     async def execute(
         self,
         template_id: int,
         project_ids: List[int],
         require_pm_approval: bool = False,
+        progress: Optional[Callable[[int], None]] = None,
     ) -> dict:
+        """``progress(processed_projects)`` is called after every pass."""
         template = await self.template_repo.get_by_id(template_id)
         if template is None:
-            from app.domain.exceptions import DomainError
             raise DomainError(f"ProcessTemplate {template_id} not found")
 
+        patch = _config_patch(template)
         applied: List[int] = []
         failed: List[dict] = []
-
-        for pid in project_ids:
-            try:
-                # Try advisory lock with bounded 5s retry
-                acquired = False
-                for _ in range(5):
-                    r = await self.session.execute(
-                        select(func.pg_try_advisory_xact_lock(_tpl_apply_lock_key(pid)))
-                    )
-                    if r.scalar_one():
-                        acquired = True
-                        break
-                    await asyncio.sleep(1)
-
-                if not acquired:
-                    failed.append({"project_id": pid, "error": "advisory_lock_timeout"})
+        pending = list(dict.fromkeys(project_ids))
+
+        for attempt in range(self.lock_retries):
+            if attempt:
+                await asyncio.sleep(self.retry_delay_s)
+            batches = [
+                pending[i:i + self.batch_size]
+                for i in range(0, len(pending), self.batch_size)
+            ]
+            outcomes = await self._run_batches(template.id, patch, batches)
+            pending = []
+            for batch, outcome in zip(batches, outcomes):
+                if isinstance(outcome, Exception):
+                    failed.extend({"project_id": pid, "error": str(outcome)} for pid in batch)
                     continue
+                applied.extend(outcome["applied"])
+                failed.extend(
+                    {"project_id": pid, "error": "project_not_found"} for pid in outcome["missing"]
+                )
+                pending.extend(outcome["locked"])
+            if progress is not None:
+                progress(len(applied) + len(failed))
+            if not pending:
+                break
+
+        failed.extend({"project_id": pid, "error": "advisory_lock_timeout"} for pid in pending)
+        # NOTE: require_pm_approval flag accepted but approval workflow deferred to Phase 12
+        return {"applied": applied, "failed": failed, "require_pm_approval": require_pm_approval}
 
-                project = await self.project_repo.get_by_id(pid)
-                if project is None:
-                    failed.append({"project_id": pid, "error": "project_not_found"})
-                    continue
+    async def _run_batches(self, template_id: int, patch: Dict[str, Any], batches: List[List[int]]) -> list:
+        """One outcome dict (or the raised exception) per batch, in order."""
 
-                # Apply template fields.
-                # C1: V2 schema — write into `phase_workflow` (was `workflow` in V1)
-                # and stamp schema_version=2. The entity normalizer is idempotent on
-                # V2 and will populate `capabilities` if absent.
-                project.process_template_id = template.id
-                pc = project.process_config or {}
-                # Deep copy: the entity normalizer mutates nested dicts in
-                # place; a shared reference would bleed across projects.
-                if getattr(template, "default_workflow", None):
-                    pc["phase_workflow"] = copy.deepcopy(template.default_workflow)
-                if getattr(template, "default_phase_criteria", None):
-                    pc["phase_completion_criteria"] = copy.deepcopy(template.default_phase_criteria)
-                pc["schema_version"] = 2
-                project.process_config = pc
-
-                await self.project_repo.update(project)
-                # NOTE: require_pm_approval flag accepted but approval workflow deferred to Phase 12
-                applied.append(pid)
-
-            except Exception as e:
-                failed.append({"project_id": pid, "error": str(e)})
+        async def run(repo: IProjectRepository, batch: List[int]):
+            lock_keys = {pid: _tpl_apply_lock_key(pid) for pid in batch}
+            return await repo.apply_template_batch(template_id, patch, lock_keys)
 
-        return {"applied": applied, "failed": failed, "require_pm_approval": require_pm_approval}
+        if self.repo_scope is None:
+            outcomes = []
+            for batch in batches:
+                try:
+                    outcomes.append(await run(self.project_repo, batch))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_scoped(batch: List[int]):
+            async with semaphore:
+                async with self.repo_scope() as repo:
+                    return await run(repo, batch)
+
+        return await asyncio.gather(*(run_scoped(b) for b in batches), return_exceptions=True)
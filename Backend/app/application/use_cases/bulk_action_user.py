@@ -1,10 +1,16 @@
 """Phase 14 Plan 14-01 / Phase 15 Plan 15-07 — BulkActionUserUseCase.
 
-Per-user transaction (NOT bulk all-or-none). Audit row written per user (NOT
-per batch). Returns BulkActionResponseDTO with per-user success/failed list.
+Set-based: every target is validated up front with one ``get_by_ids`` query
+(missing users and the admin's own row for role_change are reported as
+per-user failures, exactly as the single-user use cases would raise them),
+then all valid users are updated with ONE UPDATE and their audit rows are
+written with one executemany INSERT in the same commit. Audit row still
+written per user (NOT per batch). Returns BulkActionResponseDTO with per-user
+success/failed list.
 
-DIP — composes DeactivateUserUseCase + ChangeUserRoleUseCase; no infrastructure
-imports.
+DIP — takes the user / role / audit repositories directly (same audit
+envelopes as DeactivateUserUseCase + ChangeUserRoleUseCase); no
+infrastructure imports.
 
 Phase 15 Plan 15-06 — ChangeUserRoleUseCase migrated to (target_user_id,
 role_id: int, admin_id) signature. Bulk-action payload now accepts either
@@ -25,17 +31,22 @@ the application layer MUST NOT import from ``app.api.deps`` or
 API/router layer (which legitimately knows about ``_has_permission``) wires
 the callable; the use case stays Clean Architecture pure.
 """
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.application.dtos.admin_user_dtos import (
     BulkActionRequestDTO,
     BulkActionResponseDTO,
     BulkActionResultDTO,
 )
-from app.application.use_cases.change_user_role import ChangeUserRoleUseCase
-from app.application.use_cases.deactivate_user import DeactivateUserUseCase
 from app.domain.entities.user import User
-from app.domain.exceptions import PermissionDeniedError
+from app.domain.exceptions import (
+    PermissionDeniedError,
+    RoleNotFoundError,
+    UserNotFoundError,
+)
+from app.domain.repositories.audit_repository import IAuditRepository
+from app.domain.repositories.role_repository import IRoleRepository
+from app.domain.repositories.user_repository import IUserRepository
 
 
 # D-1.16 mapping — sub-perm per action subtype. Each bulk action is gated by
@@ -51,8 +62,9 @@ SUB_PERM_MAP: dict[str, str] = {
 class BulkActionUserUseCase:
     def __init__(
         self,
-        deactivate_use_case: DeactivateUserUseCase,
-        role_change_use_case: ChangeUserRoleUseCase,
+        user_repo: IUserRepository,
+        role_repo: IRoleRepository,
+        audit_repo: IAuditRepository,
         permission_check: Optional[Callable[[User, str], bool]] = None,
     ):
         """Constructor.
@@ -65,8 +77,9 @@ class BulkActionUserUseCase:
         umbrella ``Depends(require_permission('admin.users.bulk'))`` at the
         router still gates entry).
         """
-        self.deactivate_use_case = deactivate_use_case
-        self.role_change_use_case = role_change_use_case
+        self.user_repo = user_repo
+        self.role_repo = role_repo
+        self.audit_repo = audit_repo
         self._permission_check = permission_check
 
     async def execute(
@@ -76,8 +89,8 @@ class BulkActionUserUseCase:
         admin_user: Optional[User] = None,
         role_id_resolver: Optional[Any] = None,
     ) -> BulkActionResponseDTO:
-        # D-1.16 dynamic per-action perm dispatch — fires BEFORE the per-user
-        # loop so a missing sub-perm fails the entire bulk request without
+        # D-1.16 dynamic per-action perm dispatch — fires BEFORE any user
+        # is looked up so a missing sub-perm fails the entire bulk request without
         # mutating any rows (Pitfall 17 — no partial success).
         if self._permission_check is not None and admin_user is not None:
             sub_perm = SUB_PERM_MAP.get(request.action)
@@ -86,49 +99,108 @@ class BulkActionUserUseCase:
             if not self._permission_check(admin_user, sub_perm):
                 raise PermissionDeniedError(sub_perm)
 
-        results = []
-        success_count = 0
-        failed_count = 0
-        for user_id in request.user_ids:
-            try:
-                if request.action == "deactivate":
-                    await self.deactivate_use_case.execute(user_id, admin_id, deactivate=True)
-                elif request.action == "activate":
-                    await self.deactivate_use_case.execute(user_id, admin_id, deactivate=False)
-                elif request.action == "role_change":
-                    payload = request.payload or {}
-                    role_id = payload.get("role_id")
-                    if role_id is None:
-                        # Legacy: payload contains {role: str}; resolve via callback.
-                        legacy_role = payload.get("role")
-                        if legacy_role is None or role_id_resolver is None:
-                            raise ValueError(
-                                "role_change requires payload.role_id "
-                                "(or payload.role with role_id_resolver)"
-                            )
-                        role_id = await role_id_resolver(legacy_role)
-                        if role_id is None:
-                            raise ValueError(
-                                f"role_change: unknown role '{legacy_role}'"
-                            )
-                    await self.role_change_use_case.execute(
-                        target_user_id=user_id,
-                        role_id=int(role_id),
-                        admin_id=admin_id,
-                    )
-                else:
-                    raise ValueError(f"Unknown action: {request.action}")
-                results.append(BulkActionResultDTO(user_id=user_id, status="success"))
-                success_count += 1
-            except Exception as exc:
-                results.append(
-                    BulkActionResultDTO(
-                        user_id=user_id, status="failed", error=str(exc)
-                    )
+        failures: Dict[int, str] = {}
+        user_ids = list(dict.fromkeys(request.user_ids))  # de-dupe, keep order
+        found = {u.id: u for u in await self.user_repo.get_by_ids(user_ids)}
+        for user_id in user_ids:
+            if user_id not in found:
+                failures[user_id] = str(UserNotFoundError(user_id))
+
+        try:
+            if request.action in ("deactivate", "activate"):
+                await self._toggle_active(
+                    [u for uid, u in found.items() if uid not in failures],
+                    admin_id,
+                    deactivate=request.action == "deactivate",
                 )
-                failed_count += 1
+            elif request.action == "role_change":
+                role_id = await self._resolve_role_id(request.payload or {}, role_id_resolver)
+                target_role = await self.role_repo.get_by_id(role_id)
+                if target_role is None:
+                    raise RoleNotFoundError(role_id)
+                # D-2.9 self-edit guard, per user (same message as ChangeUserRoleUseCase)
+                if admin_id in found:
+                    failures[admin_id] = "Kendi rolünü değiştiremezsin"
+                await self._change_role(
+                    [u for uid, u in found.items() if uid not in failures],
+                    target_role,
+                    admin_id,
+                )
+            else:
+                raise ValueError(f"Unknown action: {request.action}")
+        except Exception as exc:
+            # Payload-level problems (unknown role, bad action) fail every
+            # not-yet-failed user — nothing was written.
+            for user_id in user_ids:
+                failures.setdefault(user_id, str(exc))
+
+        results = [
+            BulkActionResultDTO(user_id=uid, status="failed", error=failures[uid])
+            if uid in failures
+            else BulkActionResultDTO(user_id=uid, status="success")
+            for uid in user_ids
+        ]
+        failed_count = sum(1 for r in results if r.status == "failed")
         return BulkActionResponseDTO(
             results=results,
-            success_count=success_count,
+            success_count=len(results) - failed_count,
             failed_count=failed_count,
         )
+
+    async def _toggle_active(self, users: List[User], admin_id: int, deactivate: bool) -> None:
+        if not users:
+            return
+        await self.user_repo.set_active_many([u.id for u in users], not deactivate)
+        # Commits the UPDATE and the audit rows together.
+        await self.audit_repo.create_many_with_metadata([
+            {
+                "entity_type": "user",
+                "entity_id": u.id,
+                "action": "deactivated" if deactivate else "activated",
+                "user_id": admin_id,
+                "metadata": {
+                    "user_id": u.id,
+                    "user_email": u.email,
+                    "requested_by_admin_id": admin_id,
+                },
+            }
+            for u in users
+        ])
+
+    async def _change_role(self, users: List[User], target_role: Any, admin_id: int) -> None:
+        if not users:
+            return
+        await self.user_repo.update_role_many([u.id for u in users], target_role.id)
+        await self.audit_repo.create_many_with_metadata([
+            {
+                "entity_type": "user",
+                "entity_id": u.id,
+                "action": "role_changed",
+                "user_id": admin_id,
+                "metadata": {
+                    "user_id": u.id,
+                    "user_email": u.email,
+                    "source_role": u.role.name if u.role is not None else None,
+                    "target_role_id": target_role.id,
+                    "target_role_name": target_role.name,
+                    "requested_by_admin_id": admin_id,
+                },
+            }
+            for u in users
+        ])
+
+    @staticmethod
+    async def _resolve_role_id(payload: Dict[str, Any], role_id_resolver: Optional[Any]) -> int:
+        role_id = payload.get("role_id")
+        if role_id is None:
+            # Legacy: payload contains {role: str}; resolve via callback.
+            legacy_role = payload.get("role")
+            if legacy_role is None or role_id_resolver is None:
+                raise ValueError(
+                    "role_change requires payload.role_id "
+                    "(or payload.role with role_id_resolver)"
+                )
+            role_id = await role_id_resolver(legacy_role)
+            if role_id is None:
+                raise ValueError(f"role_change: unknown role '{legacy_role}'")
+        return int(role_id)
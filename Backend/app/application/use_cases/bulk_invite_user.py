@@ -1,54 +1,177 @@
 """Phase 14 Plan 14-01 — BulkInviteUserUseCase (D-B4 / D-A8 per-user audit).
 
-Iterates BulkInviteRowDTO rows and calls InviteUserUseCase per row. Per-row
-try/except so one bad row does not abort the batch (D-B4 commit-or-skip
-strategy). Returns {successful: [...], failed: [...]} per the BulkInviteResponseDTO.
+Set-based invite for CSV onboarding. Instead of running InviteUserUseCase once
+per row (2 lookups, 1 bcrypt hash and 1 commit per row), the batch:
 
-DIP — composes InviteUserUseCase; no infrastructure imports.
+1) validates every row up front — duplicate emails inside the upload and
+   emails that already exist (one ``IN`` query) are recorded under
+   ``failed[]`` (D-B4 commit-or-skip: a bad row never aborts the batch);
+2) resolves each distinct role name once;
+3) hashes the random placeholder passwords in parallel on the default
+   executor — bcrypt releases the GIL, so N hashes cost ~N / threads;
+4) writes users, invite tokens and ``user.invited`` audit rows with
+   multi-row inserts, one transaction per CHUNK_SIZE rows, reporting progress
+   after each chunk so large uploads can be polled (bulk_job_registry). A
+   chunk that fails is rolled back through the injected ``rollback`` callable
+   before the next one starts, so its half-written rows never ride along
+   with the next chunk's commit.
+
+Rows, token TTL, link format and audit envelope are identical to
+InviteUserUseCase, whose repositories and settings this use case reuses.
+
+DIP — composes InviteUserUseCase; no infrastructure imports. The router
+wires ``rollback`` to the session the repositories share.
 """
-from typing import Any, Optional
+import asyncio
+import secrets
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from app.application.dtos.admin_user_dtos import (
     BulkInviteRequestDTO,
     BulkInviteResponseDTO,
+    BulkInviteRowDTO,
     BulkInviteRowFailureDTO,
-    InviteUserRequestDTO,
+    InviteUserResponseDTO,
 )
-from app.application.use_cases.invite_user import InviteUserUseCase
+from app.application.use_cases.invite_user import (
+    InviteUserUseCase,
+    issue_invite_token,
+    log_invite_link,
+)
+from app.domain.entities.user import User
+from app.domain.exceptions import UserAlreadyExistsError
+
+
+CHUNK_SIZE = 200
 
 
 class BulkInviteUserUseCase:
-    def __init__(self, invite_use_case: InviteUserUseCase):
+    def __init__(
+        self,
+        invite_use_case: InviteUserUseCase,
+        chunk_size: int = CHUNK_SIZE,
+        rollback: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
         self.invite_use_case = invite_use_case
+        self.chunk_size = chunk_size
+        self._rollback = rollback
 
     async def execute(
         self,
         request: BulkInviteRequestDTO,
         admin_id: int,
         role_id_resolver: Optional[Any] = None,
+        progress: Optional[Callable[[int], None]] = None,
     ) -> BulkInviteResponseDTO:
-        successful = []
-        failed = []
+        """``progress(processed_rows)`` is called after every committed chunk."""
+        invite = self.invite_use_case
+        failed: List[BulkInviteRowFailureDTO] = []
+
+        # 1) Up-front validation: in-upload duplicates, then one IN query.
+        seen: set = set()
+        candidates: List[tuple] = []  # (row_number, row)
         for idx, row in enumerate(request.rows):
-            row_number = idx + 1
+            if row.email in seen:
+                failed.append(BulkInviteRowFailureDTO(
+                    row_number=idx + 1, email=row.email,
+                    errors=["Duplicate email in upload"],
+                ))
+                continue
+            seen.add(row.email)
+            candidates.append((idx + 1, row))
+
+        existing = await invite.user_repo.get_existing_emails([r.email for _, r in candidates])
+        valid: List[tuple] = []
+        for row_number, row in candidates:
+            if row.email in existing:
+                failed.append(BulkInviteRowFailureDTO(
+                    row_number=row_number, email=row.email,
+                    errors=[str(UserAlreadyExistsError(row.email))],
+                ))
+            else:
+                valid.append((row_number, row))
+
+        # 2) One resolver call per distinct role name.
+        role_ids: Dict[str, Optional[int]] = {}
+        if role_id_resolver is not None:
+            for role in sorted({row.role for _, row in valid}):
+                role_ids[role] = await role_id_resolver(role)
+
+        # 3) Parallel placeholder hashing — the invitee replaces it via the link.
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(*[
+            loop.run_in_executor(None, invite.security.get_password_hash, secrets.token_urlsafe(32))
+            for _ in valid
+        ])
+
+        # 4) Chunked multi-row writes.
+        successful: List[InviteUserResponseDTO] = []
+        expires_at = datetime.utcnow() + timedelta(days=invite.invite_token_ttl_days)
+        processed = len(request.rows) - len(valid)
+        for start in range(0, len(valid), self.chunk_size):
+            chunk = valid[start:start + self.chunk_size]
+            chunk_hashes = hashes[start:start + self.chunk_size]
             try:
-                resp = await self.invite_use_case.execute(
-                    InviteUserRequestDTO(
-                        email=row.email, role=row.role, name=row.name
-                    ),
-                    admin_id=admin_id,
-                    role_id_resolver=role_id_resolver,
-                )
-                successful.append(resp)
+                created = await invite.user_repo.create_many([
+                    self._new_user(row, password_hash, role_ids.get(row.role))
+                    for (_, row), password_hash in zip(chunk, chunk_hashes)
+                ])
+                tokens = [issue_invite_token() for _ in created]
+                await invite.password_reset_repo.create_many([
+                    (user.id, token_hash, expires_at)
+                    for user, (_, token_hash) in zip(created, tokens)
+                ])
+                # Commits the chunk (users + tokens + audit rows together).
+                await invite.audit_repo.create_many_with_metadata([
+                    {
+                        "entity_type": "user",
+                        "entity_id": user.id or 0,
+                        "action": "invited",
+                        "user_id": admin_id,
+                        "metadata": {
+                            "user_id": user.id,
+                            "user_email": user.email,
+                            "target_role": row.role,
+                            "requested_by_admin_id": admin_id,
+                        },
+                    }
+                    for user, (_, row) in zip(created, chunk)
+                ])
             except Exception as exc:
-                # Per-row commit-or-skip — defer DB-level rollback decisions
-                # to the underlying InviteUserUseCase. We just record the
-                # failure for the response payload.
-                failed.append(
-                    BulkInviteRowFailureDTO(
-                        row_number=row_number,
-                        email=row.email,
-                        errors=[str(exc)],
-                    )
+                # A racing insert (e.g. concurrent single invite) fails the
+                # whole chunk; discard its pending writes and record every
+                # row of it rather than guessing.
+                if self._rollback is not None:
+                    await self._rollback()
+                reason = str(exc).splitlines()[0] if str(exc) else type(exc).__name__
+                failed.extend(
+                    BulkInviteRowFailureDTO(row_number=n, email=row.email, errors=[reason])
+                    for n, row in chunk
                 )
+            else:
+                for user, (raw, _) in zip(created, tokens):
+                    log_invite_link(invite.frontend_url, user.id, user.email, raw)
+                    successful.append(InviteUserResponseDTO(
+                        user_id=user.id or 0,
+                        email=user.email,
+                        invite_token_expires_at=expires_at,
+                    ))
+            processed += len(chunk)
+            if progress is not None:
+                progress(processed)
+
+        failed.sort(key=lambda f: f.row_number)
         return BulkInviteResponseDTO(successful=successful, failed=failed)
+
+    @staticmethod
+    def _new_user(row: BulkInviteRowDTO, password_hash: str, role_id: Optional[int]) -> User:
+        # Same shape as InviteUserUseCase: ACTIVE with an unknown random
+        # password (see the K1 note there on why activation is safe).
+        return User(
+            email=row.email,
+            full_name=row.name or row.email.split("@")[0],
+            password_hash=password_hash,
+            is_active=True,
+            role_id=role_id,
+        )
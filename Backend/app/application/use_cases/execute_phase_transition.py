@@ -30,28 +30,6 @@ from app.domain.exceptions import (
 )
 
 
-def _task_is_done(t) -> bool:
-    """Language-agnostic done detection using order_index.
-
-    A task is done when its column has the highest order_index among all
-    project columns — covers 'Done' (English), 'Bitti' (Turkish), and any
-    custom last-column name.  Falls back to name-based check when project
-    columns are not loaded.
-    """
-    col = getattr(t, "column", None)
-    if col is None:
-        return False
-    project = getattr(t, "project", None)
-    proj_cols = getattr(project, "columns", None) if project else None
-    if proj_cols:
-        max_order = max(
-            (getattr(c, "order_index", 0) for c in proj_cols), default=0
-        )
-        return int(getattr(col, "order_index", -1)) == max_order
-    # Fallback: name-based (covers English defaults)
-    return str(getattr(col, "name", "")).upper() in ("DONE", "COMPLETED", "CLOSED")
-
-
 class ExecutePhaseTransitionUseCase:
     def __init__(
         self,
@@ -193,29 +171,13 @@ class ExecutePhaseTransitionUseCase:
                 # Snapshot task counts.  Include tasks explicitly assigned to
                 # the source phase AND tasks with phase_id=None (board backlog),
                 # because the frontend board shows backlog tasks inside the
-                # currently active phase.
-                phase_tasks = await self.task_repo.list_by_project_and_phase(
-                    project_id, dto.source_phase_id
-                )
-                # Null-phase tasks: call with None then filter — safe because
-                # the phase_id=None path passes Pydantic validation.
-                all_tasks = await self.task_repo.list_by_project_and_phase(
-                    project_id, None
-                )
-                null_tasks = [
-                    t for t in all_tasks
-                    if getattr(t, "phase_id", None) is None
-                ]
-                snapshot_tasks = phase_tasks + null_tasks
-                snapshot_total = len(snapshot_tasks)
-                # Done detection: language-agnostic order_index approach
-                # (same logic as _is_done in _apply_task_moves). The last
-                # column by order_index is "done" regardless of column name
-                # ("Done", "Bitti", "Tamamlandı", …).
-                snapshot_done = sum(
-                    1 for t in snapshot_tasks
-                    if _task_is_done(t)
+                # currently active phase. Done = terminal column (language-
+                # agnostic: "Done", "Bitti", "Tamamlandı", …).
+                counts = await self.task_repo.phase_task_counts(
+                    project_id, dto.source_phase_id, include_unphased=True
                 )
+                snapshot_total = counts["total"]
+                snapshot_done = counts["done"]
 
                 existing = await self.phase_report_repo.get_latest_by_project_phase(
                     project_id, dto.source_phase_id
@@ -251,21 +213,22 @@ class ExecutePhaseTransitionUseCase:
         """D-03 auto-criteria. Returns list of failed criteria.
 
         auto checks supported:
-          - all_tasks_done: every task with phase_id=source must be DONE
-          - no_critical_tasks: no CRITICAL priority task with phase_id=source is non-DONE
-          - no_blockers: (heuristic) no dependency-graph incoming edges block completion (simplified v2.0)
+          - all_tasks_done: every task with phase_id=source is in a terminal column
+          - no_critical_tasks: no CRITICAL priority task with phase_id=source is open
+          - no_blockers: no open phase task has a blocking dependency on an open task
         manual checks (in criteria['manual']) require user confirmation — evaluated as unmet unless allow_override.
         """
         unmet: List[CriterionResult] = []
         auto = criteria.get("auto", {}) or {}
         manual = criteria.get("manual", []) or []
-        # Fetch phase tasks
-        tasks = await self.task_repo.list_by_project_and_phase(project_id, source_phase_id)
+        # One grouped aggregate over the phase's tasks — no task rows loaded
+        # while the advisory lock is held.
+        counts = None
+        if auto.get("all_tasks_done") or auto.get("no_critical_tasks") or auto.get("no_blockers"):
+            counts = await self.task_repo.phase_task_counts(project_id, source_phase_id)
 
         if auto.get("all_tasks_done"):
-            done = sum(1 for t in tasks if str(getattr(t, "status", "")).upper() == "DONE" or
-                                         (getattr(t, "column", None) and getattr(t.column, "name", "").upper() == "DONE"))
-            total = len(tasks)
+            done, total = counts["done"], counts["total"]
             if total > 0 and done < total:
                 unmet.append(CriterionResult(
                     check="all_tasks_done", passed=False,
@@ -273,21 +236,17 @@ class ExecutePhaseTransitionUseCase:
                 ))
 
         if auto.get("no_critical_tasks"):
-            critical_open = [t for t in tasks if str(getattr(t, "priority", "")).upper() == "CRITICAL"
-                             and str(getattr(t, "status", "")).upper() != "DONE"]
-            if critical_open:
+            if counts["critical_open"]:
                 unmet.append(CriterionResult(
                     check="no_critical_tasks", passed=False,
-                    detail=f"{len(critical_open)} critical task(s) still open",
+                    detail=f"{counts['critical_open']} critical task(s) still open",
                 ))
 
         if auto.get("no_blockers"):
-            # Simplified v2.0: count tasks with non-null status != DONE
-            blockers = [t for t in tasks if str(getattr(t, "status", "")).upper() in ("BLOCKED", "REVIEW")]
-            if blockers:
+            if counts["blocked"]:
                 unmet.append(CriterionResult(
                     check="no_blockers", passed=False,
-                    detail=f"{len(blockers)} task(s) blocked",
+                    detail=f"{counts['blocked']} task(s) blocked",
                 ))
 
         # Manual items — each item an unmet criterion until user override/signoff
@@ -305,58 +264,18 @@ class ExecutePhaseTransitionUseCase:
     ) -> int:
         """D-04: bulk action with per-task exceptions.
 
-        Processes two sets of tasks:
+        Covers two sets of tasks:
         1. Tasks explicitly assigned to source_phase_id.
         2. Tasks with phase_id=None (backlog) — the board treats them as part of
            the active phase.  DONE backlog tasks are stamped with source_phase_id
            so they don't bleed into future phases.  Non-DONE backlog tasks follow
            the same open_tasks_action as phase-assigned tasks.
-        """
-        # Fetch phase-assigned tasks
-        phase_tasks = await self.task_repo.list_by_project_and_phase(
-            project_id, source_phase_id
-        )
-        # Fetch backlog tasks (phase_id=None) — filter in Python
-        all_tasks = await self.task_repo.list_by_project_and_phase(project_id, None)
-        backlog_tasks = [t for t in all_tasks if getattr(t, "phase_id", None) is None]
 
+        Applied as one set-based UPDATE (see
+        ``ITaskRepository.apply_phase_transition_moves``), so the lock hold time
+        does not grow with the number of tasks in the project.
+        """
         exc_map = {e.task_id: e.action for e in exceptions}
-
-        # Buckets for bulk updates (task_id lists per destination)
-        to_source: List[int] = []   # stamp with source_phase_id (done backlog)
-        to_target: List[int] = []   # move to target_phase_id
-        to_backlog: List[int] = []  # clear phase (set to null)
-
-        # Phase-assigned tasks
-        for t in phase_tasks:
-            eff_action = exc_map.get(t.id, action)
-            if eff_action == "move_to_next":
-                to_target.append(t.id)
-            elif eff_action == "move_to_backlog":
-                to_backlog.append(t.id)
-            # keep_in_source: no-op — already has correct phase_id
-
-        # Backlog tasks
-        for t in backlog_tasks:
-            if _task_is_done(t):
-                # Stamp completed backlog tasks with the source phase so they
-                # don't appear in future phases.
-                to_source.append(t.id)
-            else:
-                eff_action = exc_map.get(t.id, action)
-                if eff_action == "move_to_next":
-                    to_target.append(t.id)
-                elif eff_action == "keep_in_source":
-                    to_source.append(t.id)
-                # move_to_backlog / default: leave as null (stay in backlog)
-
-        # Persist via bulk SQL UPDATE — no per-row ORM tracking
-        if to_source:
-            await self.task_repo.bulk_stamp_phase(to_source, source_phase_id)
-        if to_target:
-            await self.task_repo.bulk_stamp_phase(to_target, target_phase_id)
-        if to_backlog:
-            await self.task_repo.bulk_stamp_phase(to_backlog, None)
-
-        moved = len(to_source) + len(to_target) + len(to_backlog)
-        return moved
+        return await self.task_repo.apply_phase_transition_moves(
+            project_id, source_phase_id, target_phase_id, action, exc_map,
+        )
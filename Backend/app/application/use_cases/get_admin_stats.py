@@ -5,8 +5,8 @@ Composite payload from 3 parallel reads:
 2) project_repo.methodology_distribution() — non-archived count per methodology
 3) Per-project velocity for top-30 by recent activity (DoS cap, D-X4)
 
-asyncio.gather drives all three in parallel — same pattern as
-GetUserSummaryUseCase (Phase 9 D-48).
+ParallelQueryExecutor runs the three reads concurrently, each on its own
+session — same pattern as GetUserSummaryUseCase (Phase 9 D-48).
 
 Scaling cliff: D-X2 active_users_trend is on-the-fly compute; ~10k events/day
 is the boundary at which a daily snapshot table + cron becomes worth building
@@ -14,14 +14,14 @@ is the boundary at which a daily snapshot table + cron becomes worth building
 
 DIP — pure repo wrappers; no infrastructure imports.
 """
-import asyncio
-from typing import Any, List
+from typing import Any, List, Optional
 
 from app.application.dtos.admin_stats_dtos import (
     ActiveUsersTrendPointDTO,
     AdminStatsResponseDTO,
     ProjectVelocityDTO,
 )
+from app.application.services.parallel_queries import BranchRepos, ParallelQueryExecutor
 from app.domain.repositories.audit_repository import IAuditRepository
 from app.domain.repositories.project_repository import IProjectRepository
 
@@ -32,21 +32,27 @@ class GetAdminStatsUseCase:
         audit_repo: IAuditRepository,
         project_repo: IProjectRepository,
         velocity_resolver: Any = None,
+        executor: Optional[ParallelQueryExecutor[BranchRepos]] = None,
     ):
         """``velocity_resolver`` is an optional callable(project_id) -> Coro
         returning {progress: float, velocity_history: List[float]}. The router
         wires it to the Phase 13 GetProjectIterationUseCase. When None (test
         path), velocities default to empty history.
+
+        Without ``executor`` the three reads run sequentially on the given repos.
         """
         self.audit_repo = audit_repo
         self.project_repo = project_repo
         self.velocity_resolver = velocity_resolver
+        self.executor = executor or ParallelQueryExecutor(
+            shared=BranchRepos(project_repo=project_repo, audit_repo=audit_repo)
+        )
 
     async def execute(self) -> AdminStatsResponseDTO:
-        trend, methodology, recent_projects = await asyncio.gather(
-            self.audit_repo.active_users_trend(days=30),
-            self.project_repo.methodology_distribution(),
-            self.project_repo.list_recent_projects(limit=30),
+        trend, methodology, recent_projects = await self.executor.run(
+            lambda r: r.audit_repo.active_users_trend(days=30),
+            lambda r: r.project_repo.methodology_distribution(),
+            lambda r: r.project_repo.list_recent_projects(limit=30),
         )
 
         velocities: List[ProjectVelocityDTO] = []
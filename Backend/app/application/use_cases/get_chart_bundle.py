@@ -0,0 +1,81 @@
+"""Chart bundle use case — capabilities + requested chart payloads together.
+
+The reports page used to fetch ``/chart-capabilities`` and then one
+endpoint per enabled chart. This use case resolves the (cached) capability
+flags once and runs only the requested charts whose flag is true, reusing
+the per-chart use cases so every payload is identical to its standalone
+endpoint.
+
+DIP: only domain repository interfaces + sibling use cases imported.
+"""
+from typing import Iterable, Optional
+
+from app.application.dtos.chart_dtos import (
+    ChartBundleResponseDTO,
+    ChartCapabilitiesResponseDTO,
+)
+from app.application.use_cases.get_chart_capabilities import GetChartCapabilitiesUseCase
+from app.application.use_cases.get_project_cfd import GetProjectCFDUseCase
+from app.application.use_cases.get_project_iteration import GetProjectIterationUseCase
+from app.application.use_cases.get_project_lead_cycle import GetProjectLeadCycleUseCase
+from app.application.use_cases.get_project_phase_progress import (
+    GetProjectPhaseProgressUseCase,
+)
+from app.domain.repositories.audit_repository import IAuditRepository
+from app.domain.repositories.project_repository import IProjectRepository
+from app.domain.repositories.report_repository import IReportRepository
+from app.domain.repositories.task_repository import ITaskRepository
+
+
+# Charts the bundle can carry (keys of ChartBundleResponseDTO).
+BUNDLE_CHARTS = ("cfd", "lead_cycle", "iteration", "phase_progress")
+
+
+class GetChartBundleUseCase:
+    def __init__(
+        self,
+        project_repo: IProjectRepository,
+        audit_repo: IAuditRepository,
+        report_repo: IReportRepository,
+        task_repo: Optional[ITaskRepository] = None,
+    ):
+        self.project_repo = project_repo
+        self.audit_repo = audit_repo
+        self.report_repo = report_repo
+        self.task_repo = task_repo
+
+    async def execute(
+        self,
+        project_id: int,
+        charts: Iterable[str],
+        range_days: int = 30,
+        count: int = 4,
+    ) -> ChartBundleResponseDTO:
+        """Raises ``ValueError`` for an unknown chart name (router → 422
+        ``UNKNOWN_CHART``); range / count errors propagate from the chart
+        use cases as ``ValueError`` too."""
+        requested = list(dict.fromkeys(charts))
+        unknown = [c for c in requested if c not in BUNDLE_CHARTS]
+        if unknown:
+            raise ValueError(f"unknown chart(s) {unknown}; expected any of {list(BUNDLE_CHARTS)}")
+
+        flags = await GetChartCapabilitiesUseCase(self.project_repo).execute(project_id)
+        bundle = ChartBundleResponseDTO(capabilities=ChartCapabilitiesResponseDTO(**flags))
+        enabled = [c for c in requested if flags.get(c)]
+        if "cfd" in enabled:
+            bundle.cfd = await GetProjectCFDUseCase(self.audit_repo, self.task_repo).execute(
+                project_id=project_id, range_days=range_days,
+            )
+        if "lead_cycle" in enabled:
+            bundle.lead_cycle = await GetProjectLeadCycleUseCase(self.audit_repo).execute(
+                project_id=project_id, range_days=range_days,
+            )
+        if "iteration" in enabled:
+            bundle.iteration = await GetProjectIterationUseCase(self.audit_repo).execute(
+                project_id=project_id, count=count,
+            )
+        if "phase_progress" in enabled:
+            bundle.phase_progress = await GetProjectPhaseProgressUseCase(
+                self.project_repo, self.report_repo,
+            ).execute(project_id)
+        return bundle
@@ -9,6 +9,7 @@ DIP: only domain repository interfaces + domain services imported.
 """
 from typing import Dict
 
+from app.application.services import chart_capability_cache
 from app.domain.entities.project import Project
 from app.domain.exceptions import ProjectNotFoundError
 from app.domain.repositories.project_repository import IProjectRepository
@@ -22,14 +23,29 @@ class GetChartCapabilitiesUseCase:
     all 6 inputs (sprint counts, column categories, member count, phase nodes)
     via scalar subqueries in one query. The rule registry then maps each
     chart name to a boolean.
+
+    The flags are cached per project under ``change_version``
+    (services/chart_capability_cache.py). A warm call is one primary-key
+    lookup. Repositories without a change version (``None``) always resolve.
     """
 
     def __init__(self, project_repo: IProjectRepository):
         self.project_repo = project_repo
 
     async def execute(self, project_id: int) -> Dict[str, bool]:
+        # Read the version BEFORE the inputs: a write landing in between
+        # stores newer flags under the older version, which the next lookup
+        # (at the newer version) simply misses.
+        version = await self.project_repo.get_change_version(project_id)
+        if version is not None:
+            cached = chart_capability_cache.lookup(project_id, version)
+            if cached is not None:
+                return cached
         project = await self.project_repo.get_by_id(project_id)
         if project is None:
             raise ProjectNotFoundError(project_id)
         inputs = await self.project_repo.get_capability_inputs(project_id)
-        return chart_capabilities(project, inputs)
+        flags = chart_capabilities(project, inputs)
+        if version is not None:
+            chart_capability_cache.store(project_id, version, flags)
+        return flags
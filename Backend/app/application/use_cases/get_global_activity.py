@@ -1,4 +1,6 @@
 """D-28: Global activity feed use case — no project_id filter."""
+from typing import Any, Dict, List, Tuple
+
 from app.domain.repositories.audit_repository import IAuditRepository
 from app.application.dtos.activity_dtos import ActivityResponseDTO, ActivityItemDTO
 
@@ -13,8 +15,14 @@ class GetGlobalActivityUseCase:
     def __init__(self, audit_repo: IAuditRepository):
         self.audit_repo = audit_repo
 
+    async def execute_rows(
+        self, limit: int = 20, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Repository row mappings as-is (fast JSON path — no DTO validation)."""
+        return await self.audit_repo.get_global_activity(limit=limit, offset=offset)
+
     async def execute(self, limit: int = 20, offset: int = 0) -> ActivityResponseDTO:
-        items, total = await self.audit_repo.get_global_activity(limit=limit, offset=offset)
+        items, total = await self.execute_rows(limit=limit, offset=offset)
         return ActivityResponseDTO(
             items=[ActivityItemDTO.model_validate(i) for i in items],
             total=total,
@@ -1,5 +1,5 @@
 """API-02 Activity feed use case."""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from app.domain.repositories.audit_repository import IAuditRepository
 from app.application.dtos.activity_dtos import ActivityResponseDTO, ActivityItemDTO
@@ -9,6 +9,22 @@ class GetProjectActivityUseCase:
     def __init__(self, audit_repo: IAuditRepository):
         self.audit_repo = audit_repo
 
+    async def execute_rows(
+        self,
+        project_id: int,
+        types: Optional[List[str]] = None,
+        user_id: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: int = 30,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Repository row mappings as-is (fast JSON path — no DTO validation)."""
+        return await self.audit_repo.get_project_activity(
+            project_id=project_id, types=types, user_id=user_id,
+            date_from=date_from, date_to=date_to, limit=limit, offset=offset,
+        )
+
     async def execute(
         self,
         project_id: int,
@@ -19,7 +35,7 @@ class GetProjectActivityUseCase:
         limit: int = 30,
         offset: int = 0,
     ) -> ActivityResponseDTO:
-        items, total = await self.audit_repo.get_project_activity(
+        items, total = await self.execute_rows(
             project_id=project_id, types=types, user_id=user_id,
             date_from=date_from, date_to=date_to, limit=limit, offset=offset,
         )
@@ -0,0 +1,104 @@
+"""GlobalSearchUseCase — ranked, access-scoped search with highlight spans.
+
+Scope follows GlobalTaskSearchUseCase: admins search everything
+(``accessible_project_ids=None``), everyone else searches the projects
+``project_repo.get_all`` returns for them (managed OR member).
+
+The repository returns up to ``limit`` hits per kind already ranked; this use
+case merges the kinds by score, keeps the top ``limit`` and computes highlight
+spans / snippets in Python — only for the rows that are actually returned.
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from app.application.dtos.search_dtos import (
+    SearchHitDTO,
+    SearchKind,
+    SearchResponseDTO,
+    SearchResultDTO,
+)
+from app.application.use_cases.manage_tasks import extract_search_words
+from app.domain.repositories.project_repository import IProjectRepository
+from app.domain.repositories.search_repository import ISearchRepository
+
+
+ALL_KINDS: Tuple[SearchKind, ...] = ("task", "project", "comment")
+SNIPPET_CHARS = 160
+
+
+def highlight_spans(text: str, words: Sequence[str]) -> List[Tuple[int, int]]:
+    """Merged, sorted ``[start, end)`` spans of every case-insensitive word hit."""
+    if not text or not words:
+        return []
+    pattern = re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)), re.IGNORECASE)
+    spans: List[Tuple[int, int]] = []
+    for m in pattern.finditer(text):
+        if spans and m.start() <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], m.end()))
+        else:
+            spans.append((m.start(), m.end()))
+    return spans
+
+
+def make_snippet(text: Optional[str], words: Sequence[str], width: int = SNIPPET_CHARS) -> Optional[str]:
+    """Window of ``width`` chars around the first word hit (or the head)."""
+    if not text:
+        return None
+    text = " ".join(text.split())
+    if len(text) <= width:
+        return text
+    spans = highlight_spans(text, words)
+    start = max(0, spans[0][0] - width // 3) if spans else 0
+    end = min(len(text), start + width)
+    start = max(0, end - width)
+    return ("…" if start else "") + text[start:end] + ("…" if end < len(text) else "")
+
+
+class GlobalSearchUseCase:
+    def __init__(self, search_repo: ISearchRepository, project_repo: IProjectRepository):
+        self.search_repo = search_repo
+        self.project_repo = project_repo
+
+    async def execute(
+        self,
+        query: str,
+        user_id: int,
+        is_admin: bool,
+        kinds: Optional[Sequence[SearchKind]] = None,
+        limit: int = 20,
+    ) -> SearchResponseDTO:
+        words = extract_search_words(query)
+        if not words:
+            return SearchResponseDTO(query=query, results=[])
+        if is_admin:
+            accessible_project_ids: Optional[List[int]] = None
+        else:
+            projects = await self.project_repo.get_all(user_id)
+            accessible_project_ids = [p.id for p in projects]
+
+        hits = await self.search_repo.search(
+            words=words,
+            kinds=tuple(kinds or ALL_KINDS),
+            accessible_project_ids=accessible_project_ids,
+            limit=limit,
+        )
+        # Stable sort: ties keep the repository's per-kind order.
+        hits = sorted(hits, key=lambda h: -h.score)[:limit]
+        return SearchResponseDTO(query=query, results=[self._to_result(h, words) for h in hits])
+
+    @staticmethod
+    def _to_result(hit: SearchHitDTO, words: List[str]) -> SearchResultDTO:
+        snippet = make_snippet(hit.body, words)
+        return SearchResultDTO(
+            kind=hit.kind,
+            id=hit.id,
+            title=hit.title,
+            title_highlights=highlight_spans(hit.title, words),
+            snippet=snippet,
+            snippet_highlights=highlight_spans(snippet or "", words),
+            project_id=hit.project_id,
+            project_key=hit.project_key,
+            task_id=hit.task_id,
+            task_key=hit.task_key,
+            score=round(hit.score, 4),
+        )
@@ -20,7 +20,7 @@ import json
 import logging
 import secrets
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from app.application.dtos.admin_user_dtos import (
     InviteUserRequestDTO,
@@ -37,6 +37,27 @@ from app.domain.repositories.user_repository import IUserRepository
 logger = logging.getLogger("spms")
 
 
+def issue_invite_token() -> Tuple[str, str]:
+    """Return ``(raw_token, sha256_hex)`` — only the hash is persisted."""
+    raw = secrets.token_urlsafe(32)
+    return raw, hashlib.sha256(raw.encode()).hexdigest()
+
+
+def log_invite_link(frontend_url: str, user_id: Optional[int], email: str, raw_token: str) -> None:
+    """Invite link logged (dev path); production sends via SMTP.
+
+    Must match the served frontend route: the "(auth)" route group adds no URL
+    segment, so the page lives at /set-password (NOT /auth/set-password).
+    """
+    link = f"{frontend_url}/set-password?token={raw_token}"
+    logger.info(json.dumps({
+        "event": "user_invited",
+        "user_id": user_id,
+        "email": email,
+        "link": link,
+    }))
+
+
 class InviteUserUseCase:
     """Admin-triggered email invite — creates user + reset token + logs link."""
 
@@ -98,21 +119,12 @@ class InviteUserUseCase:
         created = await self.user_repo.create(new_user)
 
         # 2) PasswordResetToken with extended invite TTL.
-        raw = secrets.token_urlsafe(32)
-        token_hash = hashlib.sha256(raw.encode()).hexdigest()
+        raw, token_hash = issue_invite_token()
         expires_at = datetime.utcnow() + timedelta(days=self.invite_token_ttl_days)
         await self.password_reset_repo.create(created.id, token_hash, expires_at)
 
         # 3) Invite link logged (dev path); production sends via SMTP.
-        # Must match the served frontend route: the "(auth)" route group adds no
-        # URL segment, so the page lives at /set-password (NOT /auth/set-password).
-        link = f"{self.frontend_url}/set-password?token={raw}"
-        logger.info(json.dumps({
-            "event": "user_invited",
-            "user_id": created.id,
-            "email": created.email,
-            "link": link,
-        }))
+        log_invite_link(self.frontend_url, created.id, created.email, raw)
 
         # 4) Enriched audit row (D-D2 user-lifecycle metadata).
         await self.audit_repo.create_with_metadata(
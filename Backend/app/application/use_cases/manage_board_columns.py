@@ -59,14 +59,18 @@ def _normalize_template_column_shape(col: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _to_dto(column: BoardColumn, task_count: int = 0) -> BoardColumnDTO:
+def _to_dto(column: BoardColumn) -> BoardColumnDTO:
+    # task_count is the persisted per-column counter, loaded with the column.
     return BoardColumnDTO(
         id=column.id,
         project_id=column.project_id,
         name=column.name,
         order_index=column.order_index,
         wip_limit=column.wip_limit,
-        task_count=task_count,
+        task_count=column.task_count,
+        wip_utilization=(
+            round(column.task_count / column.wip_limit, 4) if column.wip_limit else None
+        ),
         # Phase 17 — workflow engine fields. Entity carries defaults so a row
         # that predates migration 013 (where DB columns are NULL) still
         # serializes cleanly into the DTO via Pydantic from_attributes coercion.
@@ -85,11 +89,7 @@ class ListColumnsUseCase:
 
     async def execute(self, project_id: int) -> List[BoardColumnDTO]:
         columns = await self.column_repo.get_by_project(project_id)
-        result = []
-        for col in columns:
-            count = await self.column_repo.count_tasks(col.id)
-            result.append(_to_dto(col, count))
-        return result
+        return [_to_dto(col) for col in columns]
 
 
 class CreateColumnUseCase:
@@ -130,8 +130,7 @@ class CreateColumnUseCase:
 
         column = BoardColumn(**kwargs)
         created = await self.column_repo.create(column)
-        task_count = await self.column_repo.count_tasks(created.id)
-        return _to_dto(created, task_count)
+        return _to_dto(created)
 
 
 class UpdateColumnUseCase:
@@ -164,8 +163,7 @@ class UpdateColumnUseCase:
             exit_policy=dto.exit_policy if dto.exit_policy is not None else existing.exit_policy,
         )
         saved = await self.column_repo.update(updated_column)
-        task_count = await self.column_repo.count_tasks(saved.id)
-        return _to_dto(saved, task_count)
+        return _to_dto(saved)
 
 
 class DeleteColumnUseCase:
@@ -316,5 +314,5 @@ class SeedDefaultColumnsUseCase:
                 exit_policy=spec.get("exit_policy", "any"),
             )
             created = await self.column_repo.create(column)
-            columns.append(_to_dto(created, 0))
+            columns.append(_to_dto(created))
         return columns
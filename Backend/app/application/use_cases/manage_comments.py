@@ -38,20 +38,21 @@ async def _build_comment_audit_metadata(
     task_repo: Optional[ITaskRepository],
 ) -> dict:
     """Compose the D-D2 audit metadata envelope for a comment lifecycle event."""
-    task_key = None
-    task_title = None
+    identity = None
     if task_repo is not None and comment.task_id is not None:
-        task = await task_repo.get_by_id(comment.task_id)
-        if task is not None:
-            task_key = task.task_key
-            task_title = task.title
-    return {
+        identity = await task_repo.get_audit_identity(comment.task_id)
+    identity = identity or {}
+    metadata = {
         "task_id": comment.task_id,
-        "task_key": task_key,
-        "task_title": task_title,
+        "task_key": identity.get("task_key"),
+        "task_title": identity.get("title"),
         "comment_id": comment.id,
         "comment_excerpt": _build_comment_excerpt(comment.content),
     }
+    # Lets the audit writer fill audit_log.project_id without a subquery.
+    if identity.get("project_id") is not None:
+        metadata["project_id"] = identity["project_id"]
+    return metadata
 
 
 def _is_admin(user) -> bool:
@@ -1,24 +1,35 @@
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, List, Optional
 from app.domain.repositories.task_repository import ITaskRepository
 from app.domain.repositories.project_repository import IProjectRepository
 from app.application.dtos.task_dtos import (
     TaskCreateDTO,
     TaskUpdateDTO,
+    BulkTaskUpdateDTO,
     TaskResponseDTO,
     ProjectSummaryDTO,
     ParentTaskSummaryDTO,
     SubTaskSummaryDTO,
+    SubtaskNodeDTO,
+    SubtaskRollupDTO,
     UserSummaryDTO,
     PaginatedResponse,
 )
 from app.domain.entities.task import Task
+from app.domain.entities.user import User
 from app.domain.exceptions import (
     TaskNotFoundError,
     ProjectNotFoundError,
+    ProjectAccessDeniedError,
     InvalidColumnMoveError,
     WipLimitExceededError,
 )
 from app.domain.services.workflow_engine import WorkflowEngine
+from app.application.services.bulk_task_notifier import BulkTaskNotifier
+
+# Subtask hierarchy depth (levels below the task) for the subtree / summary endpoints.
+SUBTREE_DEFAULT_DEPTH = 3
+SUBTREE_MAX_DEPTH = 10
 
 STOP_WORDS = {"the", "a", "an", "is", "in", "on", "at", "to", "for", "of", "and", "or", "this", "that", "with"}
 
@@ -133,6 +144,41 @@ def map_task_to_response_dto(task: Task) -> TaskResponseDTO:
         updated_at=task.updated_at
     )
 
+def map_subtree_to_dto(task: Task) -> SubtaskNodeDTO:
+    """Nested DTO of a ``get_subtree`` result.
+
+    Status / is_done follow ``map_task_to_response_dto``; one WorkflowEngine
+    per project serves every node of the tree.
+    """
+    engines: Dict[int, WorkflowEngine] = {}
+
+    def node(t: Task) -> SubtaskNodeDTO:
+        status_slug, is_done = "todo", False
+        if t.column:
+            status_slug = t.column.name.lower()
+            engine = engines.get(t.project_id)
+            if engine is None:
+                engine = engines[t.project_id] = WorkflowEngine(
+                    workflow=(t.project.process_config or {}).get("task_workflow") if t.project else None,
+                    columns=(t.project.columns if t.project else []) or [],
+                )
+            is_done = engine.is_terminal(t.column)
+        project_key = t.project.key if t.project else "TASK"
+        return SubtaskNodeDTO(
+            id=t.id,
+            title=t.title,
+            key=t.task_key or f"{project_key}-{t.id}",
+            status=status_slug,
+            is_done=is_done,
+            priority=t.priority,
+            points=t.points,
+            assignee_id=t.assignee_id,
+            parent_task_id=t.parent_task_id,
+            subtasks=[node(sub) for sub in t.subtasks],
+        )
+
+    return node(task)
+
 class CreateTaskUseCase:
     def __init__(self, task_repo: ITaskRepository, project_repo: IProjectRepository):
         self.task_repo = task_repo
@@ -182,6 +228,36 @@ class GetTaskUseCase:
         # Yeni mapper fonksiyonunu kullanıyoruz
         return map_task_to_response_dto(task)
 
+class GetTaskSubtreeUseCase:
+    def __init__(self, task_repo: ITaskRepository):
+        self.task_repo = task_repo
+
+    async def execute(self, task_id: int, depth: int = SUBTREE_DEFAULT_DEPTH) -> SubtaskNodeDTO:
+        task = await self.task_repo.get_subtree(task_id, depth)
+        if not task:
+            raise TaskNotFoundError(f"Task with id {task_id} not found")
+        return map_subtree_to_dto(task)
+
+class GetSubtaskSummaryUseCase:
+    def __init__(self, task_repo: ITaskRepository):
+        self.task_repo = task_repo
+
+    async def execute(
+        self, project_id: int, parent_ids: List[int], depth: int = SUBTREE_DEFAULT_DEPTH
+    ) -> List[SubtaskRollupDTO]:
+        """One roll-up per requested parent, in request order (zeros when it has no subtasks)."""
+        parent_ids = list(dict.fromkeys(parent_ids))
+        counts = await self.task_repo.subtask_summaries(project_id, parent_ids, depth)
+        result = []
+        for parent_id in parent_ids:
+            c = counts.get(parent_id)
+            if c is None:
+                result.append(SubtaskRollupDTO(parent_id=parent_id))
+                continue
+            ratio = round(c["done"] / c["total"], 4) if c["total"] else 0.0
+            result.append(SubtaskRollupDTO(parent_id=parent_id, done_ratio=ratio, **c))
+        return result
+
 def _check_recurrence_should_continue(task: Task) -> bool:
     from datetime import date, datetime
     if task.recurrence_end_date:
@@ -297,13 +373,11 @@ class UpdateTaskUseCase:
                         None,
                     )
                     if target_col is not None:
-                        # Exclude self: the moving task is currently NOT in the
-                        # target column, but excluding it is still defensive — it
-                        # guarantees that an in-flight transient state (e.g. the
-                        # row being mid-write) never inflates the count.
-                        current_count = await self.task_repo.count_tasks_in_column(
-                            dto.column_id, exclude_task_id=task_id
-                        )
+                        # The column's maintained task_count came with
+                        # project.columns — no COUNT round trip. The moving task
+                        # is in another column (this branch only runs on a
+                        # cross-column move), so it is not part of the count.
+                        current_count = target_col.task_count
                         ok, reason = engine.check_wip(target_col, current_count)
                         if not ok:
                             raise WipLimitExceededError(
@@ -352,6 +426,140 @@ class UpdateTaskUseCase:
 
         return map_task_to_response_dto(updated_task)
 
+class BulkUpdateTasksUseCase:
+    """POST /tasks/bulk — many TaskUpdateDTOs, one transaction.
+
+    Validation mirrors UpdateTaskUseCase but is computed per *target*, not per
+    task: each project is loaded once, ``can_move`` is evaluated once per
+    distinct (from, to) column pair, and WIP is checked once per target column
+    against ``current + incoming`` using the columns' maintained task_count
+    (no COUNT query). Any violation
+    rejects the whole batch before a row is written. ``apply_to='all'`` series
+    propagation is not offered in bulk.
+
+    With a ``notifier`` and an ``actor``, the batched notifications, e-mails
+    and integration events (BulkTaskNotifier) follow the write.
+    """
+
+    def __init__(
+        self,
+        task_repo: ITaskRepository,
+        project_repo: IProjectRepository,
+        notifier: Optional[BulkTaskNotifier] = None,
+    ):
+        self.task_repo = task_repo
+        self.project_repo = project_repo
+        self.notifier = notifier
+
+    async def execute(
+        self,
+        dto: BulkTaskUpdateDTO,
+        user_id: int,
+        is_admin: bool = False,
+        actor: Optional[User] = None,
+    ) -> List[TaskResponseDTO]:
+        changes: Dict[int, TaskUpdateDTO] = {}
+        for item in dto.updates:
+            if item.task_id in changes:
+                raise ValueError(f"Task {item.task_id} appears more than once in the batch")
+            changes[item.task_id] = item.changes
+
+        tasks = {t.id: t for t in await self.task_repo.get_by_ids(list(changes))}
+        for task_id in changes:
+            if task_id not in tasks:
+                raise TaskNotFoundError(task_id)
+
+        projects = {}
+        for project_id in sorted({t.project_id for t in tasks.values()}):
+            if is_admin:
+                project = await self.project_repo.get_by_id(project_id)
+                if project is None:
+                    raise ProjectNotFoundError(project_id)
+            else:
+                project = await self.project_repo.get_by_id_and_user(project_id, user_id)
+                if project is None:
+                    raise ProjectAccessDeniedError(project_id)
+            projects[project_id] = project
+
+        # Column moves grouped per project: (task, target column id)
+        moves_by_project: Dict[int, list] = {}
+        for task_id, change in changes.items():
+            task = tasks[task_id]
+            if change.column_id is None:
+                continue
+            valid_column_ids = {c.id for c in projects[task.project_id].columns or []}
+            if change.column_id not in valid_column_ids:
+                raise ValueError(f"Column {change.column_id} does not belong to project {task.project_id}")
+            if task.column_id != change.column_id:
+                moves_by_project.setdefault(task.project_id, []).append((task, change.column_id))
+
+        engines = {
+            pid: WorkflowEngine(
+                workflow=(project.process_config or {}).get("task_workflow"),
+                columns=project.columns or [],
+            )
+            for pid, project in projects.items()
+        }
+        wip_targets: Counter = Counter()
+        for pid, moves in moves_by_project.items():
+            engine = engines[pid]
+            # Phase 17 C7 — one engine check per distinct edge
+            if engine.cap("enforce_sequential_dependencies"):
+                for from_id, to_id in {(t.column_id, to) for t, to in moves}:
+                    ok, reason = engine.can_move(from_id, to_id)
+                    if not ok:
+                        raise InvalidColumnMoveError(
+                            from_id=from_id, to_id=to_id, reason=reason or "edge missing"
+                        )
+            if engine.cap("enforce_wip_limits"):
+                wip_targets.update(to for _, to in moves)
+
+        # Phase 17 C8 — WIP from the columns' maintained task_count (loaded
+        # with project.columns). Moving tasks that currently sit in a target
+        # column are subtracted so a column's own rows never count twice.
+        if wip_targets:
+            leaving = Counter(
+                t.column_id for moves in moves_by_project.values() for t, _ in moves
+            )
+            for pid, project in projects.items():
+                for col in project.columns or []:
+                    incoming = wip_targets.get(col.id)
+                    if not incoming:
+                        continue
+                    current = col.task_count - leaving.get(col.id, 0)
+                    # check_wip admits one more task while count < limit, so
+                    # N incoming fit iff the (N-1)th still sees room.
+                    ok, _ = engines[pid].check_wip(col, current + incoming - 1)
+                    if not ok:
+                        raise WipLimitExceededError(
+                            column_id=col.id,
+                            column_name=col.name,
+                            limit=col.wip_limit,
+                            current=current,
+                        )
+
+        updated = await self.task_repo.bulk_update(
+            {task_id: change.model_dump(exclude_unset=True) for task_id, change in changes.items()},
+            user_id=user_id,
+        )
+
+        # Phase 17 C9 — recurring next instance for tasks landing in a terminal column
+        for pid, moves in moves_by_project.items():
+            engine = engines[pid]
+            if not engine.cap("has_recurring", default=True):
+                continue
+            columns = {c.id: c for c in projects[pid].columns or []}
+            for task, to_id in moves:
+                if task.is_recurring and engine.is_terminal(columns.get(to_id)):
+                    if _check_recurrence_should_continue(task):
+                        await _create_next_recurrence_instance(task, self.task_repo)
+
+        result = [map_task_to_response_dto(t) for t in updated]
+        if self.notifier is not None and actor is not None:
+            await self.notifier.notify(changes, result, actor)
+        return result
+
+
 class DeleteTaskUseCase:
     def __init__(self, task_repo: ITaskRepository, project_repo: IProjectRepository):
         self.task_repo = task_repo
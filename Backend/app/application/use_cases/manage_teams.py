@@ -4,6 +4,7 @@ from app.domain.entities.user import User
 from app.domain.repositories.team_repository import ITeamRepository
 from app.domain.repositories.user_repository import IUserRepository
 from app.application.dtos.team_dtos import TeamCreateDTO, TeamUpdateDTO, TeamResponseDTO
+from app.application.services import team_stats_cache
 from fastapi import HTTPException
 
 
@@ -25,6 +26,7 @@ class CreateTeamUseCase:
         for uid in (dto.member_ids or []):
             if uid != current_user.id:
                 await self._team_repo.add_member(team.id, uid)
+        team_stats_cache.invalidate()
         return team
 
 
@@ -70,6 +72,7 @@ class AddTeamMemberUseCase:
         if target is None:
             raise HTTPException(status_code=404, detail="User not found")
         await self._team_repo.add_member(team_id, user_id)
+        team_stats_cache.invalidate()
 
 
 class RemoveTeamMemberUseCase:
@@ -83,6 +86,7 @@ class RemoveTeamMemberUseCase:
         if team.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Only team owner can remove members")
         await self._team_repo.remove_member(team_id, user_id)
+        team_stats_cache.invalidate()
 
 
 class ListTeamsUseCase:
@@ -133,6 +137,7 @@ class DeleteTeamUseCase:
         if team.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Only team owner can delete this team")
         await self._team_repo.soft_delete(team_id)
+        team_stats_cache.invalidate()
 
 
 class LeaveTeamUseCase:
@@ -151,6 +156,7 @@ class LeaveTeamUseCase:
         if current_user.id not in member_ids:
             raise HTTPException(status_code=400, detail="You are not a member of this team")
         await self._team_repo.remove_member(team_id, current_user.id)
+        team_stats_cache.invalidate()
 
 
 class GetLedTeamsUseCase:
@@ -189,7 +195,12 @@ class GetTeamsStatsUseCase:
         self._team_repo = team_repo
 
     async def execute(self, current_user: User) -> dict:
-        return await self._team_repo.get_stats_for_user(current_user.id)
+        cached = team_stats_cache.lookup(current_user.id)
+        if cached is not None:
+            return cached
+        stats = await self._team_repo.get_stats_for_user(current_user.id)
+        team_stats_cache.store(current_user.id, stats)
+        return stats
 
 
 class GetTeamProjectsUseCase:
@@ -232,6 +243,7 @@ class AssignProjectToTeamUseCase:
         if not is_admin and team.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Only the team owner or an admin can assign projects")
         await self._team_repo.assign_project(team_id, project_id)
+        team_stats_cache.invalidate()
 
 
 class UnassignProjectFromTeamUseCase:
@@ -247,4 +259,5 @@ class UnassignProjectFromTeamUseCase:
         is_admin = current_user.role and current_user.role.name.lower() == "admin"
         if not is_admin and team.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Only the team owner or an admin can unassign projects")
-        await self._team_repo.unassign_project(team_id, project_id)
\ No newline at end of file
+        await self._team_repo.unassign_project(team_id, project_id)
+        team_stats_cache.invalidate()
\ No newline at end of file
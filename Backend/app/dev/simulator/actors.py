@@ -101,19 +101,24 @@ async def build_actors(session: AsyncSession, rng: random.Random) -> List[Actor]
     """Load users + memberships into Actor objects.
 
     Users with no project membership are excluded — they would never act.
-    Daily budget is sampled once per actor (range driven by role).
+    Daily budget is sampled once per actor (range driven by role). Rows are
+    read in id order so the budgets a seed produces don't depend on the
+    order Postgres happens to return them in.
     """
     # Pull (user_id, role_name) pairs once.
     user_q = (
         select(UserModel.id, RoleModel.name)
         .join(RoleModel, UserModel.role_id == RoleModel.id, isouter=True)
         .where(UserModel.is_active == True)  # noqa: E712
+        .order_by(UserModel.id)
     )
     rows = (await session.execute(user_q)).all()
     role_by_uid = {uid: _classify_role(rname) for uid, rname in rows}
 
     # Pull memberships.
-    mem_q = select(project_members.c.user_id, project_members.c.project_id)
+    mem_q = select(project_members.c.user_id, project_members.c.project_id).order_by(
+        project_members.c.user_id, project_members.c.project_id,
+    )
     mem_rows = (await session.execute(mem_q)).all()
     memberships: Dict[int, List[int]] = {}
     for uid, pid in mem_rows:
@@ -0,0 +1,504 @@
+"""Bulk mode for the discrete-event simulator (``run --bulk``).
+
+The sequential loop in ``run.py`` sends every event through the ORM on one
+session: a flush per created row, a ``SELECT ... ORDER BY random()`` per
+picked task, a commit every ``_COMMIT_EVERY`` events. Bulk mode keeps the
+same event mix and mirrors the event factories of ``events.py``, but:
+
+1. Each project is simulated on its own ``random.Random(f"{seed}:{pid}")``
+   stream with its own clock, against an in-memory copy of its tasks.
+   Projects never share state, so they run in parallel worker processes
+   (``--workers``). Output is identical for any worker count.
+2. An actor's daily budget is spread over their projects per event
+   (keep-probability ``1 / len(actor.project_ids)``) instead of a shared
+   ``rng.choice`` — the choice would couple the projects' streams.
+3. Tasks, comments, audit_log and notification rows are collected in
+   memory. Global ids follow event time (ties broken by project id), then
+   every table is written with one asyncpg ``COPY`` on a single
+   transaction. Timestamps are written explicitly, so neither the patcher
+   nor time-machine is needed.
+4. After the load: id sequences are moved past the written ids,
+   ``projects.task_seq`` is updated and the board-column counters are
+   recomputed (same as the snapshot loader).
+
+Determinism: the same seed against the same baseline produces identical
+rows. Bulk and sequential runs produce different (statistically alike)
+timelines — the sequential loop also draws from ``ORDER BY random()``.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import json
+import logging
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dev.simulator import events as events_mod
+from app.dev.simulator.actors import Actor, pick_event_type
+from app.dev.simulator.transitions import initial_column, is_terminal, next_step
+from app.infrastructure.database.models.comment import CommentModel
+from app.infrastructure.database.models.notification import NotificationType
+from app.infrastructure.database.models.project import ProjectModel
+from app.infrastructure.database.models.task import TaskModel, TaskPriority
+from app.infrastructure.database.util import audit_partitions, change_version, task_stats
+
+
+logger = logging.getLogger("simulator")
+
+
+# Random probes for a "ripe" task (updated before the dwell cutoff) before
+# falling back to a scan. Most tasks are ripe, so the first probe usually hits.
+_PICK_TRIES = 8
+
+TASK_COLUMNS = (
+    "id", "project_id", "sprint_id", "column_id", "assignee_id", "reporter_id",
+    "title", "description", "priority", "points", "is_recurring", "task_key",
+    "due_date", "created_at", "updated_at", "version", "is_deleted",
+)
+COMMENT_COLUMNS = (
+    "id", "task_id", "user_id", "content", "created_at", "updated_at",
+    "version", "is_deleted",
+)
+AUDIT_COLUMNS = (
+    "entity_type", "entity_id", "field_name", "old_value", "new_value",
+    "user_id", "action", "timestamp", "project_id", "metadata",
+)
+NOTIFICATION_COLUMNS = (
+    "user_id", "type", "message", "related_entity_id", "is_read", "created_at",
+)
+
+
+# ---------------------------------------------------------------------------
+# Inputs / outputs (plain dataclasses — pickled to and from worker processes)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ProjectPlan:
+    """Everything one project's simulation reads; built once from the DB."""
+    project_id: int
+    project_key: str
+    methodology: str
+    column_ids: Dict[str, int]  # column name -> id
+    path: List[str]
+    member_ids: List[int]
+    active_sprint_id: Optional[int]
+    actors: List[Actor]  # actors that are members of this project
+    task_seq: int
+
+
+@dataclass
+class SimTask:
+    local: int
+    project_id: int
+    sprint_id: Optional[int]
+    column_name: str
+    column_id: int
+    assignee_id: int
+    reporter_id: int
+    title: str
+    priority: TaskPriority
+    points: int
+    task_key: str
+    due_date: _dt.datetime
+    created_at: _dt.datetime
+    updated_at: _dt.datetime
+
+
+@dataclass
+class SimComment:
+    local: int
+    task_local: int
+    user_id: int
+    content: str
+    created_at: _dt.datetime
+
+
+@dataclass
+class SimAudit:
+    entity_type: str  # "task" / "comment" — entity_local indexes that list
+    entity_local: int
+    user_id: int
+    action: str
+    field_name: str
+    old_value: Optional[str]
+    new_value: Optional[str]
+    metadata: dict
+    timestamp: _dt.datetime
+    metadata_task_local: Optional[int] = None  # comment rows carry task_id
+
+
+@dataclass
+class SimNotification:
+    user_id: int
+    type: NotificationType
+    message: str
+    task_local: int
+    created_at: _dt.datetime
+
+
+@dataclass
+class ProjectOutput:
+    project_id: int
+    task_seq: int
+    events: int = 0
+    tasks: List[SimTask] = field(default_factory=list)
+    comments: List[SimComment] = field(default_factory=list)
+    audits: List[SimAudit] = field(default_factory=list)
+    notifications: List[SimNotification] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Per-project simulation (pure — no DB, no global state)
+# ---------------------------------------------------------------------------
+
+
+def project_rng(seed: int, project_id: int) -> random.Random:
+    """Independent, reproducible stream per project (str seeds are hashed stably)."""
+    return random.Random(f"{seed}:{project_id}")
+
+
+class _ProjectSim:
+    """In-memory twin of the ``events.py`` factories for one project."""
+
+    def __init__(self, plan: ProjectPlan, rng: random.Random) -> None:
+        self.plan = plan
+        self.rng = rng
+        self.now = _dt.datetime.min
+        self.out = ProjectOutput(project_id=plan.project_id, task_seq=plan.task_seq)
+
+    def _audit(self, entity_type: str, entity_local: int, actor: Actor, action: str,
+               field_name: str, old_value: Optional[str], new_value: Optional[str],
+               metadata: dict, metadata_task_local: Optional[int] = None) -> None:
+        self.out.audits.append(SimAudit(
+            entity_type, entity_local, actor.user_id, action, field_name,
+            old_value, new_value, metadata, self.now, metadata_task_local,
+        ))
+
+    def _pick_task(self, *, require_non_terminal: bool, min_dwell_hours: int) -> Optional[SimTask]:
+        """``events._pick_task``: a random task updated before the dwell cutoff."""
+        tasks = self.out.tasks
+        if not tasks:
+            return None
+        cutoff = self.now - _dt.timedelta(hours=min_dwell_hours)
+        for _ in range(_PICK_TRIES):
+            task = tasks[self.rng.randrange(len(tasks))]
+            if task.updated_at <= cutoff:
+                break
+        else:
+            ripe = [t for t in tasks if t.updated_at <= cutoff]
+            if not ripe:
+                return None
+            task = self.rng.choice(ripe)
+        if require_non_terminal and is_terminal(task.column_name, self.plan.path):
+            return None
+        return task
+
+    def create_task(self, actor: Actor) -> bool:
+        plan, rng = self.plan, self.rng
+        initial = initial_column(plan.path)
+        if not initial or initial not in plan.column_ids or not plan.member_ids:
+            return False
+        assignee_id = rng.choice(plan.member_ids)
+        self.out.task_seq += 1
+        seq = self.out.task_seq
+        title = events_mod._make_task_title(rng)
+        due_offset = rng.choices(
+            [rng.randint(-25, -1), rng.randint(1, 21), rng.randint(22, 75)],
+            weights=[30, 50, 20], k=1,
+        )[0]
+        task = SimTask(
+            local=len(self.out.tasks),
+            project_id=plan.project_id,
+            sprint_id=plan.active_sprint_id if plan.methodology == "SCRUM" else None,
+            column_name=initial,
+            column_id=plan.column_ids[initial],
+            assignee_id=assignee_id,
+            reporter_id=actor.user_id,
+            title=title,
+            priority=rng.choice(list(TaskPriority)),
+            points=rng.choice([1, 2, 3, 5, 8, 13]),
+            task_key=f"{plan.project_key}-{seq}",
+            due_date=self.now + _dt.timedelta(days=due_offset),
+            created_at=self.now,
+            updated_at=self.now,
+        )
+        self.out.tasks.append(task)
+        self._audit(
+            "task", task.local, actor, "created", "status", None, initial,
+            {"task_title": title, "project_id": plan.project_id, "task_key": f"{seq}"},
+        )
+        if assignee_id != actor.user_id:
+            self.out.notifications.append(SimNotification(
+                assignee_id, NotificationType.TASK_ASSIGNED,
+                f"Yeni görev atandı: {title}", task.local, self.now,
+            ))
+        return True
+
+    def transition_task(self, actor: Actor) -> bool:
+        task = self._pick_task(require_non_terminal=True, min_dwell_hours=self.rng.randint(4, 24))
+        if task is None:
+            return False
+        target = next_step(task.column_name, self.plan.path, self.rng)
+        if not target or target not in self.plan.column_ids:
+            return False
+        old = task.column_name
+        task.column_name, task.column_id = target, self.plan.column_ids[target]
+        task.updated_at = self.now
+        self._audit(
+            "task", task.local, actor, "updated", "column_id", old, target,
+            {"task_title": task.title, "project_id": self.plan.project_id, "phase_transition": True},
+        )
+        return True
+
+    def assign_task(self, actor: Actor) -> bool:
+        task = self._pick_task(require_non_terminal=True, min_dwell_hours=self.rng.randint(2, 12))
+        if task is None or not self.plan.member_ids:
+            return False
+        new_assignee = self.rng.choice(self.plan.member_ids)
+        if new_assignee == task.assignee_id:
+            return False
+        old = task.assignee_id
+        task.assignee_id = new_assignee
+        task.updated_at = self.now
+        self._audit(
+            "task", task.local, actor, "updated", "assignee_id",
+            str(old) if old else None, str(new_assignee),
+            {"task_title": task.title, "project_id": self.plan.project_id},
+        )
+        self.out.notifications.append(SimNotification(
+            new_assignee, NotificationType.TASK_ASSIGNED,
+            f"Görev sana atandı: {task.title}", task.local, self.now,
+        ))
+        return True
+
+    def comment_task(self, actor: Actor) -> bool:
+        task = self._pick_task(require_non_terminal=False, min_dwell_hours=self.rng.randint(0, 6))
+        if task is None:
+            return False
+        content = events_mod._make_comment(self.rng)
+        comment = SimComment(len(self.out.comments), task.local, actor.user_id, content, self.now)
+        self.out.comments.append(comment)
+        self._audit(
+            "comment", comment.local, actor, "created", "content", None, content[:60],
+            {"task_title": task.title, "project_id": self.plan.project_id,
+             "comment_excerpt": content[:60]},
+            metadata_task_local=task.local,
+        )
+        return True
+
+    def execute(self, event_name: str, actor: Actor) -> bool:
+        handler = getattr(self, event_name, None) if event_name in events_mod.EVENT_DISPATCH else None
+        return handler(actor) if handler is not None else False
+
+
+def simulate_project(
+    plan: ProjectPlan,
+    day_scales: Sequence[Tuple[_dt.date, float]],
+    seed: int,
+) -> ProjectOutput:
+    """Run every simulated day for one project. ``day_scales`` = (day, activity scale)."""
+    rng = project_rng(seed, plan.project_id)
+    sim = _ProjectSim(plan, rng)
+    for day, scale in day_scales:
+        sim.now = _dt.datetime.combine(day, _dt.time(9, 0))
+        members = list(plan.actors)
+        rng.shuffle(members)
+        for actor in members:
+            budget = max(0, int(round(actor.daily_budget * scale)))
+            keep = 1.0 / max(len(actor.project_ids), 1)
+            for _ in range(budget):
+                if keep < 1.0 and rng.random() >= keep:
+                    continue  # this slot went to another of the actor's projects
+                event_type = pick_event_type(actor, plan.methodology, rng)
+                if sim.execute(event_type, actor):
+                    sim.out.events += 1
+                sim.now += _dt.timedelta(minutes=rng.randint(5, 25))
+    return sim.out
+
+
+def _simulate_star(args) -> ProjectOutput:
+    return simulate_project(*args)
+
+
+def simulate_all(
+    plans: Sequence[ProjectPlan],
+    day_scales: Sequence[Tuple[_dt.date, float]],
+    seed: int,
+    workers: int = 1,
+) -> List[ProjectOutput]:
+    """Simulate every project; ``workers > 1`` fans out over processes (same output)."""
+    jobs = [(plan, list(day_scales), seed) for plan in plans]
+    if workers <= 1 or len(jobs) <= 1:
+        return [_simulate_star(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_simulate_star, jobs, chunksize=1))
+
+
+# ---------------------------------------------------------------------------
+# Assembly — global ids + COPY-ready records
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class BulkRows:
+    tasks: List[tuple]
+    comments: List[tuple]
+    audits: List[tuple]
+    notifications: List[tuple]
+    task_seqs: Dict[int, int]
+
+
+def assemble(
+    outputs: Sequence[ProjectOutput],
+    task_id_start: int = 0,
+    comment_id_start: int = 0,
+) -> BulkRows:
+    """Give every row its global id (event-time order) and flatten to COPY records."""
+    task_ids: Dict[Tuple[int, int], int] = {}
+    ordered_tasks = sorted(
+        ((t.created_at, o.project_id, t.local, t) for o in outputs for t in o.tasks),
+        key=lambda r: r[:3],
+    )
+    tasks = []
+    for offset, (_, pid, local, t) in enumerate(ordered_tasks, start=1):
+        tid = task_id_start + offset
+        task_ids[(pid, local)] = tid
+        tasks.append((
+            tid, pid, t.sprint_id, t.column_id, t.assignee_id, t.reporter_id,
+            t.title, f"Otomatik üretilen görev — {t.title}", t.priority.name, t.points,
+            False, t.task_key, t.due_date, t.created_at, t.updated_at, 1, False,
+        ))
+
+    comment_ids: Dict[Tuple[int, int], int] = {}
+    ordered_comments = sorted(
+        ((c.created_at, o.project_id, c.local, c) for o in outputs for c in o.comments),
+        key=lambda r: r[:3],
+    )
+    comments = []
+    for offset, (_, pid, local, c) in enumerate(ordered_comments, start=1):
+        cid = comment_id_start + offset
+        comment_ids[(pid, local)] = cid
+        comments.append((
+            cid, task_ids[(pid, c.task_local)], c.user_id, c.content,
+            c.created_at, c.created_at, 1, False,
+        ))
+
+    audits = []
+    for ts, pid, _, a in sorted(
+        ((a.timestamp, o.project_id, i, a) for o in outputs for i, a in enumerate(o.audits)),
+        key=lambda r: r[:3],
+    ):
+        ids = task_ids if a.entity_type == "task" else comment_ids
+        metadata = dict(a.metadata)
+        if a.metadata_task_local is not None:
+            metadata["task_id"] = task_ids[(pid, a.metadata_task_local)]
+        audits.append((
+            a.entity_type, ids[(pid, a.entity_local)], a.field_name, a.old_value,
+            a.new_value, a.user_id, a.action, ts, pid, json.dumps(metadata, ensure_ascii=False),
+        ))
+
+    notifications = [
+        (n.user_id, n.type.name, n.message, task_ids[(pid, n.task_local)], False, ts)
+        for ts, pid, _, n in sorted(
+            ((n.created_at, o.project_id, i, n) for o in outputs for i, n in enumerate(o.notifications)),
+            key=lambda r: r[:3],
+        )
+    ]
+    return BulkRows(
+        tasks=tasks, comments=comments, audits=audits, notifications=notifications,
+        task_seqs={o.project_id: o.task_seq for o in outputs},
+    )
+
+
+# ---------------------------------------------------------------------------
+# DB side
+# ---------------------------------------------------------------------------
+
+
+async def load_plans(
+    session: AsyncSession,
+    projects: Sequence[ProjectModel],
+    actors: Sequence[Actor],
+) -> List[ProjectPlan]:
+    """One ProjectPlan per project (sorted ids/members so plans don't depend on row order)."""
+    plans = []
+    for project in sorted(projects, key=lambda p: p.id):
+        ctx = await events_mod.load_project_ctx(session, project)
+        plans.append(ProjectPlan(
+            project_id=ctx.project_id,
+            project_key=ctx.project_key,
+            methodology=ctx.methodology,
+            column_ids={name: col.id for name, col in ctx.columns_by_name.items()},
+            path=list(ctx.path),
+            member_ids=sorted(ctx.member_ids),
+            active_sprint_id=ctx.active_sprint_id,
+            actors=sorted(
+                (a for a in actors if ctx.project_id in a.project_ids),
+                key=lambda a: a.user_id,
+            ),
+            task_seq=project.task_seq or 0,
+        ))
+    return plans
+
+
+async def _move_sequence(session: AsyncSession, table: str) -> None:
+    await session.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"(SELECT coalesce(max(id), 0) + 1 FROM {table}), false)"
+    ))
+
+
+async def write_rows(session: AsyncSession, outputs: Sequence[ProjectOutput]) -> BulkRows:
+    """COPY every simulated row in one transaction, then repair derived state. Commits."""
+    task_base = await session.scalar(select(func.coalesce(func.max(TaskModel.id), 0)))
+    comment_base = await session.scalar(select(func.coalesce(func.max(CommentModel.id), 0)))
+    rows = assemble(outputs, task_base, comment_base)
+
+    # The history is backdated: create its months' partitions before the
+    # COPY, or every row lands in audit_log_default (see audit_partitions).
+    if rows.audits and await audit_partitions.is_partitioned(session):
+        ts = AUDIT_COLUMNS.index("timestamp")
+        stamps = [audit[ts] for audit in rows.audits]
+        created = await audit_partitions.ensure_partitions_for_range(
+            session, min(stamps).date(), max(stamps).date()
+        )
+        if created:
+            logger.info(f"SIMULATOR(bulk): created audit_log partitions {', '.join(created)}")
+
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    pg = raw.driver_connection
+    for table, columns, records in (
+        ("tasks", TASK_COLUMNS, rows.tasks),
+        ("comments", COMMENT_COLUMNS, rows.comments),
+        ("audit_log", AUDIT_COLUMNS, rows.audits),
+        ("notifications", NOTIFICATION_COLUMNS, rows.notifications),
+    ):
+        if records:
+            await pg.copy_records_to_table(table, records=records, columns=list(columns))
+        logger.info(f"SIMULATOR(bulk): copied {len(records)} rows into {table}")
+
+    await _move_sequence(session, "tasks")
+    await _move_sequence(session, "comments")
+    if rows.task_seqs:
+        projects = ProjectModel.__table__
+        await session.execute(
+            update(projects)
+            .where(projects.c.id == bindparam("pid"))
+            .values(task_seq=bindparam("seq"), updated_at=projects.c.updated_at),
+            [{"pid": pid, "seq": seq} for pid, seq in rows.task_seqs.items()],
+        )
+    # COPY bypasses the ORM flush hooks: bump change_version by hand so ETags
+    # and version-keyed caches of the loaded projects revalidate. Before the
+    # recompute — projects row, then counter lock (task_stats "Lock order").
+    await change_version.bump(session, sorted({out.project_id for out in outputs}))
+    await task_stats.recompute(session)
+    await session.commit()
+    return rows
@@ -3,6 +3,7 @@
 Usage (from Backend/ dir):
 
     python -m app.dev.simulator.run --days 90 --seed 42
+    python -m app.dev.simulator.run --days 365 --seed 42 --bulk --workers 8
 
 Behaviour:
   1. Connect to the configured database via the regular async session.
@@ -17,6 +18,11 @@ Behaviour:
 Determinism: a single ``random.Random(seed)`` is threaded into every helper
 that picks something. Running twice with the same seed against the same
 baseline produces identical audit timelines.
+
+``--bulk`` swaps steps 3–5 for ``bulk.py``: projects are simulated in memory
+on independent per-project RNG streams (in parallel with ``--workers``) and
+the rows are written with COPY in one transaction — for year-long,
+many-project benchmark fixtures.
 """
 
 from __future__ import annotations
@@ -33,6 +39,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dev.simulator import actors as actor_mod
 from app.dev.simulator import bootstrap as bootstrap_mod
+from app.dev.simulator import bulk as bulk_mod
 from app.dev.simulator import clock as clock_mod
 from app.dev.simulator import events as events_mod
 from app.dev.simulator import patcher as patcher_mod
@@ -87,6 +94,14 @@ def _per_day_activity_scale(day_index: int, total_days: int) -> float:
     return 0.4 + 0.6 * min(ratio, 1.0)
 
 
+def _day_scale(day: _dt.date, day_index: int, total_days: int) -> float:
+    """Adoption ramp for ``day`` with the weekend dip applied."""
+    scale = _per_day_activity_scale(day_index, total_days)
+    if day.weekday() >= 5:
+        scale *= 0.15  # weekend traffic — a few stragglers
+    return scale
+
+
 async def _run_one_day(
     session: AsyncSession,
     day: _dt.date,
@@ -100,11 +115,7 @@ async def _run_one_day(
     events_counter: list[int],  # mutable single-element list — running total
 ) -> None:
     """Run all actors' activity for a single business day."""
-    weekday = day.weekday()  # 0=Mon..6=Sun
-    weekend = weekday >= 5
-    scale = _per_day_activity_scale(day_index, total_days)
-    if weekend:
-        scale *= 0.15  # weekend traffic — a few stragglers
+    scale = _day_scale(day, day_index, total_days)
 
     # Set clock to 09:00 of this day.
     clock.set(_dt.datetime.combine(day, _dt.time(9, 0)))
@@ -143,9 +154,30 @@ async def _run_one_day(
             clock.jitter_minutes(5, 25)
 
 
-async def run_simulation(days: int, seed: int) -> None:
+async def _run_bulk(
+    session: AsyncSession,
+    start_day: _dt.date,
+    days: int,
+    seed: int,
+    workers: int,
+    actors: list[actor_mod.Actor],
+    projects: list[ProjectModel],
+) -> int:
+    """Simulate every project in memory, COPY the rows. Returns events emitted."""
+    plans = await bulk_mod.load_plans(session, projects, actors)
+    day_scales = [
+        (start_day + _dt.timedelta(days=i), _day_scale(start_day + _dt.timedelta(days=i), i, days))
+        for i in range(days)
+    ]
+    logger.info(f"SIMULATOR(bulk): simulating {len(plans)} projects on {workers} worker(s)")
+    outputs = bulk_mod.simulate_all(plans, day_scales, seed, workers=workers)
+    await bulk_mod.write_rows(session, outputs)
+    return sum(o.events for o in outputs)
+
+
+async def run_simulation(days: int, seed: int, bulk: bool = False, workers: int = 1) -> None:
     """Top-level orchestrator."""
-    logger.info(f"SIMULATOR: starting — days={days} seed={seed}")
+    logger.info(f"SIMULATOR: starting — days={days} seed={seed} bulk={bulk}")
 
     rng = random.Random(seed)
     # Compute the start day so the timeline ends today (so rapor windows
@@ -164,6 +196,11 @@ async def run_simulation(days: int, seed: int) -> None:
         projects = await _load_projects(session)
         logger.info(f"SIMULATOR: {len(projects)} active projects")
 
+        if bulk:
+            emitted = await _run_bulk(session, start_day, days, seed, workers, actors, projects)
+            await _report(session, emitted)
+            return
+
         # Phase 3: install clock + patcher hooks. Both stay live for the
         # entire timeline — uninstall happens in finally.
         clock = clock_mod.make_clock(_dt.datetime.combine(start_day, _dt.time(9, 0)))
@@ -197,22 +234,36 @@ async def run_simulation(days: int, seed: int) -> None:
             patcher_mod.uninstall()
 
         # Phase 4: report.
-        task_count = await session.scalar(select(func.count()).select_from(TaskModel))
-        audit_count = await session.scalar(select(func.count()).select_from(AuditLogModel))
-        logger.info(
-            f"SIMULATOR: DONE — events emitted={events_counter[0]}, "
-            f"tasks={task_count}, audit_log rows={audit_count}"
-        )
+        await _report(session, events_counter[0])
+
+
+async def _report(session: AsyncSession, emitted: int) -> None:
+    task_count = await session.scalar(select(func.count()).select_from(TaskModel))
+    audit_count = await session.scalar(select(func.count()).select_from(AuditLogModel))
+    logger.info(
+        f"SIMULATOR: DONE — events emitted={emitted}, "
+        f"tasks={task_count}, audit_log rows={audit_count}"
+    )
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="SPMS discrete-event simulator")
     parser.add_argument("--days", type=int, default=90, help="Days to simulate (default 90)")
     parser.add_argument("--seed", type=int, default=42, help="RNG seed (default 42)")
+    parser.add_argument(
+        "--bulk", action="store_true",
+        help="In-memory per-project simulation + COPY load (see bulk.py)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes for --bulk (default 1; output is the same for any value)",
+    )
     args = parser.parse_args()
 
     try:
-        asyncio.run(run_simulation(days=args.days, seed=args.seed))
+        asyncio.run(run_simulation(
+            days=args.days, seed=args.seed, bulk=args.bulk, workers=args.workers,
+        ))
     except KeyboardInterrupt:
         sys.exit(130)
 
@@ -29,4 +29,8 @@ class BoardColumn(BaseModel):
     entry_policy: EntryPolicy = "any"
     exit_policy: ExitPolicy = "any"
 
+    # Read-only: non-deleted tasks in the column, maintained by the
+    # persistence layer. Serves the column list and WIP checks.
+    task_count: int = 0
+
     model_config = ConfigDict(from_attributes=True)
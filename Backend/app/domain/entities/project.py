@@ -165,6 +165,8 @@ def _normalize_process_config(config: Any) -> dict:
     if not isinstance(config, dict):
         return config  # Pydantic will raise on final validation if wrong type
     current = config.get("schema_version", 0)
+    if current == CURRENT_SCHEMA_VERSION:
+        return config  # fast path: persisted rows are written back at this version
     iterations = 0
     while current < CURRENT_SCHEMA_VERSION:
         if iterations >= _MAX_MIGRATION_ITERATIONS:
@@ -182,6 +184,35 @@ def _normalize_process_config(config: Any) -> dict:
     return config
 
 
+def process_config_is_current(config: Any) -> bool:
+    """True when ``_normalize_process_config`` would return ``config`` as is."""
+    return not isinstance(config, dict) or config.get("schema_version", 0) == CURRENT_SCHEMA_VERSION
+
+
+# Per (entity class, ORM class): the entity's fields the ORM model has.
+_ORM_FIELD_NAMES: Dict[tuple, tuple] = {}
+
+
+def _orm_field_names(entity_cls: type, model_cls: type) -> tuple:
+    key = (entity_cls, model_cls)
+    names = _ORM_FIELD_NAMES.get(key)
+    if names is None:
+        names = tuple(f for f in entity_cls.model_fields if hasattr(model_cls, f))
+        _ORM_FIELD_NAMES[key] = names
+    return names
+
+
+def _orm_values(entity_cls: type, obj: Any) -> Dict[str, Any]:
+    """``entity_cls`` field values of an ORM row, read from the instance dict
+    (skips the instrumented-attribute descriptor per field). Attributes that
+    are not loaded fall back to ``getattr``, i.e. the normal (lazy) load."""
+    state = obj.__dict__
+    return {
+        name: state[name] if name in state else getattr(obj, name)
+        for name in _orm_field_names(entity_cls, type(obj))
+    }
+
+
 class Project(BaseModel):
     id: Optional[int] = None
     key: str
@@ -209,6 +240,12 @@ class Project(BaseModel):
 
         Runs before field validation. Handles both dict (DTO/API body) and
         SQLAlchemy ORM object (from_attributes mode). Pitfall 5.
+
+        ORM rows are read once into a dict of the entity's fields (board
+        columns included) straight from the loaded instance state. Configs
+        already at CURRENT_SCHEMA_VERSION — every row once the
+        ``process_config_schema`` boot write-back has run — skip the
+        migration chain.
         """
         if isinstance(values, dict):
             pc = values.get("process_config")
@@ -217,15 +254,16 @@ class Project(BaseModel):
             return values
         # Likely a SQLAlchemy ORM model — extract attributes to dict once, normalize pc
         if hasattr(values, "__table__"):
-            out: Dict[str, Any] = {}
-            for c in values.__table__.columns:
-                out[c.name] = getattr(values, c.name)
-            # Copy known relationship attrs explicitly (columns, manager_*)
-            for attr in ("columns", "manager_name", "manager_avatar"):
-                if hasattr(values, attr):
-                    out[attr] = getattr(values, attr)
-            if out.get("process_config") is not None:
-                out["process_config"] = _normalize_process_config(out["process_config"])
+            out = _orm_values(cls, values)
+            columns = out.get("columns")
+            if columns:
+                out["columns"] = [
+                    _orm_values(BoardColumn, c) if hasattr(c, "__table__") else c
+                    for c in columns
+                ]
+            pc = out.get("process_config")
+            if not process_config_is_current(pc):
+                out["process_config"] = _normalize_process_config(pc)
             return out
         return values
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from datetime import date, datetime
 
 
@@ -52,6 +52,16 @@ class IAuditRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many_with_metadata(self, entries: List[dict]) -> None:
+        """Batch ``create_with_metadata``: one multi-row INSERT + one commit.
+
+        Each entry carries the ``create_with_metadata`` keyword arguments
+        (entity_type, entity_id, action, user_id, metadata and optionally
+        field_name / old_value / new_value).
+        """
+        pass
+
     @abstractmethod
     async def get_project_activity(
         self,
@@ -174,6 +184,27 @@ class IAuditRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_audit(
+        self,
+        project_id: Optional[int] = None,
+        types: Optional[List[str]] = None,
+        actor_id: Optional[int] = None,
+        action_prefix: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> AsyncIterator[dict]:
+        """Every matching audit row, newest first, for CSV / NDJSON exports.
+
+        No cap and no count: rows come off a server-side cursor ordered by
+        (timestamp, id) DESC; ``after`` = (timestamp, id) of the last row a
+        client already has resumes behind it. ``project_id`` applies the
+        project activity scope (project + task rows of that project);
+        without it the stream is admin-wide. Items have the
+        get_global_audit shape plus ``project_id``.
+        """
+
     @abstractmethod
     async def active_users_trend(self, days: int = 30) -> List[dict]:
         """D-X2 daily active user count over the last N days, on-the-fly compute.
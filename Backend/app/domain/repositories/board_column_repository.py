@@ -6,7 +6,11 @@ from app.domain.entities.board_column import BoardColumn
 class IBoardColumnRepository(ABC):
     @abstractmethod
     async def get_by_project(self, project_id: int) -> List[BoardColumn]:
-        """Return columns for the project ordered by order_index ASC."""
+        """Return columns for the project ordered by order_index ASC.
+
+        Each entity carries ``task_count`` (maintained per-column counter),
+        so callers never count tasks per column.
+        """
         ...
 
     @abstractmethod
@@ -24,8 +28,3 @@ class IBoardColumnRepository(ABC):
     @abstractmethod
     async def delete(self, column_id: int) -> None:
         ...
-
-    @abstractmethod
-    async def count_tasks(self, column_id: int) -> int:
-        """Count non-deleted tasks with column_id = column_id."""
-        ...
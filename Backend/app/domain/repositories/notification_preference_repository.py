@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from app.domain.entities.notification_preference import NotificationPreference
 
 
@@ -7,6 +7,10 @@ class INotificationPreferenceRepository(ABC):
     @abstractmethod
     async def get_by_user(self, user_id: int) -> Optional[NotificationPreference]: ...
 
+    @abstractmethod
+    async def get_by_users(self, user_ids: List[int]) -> Dict[int, NotificationPreference]: ...
+    # Batch lookup keyed by user_id; users without a row are absent
+
     @abstractmethod
     async def upsert(self, pref: NotificationPreference) -> NotificationPreference: ...
     # Creates if not exists, updates if exists (uses user_id unique constraint)
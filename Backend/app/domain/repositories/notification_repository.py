@@ -7,6 +7,10 @@ class INotificationRepository(ABC):
     @abstractmethod
     async def create(self, notification: Notification) -> Notification: ...
 
+    @abstractmethod
+    async def create_many(self, notifications: List[Notification]) -> None: ...
+    # One multi-row INSERT + one commit (bulk task operations)
+
     @abstractmethod
     async def get_by_user(
         self,
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from app.domain.entities.password_reset_token import PasswordResetToken
 
 
@@ -10,3 +11,6 @@ class IPasswordResetRepository(ABC):
     async def get_by_hash(self, token_hash: str) -> Optional[PasswordResetToken]: ...
     @abstractmethod
     async def mark_used(self, token_id: int) -> None: ...
+    @abstractmethod
+    async def create_many(self, tokens: List[Tuple[int, str, datetime]]) -> None: ...
+    # (user_id, token_hash, expires_at) rows — one multi-row INSERT, flush only
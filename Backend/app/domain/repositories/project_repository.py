@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+import copy
+from typing import Any, Dict, List, Optional, Tuple
 from app.domain.entities.project import Project
 from app.domain.entities.user import User
 from app.domain.services.chart_applicability import CapabilityInputs
@@ -106,6 +107,15 @@ class IProjectRepository(ABC):
         """
         return {}
 
+    async def get_change_version(self, project_id: int) -> Optional[int]:
+        """Monotonic per-project version bumped by every board-visible write.
+
+        Read endpoints derive their ETag from it, so it MUST be a single
+        indexed lookup. ``None`` when the project does not exist. Default
+        returns ``None`` (never matches) so test fakes can skip it.
+        """
+        return None
+
     # ------------------------------------------------------------------
     # Reports migration v2 (Strategy D) — chart capability gating inputs
     # ------------------------------------------------------------------
@@ -130,3 +140,57 @@ class IProjectRepository(ABC):
             member_count=0,
             has_all_categories=False,
         )
+
+    async def list_stale_process_configs(
+        self, current_version: int, after_id: int = 0, limit: int = 500
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """``(project_id, process_config)`` for object configs stored below
+        ``current_version``, ordered by id and keyset-paged after ``after_id``.
+
+        Default returns ``[]`` so test fakes can skip it.
+        """
+        return []
+
+    async def write_process_configs(
+        self, configs: Dict[int, Dict[str, Any]], current_version: int
+    ) -> None:
+        """Persist normalized configs ``{project_id: config}`` (commits).
+
+        Implementations skip rows that reached ``current_version`` since they
+        were read (a concurrent write already stored a normalized config) and
+        leave ``updated_at`` / ``change_version`` alone — normalization is
+        not a user edit. Default is a no-op.
+        """
+        return None
+
+    async def apply_template_batch(
+        self,
+        template_id: int,
+        config_patch: Dict[str, Any],
+        lock_keys: Dict[int, int],
+    ) -> Dict[str, List[int]]:
+        """D-44 bulk apply: stamp ``template_id`` on a batch of projects and
+        merge ``config_patch`` into each ``process_config`` (top-level keys).
+
+        ``lock_keys`` maps project id → advisory lock key. Implementations
+        try-lock every project first, update the locked ones in one
+        statement and commit (which releases the locks). Returns
+        ``{"applied": [...], "locked": [...], "missing": [...]}`` — locked
+        projects are left untouched for the caller to retry.
+
+        This default walks the batch through ``get_by_id`` / ``update``
+        without locking so test fakes work unchanged.
+        """
+        outcome: Dict[str, List[int]] = {"applied": [], "locked": [], "missing": []}
+        for pid in lock_keys:
+            project = await self.get_by_id(pid)
+            if project is None:
+                outcome["missing"].append(pid)
+                continue
+            project.process_template_id = template_id
+            project.process_config = {
+                **(project.process_config or {}), **copy.deepcopy(config_patch),
+            }
+            await self.update(project)
+            outcome["applied"].append(pid)
+        return outcome
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+from datetime import date, datetime
 from app.application.dtos.report_dtos import (
     SummaryDTO, BurndownDTO, VelocityDTO,
-    DistributionDTO, PerformanceDTO, TaskExportRowDTO,
+    DistributionDTO, PerformanceDTO, TaskExportRow, TaskExportRowDTO,
 )
 
 
@@ -60,6 +60,27 @@ class IReportRepository(ABC):
         date_to: Optional[date],
     ) -> List[TaskExportRowDTO]: ...
 
+    async def stream_tasks_for_export(
+        self,
+        project_id: int,
+        assignee_ids: Optional[List[int]],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> AsyncIterator[TaskExportRow]:
+        """Same rows and order as ``get_tasks_for_export`` (newest first),
+        yielded one by one; ``after`` = (created_at, task_id) resumes behind
+        that row.
+
+        Default materializes the list; the SQL implementation overrides it to
+        read through a server-side cursor so export writers can consume rows
+        as they arrive.
+        """
+        for dto in await self.get_tasks_for_export(project_id, assignee_ids, date_from, date_to):
+            if after is not None and (dto.created_at, dto.task_id) >= after:
+                continue
+            yield TaskExportRow(**dto.model_dump())
+
     # ------------------------------------------------------------------
     # Reports migration v2 (Strategy D) — phase progress aggregation
     # ------------------------------------------------------------------
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+from app.application.dtos.search_dtos import SearchHitDTO, SearchKind
+
+
+class ISearchRepository(ABC):
+    @abstractmethod
+    async def search(
+        self,
+        words: List[str],
+        kinds: Sequence[SearchKind],
+        accessible_project_ids: Optional[List[int]],
+        limit: int = 20,
+    ) -> List[SearchHitDTO]:
+        """Ranked matches across tasks, projects and comments.
+
+        Every word must match (title, key, body or project name — per kind).
+        ``accessible_project_ids=None`` is the admin bypass; an empty list
+        returns ``[]``. At most ``limit`` hits per kind, each kind sorted by
+        ``score`` descending; scores are comparable across kinds.
+        """
+        ...
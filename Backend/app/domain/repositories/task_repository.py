@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from app.domain.entities.task import Task
 
@@ -12,6 +12,26 @@ class ITaskRepository(ABC):
     async def get_by_id(self, task_id: int) -> Optional[Task]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """Batch form of ``get_by_id`` — one query, missing/deleted ids omitted."""
+        pass
+
+    async def get_audit_identity(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """``{task_key, title, project_id}`` for audit metadata, or None.
+
+        Implementations should read just those columns; this default loads
+        the full task.
+        """
+        task = await self.get_by_id(task_id)
+        if task is None:
+            return None
+        return {
+            "task_key": task.task_key,
+            "title": task.title,
+            "project_id": getattr(task, "project_id", None),
+        }
+
     @abstractmethod
     async def get_all_by_project(self, project_id: int) -> List[Task]:
         pass
@@ -24,6 +44,17 @@ class ITaskRepository(ABC):
     async def update(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def bulk_update(
+        self, updates: Dict[int, Dict[str, Any]], user_id: Optional[int] = None
+    ) -> List[Task]:
+        """Apply ``{task_id: update_data}`` atomically (single commit).
+
+        Audit rows and derived counters are written exactly as ``update`` would
+        write them per task. Returns the updated tasks in ``updates`` order.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, task_id: int) -> bool:
         pass
@@ -59,26 +90,37 @@ class ITaskRepository(ABC):
         pass
 
     @abstractmethod
-    async def bulk_stamp_phase(
-        self, task_ids: List[int], new_phase_id: Optional[str]
-    ) -> None:
-        """Bulk-update phase_id for a list of task IDs (flush, no commit).
-        Passing new_phase_id=None clears the phase (moves to backlog).
+    async def phase_task_counts(
+        self, project_id: int, phase_id: str, include_unphased: bool = False
+    ) -> Dict[str, int]:
+        """Phase gate aggregate over the phase's tasks, in one query.
+
+        Returns ``{total, done, critical_open, blocked}``. A task is done when
+        its column is terminal (``is_terminal`` or category ``done``), so the
+        check is independent of column names. ``blocked`` counts open tasks
+        with a blocking dependency on an open task. ``include_unphased`` adds
+        the ``phase_id IS NULL`` backlog tasks, which the board shows inside
+        the active phase.
         """
         pass
 
     @abstractmethod
-    async def count_tasks_in_column(
-        self, column_id: int, exclude_task_id: Optional[int] = None
+    async def apply_phase_transition_moves(
+        self,
+        project_id: int,
+        source_phase_id: str,
+        target_phase_id: str,
+        action: str,
+        exceptions: Dict[int, str],
     ) -> int:
-        """Phase 17 C8 — count active (non-deleted) tasks in a column.
-
-        ``exclude_task_id`` is critical for move semantics: when checking whether
-        a target column can accept an incoming task, the moving task itself must
-        not be counted toward the target's load (otherwise a same-column "move"
-        — or a load-near-limit move — could spuriously trip the WIP limit).
-
-        Returns 0 when the column is empty or non-existent.
+        """D-04 open-task moves as ONE set-based UPDATE (flush, no commit).
+
+        Source-phase tasks follow ``exceptions.get(id, action)``: move_to_next
+        → target, move_to_backlog → NULL, keep_in_source → unchanged. Backlog
+        (NULL phase) tasks that are done are stamped with the source phase.
+        Open backlog tasks go to the target on move_to_next, to the source on
+        keep_in_source, and otherwise stay. Returns the number of tasks whose
+        phase changed.
         """
         pass
 
@@ -101,3 +143,28 @@ class ITaskRepository(ABC):
         dropdown stays small.
         """
         pass
+
+    @abstractmethod
+    async def get_subtree(self, task_id: int, max_depth: int) -> Optional[Task]:
+        """The task with its subtask hierarchy down to ``max_depth`` levels.
+
+        ``subtasks`` is filled recursively (depth 1 = direct children). Nodes
+        carry column, assignee and project; tasks of one project share the
+        same Project / BoardColumn instances. Soft-deleted tasks and their
+        descendants are left out. Returns None when the task does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def subtask_summaries(
+        self, project_id: int, parent_ids: List[int], max_depth: int
+    ) -> Dict[int, Dict[str, int]]:
+        """Subtask roll-up per parent, for list views, in one query.
+
+        ``{parent_id: {children, total, done}}`` — ``children`` counts direct
+        subtasks, ``total`` / ``done`` every descendant down to ``max_depth``
+        levels (done = terminal column, as in ``phase_task_counts``). Only
+        parents of ``project_id`` are considered; parents without subtasks
+        are absent from the result.
+        """
+        pass
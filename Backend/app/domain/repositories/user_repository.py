@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Set
 from app.domain.entities.user import User
 
 class IUserRepository(ABC):
@@ -49,3 +49,32 @@ class IUserRepository(ABC):
         Member-fallback-01 mitigation in PLAN 15-05 threat_model).
         """
         ...
+
+    # ------------------------------------------------------------------
+    # Set-based admin operations (bulk invite / bulk action)
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    async def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        """Batch ``get_by_id`` — one query; missing/deleted ids are omitted."""
+        ...
+
+    @abstractmethod
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Subset of ``emails`` already registered (one ``IN`` query)."""
+        ...
+
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> List[User]:
+        """Multi-row INSERT (flush, no commit). Returns the users with ids, in input order."""
+        ...
+
+    @abstractmethod
+    async def set_active_many(self, user_ids: List[int], is_active: bool) -> None:
+        """One UPDATE for every id (flush, no commit)."""
+        ...
+
+    @abstractmethod
+    async def update_role_many(self, user_ids: List[int], role_id: int) -> None:
+        """One UPDATE for every id (flush, no commit)."""
+        ...
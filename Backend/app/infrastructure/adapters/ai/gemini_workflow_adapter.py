@@ -4,13 +4,18 @@ Implements IAIWorkflowSuggestionPort using gemini-2.5-flash + Pydantic
 response_schema. Model koordinat üretmez: layout_archetype seçer, geometriyi
 domain workflow_layout servisi basar. Validasyon hatasında tek self-repair
 turu yapılır.
+
+Validated suggestions are cached by content key (form + language + model,
+see ``ai_workflow_cache``); a hit replays through the same event emitters,
+paced or — with ``replay_paced=False`` — without the artificial sleeps.
+Concurrent identical requests share one Gemini call.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import AsyncIterator, Literal
+from typing import AsyncIterator, Literal, Optional, Union
 
 from pydantic import BaseModel
 
@@ -22,6 +27,7 @@ from app.application.dtos.ai_workflow_dto import (
 from app.application.ports.ai_workflow_suggestion_port import (
     IAIWorkflowSuggestionPort,
 )
+from app.application.services import ai_workflow_cache
 from app.domain.entities.ai_workflow_suggestion import (
     SuggestedColumn,
     SuggestedEdge,
@@ -118,12 +124,25 @@ class _GeminiTaskStatusResponse(BaseModel):
 class GeminiWorkflowAdapter(IAIWorkflowSuggestionPort):
     """Async Gemini adapter with structured output + paced event emission."""
 
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        replay_paced: bool = True,
+    ):
         # Lazy SDK import keeps mock-only deployments off the heavy dependency
         from google import genai
 
         self._client = genai.Client(api_key=api_key)
         self._model = model
+        self._replay_paced = replay_paced
+
+    def cache_key(
+        self,
+        form: Union[LifecycleFormDTO, TaskStatusFormDTO],
+        language: str,
+    ) -> Optional[str]:
+        return ai_workflow_cache.make_key(form, language, self._model)
 
     # ---------------------------------------------------------------------
     # Lifecycle
@@ -133,6 +152,22 @@ class GeminiWorkflowAdapter(IAIWorkflowSuggestionPort):
         self,
         form: LifecycleFormDTO,
         language: str,
+    ) -> AsyncIterator[WorkflowEventDTO]:
+        key = self.cache_key(form, language)
+        cached = ai_workflow_cache.lookup(key)
+        if cached is not None:
+            async for ev in _emit_lifecycle_events(cached, paced=self._replay_paced):
+                yield ev
+            return
+        async for ev in ai_workflow_cache.shared_stream(
+            key, lambda: self._generate_lifecycle(form, key),
+        ):
+            yield ev
+
+    async def _generate_lifecycle(
+        self,
+        form: LifecycleFormDTO,
+        key: str,
     ) -> AsyncIterator[WorkflowEventDTO]:
         prompt = build_lifecycle_prompt(form)
 
@@ -199,6 +234,7 @@ class GeminiWorkflowAdapter(IAIWorkflowSuggestionPort):
             return
 
         apply_layout(suggestion)
+        ai_workflow_cache.store(key, suggestion)
 
         async for ev in _emit_lifecycle_events(suggestion):
             yield ev
@@ -211,6 +247,22 @@ class GeminiWorkflowAdapter(IAIWorkflowSuggestionPort):
         self,
         form: TaskStatusFormDTO,
         language: str,
+    ) -> AsyncIterator[WorkflowEventDTO]:
+        key = self.cache_key(form, language)
+        cached = ai_workflow_cache.lookup(key)
+        if cached is not None:
+            async for ev in _emit_task_status_events(cached, paced=self._replay_paced):
+                yield ev
+            return
+        async for ev in ai_workflow_cache.shared_stream(
+            key, lambda: self._generate_task_status(form, key),
+        ):
+            yield ev
+
+    async def _generate_task_status(
+        self,
+        form: TaskStatusFormDTO,
+        key: str,
     ) -> AsyncIterator[WorkflowEventDTO]:
         prompt = build_task_status_prompt(form)
 
@@ -274,6 +326,8 @@ class GeminiWorkflowAdapter(IAIWorkflowSuggestionPort):
             )
             return
 
+        ai_workflow_cache.store(key, suggestion)
+
         async for ev in _emit_task_status_events(suggestion):
             yield ev
 
@@ -326,13 +380,19 @@ def _to_domain_task_status(g: _GeminiTaskStatusResponse) -> TaskStatusSuggestion
 # ---------------------------------------------------------------------------
 
 
+async def _pause(seconds: float, paced: bool) -> None:
+    if paced:
+        await asyncio.sleep(seconds)
+
+
 async def _emit_lifecycle_events(
     s: WorkflowSuggestion,
+    paced: bool = True,
 ) -> AsyncIterator[WorkflowEventDTO]:
     intro = _build_intro(s.methodology_label, s.rationale)
     for chunk in _chunk_text(intro, size=8):
         yield WorkflowEventDTO(type="text_token", payload={"text": chunk})
-        await asyncio.sleep(_TEXT_TOKEN_S)
+        await _pause(_TEXT_TOKEN_S, paced)
 
     nodes_dicts = [n.model_dump() for n in s.nodes]
     edges_dicts = [e.model_dump() for e in s.edges]
@@ -343,7 +403,7 @@ async def _emit_lifecycle_events(
     for node in nodes_dicts:
         yield WorkflowEventDTO(type="node_added", payload=node)
         emitted_ids.add(node["id"])
-        await asyncio.sleep(_NODE_INTERVAL_S)
+        await _pause(_NODE_INTERVAL_S, paced)
 
         ready = [
             e for e in pending
@@ -351,16 +411,16 @@ async def _emit_lifecycle_events(
         ]
         for edge in ready:
             yield WorkflowEventDTO(type="edge_added", payload=edge)
-            await asyncio.sleep(_EDGE_INTERVAL_S)
+            await _pause(_EDGE_INTERVAL_S, paced)
         for edge in ready:
             pending.remove(edge)
 
     for edge in pending:
         yield WorkflowEventDTO(type="edge_added", payload=edge)
-        await asyncio.sleep(_EDGE_INTERVAL_S)
+        await _pause(_EDGE_INTERVAL_S, paced)
 
     yield WorkflowEventDTO(type="rationale", payload={"text": s.rationale})
-    await asyncio.sleep(0.1)
+    await _pause(0.1, paced)
 
     yield WorkflowEventDTO(
         type="done",
@@ -375,18 +435,19 @@ async def _emit_lifecycle_events(
 
 async def _emit_task_status_events(
     s: TaskStatusSuggestion,
+    paced: bool = True,
 ) -> AsyncIterator[WorkflowEventDTO]:
     intro = _build_intro(s.methodology_label, s.rationale)
     for chunk in _chunk_text(intro, size=8):
         yield WorkflowEventDTO(type="text_token", payload={"text": chunk})
-        await asyncio.sleep(_TEXT_TOKEN_S)
+        await _pause(_TEXT_TOKEN_S, paced)
 
     for col in s.columns:
         yield WorkflowEventDTO(type="column_added", payload=col.model_dump())
-        await asyncio.sleep(_NODE_INTERVAL_S)
+        await _pause(_NODE_INTERVAL_S, paced)
 
     yield WorkflowEventDTO(type="rationale", payload={"text": s.rationale})
-    await asyncio.sleep(0.1)
+    await _pause(0.1, paced)
 
     yield WorkflowEventDTO(
         type="done",
@@ -8,6 +8,23 @@ class Settings(BaseSettings):
     DB_PORT: str = "5432"
     DB_NAME: str = "spms_db"
 
+    # Connection pools per workload class (app/infrastructure/database/database.py).
+    # OLTP serves every repository; analytics serves chart / report reads with
+    # its own pool and a statement timeout (0 = none). DB_READ_HOST points the
+    # analytics reads at a read replica (empty = primary); an unreachable
+    # replica is skipped for DB_READ_RETRY_S.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_S: float = 30.0
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_ANALYTICS_POOL_SIZE: int = 4
+    DB_ANALYTICS_MAX_OVERFLOW: int = 4
+    DB_ANALYTICS_POOL_TIMEOUT_S: float = 10.0
+    DB_ANALYTICS_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_READ_HOST: str = ""
+    DB_READ_PORT: str = ""
+    DB_READ_RETRY_S: float = 30.0
+
     JWT_SECRET: str = "supersecretkey" # Change in production
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480  # 8 hours
@@ -31,6 +48,56 @@ class Settings(BaseSettings):
     # more leeway because the user may not check email immediately.
     INVITE_TOKEN_TTL_DAYS: int = 7
 
+    # Request instrumentation (app/api/middleware/request_metrics.py) —
+    # requests / SQL statements at or above these durations are logged as
+    # slow_request / slow_query and kept for GET /admin/metrics.
+    SLOW_REQUEST_MS: float = 1000.0
+    SLOW_QUERY_MS: float = 200.0
+    # Query budgets (app/api/query_budget.py): the budget of routes without
+    # @query_budget (0 = unbudgeted), and the share of requests that collect
+    # statement texts so an over-budget one can be logged with its repeats.
+    QUERY_BUDGET_DEFAULT: int = 0
+    QUERY_BUDGET_SAMPLE_RATE: float = 0.01
+
+    # audit_log monthly partitions older than this are detached (archived)
+    # by audit_partition_maintenance_job. 0 keeps every month attached.
+    AUDIT_LOG_RETENTION_MONTHS: int = 24
+
+    # Audit sink (app/infrastructure/database/util/audit_sink.py):
+    # "transaction" writes audit rows in the caller's transaction; "buffered"
+    # queues them when the caller commits and batches them into multi-row
+    # INSERTs flushed at MAX_ROWS or after MAX_DELAY_S (and on shutdown).
+    AUDIT_SINK_MODE: str = "transaction"
+    AUDIT_BUFFER_MAX_ROWS: int = 500
+    AUDIT_BUFFER_MAX_DELAY_S: float = 1.0
+
+    # ParallelQueryExecutor (summary / admin stats / admin summary loaders):
+    # branch sessions open at once per request, and the shared deadline.
+    # Keep the cap below DB_POOL_SIZE.
+    PARALLEL_QUERY_MAX_CONCURRENCY: int = 4
+    PARALLEL_QUERY_TIMEOUT_S: float = 10.0
+
+    # Process template bulk apply (use_cases/apply_process_template.py):
+    # projects per locked UPDATE batch, batches in flight at once for
+    # background jobs (one session each — keep below DB_POOL_SIZE), and
+    # retry rounds / delay for projects whose advisory lock was held.
+    TEMPLATE_APPLY_BATCH_SIZE: int = 50
+    TEMPLATE_APPLY_CONCURRENCY: int = 4
+    TEMPLATE_APPLY_LOCK_RETRIES: int = 5
+    TEMPLATE_APPLY_RETRY_DELAY_S: float = 1.0
+
+    # Fast JSON list responses (app/api/fast_json.py): arrays with at least
+    # this many items are streamed; bodies at least this large are gzipped
+    # for clients that accept it.
+    FAST_JSON_STREAM_MIN_ITEMS: int = 1000
+    FAST_JSON_GZIP_MIN_BYTES: int = 32 * 1024
+
+    # Boot steps (app/infrastructure/database/startup.py): "fast" skips the
+    # seed / backfills whose fingerprint in system_config still matches and
+    # runs the backfills after the app is serving; "full" runs everything
+    # inline on every boot.
+    STARTUP_MODE: str = "fast"
+
     # AI Workflow Generator (v3.0) — pluggable provider config
     AI_PROVIDER: str = "mock"            # mock | gemini | ollama
     GEMINI_MODEL: str = "gemini-2.5-flash"
@@ -39,11 +106,19 @@ class Settings(BaseSettings):
     GOOGLE_API_KEY_STAGING: str = ""     # spms-staging project
     GOOGLE_API_KEY_DEMO: str = ""        # spms-demo project (fresh quota on demo day)
     OLLAMA_HOST: str = "http://localhost:11434"  # offline fallback
+    # Cached generations (app/application/services/ai_workflow_cache.py)
+    # replay with the live stream's pacing; false = emit them at once.
+    AI_CACHE_REPLAY_PACED: bool = True
 
     @property
     def DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def DATABASE_READ_URL(self) -> str:
+        port = self.DB_READ_PORT or self.DB_PORT
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_READ_HOST}:{port}/{self.DB_NAME}"
+
     @property
     def cors_origins_list(self) -> list:
         return [o.strip() for o in self.CORS_ORIGINS.split(",") if o.strip()]
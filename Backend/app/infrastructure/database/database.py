@@ -1,21 +1,148 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+"""Engines and session factories, one connection pool per workload class.
+
+- ``engine`` / ``AsyncSessionLocal`` — OLTP: every repository by default,
+  sized by ``DB_POOL_*``.
+- ``analytics_engine`` — chart / report reads on the primary, with its own
+  (smaller) pool and a statement timeout, so a slow aggregate waits for an
+  analytics slot instead of holding one a task write needs.
+- ``replica_engine`` — only when ``DB_READ_HOST`` is set: the same analytics
+  settings against a read replica, with read-only transactions.
+
+Analytics repositories take their session from :func:`get_read_session`:
+the replica when it is configured and reachable, otherwise the primary's
+analytics pool. A failed replica connect is logged and the replica is
+skipped for ``DB_READ_RETRY_S``. Replica reads may lag the primary by the
+replication delay.
+"""
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from app.infrastructure.config import settings
 
-engine = create_async_engine(
+logger = logging.getLogger(__name__)
+
+
+def _create_engine(
+    url: str,
+    *,
+    workload: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout_s: float,
+    statement_timeout_ms: int = 0,
+    read_only: bool = False,
+) -> AsyncEngine:
+    server_settings = {"application_name": f"spms-{workload}"}
+    if statement_timeout_ms > 0:
+        server_settings["statement_timeout"] = str(statement_timeout_ms)
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout_s,
+        connect_args={"server_settings": server_settings},
+    )
+
+
+engine = _create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
+    workload="oltp",
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout_s=settings.DB_POOL_TIMEOUT_S,
+    statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
 )
 
+_analytics_pool = dict(
+    pool_size=settings.DB_ANALYTICS_POOL_SIZE,
+    max_overflow=settings.DB_ANALYTICS_MAX_OVERFLOW,
+    pool_timeout_s=settings.DB_ANALYTICS_POOL_TIMEOUT_S,
+    statement_timeout_ms=settings.DB_ANALYTICS_STATEMENT_TIMEOUT_MS,
+)
+
+analytics_engine = _create_engine(settings.DATABASE_URL, workload="analytics", **_analytics_pool)
+
+replica_engine: Optional[AsyncEngine] = (
+    _create_engine(settings.DATABASE_READ_URL, workload="replica", read_only=True, **_analytics_pool)
+    if settings.DB_READ_HOST else None
+)
+
+# name → engine, for listeners and pool metrics.
+ENGINES = {
+    "oltp": engine,
+    "analytics": analytics_engine,
+    **({"replica": replica_engine} if replica_engine is not None else {}),
+}
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+AnalyticsSessionLocal = async_sessionmaker(
+    bind=analytics_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+ReplicaSessionLocal = (
+    async_sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None else None
+)
+
+# monotonic deadline before which the replica is not tried again
+_replica_down_until = 0.0
+
+
 async def get_db_session() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def _open_read_session() -> AsyncSession:
+    global _replica_down_until
+    if ReplicaSessionLocal is not None and time.monotonic() >= _replica_down_until:
+        session = ReplicaSessionLocal()
+        try:
+            await session.connection()
+            return session
+        except (OSError, DBAPIError, TimeoutError) as exc:
+            await session.close()
+            _replica_down_until = time.monotonic() + settings.DB_READ_RETRY_S
+            logger.warning(
+                f"DB: read replica unavailable ({exc.__class__.__name__}) — "
+                f"analytics reads use the primary for {settings.DB_READ_RETRY_S}s"
+            )
+    return AnalyticsSessionLocal()
+
+
+async def get_read_session() -> AsyncSession:
+    """Session for analytics repositories (reports, charts) — read only."""
+    session = await _open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def read_session_scope() -> AsyncIterator[AsyncSession]:
+    """:func:`get_read_session` outside dependency injection — for streamed
+    responses, whose body is produced after request-scoped sessions closed."""
+    session = await _open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -31,6 +31,7 @@ nothing changes on a second pass.
 from __future__ import annotations
 
 import logging
+from typing import List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
@@ -77,16 +78,20 @@ def _positional_spec(order_index: int, total: int) -> dict:
     }
 
 
-async def upgrade(engine: AsyncEngine) -> None:
+async def upgrade(engine: AsyncEngine) -> List[int]:
+    """Backfill every live project's columns; returns the ids of the projects
+    whose category / is_initial / is_terminal actually changed (their
+    ``project_task_stats`` buckets depend on them)."""
     async with AsyncSession(engine) as session:
         result = await session.execute(
             select(ProjectModel).where(ProjectModel.is_deleted == False)  # noqa: E712
         )
         projects = result.scalars().all()
         if not projects:
-            return
+            return []
 
         updated_total = 0
+        changed_projects: List[int] = []
         for project in projects:
             methodology = (
                 project.methodology.value
@@ -105,6 +110,7 @@ async def upgrade(engine: AsyncEngine) -> None:
             total = len(cols)
 
             for col in cols:
+                before = (col.category, col.is_initial, col.is_terminal)
                 spec = spec_by_name.get(col.name)
                 if spec is None:
                     spec = _positional_spec(col.order_index, total)
@@ -118,8 +124,13 @@ async def upgrade(engine: AsyncEngine) -> None:
                 if spec.get("exit_policy"):
                     col.exit_policy = spec["exit_policy"]
                 updated_total += 1
+                if (col.category, col.is_initial, col.is_terminal) != before and (
+                    not changed_projects or changed_projects[-1] != project.id
+                ):
+                    changed_projects.append(project.id)
 
         await session.commit()
         logger.info(
             f"MIGRATION 008: backfilled engine fields on {updated_total} board_columns rows"
         )
+        return changed_projects
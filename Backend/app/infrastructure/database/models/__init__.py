@@ -30,3 +30,9 @@ from app.infrastructure.database.models.project_join_request import (  # noqa: F
 # Phase 15 Plan 15-04 — RBAC redesign additions
 from app.infrastructure.database.models.permission import PermissionModel  # noqa: F401
 from app.infrastructure.database.models.role_permission import RolePermissionModel  # noqa: F401
+
+# Materialized per-project task counters (migration 018)
+from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel  # noqa: F401
+
+# Per-project change version flush hooks (migration 022) — registered on import
+from app.infrastructure.database.util import change_version as _change_version  # noqa: F401, E402
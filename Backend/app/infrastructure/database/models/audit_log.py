@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, event
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -6,6 +6,12 @@ from app.infrastructure.database.models.base import Base
 
 # NOTE: AuditLogModel intentionally does NOT use TimestampedMixin.
 # It is an immutable append-only log table — no soft-delete, no version tracking.
+#
+# On PostgreSQL (alembic 020) the table is RANGE-partitioned by month on
+# ``timestamp`` with PRIMARY KEY (id, timestamp); ``id`` stays unique through
+# its sequence, so the ORM keeps treating it as the identity. Partitions are
+# created ahead and detached after retention by
+# app/infrastructure/database/util/audit_partitions.py.
 
 
 class AuditLogModel(Base):
@@ -23,7 +29,11 @@ class AuditLogModel(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     # action: "created", "updated", "deleted"
     action = Column(String(50), nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Denormalized project scope (alembic 020) — filled at insert time by the
+    # before_insert hook below; NULL for entities outside any project
+    # (users, roles, auth events). No FK: history outlives hard-deleted projects.
+    project_id = Column(Integer, nullable=True)
 
     # D-08: Rich phase transition envelope + other structured metadata.
     # Python attribute is `extra_metadata` to avoid clashing with SQLAlchemy's
@@ -33,3 +43,17 @@ class AuditLogModel(Base):
     extra_metadata = Column("metadata", JSONB, nullable=True)
 
     user = relationship("UserModel", backref="audit_logs")
+
+    __table_args__ = (
+        Index("ix_audit_log_project_ts", "project_id", timestamp.desc()),
+        Index("ix_audit_log_user_ts", "user_id", timestamp.desc()),
+    )
+
+
+@event.listens_for(AuditLogModel, "before_insert")
+def _fill_project_id(mapper, connection, target: AuditLogModel) -> None:
+    if target.project_id is None:
+        from app.infrastructure.database.util.audit_scope import project_id_clause
+        target.project_id = project_id_clause(
+            target.entity_type, target.entity_id, target.extra_metadata
+        )
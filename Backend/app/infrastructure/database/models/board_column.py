@@ -26,4 +26,9 @@ class BoardColumnModel(Base):
     entry_policy = Column(String(20), nullable=True, default="any", server_default=text("'any'"))
     exit_policy = Column(String(20), nullable=True, default="any", server_default=text("'any'"))
 
+    # Non-deleted tasks in this column (migration 021). Moved by
+    # util/task_stats.py in the same transaction as the task write and
+    # repaired by reconcile_task_stats_job; never written from the entity.
+    task_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+
     project = relationship("ProjectModel", back_populates="columns")
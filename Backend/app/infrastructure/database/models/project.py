@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SqlEnum, Date, Table, JSON
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Enum as SqlEnum, Date, Table, JSON
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -36,6 +36,8 @@ class ProjectModel(TimestampedMixin, Base):
     status = Column(String(20), nullable=False, server_default="ACTIVE", index=True)
     # Phase 9 D-45: link to process_templates table (nullable; backfilled from methodology in migration 005)
     process_template_id = Column(Integer, ForeignKey("process_templates.id"), nullable=True, index=True)
+    # Conditional GETs (migration 022): bumped on every task/column/sprint/comment write
+    change_version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     manager = relationship("UserModel", backref="managed_projects")
     process_template = relationship("ProcessTemplateModel", foreign_keys=[process_template_id])
@@ -0,0 +1,31 @@
+"""Materialized per-project / per-phase task counters.
+
+One row per (project_id, phase_id). The project-wide row uses the empty
+string as its ``phase_id`` (PK columns cannot be NULL); phase rows carry the
+``tasks.phase_id`` they aggregate.
+
+Maintained incrementally by SqlAlchemyTaskRepository in the SAME transaction
+as the task write (see util/task_stats.py) and re-derived from ``tasks`` by
+the hourly ``reconcile_task_stats_job``. Dashboard / project list / team
+progress reads hit this table instead of re-scanning tasks ⋈ board_columns.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, text
+from sqlalchemy.sql import func
+from app.infrastructure.database.models.base import Base
+
+
+class ProjectTaskStatsModel(Base):
+    __tablename__ = "project_task_stats"
+
+    project_id = Column(
+        Integer,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    phase_id = Column(String(20), primary_key=True, default="", server_default=text("''"))
+    total = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    todo = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    in_progress = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    done = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    points = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
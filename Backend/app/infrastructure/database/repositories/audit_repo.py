@@ -1,12 +1,15 @@
-from typing import Optional, List, Tuple, Any, Mapping
+from typing import AsyncIterator, Optional, List, Tuple, Any, Mapping
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func as sqlfunc, text, or_, and_
+from sqlalchemy import select, func as sqlfunc, text, and_, tuple_
 
 from app.domain.repositories.audit_repository import IAuditRepository
 from app.infrastructure.database.models.audit_log import AuditLogModel
-from app.infrastructure.database.models.task import TaskModel
 from app.infrastructure.database.models.team import TeamProjectModel, TeamMemberModel
+from app.infrastructure.database.util.audit_sink import AuditSink, get_audit_sink
+
+# Rows fetched per round trip when streaming exports (server-side cursor).
+EXPORT_BATCH_ROWS = 1000
 
 
 # ---------------------------------------------------------------------------
@@ -61,8 +64,9 @@ def _resolve_entity_label(row: Mapping[str, Any]) -> Optional[str]:
 
 
 class SqlAlchemyAuditRepository(IAuditRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, audit_sink: Optional[AuditSink] = None):
         self.session = session
+        self.audit_sink = audit_sink or get_audit_sink()
 
     async def create(
         self,
@@ -74,7 +78,7 @@ class SqlAlchemyAuditRepository(IAuditRepository):
         user_id: Optional[int],
         action: str,
     ) -> None:
-        entry = AuditLogModel(
+        await self.audit_sink.write(self.session, [dict(
             entity_type=entity_type,
             entity_id=entity_id,
             field_name=field_name,
@@ -82,8 +86,7 @@ class SqlAlchemyAuditRepository(IAuditRepository):
             new_value=new_value,
             user_id=user_id,
             action=action,
-        )
-        self.session.add(entry)
+        )])
         await self.session.commit()
 
     async def get_by_entity(self, entity_type: str, entity_id: int) -> list[dict]:
@@ -161,7 +164,7 @@ class SqlAlchemyAuditRepository(IAuditRepository):
 
         Note: DB column is literally `metadata`; Python attr is `extra_metadata` (Pitfall 7).
         """
-        log = AuditLogModel(
+        await self.create_many_with_metadata([dict(
             entity_type=entity_type,
             entity_id=entity_id,
             action=action,
@@ -169,12 +172,16 @@ class SqlAlchemyAuditRepository(IAuditRepository):
             field_name=field_name,
             old_value=old_value,
             new_value=new_value,
-            extra_metadata=metadata,
-        )
-        self.session.add(log)
-        await self.session.flush()
+            metadata=metadata,
+        )])
+
+    async def create_many_with_metadata(self, entries: List[dict]) -> None:
+        if not entries:
+            return
+        # The commit stays even when the sink is buffered: callers rely on it
+        # to persist the change the audit row describes.
+        await self.audit_sink.write(self.session, entries)
         await self.session.commit()
-        return log
 
     async def get_project_activity(
         self,
@@ -192,23 +199,19 @@ class SqlAlchemyAuditRepository(IAuditRepository):
         entity_label is derived from entity_type + related entity lookups (best-effort; None allowed).
 
         D-13-01: BROADENED — entity_type='task' rows for project tasks now
-        included via subquery (RESEARCH §Pitfall 2). Without this UNION the
+        included (RESEARCH §Pitfall 2), matched on audit_log.project_id. Without this UNION the
         Activity tab would only surface phase_transition events even though
         the project has hundreds of task updates per day.
         """
         from app.infrastructure.database.models.user import UserModel
 
-        # Phase 13 broadening: project rows OR task rows whose task belongs to the project.
-        project_task_ids = select(TaskModel.id).where(TaskModel.project_id == project_id)
-        scope_filter = or_(
-            and_(
-                AuditLogModel.entity_type == "project",
-                AuditLogModel.entity_id == project_id,
-            ),
-            and_(
-                AuditLogModel.entity_type == "task",
-                AuditLogModel.entity_id.in_(project_task_ids),
-            ),
+        # Phase 13 broadening: project rows OR task rows whose task belongs to
+        # the project. Scoped through the denormalized audit_log.project_id
+        # (alembic 020, index (project_id, timestamp DESC)) instead of an
+        # ``entity_id IN (SELECT id FROM tasks …)`` subquery.
+        scope_filter = and_(
+            AuditLogModel.project_id == project_id,
+            AuditLogModel.entity_type.in_(("project", "task")),
         )
         conditions = [scope_filter]
 
@@ -428,6 +431,84 @@ class SqlAlchemyAuditRepository(IAuditRepository):
         ]
         return items, capped_total, truncated
 
+    async def stream_audit(
+        self,
+        project_id: Optional[int] = None,
+        types: Optional[List[str]] = None,
+        actor_id: Optional[int] = None,
+        action_prefix: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        batch_size: int = EXPORT_BATCH_ROWS,
+    ) -> AsyncIterator[dict]:
+        """Export stream — see IAuditRepository.stream_audit.
+
+        The keyset predicate walks ix_audit_log_project_ts (project scope) or
+        the partitions newest first; each fetch pulls ``batch_size`` rows.
+        """
+        from app.infrastructure.database.models.user import UserModel
+
+        conditions = []
+        if project_id is not None:
+            conditions.append(AuditLogModel.project_id == project_id)
+            conditions.append(AuditLogModel.entity_type.in_(("project", "task")))
+        if types:
+            conditions.append(AuditLogModel.action.in_(types))
+        if actor_id is not None:
+            conditions.append(AuditLogModel.user_id == actor_id)
+        if action_prefix:
+            conditions.append(AuditLogModel.action.like(f"{action_prefix}%"))
+        if date_from is not None:
+            conditions.append(AuditLogModel.timestamp >= date_from)
+        if date_to is not None:
+            conditions.append(AuditLogModel.timestamp <= date_to)
+        if after is not None:
+            conditions.append(tuple_(AuditLogModel.timestamp, AuditLogModel.id) < tuple_(*after))
+
+        stmt = (
+            select(
+                AuditLogModel.id,
+                AuditLogModel.action,
+                AuditLogModel.entity_type,
+                AuditLogModel.entity_id,
+                AuditLogModel.field_name,
+                AuditLogModel.old_value,
+                AuditLogModel.new_value,
+                AuditLogModel.user_id,
+                UserModel.full_name.label("user_name"),
+                AuditLogModel.timestamp,
+                AuditLogModel.project_id,
+                AuditLogModel.extra_metadata,
+            )
+            .select_from(AuditLogModel)
+            .join(UserModel, UserModel.id == AuditLogModel.user_id, isouter=True)
+            .where(*conditions)
+            .order_by(AuditLogModel.timestamp.desc(), AuditLogModel.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        try:
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    yield {
+                        "id": row["id"],
+                        "timestamp": row["timestamp"],
+                        "action": row["action"],
+                        "entity_type": row["entity_type"],
+                        "entity_id": row["entity_id"],
+                        "entity_label": _resolve_entity_label(row),
+                        "field_name": row["field_name"],
+                        "old_value": row["old_value"],
+                        "new_value": row["new_value"],
+                        "user_id": row["user_id"],
+                        "user_name": row["user_name"],
+                        "project_id": row["project_id"],
+                        "metadata": row["extra_metadata"],
+                    }
+        finally:
+            await result.close()
+
     async def active_users_trend(self, days: int = 30) -> List[dict]:
         """D-X2 daily active users — on-the-fly audit_log compute.
 
@@ -852,19 +933,9 @@ class SqlAlchemyAuditRepository(IAuditRepository):
                 )
                 .where(TeamMemberModel.user_id == viewer_user_id)
             )
-            scope_filter = or_(
-                and_(
-                    AuditLogModel.entity_type == "project",
-                    AuditLogModel.entity_id.in_(viewer_project_ids),
-                ),
-                and_(
-                    AuditLogModel.entity_type == "task",
-                    AuditLogModel.entity_id.in_(
-                        select(TaskModel.id).where(
-                            TaskModel.project_id.in_(viewer_project_ids),
-                        )
-                    ),
-                ),
+            scope_filter = and_(
+                AuditLogModel.entity_type.in_(("project", "task")),
+                AuditLogModel.project_id.in_(viewer_project_ids),
             )
             base_conditions.append(scope_filter)
 
@@ -17,6 +17,11 @@ After Phase 13:
     → Activity tab also shows task created / updated / deleted events,
       which is essential for an actually useful project Activity tab UAT.
 
+Since alembic 020 (denormalized audit_log.project_id):
+    WHERE project_id=:project_id AND entity_type IN ('project', 'task')
+    → same rows, served by ix_audit_log_project_ts instead of the tasks
+      subquery.
+
 The implementation lives in ``audit_repo.py`` (single file, single source
 of truth). This file is a marker so both ``Frontend2/components/activity``
 plan executors and any future code search land on the right grep hit.
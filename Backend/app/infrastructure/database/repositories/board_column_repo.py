@@ -1,12 +1,12 @@
 from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from app.domain.entities.board_column import BoardColumn
 from app.domain.repositories.board_column_repository import IBoardColumnRepository
 from app.infrastructure.database.models.board_column import BoardColumnModel
-from app.infrastructure.database.models.task import TaskModel
+from app.infrastructure.database.util import change_version, task_stats
 
 
 class SqlAlchemyBoardColumnRepository(IBoardColumnRepository):
@@ -56,6 +56,16 @@ class SqlAlchemyBoardColumnRepository(IBoardColumnRepository):
         refreshed = result.scalar_one()
         return self._to_entity(refreshed)
 
+    async def _lock_project(self, project_id: Optional[int], recompute: bool) -> None:
+        """Bump change_version (locks the projects row) and, when the counters
+        will be recomputed, take the counter lock — both before the column
+        row is flushed, matching the order task writes lock in."""
+        if project_id is None:
+            return
+        await change_version.bump(self.session, [project_id])
+        if recompute:
+            await task_stats.lock_for_recompute(self.session, [project_id])
+
     async def update(self, column: BoardColumn) -> BoardColumn:
         stmt = select(BoardColumnModel).where(BoardColumnModel.id == column.id)
         result = await self.session.execute(stmt)
@@ -64,6 +74,15 @@ class SqlAlchemyBoardColumnRepository(IBoardColumnRepository):
         if model is None:
             raise ValueError(f"BoardColumn {column.id} not found")
 
+        # Re-bucketing a column (todo → done, ...) moves every task in it, so
+        # project_task_stats is re-derived for the project in the same commit.
+        bucket_changed = (
+            model.category != column.category or bool(model.is_terminal) != bool(column.is_terminal)
+        )
+        # Lock in task-write order (projects row, counter lock, then the
+        # column row) BEFORE touching the model — see task_stats "Lock order".
+        await self._lock_project(model.project_id, recompute=bucket_changed)
+
         if column.name is not None:
             model.name = column.name
         if column.order_index is not None:
@@ -83,6 +102,8 @@ class SqlAlchemyBoardColumnRepository(IBoardColumnRepository):
         model.exit_policy = column.exit_policy
 
         await self.session.flush()
+        if bucket_changed and model.project_id is not None:
+            await task_stats.recompute(self.session, [model.project_id])
         await self.session.commit()
 
         # Re-fetch to return fresh entity
@@ -96,18 +117,10 @@ class SqlAlchemyBoardColumnRepository(IBoardColumnRepository):
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         if model is not None:
+            project_id = model.project_id
+            await self._lock_project(project_id, recompute=True)
             await self.session.delete(model)
+            await self.session.flush()
+            if project_id is not None:
+                await task_stats.recompute(self.session, [project_id])
             await self.session.commit()
-
-    async def count_tasks(self, column_id: int) -> int:
-        """Count non-deleted tasks assigned to the given column."""
-        stmt = (
-            select(func.count())
-            .select_from(TaskModel)
-            .where(
-                TaskModel.column_id == column_id,
-                TaskModel.is_deleted == False,
-            )
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -20,6 +20,18 @@ class SqlAlchemyNotificationPreferenceRepository(INotificationPreferenceReposito
         row = result.scalar_one_or_none()
         return NotificationPreference.model_validate(row) if row else None
 
+    async def get_by_users(self, user_ids: List[int]) -> Dict[int, NotificationPreference]:
+        if not user_ids:
+            return {}
+        stmt = select(NotificationPreferenceModel).where(
+            NotificationPreferenceModel.user_id.in_(user_ids)
+        )
+        result = await self.session.execute(stmt)
+        return {
+            row.user_id: NotificationPreference.model_validate(row)
+            for row in result.scalars().all()
+        }
+
     async def upsert(self, pref: NotificationPreference) -> NotificationPreference:
         stmt = select(NotificationPreferenceModel).where(
             NotificationPreferenceModel.user_id == pref.user_id
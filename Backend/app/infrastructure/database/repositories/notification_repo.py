@@ -21,6 +21,15 @@ class SqlAlchemyNotificationRepository(INotificationRepository):
         await self.session.refresh(db_obj)
         return Notification.model_validate(db_obj)
 
+    async def create_many(self, notifications: List[Notification]) -> None:
+        if not notifications:
+            return
+        # exclude_none keeps created_at on its server_default
+        self.session.add_all(
+            [NotificationModel(**n.model_dump(exclude={"id"}, exclude_none=True)) for n in notifications]
+        )
+        await self.session.commit()
+
     async def get_by_user(
         self,
         user_id: int,
@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 
 from app.domain.entities.password_reset_token import PasswordResetToken
 from app.domain.repositories.password_reset_repository import IPasswordResetRepository
@@ -26,6 +26,17 @@ class SqlAlchemyPasswordResetRepository(IPasswordResetRepository):
         await self.session.refresh(model)
         return self._to_entity(model)
 
+    async def create_many(self, tokens: List[Tuple[int, str, datetime]]) -> None:
+        if not tokens:
+            return
+        await self.session.execute(
+            insert(PasswordResetTokenModel).values([
+                {"user_id": user_id, "token_hash": token_hash, "expires_at": expires_at}
+                for user_id, token_hash, expires_at in tokens
+            ])
+        )
+        await self.session.flush()
+
     async def get_by_hash(self, token_hash: str) -> Optional[PasswordResetToken]:
         stmt = select(PasswordResetTokenModel).where(
             PasswordResetTokenModel.token_hash == token_hash
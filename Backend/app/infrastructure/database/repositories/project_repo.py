@@ -1,9 +1,12 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, insert, delete, func, and_, exists, literal, text
-from sqlalchemy.dialects.postgresql import insert as pg_insert
-from app.domain.entities.project import Project
+from sqlalchemy import (
+    BigInteger, Integer, bindparam, column, select, or_, insert, delete, func, and_, exists,
+    literal, text, update, values,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from app.domain.entities.project import CURRENT_SCHEMA_VERSION, Project, _normalize_process_config
 from app.domain.entities.user import User
 from app.domain.repositories.project_repository import IProjectRepository
 from app.domain.services.chart_applicability import CapabilityInputs
@@ -12,6 +15,7 @@ from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.database.models.board_column import BoardColumnModel
 from app.infrastructure.database.models.sprint import SprintModel
 from app.infrastructure.database.models.audit_log import AuditLogModel
+from app.infrastructure.database.util import change_version
 from sqlalchemy.orm import joinedload
 
 
@@ -19,9 +23,11 @@ from sqlalchemy.orm import joinedload
 # whitelist hoisted to module level so:
 #   1. Tests can import it directly and assert the membership contract
 #      without spinning up a full DB.
-#   2. The set is shared between task_counts_by_project_ids (admin /admin/
+#   2. The set was shared between task_counts_by_project_ids (admin /admin/
 #      projects table progress bar) and any future helper that needs the
-#      same "is this column terminal?" semantics.
+#      same "is this column terminal?" semantics. Task counts now come from
+#      project_task_stats (is_terminal / category flags, util/task_stats.py);
+#      the whitelist is kept as the documented name-matching contract.
 #
 # The whitelist case-insensitively matches the lowercase board column name
 # against the names admins commonly use for terminal-state columns. Plan
@@ -296,6 +302,7 @@ class SqlAlchemyProjectRepository(IProjectRepository):
             .on_conflict_do_nothing()
         )
         await self.session.execute(stmt)
+        await change_version.bump(self.session, [project_id])
         await self.session.commit()
 
     async def remove_member(self, project_id: int, user_id: int) -> None:
@@ -305,6 +312,7 @@ class SqlAlchemyProjectRepository(IProjectRepository):
             project_members.c.user_id == user_id,
         )
         await self.session.execute(stmt)
+        await change_version.bump(self.session, [project_id])
         await self.session.commit()
 
     async def get_members(self, project_id: int) -> List[User]:
@@ -413,54 +421,27 @@ class SqlAlchemyProjectRepository(IProjectRepository):
     async def task_counts_by_project_ids(self, project_ids):
         """Plan 14-05 follow-up — task aggregates for the admin /admin/projects table.
 
-        One query: SELECT project_id, COUNT(*) total, SUM(...) done
-        FROM tasks LEFT JOIN board_columns ON tasks.column_id = board_columns.id
-        WHERE project_id IN (...) GROUP BY project_id.
-
-        A task is "done" when its board column name (case-insensitive) is one of
-        the terminal-state labels also used by manage_tasks (manage_tasks.py:242).
-        The set is duplicated here intentionally — the repo layer cannot import
-        from application use_cases (DIP — CLAUDE.md §4.1.D).
+        Reads the materialized ``project_task_stats`` project rows
+        (``phase_id = ''``) — O(projects), no scan of ``tasks``. The counters
+        are maintained by SqlAlchemyTaskRepository in the task write
+        transaction; "done" follows ``is_terminal`` / ``category='done'``
+        (util/task_stats.py) rather than the DONE_COLUMN_NAMES whitelist.
+        Projects without a stats row have no tasks and are omitted — callers
+        already default missing ids to 0/0.
         """
         if not project_ids:
             return {}
 
-        from sqlalchemy import case, func as sqlfunc
-        from app.infrastructure.database.models.task import TaskModel
-
-        # Plan 14-18 — DONE_COLUMN_NAMES is now a module-level constant
-        # (declared above). The expanded whitelist covers UAT Test 31
-        # variants ("Bitti ✓", "Released", "Yayınlandı", etc.) that
-        # previously reported 0% completion because their column name
-        # didn't match the original 7-name set.
+        from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel
+        from app.infrastructure.database.util.task_stats import PROJECT_ROW
 
-        stmt = (
-            select(
-                TaskModel.project_id,
-                sqlfunc.count(TaskModel.id).label("total"),
-                sqlfunc.coalesce(
-                    sqlfunc.sum(
-                        case(
-                            (
-                                sqlfunc.lower(BoardColumnModel.name).in_(
-                                    DONE_COLUMN_NAMES
-                                ),
-                                1,
-                            ),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                ).label("done"),
-            )
-            .select_from(TaskModel)
-            .join(
-                BoardColumnModel,
-                TaskModel.column_id == BoardColumnModel.id,
-                isouter=True,
-            )
-            .where(TaskModel.project_id.in_(project_ids))
-            .group_by(TaskModel.project_id)
+        stmt = select(
+            ProjectTaskStatsModel.project_id,
+            ProjectTaskStatsModel.total,
+            ProjectTaskStatsModel.done,
+        ).where(
+            ProjectTaskStatsModel.project_id.in_(project_ids),
+            ProjectTaskStatsModel.phase_id == PROJECT_ROW,
         )
 
         result = await self.session.execute(stmt)
@@ -589,3 +570,128 @@ class SqlAlchemyProjectRepository(IProjectRepository):
             member_count=int(row.member_count or 0),
             has_all_categories=bool(row.has_all_categories),
         )
+
+    async def get_change_version(self, project_id: int) -> Optional[int]:
+        """Primary-key lookup of ``projects.change_version`` (conditional GETs).
+
+        Selects the column rather than the entity so a version bumped by a
+        core UPDATE is never served from the identity map.
+        """
+        stmt = select(ProjectModel.change_version).where(ProjectModel.id == project_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def list_stale_process_configs(
+        self, current_version: int, after_id: int = 0, limit: int = 500
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        projects = ProjectModel.__table__
+        stmt = (
+            select(projects.c.id, projects.c.process_config)
+            .where(
+                projects.c.id > after_id,
+                func.jsonb_typeof(projects.c.process_config) == "object",
+                func.coalesce(projects.c.process_config["schema_version"].as_integer(), 0)
+                < current_version,
+            )
+            .order_by(projects.c.id)
+            .limit(limit)
+        )
+        return [(pid, cfg) for pid, cfg in (await self.session.execute(stmt)).all()]
+
+    async def write_process_configs(
+        self, configs: Dict[int, Dict[str, Any]], current_version: int
+    ) -> None:
+        if not configs:
+            return
+        projects = ProjectModel.__table__
+        stmt = (
+            update(projects)
+            .where(
+                projects.c.id == bindparam("pid"),
+                func.coalesce(projects.c.process_config["schema_version"].as_integer(), 0)
+                < current_version,
+            )
+            # Explicit so the column's onupdate=now() does not fire.
+            .values(process_config=bindparam("cfg"), updated_at=projects.c.updated_at)
+        )
+        await self.session.execute(
+            stmt, [{"pid": pid, "cfg": cfg} for pid, cfg in configs.items()]
+        )
+        await self.session.commit()
+
+    async def apply_template_batch(
+        self,
+        template_id: int,
+        config_patch: Dict[str, Any],
+        lock_keys: Dict[int, int],
+    ) -> Dict[str, List[int]]:
+        """One try-lock SELECT plus one UPDATE for the batch, then commit
+        (which releases the ``pg_try_advisory_xact_lock`` locks).
+
+        Configs already at ``CURRENT_SCHEMA_VERSION`` (or NULL) are merged in
+        SQL with ``jsonb ||`` and never read. Older configs are normalized in
+        Python first and written with a single executemany, because the patch
+        stamps ``schema_version`` and an un-migrated V0/V1 body under that
+        stamp would never be migrated by the lazy normalizer.
+        """
+        outcome: Dict[str, List[int]] = {"applied": [], "locked": [], "missing": []}
+        if not lock_keys:
+            return outcome
+        projects = ProjectModel.__table__
+        requested = values(
+            column("id", Integer), column("lock_key", BigInteger), name="requested"
+        ).data(sorted(lock_keys.items()))
+        schema_version = projects.c.process_config["schema_version"].as_integer()
+        probe = (
+            select(
+                projects.c.id,
+                func.pg_try_advisory_xact_lock(requested.c.lock_key).label("locked"),
+                or_(
+                    projects.c.process_config.is_(None),
+                    schema_version >= CURRENT_SCHEMA_VERSION,
+                ).label("current"),
+            )
+            .join(requested, requested.c.id == projects.c.id)
+            .where(projects.c.is_deleted == False)  # noqa: E712
+        )
+        stamp = {
+            "process_template_id": template_id,
+            "version": projects.c.version + 1,
+            "change_version": projects.c.change_version + 1,
+        }
+        try:
+            rows = (await self.session.execute(probe)).all()
+            found = {r.id for r in rows}
+            outcome["missing"] = [pid for pid in lock_keys if pid not in found]
+            outcome["locked"] = [r.id for r in rows if not r.locked]
+            current = [r.id for r in rows if r.locked and r.current]
+            legacy = [r.id for r in rows if r.locked and not r.current]
+
+            if current:
+                merged = func.coalesce(projects.c.process_config, literal({}, JSONB)).op(
+                    "||", return_type=JSONB
+                )(literal(config_patch, JSONB))
+                await self.session.execute(
+                    update(projects)
+                    .where(projects.c.id.in_(current))
+                    .values(process_config=merged, **stamp)
+                )
+            if legacy:
+                configs = await self.session.execute(
+                    select(projects.c.id, projects.c.process_config).where(projects.c.id.in_(legacy))
+                )
+                params = [
+                    {"pid": pid, "cfg": {**(_normalize_process_config(cfg) or {}), **config_patch}}
+                    for pid, cfg in configs.all()
+                ]
+                await self.session.execute(
+                    update(projects)
+                    .where(projects.c.id == bindparam("pid"))
+                    .values(process_config=bindparam("cfg"), **stamp),
+                    params,
+                )
+            outcome["applied"] = current + legacy
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return outcome
@@ -1,7 +1,7 @@
-from typing import List, Optional
-from datetime import date, timedelta
+from typing import AsyncIterator, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, distinct, and_, or_, union, case
+from sqlalchemy import select, func, distinct, and_, or_, union, tuple_
 
 from app.domain.repositories.report_repository import IReportRepository
 from app.application.dtos.report_dtos import (
@@ -14,6 +14,7 @@ from app.application.dtos.report_dtos import (
     DistributionItemDTO,
     PerformanceDTO,
     MemberPerformanceDTO,
+    TaskExportRow,
     TaskExportRowDTO,
 )
 from app.infrastructure.database.models.task import TaskModel
@@ -24,6 +25,9 @@ from app.infrastructure.database.models.audit_log import AuditLogModel
 from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.database.util.done_columns import resolve_done_column_ids
 
+# Rows fetched per round trip when streaming exports (server-side cursor).
+EXPORT_BATCH_ROWS = 1000
+
 
 class SqlAlchemyReportRepository(IReportRepository):
     def __init__(self, session: AsyncSession):
@@ -463,13 +467,13 @@ class SqlAlchemyReportRepository(IReportRepository):
 
         return PerformanceDTO(members=members)
 
-    async def get_tasks_for_export(
+    def _export_stmt(
         self,
         project_id: int,
         assignee_ids: Optional[List[int]],
         date_from: Optional[date],
         date_to: Optional[date],
-    ) -> List[TaskExportRowDTO]:
+    ):
         assignee_alias = UserModel.__table__.alias("assignee_user")
         reporter_alias = UserModel.__table__.alias("reporter_user")
 
@@ -496,7 +500,7 @@ class SqlAlchemyReportRepository(IReportRepository):
                 TaskModel.project_id == project_id,
                 TaskModel.deleted_at.is_(None),
             )
-            .order_by(TaskModel.created_at.desc())
+            .order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
         )
 
         if assignee_ids:
@@ -505,28 +509,64 @@ class SqlAlchemyReportRepository(IReportRepository):
             stmt = stmt.where(TaskModel.created_at >= date_from)
         if date_to:
             stmt = stmt.where(TaskModel.created_at <= date_to)
+        return stmt
+
+    @staticmethod
+    def _export_row(row) -> TaskExportRow:
+        return TaskExportRow(
+            row.task_id,
+            row.task_key,
+            row.title,
+            row.status,
+            row.assignee,
+            str(row.priority.value) if row.priority else None,
+            row.sprint,
+            row.points,
+            row.created_at,
+            row.due_date,
+            row.updated_at,
+            row.reporter,
+        )
 
-        result = await self.session.execute(stmt)
-        rows = result.all()
-
+    async def get_tasks_for_export(
+        self,
+        project_id: int,
+        assignee_ids: Optional[List[int]],
+        date_from: Optional[date],
+        date_to: Optional[date],
+    ) -> List[TaskExportRowDTO]:
+        result = await self.session.execute(
+            self._export_stmt(project_id, assignee_ids, date_from, date_to)
+        )
         return [
-            TaskExportRowDTO(
-                task_id=row.task_id,
-                task_key=row.task_key,
-                title=row.title,
-                status=row.status,
-                assignee=row.assignee,
-                priority=str(row.priority.value) if row.priority else None,
-                sprint=row.sprint,
-                points=row.points,
-                created_at=row.created_at,
-                due_date=row.due_date,
-                updated_at=row.updated_at,
-                reporter=row.reporter,
-            )
-            for row in rows
+            TaskExportRowDTO(**self._export_row(row)._asdict())
+            for row in result.all()
         ]
 
+    async def stream_tasks_for_export(
+        self,
+        project_id: int,
+        assignee_ids: Optional[List[int]],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        after: Optional[Tuple[datetime, int]] = None,
+        batch_size: int = EXPORT_BATCH_ROWS,
+    ) -> AsyncIterator[TaskExportRow]:
+        """Export rows through a server-side cursor, ``batch_size`` rows per
+        fetch — memory stays flat however many tasks the project has.
+        ``after`` = (created_at, task_id) of the last row already delivered."""
+        stmt = self._export_stmt(project_id, assignee_ids, date_from, date_to)
+        if after is not None:
+            stmt = stmt.where(tuple_(TaskModel.created_at, TaskModel.id) < tuple_(*after))
+        result = await self.session.stream(stmt.execution_options(yield_per=batch_size))
+        try:
+            async for partition in result.partitions():
+                for row in partition:
+                    yield self._export_row(row)
+        finally:
+            # A writer that stops early must not leave the cursor open.
+            await result.close()
+
     # ------------------------------------------------------------------
     # Reports migration v2 (Strategy D) — phase progress aggregation
     # ------------------------------------------------------------------
@@ -534,9 +574,9 @@ class SqlAlchemyReportRepository(IReportRepository):
     async def get_phase_progress(self, project_id: int) -> List[dict]:
         """Aggregate tasks per ``phase_id`` broken down by column category.
 
-        Single GROUP-BY query joining ``tasks`` LEFT JOIN ``board_columns`` so
-        the breakdown buckets fall out of one round trip. Tasks with NULL
-        ``phase_id`` are excluded — the FE only renders phases declared in
+        Served from the materialized ``project_task_stats`` phase rows (one
+        row per phase — no scan of ``tasks``). Tasks with NULL ``phase_id``
+        have no phase row — the FE only renders phases declared in
         ``process_config.phase_workflow.nodes``, so unphased tasks don't
         belong in the visualisation.
 
@@ -544,45 +584,16 @@ class SqlAlchemyReportRepository(IReportRepository):
         The use case is responsible for zipping these with the project's node
         order and resolving display labels.
         """
-        stmt = (
-            select(
-                TaskModel.phase_id,
-                func.count(TaskModel.id).label("total"),
-                func.coalesce(
-                    func.sum(
-                        case((BoardColumnModel.category == "done", 1), else_=0)
-                    ),
-                    0,
-                ).label("done"),
-                func.coalesce(
-                    func.sum(
-                        case((BoardColumnModel.category == "in_progress", 1), else_=0)
-                    ),
-                    0,
-                ).label("in_progress"),
-                func.coalesce(
-                    func.sum(
-                        case((BoardColumnModel.category == "todo", 1), else_=0)
-                    ),
-                    0,
-                ).label("todo"),
-            )
-            .select_from(TaskModel)
-            .join(
-                BoardColumnModel,
-                TaskModel.column_id == BoardColumnModel.id,
-                isouter=True,
-            )
-            .where(
-                TaskModel.project_id == project_id,
-                TaskModel.phase_id.is_not(None),
-                TaskModel.deleted_at.is_(None),
-            )
-            .group_by(TaskModel.phase_id)
+        from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel
+        from app.infrastructure.database.util.task_stats import PROJECT_ROW
+
+        stmt = select(ProjectTaskStatsModel).where(
+            ProjectTaskStatsModel.project_id == project_id,
+            ProjectTaskStatsModel.phase_id != PROJECT_ROW,
         )
 
         result = await self.session.execute(stmt)
-        rows = result.all()
+        rows = result.scalars().all()
         return [
             {
                 "phase_id": row.phase_id,
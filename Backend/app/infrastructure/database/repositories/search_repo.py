@@ -0,0 +1,252 @@
+"""Global search over tasks, projects and comments.
+
+PostgreSQL path (migration 019):
+- every word must match; per kind a word matches via ``ILIKE '%word%'`` on
+  the short fields (served by the pg_trgm GIN indexes) OR a prefix tsquery
+  against the ``to_tsvector('simple', …)`` document (served by the FTS
+  expression indexes) — so ``auth`` finds "Authentication" and a word that
+  only appears in a description / comment body;
+- rank = ``ts_rank`` of the document + ``similarity(title, query)`` when
+  pg_trgm is installed + 1.0 for an exact task/project key hit.
+
+Other dialects (SQLite test runs) keep the plain ILIKE match on the short
+fields and rank in Python by how many words hit the title.
+
+Highlighting is done by the use case on the returned rows, not in SQL.
+"""
+import re
+from typing import List, Optional, Sequence
+
+from sqlalchemy import case, func, literal, literal_column, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.dtos.search_dtos import SearchHitDTO, SearchKind
+from app.domain.repositories.search_repository import ISearchRepository
+from app.infrastructure.database.models.comment import CommentModel
+from app.infrastructure.database.models.project import ProjectModel
+from app.infrastructure.database.models.task import TaskModel
+
+# Cached per process: whether the pg_trgm extension is installed.
+_pg_trgm_available: Optional[bool] = None
+
+
+# The documents are spelled as literal SQL — with bound '' / ' ' parameters
+# a generic prepared plan would no longer match the index expressions.
+# Must stay identical to the expressions in alembic 019.
+_TASK_DOCUMENT = (
+    "to_tsvector('simple', coalesce(tasks.title, '') || ' ' || coalesce(tasks.description, ''))"
+)
+_COMMENT_DOCUMENT = "to_tsvector('simple', coalesce(comments.content, ''))"
+
+
+def _task_document():
+    return literal_column(_TASK_DOCUMENT)
+
+
+def _comment_document():
+    return literal_column(_COMMENT_DOCUMENT)
+
+
+def _prefix_tsquery(words: List[str], joiner: str):
+    """``to_tsquery('simple', 'w1:* & w2:*')`` — tokens reduced to word chars."""
+    terms = [re.sub(r"\W", "", w) for w in words]
+    terms = [f"{t}:*" for t in terms if t]
+    if not terms:
+        return None
+    return func.to_tsquery(text("'simple'"), f" {joiner} ".join(terms))
+
+
+def _like(word: str) -> str:
+    escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class SqlAlchemySearchRepository(ISearchRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(
+        self,
+        words: List[str],
+        kinds: Sequence[SearchKind],
+        accessible_project_ids: Optional[List[int]],
+        limit: int = 20,
+    ) -> List[SearchHitDTO]:
+        if not words:
+            return []
+        # Same empty-scope short-circuit as search_by_title_global.
+        if accessible_project_ids is not None and len(accessible_project_ids) == 0:
+            return []
+        is_pg = self.session.get_bind().dialect.name == "postgresql"
+        trgm = is_pg and await self._has_pg_trgm()
+
+        hits: List[SearchHitDTO] = []
+        if "task" in kinds:
+            hits += await self._tasks(words, accessible_project_ids, limit, is_pg, trgm)
+        if "project" in kinds:
+            hits += await self._projects(words, accessible_project_ids, limit, trgm)
+        if "comment" in kinds:
+            hits += await self._comments(words, accessible_project_ids, limit, is_pg)
+        return hits
+
+    async def _has_pg_trgm(self) -> bool:
+        global _pg_trgm_available
+        if _pg_trgm_available is None:
+            row = await self.session.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            )
+            _pg_trgm_available = row.scalar() is not None
+        return _pg_trgm_available
+
+    async def _tasks(self, words, scope, limit, is_pg, trgm) -> List[SearchHitDTO]:
+        query = " ".join(words)
+        per_word = []
+        for w in words:
+            field_match = or_(
+                TaskModel.title.ilike(_like(w), escape="\\"),
+                TaskModel.task_key.ilike(_like(w), escape="\\"),
+            )
+            tsq = _prefix_tsquery([w], "&") if is_pg else None
+            per_word.append(
+                or_(field_match, _task_document().op("@@")(tsq)) if tsq is not None else field_match
+            )
+        key_hit = case((func.lower(TaskModel.task_key) == query, 1.0), else_=0.0)
+        score = key_hit
+        if is_pg:
+            any_word = _prefix_tsquery(words, "|")
+            if any_word is not None:
+                score = score + func.ts_rank(_task_document(), any_word)
+            if trgm:
+                score = score + func.similarity(TaskModel.title, query)
+
+        stmt = (
+            select(
+                TaskModel.id,
+                TaskModel.title,
+                TaskModel.description,
+                TaskModel.task_key,
+                TaskModel.project_id,
+                ProjectModel.key.label("project_key"),
+                score.label("score"),
+            )
+            .join(ProjectModel, ProjectModel.id == TaskModel.project_id)
+            .where(TaskModel.is_deleted == False, *per_word)  # noqa: E712
+        )
+        if scope is not None:
+            stmt = stmt.where(TaskModel.project_id.in_(scope))
+        stmt = stmt.order_by(text("score DESC"), TaskModel.updated_at.desc().nulls_last()).limit(limit)
+        rows = (await self.session.execute(stmt)).all()
+        return self._ranked([
+            SearchHitDTO(
+                kind="task",
+                id=r.id,
+                title=r.title,
+                body=r.description,
+                project_id=r.project_id,
+                project_key=r.project_key,
+                task_id=r.id,
+                task_key=r.task_key,
+                score=float(r.score or 0.0),
+            )
+            for r in rows
+        ], words, is_pg)
+
+    async def _projects(self, words, scope, limit, trgm) -> List[SearchHitDTO]:
+        query = " ".join(words)
+        per_word = [
+            or_(
+                ProjectModel.name.ilike(_like(w), escape="\\"),
+                ProjectModel.key.ilike(_like(w), escape="\\"),
+            )
+            for w in words
+        ]
+        score = case((func.lower(ProjectModel.key) == query, 1.0), else_=0.0)
+        if trgm:
+            score = score + func.similarity(ProjectModel.name, query)
+        stmt = (
+            select(
+                ProjectModel.id,
+                ProjectModel.name,
+                ProjectModel.description,
+                ProjectModel.key,
+                score.label("score"),
+            )
+            .where(ProjectModel.is_deleted == False, *per_word)  # noqa: E712
+        )
+        if scope is not None:
+            stmt = stmt.where(ProjectModel.id.in_(scope))
+        stmt = stmt.order_by(text("score DESC"), ProjectModel.name).limit(limit)
+        rows = (await self.session.execute(stmt)).all()
+        return self._ranked([
+            SearchHitDTO(
+                kind="project",
+                id=r.id,
+                title=r.name,
+                body=r.description,
+                project_id=r.id,
+                project_key=r.key,
+                score=float(r.score or 0.0),
+            )
+            for r in rows
+        ], words, trgm)
+
+    async def _comments(self, words, scope, limit, is_pg) -> List[SearchHitDTO]:
+        if is_pg:
+            tsq = _prefix_tsquery(words, "&")
+            if tsq is None:
+                return []
+            match = [_comment_document().op("@@")(tsq)]
+            score = func.ts_rank(_comment_document(), tsq)
+        else:
+            match = [CommentModel.content.ilike(_like(w), escape="\\") for w in words]
+            score = literal(0.0)
+        stmt = (
+            select(
+                CommentModel.id,
+                CommentModel.content,
+                TaskModel.id.label("task_id"),
+                TaskModel.title,
+                TaskModel.task_key,
+                TaskModel.project_id,
+                ProjectModel.key.label("project_key"),
+                score.label("score"),
+            )
+            .join(TaskModel, TaskModel.id == CommentModel.task_id)
+            .join(ProjectModel, ProjectModel.id == TaskModel.project_id)
+            .where(
+                CommentModel.is_deleted == False,  # noqa: E712
+                TaskModel.is_deleted == False,  # noqa: E712
+                *match,
+            )
+        )
+        if scope is not None:
+            stmt = stmt.where(TaskModel.project_id.in_(scope))
+        stmt = stmt.order_by(text("score DESC"), CommentModel.created_at.desc()).limit(limit)
+        rows = (await self.session.execute(stmt)).all()
+        # Comment hits rank below a title hit on the same words.
+        return [
+            SearchHitDTO(
+                kind="comment",
+                id=r.id,
+                title=r.title,
+                body=r.content,
+                project_id=r.project_id,
+                project_key=r.project_key,
+                task_id=r.task_id,
+                task_key=r.task_key,
+                score=float(r.score or 0.0) * 0.5,
+            )
+            for r in rows
+        ]
+
+    @staticmethod
+    def _ranked(hits: List[SearchHitDTO], words: List[str], ranked_in_sql: bool) -> List[SearchHitDTO]:
+        """Fallback rank when SQL could not score text similarity: share of
+        the words found in the title (on top of any key bonus)."""
+        if ranked_in_sql:
+            return hits
+        for hit in hits:
+            title = hit.title.lower()
+            hit.score += sum(1 for w in words if w in title) / len(words)
+        hits.sort(key=lambda h: -h.score)
+        return hits
@@ -10,6 +10,7 @@ from app.infrastructure.database.models.sprint import SprintModel
 from app.infrastructure.database.models.sprint_snapshot import SprintSnapshotModel
 from app.infrastructure.database.models.task import TaskModel
 from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.util import change_version
 
 
 class SqlAlchemySprintRepository(ISprintRepository):
@@ -242,6 +243,7 @@ class SqlAlchemySprintRepository(ISprintRepository):
                 .values(sprint_id=to_sprint_id)
             )
             await self.session.execute(update_stmt)
+            await change_version.bump(self.session, task_ids=task_ids)
             await self.session.commit()
 
         return len(task_ids)
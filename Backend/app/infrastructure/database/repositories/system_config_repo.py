@@ -7,6 +7,7 @@ from sqlalchemy.sql import func
 
 from app.domain.repositories.system_config_repository import ISystemConfigRepository
 from app.infrastructure.database.models.system_config import SystemConfigModel
+from app.infrastructure.database.startup import STARTUP_KEY_PREFIX
 
 
 class SqlAlchemySystemConfigRepository(ISystemConfigRepository):
@@ -14,7 +15,10 @@ class SqlAlchemySystemConfigRepository(ISystemConfigRepository):
         self._session = session
 
     async def get_all(self) -> Dict[str, str]:
-        stmt = select(SystemConfigModel)
+        # Boot-step fingerprints share the table but are not settings.
+        stmt = select(SystemConfigModel).where(
+            ~SystemConfigModel.key.startswith(STARTUP_KEY_PREFIX)
+        )
         result = await self._session.execute(stmt)
         rows = result.scalars().all()
         return {row.key: row.value for row in rows}
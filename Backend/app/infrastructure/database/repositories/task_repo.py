@@ -1,16 +1,20 @@
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func, or_, text
-from sqlalchemy.orm import joinedload, selectinload
-from app.domain.entities.task import Task
+from sqlalchemy import select, update, func, literal_column, or_, and_, case, exists, false, null, true, text
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from app.domain.entities.project import Project
+from app.domain.entities.task import Task, TaskPriority
 from app.domain.repositories.task_repository import ITaskRepository
 from app.infrastructure.database.models.task import TaskModel
-from app.infrastructure.database.models.audit_log import AuditLogModel
 # YENİ İMPORT: Nested eager loading için gerekli
 from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.database.models.project import ProjectModel
 from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.models.task_dependency import TaskDependencyModel
+from app.infrastructure.database.util import change_version, task_stats
+from app.infrastructure.database.util.done_columns import terminal_column_clause
+from app.infrastructure.database.util.audit_sink import AuditSink, get_audit_sink
 
 
 # Audit values for large free-text fields (notably `description`) are capped at
@@ -22,6 +26,9 @@ from app.infrastructure.database.models.board_column import BoardColumnModel
 # User decision 2026-05-29: cap-at-write (Option C) over full-store / event-only.
 AUDIT_VALUE_MAX_LEN = 255
 
+# Task fields whose change moves a project_task_stats counter.
+_STATS_FIELDS = {"column_id", "phase_id", "points"}
+
 
 def _cap_audit_value(value: Any) -> Optional[str]:
     """Stringify an audit old/new value, truncating oversized values with an
@@ -35,6 +42,49 @@ def _cap_audit_value(value: Any) -> Optional[str]:
     return s[:AUDIT_VALUE_MAX_LEN] + "…"
 
 
+def _audit_row(
+    model: TaskModel,
+    identity: Tuple[Optional[str], str],
+    key: str,
+    old_val: Any,
+    new_val: Any,
+    old_label: Optional[str],
+    new_label: Optional[str],
+    project_key: Optional[str],
+    project_name: Optional[str],
+    user_id: Optional[int],
+) -> Dict[str, Any]:
+    """Column values for one 'updated' audit row (Plan 14-09 D-D2 envelope).
+
+    ``identity`` is the ``(task_key, title)`` pair snapshotted BEFORE any field
+    is mutated, so every row of one update carries the pre-update title.
+    Shared by ``update`` (ORM objects) and ``bulk_update`` (one executemany
+    INSERT).
+    """
+    task_key, task_title = identity
+    return {
+        "entity_type": "task",
+        "entity_id": model.id,
+        "field_name": key,
+        "old_value": _cap_audit_value(old_val),
+        "new_value": _cap_audit_value(new_val),
+        "user_id": user_id,
+        "action": "updated",
+        "project_id": model.project_id,
+        "extra_metadata": {
+            "task_id": model.id,
+            "task_key": task_key,
+            "task_title": task_title,
+            "project_id": model.project_id,
+            "project_key": project_key,
+            "project_name": project_name,
+            "field_name": key,
+            "old_value_label": old_label,
+            "new_value_label": new_label,
+        },
+    }
+
+
 async def _resolve_column_name(session: AsyncSession, column_id: Optional[int]) -> Optional[str]:
     """D-D2: resolve column_id → column.name for old/new value label.
 
@@ -55,18 +105,14 @@ async def _resolve_column_name(session: AsyncSession, column_id: Optional[int])
 
 
 class SqlAlchemyTaskRepository(ITaskRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, audit_sink: Optional[AuditSink] = None):
         self.session = session
+        self.audit_sink = audit_sink or get_audit_sink()
 
-    def _to_entity(self, model: TaskModel) -> Optional[Task]:
-        """
-        SQLAlchemy modelini Domain Entity'e MANUEL olarak çeviriyoruz.
-        """
-        if not model:
-            return None
-
-        # 1. Ana Task Objesini oluştur
-        task_data = {
+    @staticmethod
+    def _entity_fields(model: TaskModel) -> Dict[str, Any]:
+        """Scalar Task fields of a row (relationships are mapped by the callers)."""
+        return {
             "id": model.id,
             "title": model.title,
             "description": model.description,
@@ -89,7 +135,18 @@ class SqlAlchemyTaskRepository(ITaskRepository):
             "parent_task_id": model.parent_task_id,
             "created_at": model.created_at,
             "updated_at": model.updated_at,
+        }
+
+    def _to_entity(self, model: TaskModel) -> Optional[Task]:
+        """
+        SQLAlchemy modelini Domain Entity'e MANUEL olarak çeviriyoruz.
+        """
+        if not model:
+            return None
 
+        # 1. Ana Task Objesini oluştur
+        task_data = {
+            **self._entity_fields(model),
             "assignee": model.assignee,
             "column": model.column,
             "project": model.project,
@@ -157,11 +214,11 @@ class SqlAlchemyTaskRepository(ITaskRepository):
                 joinedload(TaskModel.column),
             ),
 
-            # 3. Subtasks İlişkisi
+            # 3. Subtasks İlişkisi — one level, summary fields only (_to_entity
+            # never reads sub.project; deeper trees: get_subtree).
             selectinload(TaskModel.subtasks).options(
                 joinedload(TaskModel.column),
                 joinedload(TaskModel.assignee).joinedload(UserModel.role),
-                joinedload(TaskModel.project).joinedload(ProjectModel.columns)
             )
         )
 
@@ -265,6 +322,13 @@ class SqlAlchemyTaskRepository(ITaskRepository):
             .values(**fields)
         )
         await self.session.execute(stmt)
+        project_ids = await task_stats.project_ids_for_tasks(
+            self.session, TaskModel.series_id == series_id
+        )
+        # projects row before the counter lock (task_stats "Lock order").
+        await change_version.bump(self.session, project_ids)
+        if _STATS_FIELDS & fields.keys():
+            await task_stats.recompute(self.session, project_ids)
         await self.session.commit()
 
     async def create(self, task: Task) -> Task:
@@ -287,7 +351,7 @@ class SqlAlchemyTaskRepository(ITaskRepository):
             project_name = project.name if project else None
 
         # Audit log — task oluşturuldu
-        audit_entry = AuditLogModel(
+        audit_entry = dict(
             entity_type="task",
             entity_id=model.id,
             field_name="title",
@@ -295,6 +359,7 @@ class SqlAlchemyTaskRepository(ITaskRepository):
             new_value=model.title,
             user_id=model.reporter_id,
             action="created",
+            project_id=model.project_id,
             extra_metadata={
                 "task_id": model.id,
                 "task_key": model.task_key,
@@ -304,7 +369,8 @@ class SqlAlchemyTaskRepository(ITaskRepository):
                 "project_name": project_name,
             },
         )
-        self.session.add(audit_entry)
+        await self.audit_sink.write(self.session, [audit_entry])
+        await task_stats.apply_task_delta(self.session, None, task_stats.counter_key(model))
         await self.session.commit()
         # ARCH-04: fetch full entity with eager loading in a single query (no separate get_by_id call)
         stmt = self._get_base_query().where(TaskModel.id == model.id)
@@ -318,6 +384,16 @@ class SqlAlchemyTaskRepository(ITaskRepository):
         model = result.unique().scalar_one_or_none()
         return self._to_entity(model)
 
+    async def get_audit_identity(self, task_id: int) -> Optional[Dict[str, Any]]:
+        # Three columns instead of get_by_id's eager-loaded graph.
+        stmt = select(TaskModel.task_key, TaskModel.title, TaskModel.project_id).where(
+            TaskModel.id == task_id, TaskModel.is_deleted == False
+        )
+        row = (await self.session.execute(stmt)).mappings().first()
+        if row is None:
+            return None
+        return {"task_key": row["task_key"], "title": row["title"], "project_id": row["project_id"]}
+
     async def get_all_by_project(self, project_id: int) -> List[Task]:
         stmt = self._get_base_query().where(TaskModel.project_id == project_id)
         result = await self.session.execute(stmt)
@@ -348,10 +424,10 @@ class SqlAlchemyTaskRepository(ITaskRepository):
 
         # Snapshot identity fields BEFORE mutation so the audit row carries the
         # current task_key + title regardless of which field was changed.
-        task_key_snapshot = model.task_key
-        task_title_snapshot = model.title
+        identity = (model.task_key, model.title)
+        counters_before = task_stats.counter_key(model)
 
-        # Compute audit diff — one AuditLogModel row per changed field
+        # Compute audit diff — one audit_log row per changed field
         audit_entries = []
         for key, new_val in update_data.items():
             if hasattr(model, key):
@@ -368,42 +444,122 @@ class SqlAlchemyTaskRepository(ITaskRepository):
                         old_label = str(old_val) if old_val is not None else None
                         new_label = str(new_val) if new_val is not None else None
 
-                    enriched_metadata = {
-                        "task_id": model.id,
-                        "task_key": task_key_snapshot,
-                        "task_title": task_title_snapshot,
-                        "project_id": model.project_id,
-                        "project_key": project_key,
-                        "project_name": project_name,
-                        "field_name": key,
-                        "old_value_label": old_label,
-                        "new_value_label": new_label,
-                    }
-
-                    audit_entries.append(
-                        AuditLogModel(
-                            entity_type="task",
-                            entity_id=task_id,
-                            field_name=key,
-                            old_value=_cap_audit_value(old_val),
-                            new_value=_cap_audit_value(new_val),
-                            user_id=user_id,
-                            action="updated",
-                            extra_metadata=enriched_metadata,
-                        )
-                    )
+                    audit_entries.append(_audit_row(
+                        model, identity, key, old_val, new_val, old_label, new_label,
+                        project_key, project_name, user_id,
+                    ))
                     setattr(model, key, new_val)
 
         # Increment optimistic lock version
         model.version = (model.version or 1) + 1
 
-        # Persist audit entries and updated model in one commit
-        self.session.add_all(audit_entries)
+        # Persist audit entries, updated model and project_task_stats deltas
+        # in one commit. Only column/phase/points edits move a counter.
+        await self.audit_sink.write(self.session, audit_entries)
+        if _STATS_FIELDS & {e["field_name"] for e in audit_entries}:
+            await task_stats.apply_task_delta(
+                self.session, counters_before, task_stats.counter_key(model)
+            )
         await self.session.flush()
         await self.session.commit()
 
         return await self.get_by_id(task_id)
 
+    async def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        if not task_ids:
+            return []
+        stmt = self._get_base_query().where(TaskModel.id.in_(task_ids))
+        result = await self.session.execute(stmt)
+        models = result.unique().scalars().all()
+        return [self._to_entity(m) for m in models if m is not None]
+
+    async def bulk_update(
+        self, updates: Dict[int, Dict[str, Any]], user_id: int = None
+    ) -> List[Task]:
+        """Apply ``{task_id: update_data}`` in ONE transaction.
+
+        Same audit envelope and counter maintenance as :meth:`update`, but the
+        per-row round trips are batched: tasks, projects and column labels are
+        each loaded with one IN query, audit rows go out as a single
+        executemany INSERT, project_task_stats deltas as one upsert, and the
+        result is re-read with one eager-loaded SELECT. Order of the returned
+        list follows ``updates``.
+        """
+        if not updates:
+            return []
+        task_ids = list(updates)
+        result = await self.session.execute(
+            select(TaskModel).where(TaskModel.id.in_(task_ids), TaskModel.is_deleted == False)  # noqa: E712
+        )
+        models = {m.id: m for m in result.scalars().all()}
+        missing = [tid for tid in task_ids if tid not in models]
+        if missing:
+            raise Exception(f"Task with id {missing[0]} not found")
+
+        project_rows = await self.session.execute(
+            select(ProjectModel.id, ProjectModel.key, ProjectModel.name).where(
+                ProjectModel.id.in_({m.project_id for m in models.values()})
+            )
+        )
+        projects = {row.id: (row.key, row.name) for row in project_rows.all()}
+
+        # D-D2 column labels for every old/new column id in one query;
+        # deleted columns degrade to str(id) exactly like _resolve_column_name.
+        column_ids = set()
+        for tid, data in updates.items():
+            if "column_id" in data and data["column_id"] != models[tid].column_id:
+                column_ids.update(c for c in (models[tid].column_id, data["column_id"]) if c is not None)
+        column_names: Dict[int, str] = {}
+        if column_ids:
+            column_rows = await self.session.execute(
+                select(BoardColumnModel.id, BoardColumnModel.name).where(
+                    BoardColumnModel.id.in_(column_ids)
+                )
+            )
+            column_names = {row.id: row.name for row in column_rows.all()}
+
+        def _column_label(column_id: Optional[int]) -> Optional[str]:
+            if column_id is None:
+                return None
+            return column_names.get(column_id, str(column_id))
+
+        audit_rows: List[Dict[str, Any]] = []
+        counter_changes = []
+        for tid in task_ids:
+            model = models[tid]
+            project_key, project_name = projects.get(model.project_id, (None, None))
+            identity = (model.task_key, model.title)
+            counters_before = task_stats.counter_key(model)
+            changed = set()
+            for key, new_val in updates[tid].items():
+                if not hasattr(model, key):
+                    continue
+                old_val = getattr(model, key)
+                if old_val == new_val:
+                    continue
+                if key == "column_id":
+                    old_label, new_label = _column_label(old_val), _column_label(new_val)
+                else:
+                    old_label = str(old_val) if old_val is not None else None
+                    new_label = str(new_val) if new_val is not None else None
+                audit_rows.append(_audit_row(
+                    model, identity, key, old_val, new_val, old_label, new_label,
+                    project_key, project_name, user_id,
+                ))
+                changed.add(key)
+                setattr(model, key, new_val)
+            model.version = (model.version or 1) + 1
+            if _STATS_FIELDS & changed:
+                counter_changes.append((counters_before, task_stats.counter_key(model)))
+
+        await self.audit_sink.write(self.session, audit_rows)
+        await task_stats.apply_task_deltas(self.session, counter_changes)
+        await self.session.flush()
+        await self.session.commit()
+
+        by_id = {t.id: t for t in await self.get_by_ids(task_ids)}
+        return [by_id[tid] for tid in task_ids if tid in by_id]
+
     async def delete(self, task_id: int) -> bool:
         """Soft-delete: set is_deleted=True and deleted_at; do NOT issue SQL DELETE."""
         stmt = select(TaskModel).where(TaskModel.id == task_id, TaskModel.is_deleted == False)
@@ -412,6 +568,7 @@ class SqlAlchemyTaskRepository(ITaskRepository):
         if model:
             model.is_deleted = True
             model.deleted_at = datetime.utcnow()  # Set explicitly — NOT via onupdate
+            await task_stats.apply_task_delta(self.session, task_stats.counter_key(model), None)
             await self.session.commit()
             return True
         return False
@@ -505,44 +662,221 @@ class SqlAlchemyTaskRepository(ITaskRepository):
         if done_column_ids:
             stmt = stmt.where(TaskModel.column_id.notin_(done_column_ids))
 
-        stmt = stmt.values(assignee_id=None)
-        await self.session.execute(stmt)
+        stmt = stmt.values(assignee_id=None).returning(
+            TaskModel.project_id, TaskModel.phase_id, TaskModel.column_id, TaskModel.points,
+        )
+        rows = (await self.session.execute(stmt)).all()
+        await change_version.bump(self.session, [project_id])
+        # No counter moves, but the batch goes through the shared delta path
+        # like every other task write (team stats invalidation).
+        await task_stats.apply_task_deltas(self.session, [
+            (task_stats.TaskCounterKey(*row), task_stats.TaskCounterKey(*row)) for row in rows
+        ])
         await self.session.commit()
 
-    async def bulk_stamp_phase(
-        self, task_ids: List[int], new_phase_id
-    ) -> None:
-        """Bulk-update phase_id for a list of task IDs without committing.
-        Uses a single UPDATE statement for efficiency.
-        """
-        if not task_ids:
-            return
+    @staticmethod
+    def _task_done_clause(project_id: int):
+        """The task sits in one of the project's terminal columns (never NULL)."""
+        done_columns = select(BoardColumnModel.id).where(
+            BoardColumnModel.project_id == project_id, terminal_column_clause()
+        )
+        return and_(TaskModel.column_id.is_not(None), TaskModel.column_id.in_(done_columns))
+
+    async def phase_task_counts(
+        self, project_id: int, phase_id: str, include_unphased: bool = False
+    ) -> Dict[str, int]:
+        done = self._task_done_clause(project_id)
+        # Dependency rows read "task_id blocks depends_on_id" (see
+        # task_dependency_repo.list_for_task).
+        blocker = aliased(TaskModel)
+        has_open_blocker = (
+            select(TaskDependencyModel.id)
+            .join(blocker, blocker.id == TaskDependencyModel.task_id)
+            .where(
+                TaskDependencyModel.depends_on_id == TaskModel.id,
+                TaskDependencyModel.dependency_type == "blocks",
+                blocker.is_deleted == False,  # noqa: E712
+                ~exists().where(BoardColumnModel.id == blocker.column_id, terminal_column_clause()),
+            )
+            .exists()
+        )
+        in_phase = TaskModel.phase_id == phase_id
+        if include_unphased:
+            in_phase = or_(in_phase, TaskModel.phase_id.is_(None))
+        stmt = select(
+            func.count().label("total"),
+            func.count().filter(done).label("done"),
+            func.count().filter(
+                and_(TaskModel.priority == TaskPriority.CRITICAL, ~done)
+            ).label("critical_open"),
+            func.count().filter(and_(~done, has_open_blocker)).label("blocked"),
+        ).where(
+            TaskModel.project_id == project_id,
+            TaskModel.is_deleted == False,  # noqa: E712
+            in_phase,
+        )
+        row = (await self.session.execute(stmt)).one()
+        return {key: int(value or 0) for key, value in row._mapping.items()}
+
+    async def apply_phase_transition_moves(
+        self,
+        project_id: int,
+        source_phase_id: str,
+        target_phase_id: str,
+        action: str,
+        exceptions: Dict[int, str],
+    ) -> int:
+        def takes(act: str):
+            # SQL predicate: the task's effective action (exception or default) is ``act``.
+            named = [tid for tid, a in exceptions.items() if a == act]
+            others = [tid for tid, a in exceptions.items() if a != act]
+            if act == action:
+                return TaskModel.id.not_in(others) if others else true()
+            return TaskModel.id.in_(named) if named else false()
+
+        in_source = TaskModel.phase_id == source_phase_id
+        new_phase = case(
+            (and_(in_source, takes("move_to_next")), target_phase_id),
+            (and_(in_source, takes("move_to_backlog")), null()),
+            (in_source, TaskModel.phase_id),
+            # Backlog (NULL phase) rows from here on.
+            (self._task_done_clause(project_id), source_phase_id),
+            (takes("move_to_next"), target_phase_id),
+            (takes("keep_in_source"), source_phase_id),
+            else_=null(),
+        )
+        # The pre-update phase rides along through the FROM subquery so the
+        # counter deltas are computed from RETURNING rows, not a project rescan.
+        before = (
+            select(TaskModel.id, TaskModel.phase_id.label("old_phase_id"))
+            .where(
+                TaskModel.project_id == project_id,
+                TaskModel.is_deleted == False,  # noqa: E712
+                or_(in_source, TaskModel.phase_id.is_(None)),
+            )
+            .subquery()
+        )
         stmt = (
             update(TaskModel)
+            .where(TaskModel.id == before.c.id, new_phase.is_distinct_from(TaskModel.phase_id))
+            .values(phase_id=new_phase)
+            .returning(
+                TaskModel.id, before.c.old_phase_id, TaskModel.phase_id,
+                TaskModel.column_id, TaskModel.points,
+            )
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            return 0
+        # projects row before the counter lock (task_stats "Lock order").
+        await change_version.bump(self.session, [project_id])
+        await task_stats.apply_task_deltas(self.session, [
+            (
+                task_stats.TaskCounterKey(project_id, row.old_phase_id, row.column_id, row.points),
+                task_stats.TaskCounterKey(project_id, row.phase_id, row.column_id, row.points),
+            )
+            for row in rows
+        ])
+        return len(rows)
+
+    @staticmethod
+    def _subtree_cte(seed, max_depth: int):
+        """Recursive CTE walking ``parent_task_id`` down from ``seed``.
+
+        ``seed`` selects the first level as (root_id, id, column_id, depth);
+        each recursion step adds the live children of the previous level
+        until ``depth`` reaches ``max_depth``. The depth bound also stops a
+        (corrupt) parent cycle from recursing forever.
+        """
+        tree = seed.cte("subtree", recursive=True)
+        child = aliased(TaskModel, name="child")
+        return tree.union_all(
+            select(tree.c.root_id, child.id, child.column_id, tree.c.depth + 1)
             .where(
-                TaskModel.id.in_(task_ids),
-                TaskModel.is_deleted == False,  # noqa: E712
+                child.parent_task_id == tree.c.id,
+                child.is_deleted == False,  # noqa: E712
+                tree.c.depth < max_depth,
             )
-            .values(phase_id=new_phase_id)
         )
-        await self.session.execute(stmt)
 
-    async def count_tasks_in_column(
-        self, column_id: int, exclude_task_id: Optional[int] = None
-    ) -> int:
-        """Phase 17 C8 — count non-deleted tasks in ``column_id``.
+    async def get_subtree(self, task_id: int, max_depth: int) -> Optional[Task]:
+        tree = self._subtree_cte(
+            select(
+                TaskModel.id.label("root_id"), TaskModel.id, TaskModel.column_id,
+                literal_column("0").label("depth"),
+            ).where(TaskModel.id == task_id, TaskModel.is_deleted == False),  # noqa: E712
+            max_depth,
+        )
+        # One statement for the whole hierarchy; project and columns are not
+        # joined per row but loaded once below and shared by every node.
+        stmt = (
+            select(TaskModel, tree.c.depth)
+            .join(tree, tree.c.id == TaskModel.id)
+            .options(joinedload(TaskModel.assignee).joinedload(UserModel.role))
+            .order_by(tree.c.depth, TaskModel.id)
+        )
+        rows = (await self.session.execute(stmt)).unique().all()
+        if not rows:
+            return None
 
-        Mirrors the soft-delete filter used by ``_get_base_query`` and
-        ``count_active_by_assignee`` so the count never includes archived rows.
-        ``exclude_task_id`` is applied at the SQL level (not in Python) so the
-        COUNT(*) executes on the database without materialising rows.
-        """
+        project_ids = {model.project_id for model, _ in rows}
+        project_models = (await self.session.execute(
+            select(ProjectModel)
+            .where(ProjectModel.id.in_(project_ids))
+            .options(selectinload(ProjectModel.columns))
+        )).scalars().all()
+        projects = {pm.id: Project.model_validate(pm) for pm in project_models}
+        columns = {c.id: c for p in projects.values() for c in p.columns}
+
+        nodes: Dict[int, Task] = {}
+        for model, depth in rows:
+            if model.id in nodes:  # parent cycle looping back into the tree
+                continue
+            node = Task(
+                **self._entity_fields(model),
+                assignee=model.assignee,
+                column=columns.get(model.column_id),
+                project=projects.get(model.project_id),
+            )
+            nodes[model.id] = node
+            # Rows come level by level, so the parent node already exists.
+            if depth > 0:
+                nodes[model.parent_task_id].subtasks.append(node)
+        return nodes[task_id]
+
+    async def subtask_summaries(
+        self, project_id: int, parent_ids: List[int], max_depth: int
+    ) -> Dict[int, Dict[str, int]]:
+        if not parent_ids:
+            return {}
+        parent = aliased(TaskModel, name="parent")
+        tree = self._subtree_cte(
+            select(
+                TaskModel.parent_task_id.label("root_id"), TaskModel.id, TaskModel.column_id,
+                literal_column("1").label("depth"),
+            )
+            .join(parent, parent.id == TaskModel.parent_task_id)
+            .where(
+                parent.id.in_(parent_ids),
+                parent.project_id == project_id,
+                parent.is_deleted == False,  # noqa: E712
+                TaskModel.is_deleted == False,  # noqa: E712
+            ),
+            max_depth,
+        )
         stmt = (
-            select(func.count(TaskModel.id))
-            .where(TaskModel.column_id == column_id)
-            .where(TaskModel.is_deleted == False)  # noqa: E712
+            select(
+                tree.c.root_id,
+                func.count().filter(tree.c.depth == 1).label("children"),
+                func.count().label("total"),
+                func.count().filter(terminal_column_clause()).label("done"),
+            )
+            .select_from(tree)
+            .outerjoin(BoardColumnModel, BoardColumnModel.id == tree.c.column_id)
+            .group_by(tree.c.root_id)
         )
-        if exclude_task_id is not None:
-            stmt = stmt.where(TaskModel.id != exclude_task_id)
-        result = await self.session.execute(stmt)
-        return int(result.scalar() or 0)
+        rows = (await self.session.execute(stmt)).all()
+        return {
+            row.root_id: {"children": row.children, "total": row.total, "done": row.done}
+            for row in rows
+        }
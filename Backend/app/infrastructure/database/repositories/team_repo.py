@@ -168,15 +168,68 @@ class SqlAlchemyTeamRepository(ITeamRepository):
 
     async def get_stats_for_user(self, user_id: int) -> dict:
         """Sayfa üstü stats strip için toplu sayım:
-        toplam takım, toplam üye, aktif görev, tamamlanma oranı."""
-        from app.infrastructure.database.models.team import TeamProjectModel
-        from app.infrastructure.database.models.task import TaskModel
-        from app.infrastructure.database.models.board_column import BoardColumnModel
-        from app.infrastructure.database.repositories.project_repo import DONE_COLUMN_NAMES
+        toplam takım, toplam üye, aktif görev, tamamlanma oranı.
+
+        Tek round trip: kullanıcının takımları (owner VEYA üye) CTE olarak
+        bir kez çözülür, üye/owner/proje sayıları scalar subquery, görev
+        toplamları ise materialized ``project_task_stats`` proje satırlarından
+        (O(proje), tasks taranmaz) okunur. "Done" kararı ``is_terminal`` /
+        ``category='done'`` bayraklarına dayanır (bkz. util/task_stats.py).
+        """
+        from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel
+        from app.infrastructure.database.util.task_stats import PROJECT_ROW
+        from sqlalchemy import distinct
+
+        member_team_ids = select(TeamMemberModel.team_id).where(
+            TeamMemberModel.user_id == user_id
+        )
+        user_teams = (
+            select(TeamModel.id, TeamModel.owner_id)
+            .where(
+                TeamModel.is_deleted == False,  # noqa: E712
+                or_(
+                    TeamModel.owner_id == user_id,
+                    TeamModel.id.in_(member_team_ids),
+                ),
+            )
+            .cte("user_teams")
+        )
+        team_project_ids = (
+            select(TeamProjectModel.project_id)
+            .where(TeamProjectModel.team_id.in_(select(user_teams.c.id)))
+            .distinct()
+            .cte("user_team_projects")
+        )
+        task_totals = (
+            select(
+                func.coalesce(func.sum(ProjectTaskStatsModel.total), 0).label("total"),
+                func.coalesce(func.sum(ProjectTaskStatsModel.done), 0).label("done"),
+            )
+            .where(
+                ProjectTaskStatsModel.project_id.in_(select(team_project_ids.c.project_id)),
+                ProjectTaskStatsModel.phase_id == PROJECT_ROW,
+            )
+            .cte("user_task_totals")
+        )
 
-        teams = await self.list_by_user(user_id)
-        team_ids = [t.id for t in teams]
-        if not team_ids:
+        stmt = select(
+            select(func.count()).select_from(user_teams)
+            .scalar_subquery().label("total_teams"),
+            # Toplam üye (DISTINCT user_id) + owner sayısı
+            select(func.count(distinct(TeamMemberModel.user_id)))
+            .where(TeamMemberModel.team_id.in_(select(user_teams.c.id)))
+            .scalar_subquery().label("member_count"),
+            select(func.count(distinct(user_teams.c.owner_id)))
+            .scalar_subquery().label("owner_count"),
+            select(func.count()).select_from(team_project_ids)
+            .scalar_subquery().label("project_count"),
+            task_totals.c.total,
+            task_totals.c.done,
+        ).select_from(task_totals)
+        row = (await self.session.execute(stmt)).one()
+
+        total_teams = int(row.total_teams or 0)
+        if total_teams == 0:
             return {
                 "total_teams": 0,
                 "total_members": 0,
@@ -184,86 +237,62 @@ class SqlAlchemyTeamRepository(ITeamRepository):
                 "completion_rate": 0.0,
             }
 
-        # Toplam üye (DISTINCT user_id) + owner sayısı
-        member_stmt = select(func.count(func.distinct(TeamMemberModel.user_id))).where(
-            TeamMemberModel.team_id.in_(team_ids)
-        )
-        member_count = (await self.session.execute(member_stmt)).scalar() or 0
-        owner_count = len({t.owner_id for t in teams})
-        total_members = member_count + owner_count
-
-        # Bu takımlara atanmış proje id'leri
-        proj_stmt = select(TeamProjectModel.project_id).where(
-            TeamProjectModel.team_id.in_(team_ids)
-        )
-        project_ids = list({
-            pid for pid in (await self.session.execute(proj_stmt)).scalars().all()
-        })
-
-        active_tasks = 0
-        completion_rate = 0.0
-        if project_ids:
-            # "Aktif" = column adı DONE_COLUMN_NAMES içinde olmayan görevler
-            done_stmt = (
-                select(func.count(TaskModel.id))
-                .join(BoardColumnModel, TaskModel.column_id == BoardColumnModel.id, isouter=True)
-                .where(
-                    TaskModel.project_id.in_(project_ids),
-                    func.lower(BoardColumnModel.name).in_(DONE_COLUMN_NAMES),
-                )
-            )
-            total_stmt = select(func.count(TaskModel.id)).where(
-                TaskModel.project_id.in_(project_ids)
-            )
-            done_tasks = (await self.session.execute(done_stmt)).scalar() or 0
-            total_tasks = (await self.session.execute(total_stmt)).scalar() or 0
-            active_tasks = total_tasks - done_tasks
-            if total_tasks > 0:
-                completion_rate = done_tasks / total_tasks
-
+        total_tasks = int(row.total or 0)
+        done_tasks = int(row.done or 0)
+        completion_rate = (done_tasks / total_tasks) if total_tasks > 0 else 0.0
         return {
-            "total_teams": len(teams),
-            "total_members": total_members,
-            "active_projects": len(project_ids),
-            "active_tasks": active_tasks,
+            "total_teams": total_teams,
+            "total_members": int(row.member_count or 0) + int(row.owner_count or 0),
+            "active_projects": int(row.project_count or 0),
+            "active_tasks": total_tasks - done_tasks,
             "completion_rate": round(completion_rate, 4),
         }
 
     async def get_projects(self, team_id: int) -> list:
-        """Detay sayfası → Projeler sekmesi: takıma bağlı projeler ve ilerleme."""
-        from app.infrastructure.database.models.team import TeamProjectModel
+        """Detay sayfası → Projeler sekmesi: takıma bağlı projeler ve ilerleme.
+
+        Proje başına iki COUNT yerine tek sorgu: projects ⋈ team_projects
+        ⟕ project_task_stats (proje satırı). Görevi olmayan projeler 0/0 ile
+        gelir.
+        """
         from app.infrastructure.database.models.project import ProjectModel
-        from app.infrastructure.database.models.task import TaskModel
-        from app.infrastructure.database.models.board_column import BoardColumnModel
-        from sqlalchemy import case
-        from app.infrastructure.database.repositories.project_repo import DONE_COLUMN_NAMES
+        from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel
+        from app.infrastructure.database.util.task_stats import PROJECT_ROW
+        from sqlalchemy import and_
 
         stmt = (
-            select(ProjectModel)
+            select(
+                ProjectModel.id,
+                ProjectModel.name,
+                ProjectModel.description,
+                ProjectModel.status,
+                ProjectTaskStatsModel.total,
+                ProjectTaskStatsModel.done,
+            )
             .join(TeamProjectModel, TeamProjectModel.project_id == ProjectModel.id)
+            .join(
+                ProjectTaskStatsModel,
+                and_(
+                    ProjectTaskStatsModel.project_id == ProjectModel.id,
+                    ProjectTaskStatsModel.phase_id == PROJECT_ROW,
+                ),
+                isouter=True,
+            )
             .where(TeamProjectModel.team_id == team_id)
+            .order_by(ProjectModel.id)
         )
-        projects = (await self.session.execute(stmt)).scalars().all()
+        rows = (await self.session.execute(stmt)).all()
 
         out = []
-        for p in projects:
-            total_q = select(func.count(TaskModel.id)).where(TaskModel.project_id == p.id)
-            done_q = (
-                select(func.count(TaskModel.id))
-                .join(BoardColumnModel, TaskModel.column_id == BoardColumnModel.id, isouter=True)
-                .where(
-                    TaskModel.project_id == p.id,
-                    func.lower(BoardColumnModel.name).in_(DONE_COLUMN_NAMES),
-                )
-            )
-            total = (await self.session.execute(total_q)).scalar() or 0
-            done = (await self.session.execute(done_q)).scalar() or 0
+        for row in rows:
+            total = int(row.total or 0)
+            done = int(row.done or 0)
             progress = (done / total) if total > 0 else 0.0
             out.append({
-                "id": p.id,
-                "name": p.name,
-                "description": getattr(p, "description", None),
-                "status": getattr(p, "status", None),
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "status": row.status,
                 "progress": round(progress, 4),
                 "member_count": 0,
                 "task_count": total,
@@ -298,7 +327,7 @@ class SqlAlchemyTeamRepository(ITeamRepository):
         from app.infrastructure.database.models.task import TaskModel
         from app.infrastructure.database.models.board_column import BoardColumnModel
         from app.infrastructure.database.models.user import UserModel
-        from app.infrastructure.database.repositories.project_repo import DONE_COLUMN_NAMES
+        from app.infrastructure.database.util.done_columns import terminal_column_clause
 
         # 1. Bu takıma bağlı proje id'leri
         proj_stmt = select(TeamProjectModel.project_id).where(
@@ -340,7 +369,7 @@ class SqlAlchemyTeamRepository(ITeamRepository):
                 TaskModel.project_id.in_(proj_ids),
                 TaskModel.is_deleted == False,  # noqa: E712
                 TaskModel.assignee_id.in_(list(total_map.keys())),
-                func.lower(BoardColumnModel.name).in_(DONE_COLUMN_NAMES),
+                terminal_column_clause(),
             )
             .group_by(TaskModel.assignee_id)
         )
@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Set
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, update
+from sqlalchemy import select, or_, update, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 from fastapi import HTTPException
 
@@ -170,3 +171,57 @@ class SqlAlchemyUserRepository(IUserRepository):
             )
             await self.session.flush()
         return user_ids
+
+    async def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        if not user_ids:
+            return []
+        stmt = self._get_base_query().where(UserModel.id.in_(user_ids))
+        result = await self.session.execute(stmt)
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        if not emails:
+            return set()
+        # No is_deleted filter: the users.email UNIQUE constraint covers
+        # soft-deleted rows too, so they would still collide on INSERT.
+        result = await self.session.execute(
+            select(UserModel.email).where(UserModel.email.in_(emails))
+        )
+        return set(result.scalars().all())
+
+    async def create_many(self, users: List[User]) -> List[User]:
+        if not users:
+            return []
+        # Same column set as _to_model; version / is_deleted / is_active keep
+        # their Python-side defaults, which apply per row in a multi-VALUES insert.
+        values = [
+            u.model_dump(exclude={"id", "created_at", "updated_at", "role", "permissions"})
+            for u in users
+        ]
+        try:
+            result = await self.session.execute(
+                insert(UserModel).values(values).returning(UserModel.id, UserModel.email)
+            )
+        except IntegrityError:
+            # Leave the session usable for the caller's next chunk.
+            await self.session.rollback()
+            raise
+        ids = {email: uid for uid, email in result.all()}
+        await self.session.flush()
+        return [u.model_copy(update={"id": ids.get(u.email)}) for u in users]
+
+    async def set_active_many(self, user_ids: List[int], is_active: bool) -> None:
+        if not user_ids:
+            return
+        await self.session.execute(
+            update(UserModel).where(UserModel.id.in_(user_ids)).values(is_active=is_active)
+        )
+        await self.session.flush()
+
+    async def update_role_many(self, user_ids: List[int], role_id: int) -> None:
+        if not user_ids:
+            return
+        await self.session.execute(
+            update(UserModel).where(UserModel.id.in_(user_ids)).values(role_id=role_id)
+        )
+        await self.session.flush()
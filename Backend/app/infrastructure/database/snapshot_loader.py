@@ -33,6 +33,7 @@ from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.models.audit_log import AuditLogModel
+from app.infrastructure.database.util import audit_partitions, audit_scope, task_stats
 
 
 logger = logging.getLogger(__name__)
@@ -191,6 +192,13 @@ async def maybe_load_snapshot(session: AsyncSession) -> bool:
     # state from previous queries in this connection.
     await asyncpg_conn.execute("SET search_path = public, pg_catalog;")
     await asyncpg_conn.execute(sql)
+    # Snapshots dumped before alembic 020 carry no audit_log.project_id;
+    # ones dumped before 021 carry no board_columns.task_count.
+    await audit_scope.backfill(session)
+    # The snapshot's backdated history predates the partition window and
+    # landed in audit_log_default; give those months their partitions.
+    await audit_partitions.rehome_default(session)
+    await task_stats.recompute(session)
     await session.commit()
 
     count = await session.scalar(select(func.count()).select_from(AuditLogModel))
@@ -0,0 +1,299 @@
+"""Boot-time seeding and runtime backfills, fingerprinted in ``system_config``.
+
+Every worker used to run ``seed_data`` (snapshot restore or the legacy
+seeders) and the migration_007 / migration_008 backfills inline on every
+boot, so a rolling restart of N workers repeated that work N times before
+any of them served a request.
+
+Each boot step now carries a fingerprint: a hash of the source of the
+modules that define what it writes, the alembic head and (for the seed)
+the snapshot fixture. After a step succeeds its fingerprint is stored
+under ``startup.<step>`` in ``system_config``. On the next boot ONE query
+reads every stored fingerprint, and steps whose fingerprint still matches
+are skipped. Editing a seeder or adding a migration changes the
+fingerprint, so late-added entities still land on the next boot.
+
+- Blocking steps (the seed) run before the app accepts traffic; a failure
+  aborts startup as before.
+- Deferred steps (the backfills) run in a background task once the app is
+  serving. A failure is logged, and because its fingerprint is not
+  recorded the step is retried on the next boot. Deferred steps must be
+  idempotent, because two workers booting together may both run them.
+
+``STARTUP_MODE=full`` ignores stored fingerprints and runs every step
+inline (the previous behaviour). :data:`progress` feeds GET /health/ready.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+STARTUP_KEY_PREFIX = "startup."
+
+
+@dataclass
+class StartupStep:
+    name: str
+    run: Callable[[], Awaitable[None]]
+    # Modules whose source defines what the step writes (hashed).
+    sources: Sequence[str] = ()
+    # Extra fingerprint inputs (alembic head, fixture stat, ...).
+    extra: Sequence[str] = ()
+    deferred: bool = False
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        for module in self.sources:
+            spec = importlib.util.find_spec(module)
+            origin = spec.origin if spec is not None else None
+            digest.update(module.encode())
+            digest.update(Path(origin).read_bytes() if origin else b"<missing>")
+        for value in self.extra:
+            digest.update(b"\0" + value.encode())
+        return digest.hexdigest()[:32]
+
+
+@dataclass
+class StartupProgress:
+    """Per-worker view of the boot steps for the readiness endpoint."""
+
+    started_at: float = field(default_factory=time.monotonic)
+    ready_at: Optional[float] = None
+    steps: Dict[str, Dict[str, object]] = field(default_factory=dict)
+
+    def mark(self, name: str, state: str, **info: object) -> None:
+        self.steps[name] = {"state": state, **info}
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_at is not None
+
+    @property
+    def backfills_pending(self) -> bool:
+        return any(s["state"] in ("pending", "running") for s in self.steps.values())
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "ready": self.ready,
+            "startup_ms": (
+                round((self.ready_at - self.started_at) * 1000, 1) if self.ready else None
+            ),
+            "backfills_pending": self.backfills_pending,
+            "steps": {name: dict(info) for name, info in self.steps.items()},
+        }
+
+
+progress = StartupProgress()
+
+
+def reset_for_tests() -> None:
+    progress.__init__()
+
+
+async def read_fingerprints(engine: AsyncEngine) -> Dict[str, str]:
+    """Stored step fingerprints in one round trip.
+
+    Returns ``{}`` when system_config is missing or the users table is empty.
+    An empty users table means the data was wiped while system_config
+    survived, so every step must run again.
+    """
+    try:
+        async with engine.connect() as conn:
+            rows = (await conn.execute(
+                text(
+                    "SELECT key, value, EXISTS (SELECT 1 FROM users) AS seeded "
+                    "FROM system_config WHERE key LIKE :prefix"
+                ),
+                {"prefix": f"{STARTUP_KEY_PREFIX}%"},
+            )).all()
+    except DBAPIError as exc:
+        logger.info(f"STARTUP: fingerprints unavailable ({exc.__class__.__name__}) — running all steps")
+        return {}
+    if not rows or not rows[0].seeded:
+        return {}
+    return {row.key[len(STARTUP_KEY_PREFIX):]: row.value for row in rows}
+
+
+async def record_fingerprint(engine: AsyncEngine, name: str, value: str) -> None:
+    """Best effort — a missing row only means the step runs again next boot."""
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO system_config (key, value) VALUES (:key, :value) "
+                    "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = now()"
+                ),
+                {"key": f"{STARTUP_KEY_PREFIX}{name}", "value": value},
+            )
+    except DBAPIError as exc:
+        logger.warning(f"STARTUP: could not record {name} fingerprint ({exc.__class__.__name__})")
+
+
+async def _run_step(engine: AsyncEngine, step: StartupStep, fingerprint: str) -> None:
+    progress.mark(step.name, "running")
+    t0 = time.perf_counter()
+    try:
+        await step.run()
+    except Exception:
+        # The message can carry DSNs / hosts / SQL: it goes to the log only,
+        # never into ``progress`` (served unauthenticated by /health/ready).
+        logger.exception(f"STARTUP: {step.name} failed")
+        progress.mark(step.name, "failed")
+        raise
+    await record_fingerprint(engine, step.name, fingerprint)
+    duration_ms = round((time.perf_counter() - t0) * 1000, 1)
+    progress.mark(step.name, "done", duration_ms=duration_ms)
+    logger.info(f"STARTUP: {step.name} done in {duration_ms} ms")
+
+
+async def _run_deferred(engine: AsyncEngine, pending: List[Tuple[StartupStep, str]]) -> None:
+    for step, fingerprint in pending:
+        try:
+            await _run_step(engine, step, fingerprint)
+        except Exception:
+            logger.warning(f"STARTUP: deferred step {step.name} failed — retried next boot")
+
+
+async def run_startup(
+    engine: AsyncEngine,
+    steps: Sequence[StartupStep],
+    *,
+    mode: str = "fast",
+) -> Optional[asyncio.Task]:
+    """Run blocking steps now; return the background task for deferred ones.
+
+    The caller owns the returned task (await or cancel it on shutdown).
+    """
+    full = mode == "full"
+    stored = {} if full else await read_fingerprints(engine)
+    pending: List[Tuple[StartupStep, str]] = []
+    for step in steps:
+        fingerprint = step.fingerprint()
+        if stored.get(step.name) == fingerprint:
+            progress.mark(step.name, "skipped")
+            continue
+        if step.deferred and not full:
+            progress.mark(step.name, "pending")
+            pending.append((step, fingerprint))
+            continue
+        await _run_step(engine, step, fingerprint)
+    progress.ready_at = time.monotonic()
+    logger.info(f"STARTUP: ready — {progress.snapshot()}")
+    if not pending:
+        return None
+    return asyncio.create_task(_run_deferred(engine, pending), name="startup-backfills")
+
+
+def default_steps(engine: AsyncEngine) -> List[StartupStep]:
+    """Seed (blocking) + migration_007 / migration_008 / process_config
+    schema backfills (deferred)."""
+    from app.infrastructure.database._alembic_check import _expected_head_revision
+    from app.infrastructure.database.database import AsyncSessionLocal
+    from app.infrastructure.database.snapshot_loader import _SNAPSHOT_PATH
+
+    head = _expected_head_revision() or ""
+    snapshot = (
+        f"{_SNAPSHOT_PATH.stat().st_size}:{_SNAPSHOT_PATH.stat().st_mtime_ns}"
+        if _SNAPSHOT_PATH.exists() else "no-snapshot"
+    )
+
+    async def seed() -> None:
+        from app.infrastructure.database.seeder import seed_data
+        from app.infrastructure.database.util import task_stats
+
+        async with AsyncSessionLocal() as session:
+            await seed_data(session)
+            # Seeded tasks bypass the repository deltas (same as the snapshot
+            # loader): derive the counters now, not at the next reconcile.
+            await task_stats.recompute(session)
+            await session.commit()
+
+    async def backfill_007() -> None:
+        from app.infrastructure.database.migrations.migration_007 import upgrade
+
+        await upgrade(engine)
+
+    async def backfill_008() -> None:
+        from app.infrastructure.database.migrations.migration_008 import upgrade
+        from app.infrastructure.database.util import task_stats
+
+        changed = await upgrade(engine)
+        if changed:
+            # The done / in-progress / todo buckets follow the rewritten
+            # column flags; the app is already serving, so refresh them now.
+            async with AsyncSessionLocal() as session:
+                await task_stats.recompute(session, changed)
+                await session.commit()
+            logger.info(f"STARTUP: migration_008 changed {len(changed)} project(s) — task stats recomputed")
+
+    async def process_config_schema() -> None:
+        from app.application.services.process_config_normalizer import (
+            migrate_all_projects_to_current_schema,
+        )
+        from app.infrastructure.database.repositories.project_repo import (
+            SqlAlchemyProjectRepository,
+        )
+
+        async with AsyncSessionLocal() as session:
+            count = await migrate_all_projects_to_current_schema(
+                SqlAlchemyProjectRepository(session)
+            )
+        logger.info(f"STARTUP: process_config_schema rewrote {count} project config(s)")
+
+    return [
+        StartupStep(
+            "seed",
+            seed,
+            sources=(
+                "app.infrastructure.database.seeder",
+                "app.infrastructure.database.seeder_extended",
+                "app.infrastructure.database._seed_rbac",
+                "app.infrastructure.database._seed_system",
+                "app.infrastructure.database._template_workflows",
+                "app.infrastructure.database._default_columns",
+                "app.infrastructure.database.snapshot_loader",
+            ),
+            extra=(head, snapshot),
+        ),
+        StartupStep(
+            "migration_007",
+            backfill_007,
+            sources=("app.infrastructure.database.migrations.migration_007",),
+            extra=(head,),
+            deferred=True,
+        ),
+        StartupStep(
+            "migration_008",
+            backfill_008,
+            sources=(
+                "app.infrastructure.database.migrations.migration_008",
+                "app.infrastructure.database._default_columns",
+            ),
+            extra=(head,),
+            deferred=True,
+        ),
+        StartupStep(
+            "process_config_schema",
+            process_config_schema,
+            # The migration chain lives in the entity module, so any schema
+            # bump (or migration fix) re-runs the write-back.
+            sources=(
+                "app.domain.entities.project",
+                "app.application.services.process_config_normalizer",
+            ),
+            extra=(head,),
+            deferred=True,
+        ),
+    ]
@@ -0,0 +1,180 @@
+"""Monthly ``audit_log`` partitions — create ahead, detach after retention.
+
+alembic 020 turns ``audit_log`` into ``PARTITION BY RANGE (timestamp)`` with
+``audit_log_pYYYYMM`` partitions and an ``audit_log_default`` catch-all.
+``audit_partition_maintenance_job`` calls :func:`maintain` daily:
+
+- :func:`ensure_partitions` keeps ``MONTHS_AHEAD`` future months created, so
+  new rows never land in the default partition (a month whose rows sit in the
+  default partition could not be attached later without moving them);
+- :func:`rehome_default` moves rows that did land in the default partition
+  (backdated history from older loads) into their monthly partitions, so
+  retention can see them.
+- :func:`detach_expired` DETACHes months older than
+  ``settings.AUDIT_LOG_RETENTION_MONTHS`` and renames them to
+  ``audit_log_archive_YYYYMM``. Detached tables are plain tables: activity
+  queries no longer see them, but they can still be dumped or queried
+  directly and dropped whenever the archive has been exported.
+
+Loaders that write backdated history call :func:`ensure_partitions_for_range`
+with the span of their rows first (simulator bulk COPY), or
+:func:`rehome_default` after a load whose span is not known up front
+(snapshot restore).
+
+No-op on databases where ``audit_log`` is not partitioned (schemas built with
+``Base.metadata.create_all`` in tests).
+
+DIP note: INFRASTRUCTURE only — called from the scheduler.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+MONTHS_AHEAD = 3
+_PARTITION_RE = re.compile(r"^audit_log_p(\d{4})(\d{2})$")
+_DEFAULT = "audit_log_default"
+_COLUMNS = (
+    "id, entity_type, entity_id, field_name, old_value, new_value, user_id, "
+    "action, timestamp, metadata, project_id"
+)
+
+
+def add_months(d: date, n: int) -> date:
+    y, m = divmod(d.month - 1 + n, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_log_p{month:%Y%m}"
+
+
+def expired_partitions(names: List[str], today: date, retention_months: int) -> List[str]:
+    """Partitions whose whole month ends on or before the retention cutoff."""
+    cutoff = add_months(today.replace(day=1), -retention_months)
+    expired = []
+    for name in names:
+        m = _PARTITION_RE.match(name)
+        if m and add_months(date(int(m.group(1)), int(m.group(2)), 1), 1) <= cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+async def is_partitioned(session: AsyncSession) -> bool:
+    row = await session.execute(text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'audit_log'"
+    ))
+    return row.scalar() is not None
+
+
+async def attached_partitions(session: AsyncSession) -> List[str]:
+    rows = await session.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'audit_log'"
+    ))
+    return [r[0] for r in rows.all()]
+
+
+def _month_range(start: date) -> str:
+    return f"timestamp >= '{start.isoformat()}' AND timestamp < '{add_months(start, 1).isoformat()}'"
+
+
+async def ensure_partitions_for_range(session: AsyncSession, first: date, last: date) -> List[str]:
+    """Create the monthly partitions covering ``first`` .. ``last`` (inclusive months).
+
+    Rows of those months already sitting in the default partition are moved
+    into the new partitions: Postgres refuses ``PARTITION OF`` for a range
+    the default still holds rows of, so the default is detached for the move
+    and attached again. Returns the created names. Does NOT commit.
+    """
+    existing = set(await attached_partitions(session))
+    months = []
+    month = first.replace(day=1)
+    while month <= last:
+        if partition_name(month) not in existing:
+            months.append(month)
+        month = add_months(month, 1)
+    if not months:
+        return []
+
+    stranded: List[date] = []
+    if _DEFAULT in existing:
+        rows = await session.execute(text(
+            f"SELECT DISTINCT date_trunc('month', timestamp)::date FROM {_DEFAULT} "
+            f"WHERE timestamp >= '{months[0].isoformat()}' "
+            f"AND timestamp < '{add_months(months[-1], 1).isoformat()}'"
+        ))
+        stranded = sorted(set(r[0] for r in rows.all()) & set(months))
+    if stranded:
+        await session.execute(text(f"ALTER TABLE audit_log DETACH PARTITION {_DEFAULT}"))
+    for start in months:
+        await session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(start)} PARTITION OF audit_log "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{add_months(start, 1).isoformat()}')"
+        ))
+    if stranded:
+        for start in stranded:
+            await session.execute(text(
+                f"WITH moved AS (DELETE FROM {_DEFAULT} WHERE {_month_range(start)} RETURNING {_COLUMNS}) "
+                f"INSERT INTO audit_log ({_COLUMNS}) SELECT {_COLUMNS} FROM moved"
+            ))
+        await session.execute(text(f"ALTER TABLE audit_log ATTACH PARTITION {_DEFAULT} DEFAULT"))
+        logger.info(
+            "audit_log rows moved out of the default partition for: %s",
+            ", ".join(partition_name(m) for m in stranded),
+        )
+    return [partition_name(m) for m in months]
+
+
+async def ensure_partitions(session: AsyncSession, today: Optional[date] = None) -> List[str]:
+    """Create the current month and MONTHS_AHEAD next ones if missing. Does NOT commit."""
+    month = (today or date.today()).replace(day=1)
+    return await ensure_partitions_for_range(session, month, add_months(month, MONTHS_AHEAD))
+
+
+async def rehome_default(session: AsyncSession) -> List[str]:
+    """Give every month with rows in the default partition its own partition. Does NOT commit."""
+    if not await is_partitioned(session):
+        return []
+    oldest, newest = (await session.execute(text(
+        f"SELECT min(timestamp)::date, max(timestamp)::date FROM {_DEFAULT}"
+    ))).one()
+    if oldest is None:
+        return []
+    return await ensure_partitions_for_range(session, oldest, newest)
+
+
+async def detach_expired(
+    session: AsyncSession, retention_months: int, today: Optional[date] = None
+) -> List[str]:
+    """Detach + rename months past retention; ``retention_months <= 0`` disables. Does NOT commit."""
+    if retention_months <= 0:
+        return []
+    names = expired_partitions(await attached_partitions(session), today or date.today(), retention_months)
+    for name in names:
+        await session.execute(text(f"ALTER TABLE audit_log DETACH PARTITION {name}"))
+        await session.execute(text(f"ALTER TABLE {name} RENAME TO {name.replace('audit_log_p', 'audit_log_archive_')}"))
+    return names
+
+
+async def maintain(session: AsyncSession, retention_months: int) -> dict:
+    if not await is_partitioned(session):
+        return {"created": [], "detached": []}
+    created = await ensure_partitions(session)
+    created += await rehome_default(session)
+    detached = await detach_expired(session, retention_months)
+    if created:
+        logger.info("audit_log partitions created: %s", ", ".join(created))
+    if detached:
+        logger.warning("audit_log partitions detached past retention: %s", ", ".join(detached))
+    return {"created": created, "detached": detached}
@@ -0,0 +1,106 @@
+"""Denormalized ``audit_log.project_id`` — write-time fill + backfill.
+
+Activity feeds scope by ``audit_log.project_id`` (index
+``(project_id, timestamp DESC)``) instead of ``entity_id IN (SELECT id FROM
+tasks WHERE project_id = …)``. The column is filled at write time:
+
+- ORM inserts (``session.add(AuditLogModel(...))`` — repositories, seeders,
+  simulator) go through the ``before_insert`` hook registered in
+  models/audit_log.py, which calls :func:`project_id_clause`. Lookups become a
+  scalar subquery embedded in the INSERT, so no extra round trip.
+- Rows written through the audit sink (util/audit_sink.py) are multi-row
+  VALUES inserts, which embed the same :func:`project_id_clause` per row.
+
+:func:`backfill` re-derives the column for rows that were written without it
+(alembic 020 for history, the snapshot loader after a restore).
+
+DIP note: INFRASTRUCTURE only.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# entity_type → table carrying a project_id column for that entity.
+PROJECT_SCOPED_TABLES = {
+    "task": "tasks",
+    "milestone": "milestones",
+    "artifact": "artifacts",
+    "phase_report": "phase_reports",
+    "sprint": "sprints",
+    "project_join_request": "project_join_requests",
+}
+
+
+def resolve_project_id(entity_type: str, entity_id: Optional[int], metadata: Optional[dict]) -> Optional[int]:
+    """Project id derivable without a query (project rows, enriched metadata)."""
+    if entity_type == "project" and entity_id:
+        return entity_id
+    if isinstance(metadata, dict):
+        value = metadata.get("project_id")
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+    return None
+
+
+def project_id_clause(entity_type: str, entity_id: Optional[int], metadata: Optional[dict]) -> Any:
+    """``project_id`` value for an ORM insert: an int, a scalar subquery or None."""
+    resolved = resolve_project_id(entity_type, entity_id, metadata)
+    if resolved is not None or not entity_id:
+        return resolved
+    from app.infrastructure.database.models.artifact import ArtifactModel
+    from app.infrastructure.database.models.comment import CommentModel
+    from app.infrastructure.database.models.milestone import MilestoneModel
+    from app.infrastructure.database.models.phase_report import PhaseReportModel
+    from app.infrastructure.database.models.project_join_request import ProjectJoinRequestModel
+    from app.infrastructure.database.models.sprint import SprintModel
+    from app.infrastructure.database.models.task import TaskModel
+
+    if entity_type == "comment":
+        return (
+            select(TaskModel.project_id)
+            .join(CommentModel, CommentModel.task_id == TaskModel.id)
+            .where(CommentModel.id == entity_id)
+            .scalar_subquery()
+        )
+    model = {
+        "task": TaskModel,
+        "milestone": MilestoneModel,
+        "artifact": ArtifactModel,
+        "phase_report": PhaseReportModel,
+        "sprint": SprintModel,
+        "project_join_request": ProjectJoinRequestModel,
+    }.get(entity_type)
+    if model is None:
+        return None
+    return select(model.project_id).where(model.id == entity_id).scalar_subquery()
+
+
+# Kept in sync with alembic 020 (which inlines the same statements).
+BACKFILL_SQL = (
+    "UPDATE audit_log SET project_id = entity_id "
+    "WHERE project_id IS NULL AND entity_type = 'project'",
+    *(
+        f"UPDATE audit_log a SET project_id = s.project_id FROM {table} s "
+        f"WHERE a.project_id IS NULL AND a.entity_type = '{entity_type}' AND s.id = a.entity_id"
+        for entity_type, table in PROJECT_SCOPED_TABLES.items()
+    ),
+    "UPDATE audit_log a SET project_id = t.project_id FROM comments c JOIN tasks t ON t.id = c.task_id "
+    "WHERE a.project_id IS NULL AND a.entity_type = 'comment' AND c.id = a.entity_id",
+    "UPDATE audit_log SET project_id = CAST(metadata->>'project_id' AS INTEGER) "
+    "WHERE project_id IS NULL AND metadata->>'project_id' ~ '^[0-9]+$'",
+)
+
+
+async def backfill(session: AsyncSession) -> int:
+    """Fill ``project_id`` where it is still NULL. Does NOT commit."""
+    updated = 0
+    for statement in BACKFILL_SQL:
+        result = await session.execute(text(statement))
+        updated += result.rowcount or 0
+    return updated
@@ -0,0 +1,230 @@
+"""Audit sink — where audit_log rows go once a writer has built them.
+
+Writers (task / audit repositories) build plain row dicts with the
+``AuditLogModel`` attribute names (``extra_metadata`` or its wire alias
+``metadata``). They hand the rows to the process-wide sink from
+:func:`get_audit_sink`, which is chosen by ``AUDIT_SINK_MODE``:
+
+- ``transaction`` (default): one multi-row INSERT on the caller's session,
+  committed with the caller's write. These are the historical semantics:
+  the audit row exists if and only if the change does.
+- ``buffered``: rows are stamped with their event time and parked on the
+  writer's session; they join the in-memory queue only when that session
+  commits (``after_commit``) and are dropped if it rolls back, so the log
+  never records a change that did not happen. A background flush writes
+  the queue in multi-row INSERTs of at most
+  ``AUDIT_BUFFER_MAX_ROWS`` on its own session. The flush runs when the
+  queue reaches that size, or ``AUDIT_BUFFER_MAX_DELAY_S`` after the first
+  queued row. The write path loses its audit INSERT round trips. In
+  exchange, activity feeds and charts lag by up to the delay, and a crash
+  loses the unflushed rows. A failed flush requeues its rows, up to a cap.
+  The lifespan calls :func:`shutdown`, which flushes whatever is left.
+  Each flush bumps ``projects.change_version`` for the projects of its rows
+  in the same transaction, so the audit-derived chart ETags move with it.
+
+``project_id`` is filled the same way as the ORM ``before_insert`` hook
+(util/audit_scope.py): it is taken from the row if present, otherwise
+derived from the metadata, otherwise resolved by a scalar subquery
+embedded in the VALUES list.
+
+DIP note: INFRASTRUCTURE only.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set
+
+from sqlalchemy import event, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.infrastructure.config import settings
+from app.infrastructure.database.models.audit_log import AuditLogModel
+from app.infrastructure.database.util import change_version
+from app.infrastructure.database.util.audit_scope import project_id_clause
+
+logger = logging.getLogger(__name__)
+
+# Requeued rows beyond this many buffers' worth are dropped (logged) so a
+# database outage cannot grow the queue without bound.
+_REQUEUE_BUFFERS = 20
+
+# session.info key: [(sink, rows), ...] written in the open transaction.
+_PENDING = "audit_sink.pending"
+
+
+def audit_values(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Normalize a writer's row to the full AuditLogModel column set."""
+    metadata = row.get("extra_metadata", row.get("metadata"))
+    project_id = row.get("project_id")
+    if project_id is None:
+        project_id = project_id_clause(row["entity_type"], row["entity_id"], metadata)
+    return {
+        "entity_type": row["entity_type"],
+        "entity_id": row["entity_id"],
+        "field_name": row.get("field_name") or "transition",
+        "old_value": row.get("old_value"),
+        "new_value": row.get("new_value"),
+        "user_id": row.get("user_id"),
+        "action": row["action"],
+        "project_id": project_id,
+        "extra_metadata": metadata,
+        "timestamp": row.get("timestamp") or func.now(),
+    }
+
+
+def _insert(rows: Sequence[Mapping[str, Any]]):
+    return insert(AuditLogModel).values([audit_values(r) for r in rows])
+
+
+class AuditSink(ABC):
+    buffered = False
+
+    @abstractmethod
+    async def write(self, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Record ``rows`` for the change being written on ``session``."""
+        pass
+
+    async def close(self) -> None:
+        return None
+
+
+class InTransactionAuditSink(AuditSink):
+    """Rows join the caller's transaction; the caller commits."""
+
+    async def write(self, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+        if rows:
+            await session.execute(_insert(rows))
+
+
+class BufferedAuditSink(AuditSink):
+    """Rows are queued and flushed in batches on a dedicated session."""
+
+    buffered = True
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        max_rows: int = 500,
+        max_delay_s: float = 1.0,
+    ):
+        self.session_factory = session_factory
+        self.max_rows = max(1, max_rows)
+        self.max_delay_s = max_delay_s
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def write(self, session: Optional[AsyncSession], rows: Sequence[Mapping[str, Any]]) -> None:
+        """Queue ``rows`` once ``session`` commits (immediately when it is None)."""
+        if not rows:
+            return
+        now = datetime.now(timezone.utc)
+        stamped = [{**row, "timestamp": row.get("timestamp") or now} for row in rows]
+        if session is None:
+            self.enqueue(stamped)
+            return
+        session.info.setdefault(_PENDING, []).append((self, stamped))
+
+    def enqueue(self, rows: List[Dict[str, Any]]) -> None:
+        """Add committed rows to the queue and schedule their flush."""
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.max_rows:
+            task = asyncio.create_task(self.flush(), name="audit-sink-flush")
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later(), name="audit-sink-flush")
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay_s)
+        # Shielded: close() cancelling the timer must not abort a flush that
+        # already took the rows out of the buffer.
+        await asyncio.shield(self.flush())
+
+    async def flush(self) -> int:
+        """Write every queued row now; returns the number written."""
+        async with self._lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            written = 0
+            try:
+                async with self.session_factory() as session:
+                    project_ids = set()
+                    for start in range(0, len(rows), self.max_rows):
+                        stmt = _insert(rows[start:start + self.max_rows]).returning(
+                            AuditLogModel.project_id
+                        )
+                        project_ids.update((await session.execute(stmt)).scalars().all())
+                    await change_version.bump(session, project_ids)
+                    await session.commit()
+                written = len(rows)
+            except Exception:
+                logger.exception(f"AUDIT_SINK: flush of {len(rows)} rows failed — requeued")
+                queued, cap = rows + self._buffer, self.max_rows * _REQUEUE_BUFFERS
+                self._buffer = queued[:cap]
+                if len(queued) > cap:
+                    logger.error(f"AUDIT_SINK: queue full — dropped {len(queued) - cap} audit rows")
+            return written
+
+    async def close(self) -> None:
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        self._timer = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+
+
+def _release_pending(session: Session) -> None:
+    for sink, rows in session.info.pop(_PENDING, ()):
+        sink.enqueue(rows)
+
+
+def _drop_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING, ())
+    if pending:
+        logger.debug(f"AUDIT_SINK: dropped {sum(len(r) for _, r in pending)} rows of a rolled-back transaction")
+
+
+event.listen(Session, "after_commit", _release_pending)
+event.listen(Session, "after_rollback", _drop_pending)
+
+
+_sink: Optional[AuditSink] = None
+
+
+def get_audit_sink() -> AuditSink:
+    global _sink
+    if _sink is None:
+        if settings.AUDIT_SINK_MODE == "buffered":
+            from app.infrastructure.database.database import AsyncSessionLocal
+
+            _sink = BufferedAuditSink(
+                AsyncSessionLocal,
+                max_rows=settings.AUDIT_BUFFER_MAX_ROWS,
+                max_delay_s=settings.AUDIT_BUFFER_MAX_DELAY_S,
+            )
+        else:
+            _sink = InTransactionAuditSink()
+    return _sink
+
+
+async def shutdown() -> None:
+    """Flush the buffered sink (lifespan shutdown)."""
+    if _sink is not None:
+        await _sink.close()
+
+
+def reset_for_tests() -> None:
+    global _sink
+    _sink = None
@@ -0,0 +1,104 @@
+"""Per-project change version (``projects.change_version``) for conditional GETs.
+
+The board, project task lists and charts derive a weak ETag from this
+counter (app/api/deps/conditional.py). Any write that can change what those
+endpoints return bumps it IN the writing transaction, so a reader never sees
+new rows under an old version:
+
+- ORM writes are collected automatically: a ``before_flush`` hook on
+  ``Session`` records the project of every new / modified / deleted task,
+  board column, sprint and comment (comments via their task), plus modified
+  projects themselves; ``after_flush_postexec`` issues ONE
+  ``UPDATE projects SET change_version = change_version + 1`` for the flush.
+- Core ``update(TaskModel)`` statements bypass the ORM, so their callers
+  await :func:`bump` with the affected project ids (same pattern as
+  ``task_stats.recompute``).
+
+The version only has to change, not count writes: one bump per flush is
+enough. Like the ``project_task_stats`` upsert, the bump locks the project
+row until commit, so concurrent writers in one project serialize there.
+
+Not covered (accepted staleness, revalidated on the next project write):
+user renames / avatars and label renames shown inside task DTOs.
+
+DIP note: INFRASTRUCTURE only.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import event, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.models.comment import CommentModel
+from app.infrastructure.database.models.project import ProjectModel
+from app.infrastructure.database.models.sprint import SprintModel
+from app.infrastructure.database.models.task import TaskModel
+
+_PENDING_PROJECTS = "change_version.project_ids"
+_PENDING_TASKS = "change_version.task_ids"
+_PROJECT_SCOPED = (TaskModel, BoardColumnModel, SprintModel)
+
+
+def _bump_stmt(project_ids: Iterable[int], task_ids: Iterable[int] = ()):
+    pids = sorted(set(project_ids))
+    tids = sorted(set(task_ids))
+    criteria = []
+    if pids:
+        criteria.append(ProjectModel.id.in_(pids))
+    if tids:
+        criteria.append(
+            ProjectModel.id.in_(select(TaskModel.project_id).where(TaskModel.id.in_(tids)))
+        )
+    if not criteria:
+        return None
+    return (
+        update(ProjectModel.__table__)
+        .where(or_(*criteria))
+        .values(change_version=ProjectModel.__table__.c.change_version + 1)
+    )
+
+
+async def bump(
+    session: AsyncSession,
+    project_ids: Iterable[Optional[int]] = (),
+    task_ids: Iterable[int] = (),
+) -> None:
+    """Bump the given projects (and those owning ``task_ids``) now. Does NOT commit.
+
+    For core-statement writers the flush hooks cannot see.
+    """
+    stmt = _bump_stmt((pid for pid in project_ids if pid is not None), task_ids)
+    if stmt is not None:
+        await session.execute(stmt)
+
+
+def _collect(session: Session, flush_context, instances) -> None:
+    project_ids: Set[int] = session.info.setdefault(_PENDING_PROJECTS, set())
+    task_ids: Set[int] = session.info.setdefault(_PENDING_TASKS, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, _PROJECT_SCOPED):
+            if obj.project_id is not None:
+                project_ids.add(obj.project_id)
+        elif isinstance(obj, CommentModel):
+            if obj.task_id is not None:
+                task_ids.add(obj.task_id)
+        elif isinstance(obj, ProjectModel) and obj.id is not None:
+            project_ids.add(obj.id)
+
+
+def _apply(session: Session, flush_context) -> None:
+    project_ids = session.info.pop(_PENDING_PROJECTS, None) or set()
+    task_ids = session.info.pop(_PENDING_TASKS, None) or set()
+    stmt = _bump_stmt(project_ids, task_ids)
+    if stmt is not None:
+        # Connection-level: no autoflush, no re-entry into the flush hooks.
+        session.connection().execute(stmt)
+
+
+event.listen(Session, "before_flush", _collect)
+event.listen(Session, "after_flush_postexec", _apply)
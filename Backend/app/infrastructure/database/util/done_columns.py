@@ -23,7 +23,7 @@ from __future__ import annotations
 import logging
 from typing import List, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.models.board_column import BoardColumnModel
@@ -46,6 +46,24 @@ except Exception:  # pragma: no cover - prometheus is optional in tests
     DONE_COLUMN_FALLBACK_COUNTER = None
 
 
+def terminal_column_clause():
+    """SQL predicate: the joined ``board_columns`` row is a done/terminal column.
+
+    Set-based counterpart of :func:`resolve_done_column_ids` for GROUP BY
+    aggregates that count done tasks across many projects in one statement.
+    Keys on the Phase 17 workflow flags (``is_terminal`` OR ``category='done'``)
+    rather than the legacy ``DONE_COLUMN_NAMES`` name whitelist. Migration 013
+    backfilled ``is_terminal`` from ``max(order_index)``, so unmigrated column
+    names ("Bitti ✓", "Released", ...) are still counted.
+
+    Tasks with no column (outer-joined NULL row) evaluate to NULL → not done.
+    """
+    return or_(
+        BoardColumnModel.is_terminal.is_(True),
+        BoardColumnModel.category == "done",
+    )
+
+
 async def resolve_done_column_ids(
     session: AsyncSession,
     project_id: int,
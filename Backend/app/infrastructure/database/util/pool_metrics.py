@@ -0,0 +1,80 @@
+"""Connection pool usage per workload class (oltp / analytics / replica).
+
+``install_pool_listeners(name, engine)`` counts checkouts on the engine's
+pool and records the peak number of connections in use, plus how many
+checkouts took the pool's last slot (``saturated_checkouts``). Once the pool
+is saturated, the next request waits up to the pool timeout, so a rising
+count is the early warning. :func:`snapshot` adds the live
+``QueuePool`` gauges and is served under ``db_pools`` by GET /admin/metrics.
+
+Per worker and in memory, like request_metrics.
+
+DIP note: INFRASTRUCTURE only — installed once from app/api/main.py.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Mapping
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class PoolCounters:
+    checkouts: int = 0
+    peak_in_use: int = 0
+    saturated_checkouts: int = 0
+
+
+_counters: Dict[str, PoolCounters] = {}
+
+
+def _capacity(pool) -> int:
+    size = pool.size() if hasattr(pool, "size") else 0
+    return size + max(getattr(pool, "_max_overflow", 0), 0)
+
+
+def install_pool_listeners(name: str, engine: AsyncEngine) -> None:
+    """Idempotent per ``name``."""
+    if name in _counters:
+        return
+    counters = _counters[name] = PoolCounters()
+    pool = engine.sync_engine.pool
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        in_use = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        counters.checkouts += 1
+        counters.peak_in_use = max(counters.peak_in_use, in_use)
+        capacity = _capacity(pool)
+        if capacity and in_use >= capacity:
+            counters.saturated_checkouts += 1
+
+    event.listen(pool, "checkout", on_checkout)
+
+
+def snapshot(engines: Mapping[str, AsyncEngine]) -> Dict[str, dict]:
+    out: Dict[str, dict] = {}
+    for name, engine in engines.items():
+        pool = engine.sync_engine.pool
+        counters = _counters.get(name, PoolCounters())
+        in_use = pool.checkedout() if hasattr(pool, "checkedout") else None
+        capacity = _capacity(pool)
+        out[name] = {
+            "pool_size": pool.size() if hasattr(pool, "size") else None,
+            "capacity": capacity,
+            "in_use": in_use,
+            "idle": pool.checkedin() if hasattr(pool, "checkedin") else None,
+            "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+            "utilization": round(in_use / capacity, 3) if capacity and in_use is not None else None,
+            "checkouts": counters.checkouts,
+            "peak_in_use": counters.peak_in_use,
+            "saturated_checkouts": counters.saturated_checkouts,
+        }
+    return out
+
+
+def reset() -> None:
+    """Start a new window for the counters (gauges are always live)."""
+    for counters in _counters.values():
+        counters.__init__()
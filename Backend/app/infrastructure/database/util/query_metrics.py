@@ -0,0 +1,71 @@
+"""SQLAlchemy engine hooks feeding the per-request DB counters.
+
+``install_query_listeners(engine)`` registers ``before/after_cursor_execute``
+on the engine's sync core. Each statement's wall time and, for statements that
+return rows, the driver's row count are added to the current request
+(``request_metrics.record_query``); statements slower than
+``settings.SLOW_QUERY_MS`` are also logged as one JSON line.
+
+The async engine runs these hooks inside SQLAlchemy's greenlet, which inherits
+the caller's contextvars, so queries are attributed to the request that issued
+them. Queries from the scheduler or startup land in a process-wide counter.
+
+DIP note: INFRASTRUCTURE only — installed once from app/api/main.py.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.application.services import request_metrics
+from app.infrastructure.config import settings
+
+logger = logging.getLogger("spms.sql")
+
+_START_KEY = "spms_query_start"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    duration_ms = (time.perf_counter() - starts.pop()) * 1000
+    # Buffered result sets report their size (asyncpg: the "SELECT n" status);
+    # server-side cursors report -1 and are not counted.
+    rows = cursor.rowcount if cursor.description is not None and cursor.rowcount > 0 else 0
+    if request_metrics.record_query(statement, duration_ms, settings.SLOW_QUERY_MS, rows):
+        stats = request_metrics.current()
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(duration_ms, 2),
+            "route": stats.route_label() if stats is not None else None,
+            "statement": " ".join(statement.split())[:request_metrics.STATEMENT_MAX_CHARS],
+        }))
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # mark so the next statement on this connection is timed correctly.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_KEY):
+        conn.info[_START_KEY].pop()
+
+
+def install_query_listeners(engine: AsyncEngine) -> None:
+    """Idempotent — safe to call again (e.g. on test app re-imports)."""
+    sync_engine = engine.sync_engine
+    for name, fn in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ):
+        if not event.contains(sync_engine, name, fn):
+            event.listen(sync_engine, name, fn)
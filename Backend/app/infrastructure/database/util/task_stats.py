@@ -0,0 +1,378 @@
+"""Incremental maintenance + reconciliation of ``project_task_stats`` and
+``board_columns.task_count``.
+
+Task writes in SqlAlchemyTaskRepository call :func:`apply_task_delta` (or
+:func:`apply_task_deltas` for bulk updates) BEFORE their commit so the
+counters move in the same transaction as the task row. Everything that rewrites tasks in bulk (series updates, phase stamping,
+column category edits) calls :func:`recompute` for the affected projects
+instead of computing per-row deltas. The hourly ``reconcile_task_stats_job``
+runs :func:`recompute` over every project and logs any drift it repaired —
+rows written outside the repository (seeders, simulator, raw SQL) converge
+there.
+
+The per-column counter follows ``TaskCounterKey.column_id``: a task counts
+in its column while it is not deleted. It feeds the board column list and
+the WIP checks in UpdateTaskUseCase / BulkUpdateTasksUseCase.
+
+Locking: :func:`recompute` reads the true counts and then writes absolute
+values, so a delta committed between the two would be overwritten. Both
+sides therefore take transaction-scoped advisory locks: delta writers lock
+their projects (and the all-projects key) SHARED, so they never wait on each
+other; ``recompute`` locks its projects — or the all-projects key for a full
+reconcile — EXCLUSIVE, so it waits for in-flight deltas to commit, reads
+after them, and holds new ones off until its own commit.
+
+Lock order: a task write locks the ``projects`` row first (the change_version
+bump at flush), then the advisory lock, then the ``board_columns`` rows it
+re-counts. Column edits that recompute must follow the same order — bump,
+:func:`lock_for_recompute`, and only then flush the column — or a concurrent
+task move and column edit deadlock.
+
+Team stats: the Teams page stats strip (team_stats_cache) is read from the
+project rows, so every call here marks the session and the cache is cleared
+when that transaction commits — one hook for create / update / delete, bulk
+actions, unassignment and phase-transition moves. Clearing after the commit,
+not before, keeps a concurrent read from re-caching the old totals.
+
+Bucket semantics match ``terminal_column_clause``: a task is *done* when its
+column is terminal (``is_terminal`` OR ``category='done'``), *in_progress*
+when the column category is ``in_progress``, otherwise *todo* (including
+tasks with no column).
+
+DIP note: INFRASTRUCTURE only — called from repository / scheduler code.
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import String, and_, case, delete, event, func, literal, or_, select, tuple_, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.application.services import team_stats_cache
+from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel
+from app.infrastructure.database.models.task import TaskModel
+from app.infrastructure.database.util.done_columns import terminal_column_clause
+
+logger = logging.getLogger(__name__)
+
+# phase_id sentinel for the project-wide row.
+PROJECT_ROW = ""
+COUNTER_FIELDS = ("total", "todo", "in_progress", "done", "points")
+
+_Key = Tuple[int, str]
+
+# pg_advisory_xact_lock(classid, objid) namespace for the counters; objid is
+# the project id, 0 (never a project id) the all-projects key.
+_LOCK_CLASS = 0x7473
+_ALL_PROJECTS = 0
+
+# session.info key: the open transaction wrote tasks (team stats go stale).
+_TEAM_STATS_STALE = "task_stats.team_stats_stale"
+
+
+class TaskCounterKey(NamedTuple):
+    """The task fields that decide which counters a task contributes to."""
+    project_id: int
+    phase_id: Optional[str]
+    column_id: Optional[int]
+    points: Optional[int]
+
+
+def counter_key(model: TaskModel) -> TaskCounterKey:
+    return TaskCounterKey(model.project_id, model.phase_id, model.column_id, model.points)
+
+
+def bucket_clause():
+    """SQL CASE mapping the joined board column to its counter bucket."""
+    return case(
+        (terminal_column_clause(), "done"),
+        (BoardColumnModel.category == "in_progress", "in_progress"),
+        else_="todo",
+    )
+
+
+def _bucket_for(category: Optional[str], is_terminal: Optional[bool]) -> str:
+    if is_terminal or category == "done":
+        return "done"
+    if category == "in_progress":
+        return "in_progress"
+    return "todo"
+
+
+async def column_buckets(
+    session: AsyncSession, column_ids: Iterable[Optional[int]]
+) -> Dict[Optional[int], str]:
+    """Python twin of :func:`bucket_clause` — one IN query for many column ids.
+
+    ``None`` and unknown ids map to ``todo``.
+    """
+    ids = sorted({cid for cid in column_ids if cid is not None})
+    buckets: Dict[Optional[int], str] = {None: "todo"}
+    if ids:
+        stmt = select(
+            BoardColumnModel.id, BoardColumnModel.category, BoardColumnModel.is_terminal
+        ).where(BoardColumnModel.id.in_(ids))
+        for row in (await session.execute(stmt)).all():
+            buckets[row.id] = _bucket_for(row.category, row.is_terminal)
+    for cid in ids:
+        buckets.setdefault(cid, "todo")
+    return buckets
+
+
+def _add_contribution(
+    deltas: Dict[_Key, Dict[str, int]],
+    key: TaskCounterKey,
+    bucket: str,
+    sign: int,
+) -> None:
+    targets = [(key.project_id, PROJECT_ROW)]
+    if key.phase_id:
+        targets.append((key.project_id, key.phase_id))
+    for target in targets:
+        row = deltas.setdefault(target, dict.fromkeys(COUNTER_FIELDS, 0))
+        row["total"] += sign
+        row[bucket] += sign
+        row["points"] += sign * int(key.points or 0)
+
+
+def column_deltas(
+    changes: Sequence[Tuple[Optional[TaskCounterKey], Optional[TaskCounterKey]]],
+) -> Dict[int, int]:
+    """Net ``task_count`` change per column id (zero deltas dropped)."""
+    deltas: Counter = Counter()
+    for old, new in changes:
+        if old is not None and old.column_id is not None:
+            deltas[old.column_id] -= 1
+        if new is not None and new.column_id is not None:
+            deltas[new.column_id] += 1
+    return {cid: d for cid, d in deltas.items() if d}
+
+
+async def _lock(session: AsyncSession, project_ids: Iterable[int], shared: bool) -> None:
+    """Take the counter advisory locks (held until commit), in sorted order."""
+    fn = func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+    keys = sorted(set(project_ids))
+    if keys:
+        await session.execute(select(*(fn(_LOCK_CLASS, key) for key in keys)))
+
+
+async def lock_for_recompute(session: AsyncSession, project_ids: Iterable[int]) -> None:
+    """Take :func:`recompute`'s exclusive locks now, before writing rows the
+    task path locks after them (see "Lock order"). Re-entrant; held until
+    commit."""
+    await _lock(session, project_ids, shared=False)
+
+
+async def _apply_column_deltas(session: AsyncSession, deltas: Dict[int, int]) -> None:
+    if not deltas:
+        return
+    # One UPDATE for every touched column; ids sorted so concurrent writers
+    # take the row locks in the same order.
+    ids = sorted(deltas)
+    await session.execute(
+        update(BoardColumnModel)
+        .where(BoardColumnModel.id.in_(ids))
+        .values(
+            task_count=BoardColumnModel.task_count
+            + case({cid: deltas[cid] for cid in ids}, value=BoardColumnModel.id, else_=0)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def apply_task_deltas(
+    session: AsyncSession,
+    changes: Sequence[Tuple[Optional[TaskCounterKey], Optional[TaskCounterKey]]],
+) -> None:
+    """Move many tasks' contributions, each ``(old, new)`` (either may be None).
+
+    create → ``(None, key)``, soft-delete → ``(key, None)``, update →
+    ``(before, after)``. Column buckets are resolved in one query, every
+    stats delta lands in one multi-row upsert and every column counter in one
+    UPDATE; no-op when nothing changes.
+    Does NOT commit — the caller's commit makes it atomic with the task writes.
+    Any non-empty batch (even one whose counters do not move) clears
+    team_stats_cache at that commit.
+    """
+    if changes:
+        session.info[_TEAM_STATS_STALE] = True
+    changes = [(old, new) for old, new in changes if old != new]
+    if not changes:
+        return
+    await _lock(
+        session,
+        [_ALL_PROJECTS, *(k.project_id for pair in changes for k in pair if k is not None)],
+        shared=True,
+    )
+    await _apply_column_deltas(session, column_deltas(changes))
+    buckets = await column_buckets(
+        session,
+        [k.column_id for pair in changes for k in pair if k is not None],
+    )
+    deltas: Dict[_Key, Dict[str, int]] = {}
+    for old, new in changes:
+        if old is not None:
+            _add_contribution(deltas, old, buckets[old.column_id], -1)
+        if new is not None:
+            _add_contribution(deltas, new, buckets[new.column_id], +1)
+
+    rows = [
+        {"project_id": pid, "phase_id": phase, **counters}
+        for (pid, phase), counters in deltas.items()
+        if any(counters.values())
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(ProjectTaskStatsModel).values(rows)
+    table = ProjectTaskStatsModel.__table__
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.project_id, table.c.phase_id],
+        set_={
+            **{f: table.c[f] + stmt.excluded[f] for f in COUNTER_FIELDS},
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+async def apply_task_delta(
+    session: AsyncSession,
+    old: Optional[TaskCounterKey],
+    new: Optional[TaskCounterKey],
+) -> None:
+    """Single-task form of :func:`apply_task_deltas`."""
+    await apply_task_deltas(session, [(old, new)])
+
+
+def _aggregate_columns():
+    bucket = bucket_clause()
+    return (
+        func.count(TaskModel.id).label("total"),
+        func.sum(case((bucket == "todo", 1), else_=0)).label("todo"),
+        func.sum(case((bucket == "in_progress", 1), else_=0)).label("in_progress"),
+        func.sum(case((bucket == "done", 1), else_=0)).label("done"),
+        func.coalesce(func.sum(TaskModel.points), 0).label("points"),
+    )
+
+
+def _truth_select(project_ids: Optional[List[int]]):
+    """GROUP BY over tasks ⋈ board_columns — project rows UNION ALL phase rows,
+    shaped like ``project_task_stats`` (project_id, phase_id, *COUNTER_FIELDS)."""
+    parts = []
+    for phase_col in (None, TaskModel.phase_id):
+        phase = literal(PROJECT_ROW, String) if phase_col is None else phase_col
+        group = [TaskModel.project_id] + ([phase_col] if phase_col is not None else [])
+        stmt = (
+            select(TaskModel.project_id, phase.label("phase_id"), *_aggregate_columns())
+            .select_from(TaskModel)
+            .join(BoardColumnModel, TaskModel.column_id == BoardColumnModel.id, isouter=True)
+            .where(TaskModel.is_deleted == False)  # noqa: E712
+            .group_by(*group)
+        )
+        if phase_col is not None:
+            stmt = stmt.where(TaskModel.phase_id.is_not(None), TaskModel.phase_id != PROJECT_ROW)
+        if project_ids is not None:
+            stmt = stmt.where(TaskModel.project_id.in_(project_ids))
+        parts.append(stmt)
+    return union_all(*parts)
+
+
+async def _recompute_stats(session: AsyncSession, project_ids: Optional[List[int]]) -> int:
+    """Repair ``project_task_stats`` in the database — no rows round-trip.
+
+    One ``INSERT ... SELECT ... ON CONFLICT DO UPDATE`` writes only the rows
+    whose counters differ, one ``DELETE`` drops rows with no live tasks left;
+    both RETURNING, so the repaired count is exact. Bind parameters stay
+    bounded by ``project_ids``, never by the number of stats rows.
+    """
+    table = ProjectTaskStatsModel.__table__
+    truth = _truth_select(project_ids).subquery("truth")
+    fields = ("project_id", "phase_id", *COUNTER_FIELDS)
+    upsert = pg_insert(table).from_select(list(fields), select(*(truth.c[f] for f in fields)))
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[table.c.project_id, table.c.phase_id],
+        set_={
+            **{f: upsert.excluded[f] for f in COUNTER_FIELDS},
+            "updated_at": func.now(),
+        },
+        where=or_(*(table.c[f].is_distinct_from(upsert.excluded[f]) for f in COUNTER_FIELDS)),
+    ).returning(table.c.project_id)
+    upserted = len((await session.execute(upsert)).all())
+
+    stale = delete(table).where(
+        tuple_(table.c.project_id, table.c.phase_id).not_in(
+            select(truth.c.project_id, truth.c.phase_id)
+        )
+    )
+    if project_ids is not None:
+        stale = stale.where(table.c.project_id.in_(project_ids))
+    removed = len((await session.execute(stale.returning(table.c.project_id))).all())
+    return upserted + removed
+
+
+async def _recompute_columns(session: AsyncSession, project_ids: Optional[List[int]]) -> int:
+    """Repair ``board_columns.task_count`` — one UPDATE ... FROM (GROUP BY)."""
+    counts = (
+        select(BoardColumnModel.id, func.count(TaskModel.id).label("n"))
+        .select_from(BoardColumnModel)
+        .join(
+            TaskModel,
+            and_(TaskModel.column_id == BoardColumnModel.id, TaskModel.is_deleted == False),  # noqa: E712
+            isouter=True,
+        )
+        .group_by(BoardColumnModel.id)
+    )
+    if project_ids is not None:
+        counts = counts.where(BoardColumnModel.project_id.in_(project_ids))
+    counts = counts.subquery("counts")
+    stmt = (
+        update(BoardColumnModel)
+        .where(BoardColumnModel.id == counts.c.id, BoardColumnModel.task_count.is_distinct_from(counts.c.n))
+        .values(task_count=counts.c.n)
+        .returning(BoardColumnModel.id)
+        .execution_options(synchronize_session=False)
+    )
+    return len((await session.execute(stmt)).all())
+
+
+async def recompute(session: AsyncSession, project_ids: Optional[Iterable[int]] = None) -> int:
+    """Re-derive counters from ``tasks`` and repair drifted rows (stats rows
+    and column counters), entirely in SQL.
+
+    ``project_ids=None`` reconciles every project. Returns the number of rows
+    that were inserted, corrected or removed (0 == counters were exact).
+    Does NOT commit.
+    """
+    ids = None if project_ids is None else sorted(set(project_ids))
+    if ids is not None and not ids:
+        return 0
+
+    # Before reading: deltas committed after this point wait for our commit.
+    await _lock(session, [_ALL_PROJECTS] if ids is None else ids, shared=False)
+    session.info[_TEAM_STATS_STALE] = True
+    repaired = await _recompute_stats(session, ids)
+    return repaired + await _recompute_columns(session, ids)
+
+
+async def project_ids_for_tasks(session: AsyncSession, *criteria) -> List[int]:
+    """Distinct project ids of the tasks matching ``criteria`` (bulk-write helpers)."""
+    stmt = select(TaskModel.project_id).where(*criteria).distinct()
+    return list((await session.execute(stmt)).scalars().all())
+
+
+def _invalidate_team_stats(session: Session) -> None:
+    if session.info.pop(_TEAM_STATS_STALE, False):
+        team_stats_cache.invalidate()
+
+
+def _drop_team_stats_mark(session: Session) -> None:
+    session.info.pop(_TEAM_STATS_STALE, None)
+
+
+event.listen(Session, "after_commit", _invalidate_team_stats)
+event.listen(Session, "after_rollback", _drop_team_stats_mark)
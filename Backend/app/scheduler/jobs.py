@@ -1,38 +1,49 @@
 import asyncio
+import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.infrastructure.database.database import AsyncSessionLocal
-from app.domain.entities.notification import NotificationType
+from app.domain.entities.notification import Notification, NotificationType
 from app.infrastructure.database.repositories.notification_repo import SqlAlchemyNotificationRepository
 from app.infrastructure.database.repositories.notification_preference_repo import SqlAlchemyNotificationPreferenceRepository
 from app.infrastructure.database.repositories.user_repo import SqlAlchemyUserRepository
-from app.application.use_cases.manage_notifications import CreateNotificationUseCase
+from app.infrastructure.config import settings
+from app.infrastructure.database.util import audit_partitions, task_stats
+
+logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler(timezone="Europe/Istanbul")
 
 
 async def deadline_alert_job() -> None:
     """Daily job: fire deadline-approaching notifications for tasks due in N days.
-    Each user's preference determines N (1, 2, 3, or 7). 1-day always fires."""
+    Each user's preference determines N (1, 2, 3, or 7). 1-day always fires.
+
+    Preferences are read in one query for every assignee and the notifications
+    written as one batch (previously a preference query + commit per task)."""
     async with AsyncSessionLocal() as session:
         notif_repo = SqlAlchemyNotificationRepository(session)
         pref_repo = SqlAlchemyNotificationPreferenceRepository(session)
-        create_uc = CreateNotificationUseCase(notif_repo)
-        for days_ahead in [1, 2, 3, 7]:
-            tasks_due = await notif_repo.get_tasks_approaching_deadline(days_ahead)
-            for t in tasks_due:
-                user_id = t["assignee_id"]
-                pref = await pref_repo.get_by_user(user_id)
-                deadline_days = pref.deadline_days if pref else 1
-                # Fire if days_ahead == 1 (always) OR days_ahead <= user preference
-                if days_ahead == 1 or days_ahead <= deadline_days:
-                    await create_uc.execute(
-                        user_id=user_id,
-                        type=NotificationType.DEADLINE_APPROACHING,
-                        message=f"'{t['task_title']}' görevinin son tarihi {days_ahead} gün sonra.",
-                        related_entity_id=t["task_id"],
-                        related_entity_type="task",
-                    )
+        due = [
+            (days_ahead, t)
+            for days_ahead in [1, 2, 3, 7]
+            for t in await notif_repo.get_tasks_approaching_deadline(days_ahead)
+        ]
+        prefs = await pref_repo.get_by_users(sorted({t["assignee_id"] for _, t in due}))
+        pending = []
+        for days_ahead, t in due:
+            pref = prefs.get(t["assignee_id"])
+            deadline_days = pref.deadline_days if pref else 1
+            # Fire if days_ahead == 1 (always) OR days_ahead <= user preference
+            if days_ahead == 1 or days_ahead <= deadline_days:
+                pending.append(Notification(
+                    user_id=t["assignee_id"],
+                    type=NotificationType.DEADLINE_APPROACHING,
+                    message=f"'{t['task_title']}' görevinin son tarihi {days_ahead} gün sonra.",
+                    related_entity_id=t["task_id"],
+                    related_entity_type="task",
+                ))
+        await notif_repo.create_many(pending)
 
 
 async def purge_notifications_job() -> None:
@@ -40,3 +51,23 @@ async def purge_notifications_job() -> None:
     async with AsyncSessionLocal() as session:
         notif_repo = SqlAlchemyNotificationRepository(session)
         deleted = await notif_repo.purge_old_read(days=90)
+
+
+async def reconcile_task_stats_job() -> None:
+    """Hourly job: re-derive project_task_stats from tasks and repair drift.
+
+    The task repository keeps the counters exact for its own writes; drift
+    only comes from writers that bypass it (seeders, simulator, raw SQL)."""
+    async with AsyncSessionLocal() as session:
+        repaired = await task_stats.recompute(session)
+        await session.commit()
+    if repaired:
+        logger.warning("project_task_stats reconciliation repaired %s row(s)", repaired)
+
+
+async def audit_partition_maintenance_job() -> None:
+    """Daily job: keep future audit_log months partitioned and detach months
+    older than AUDIT_LOG_RETENTION_MONTHS (see util/audit_partitions.py)."""
+    async with AsyncSessionLocal() as session:
+        await audit_partitions.maintain(session, settings.AUDIT_LOG_RETENTION_MONTHS)
+        await session.commit()
@@ -0,0 +1,209 @@
+"""Endpoint benchmark — hot API routes against a simulator-loaded database.
+
+Drives the real FastAPI app in-process (httpx ``ASGITransport``: the full
+middleware / dependency / serialization stack, no network) as an Admin
+principal, against whatever the configured database holds — normally the
+restored ``fixtures/simulated_quarter.sql.gz`` or a scaled dataset from
+``python -m app.dev.simulator.run --bulk``.
+
+For each endpoint: ``--warmup`` untimed requests, then ``--runs`` timed ones.
+Latency p50 / p95 are exact (client-side samples); DB query count and rows
+fetched per request come from the request_metrics window of the same runs.
+Results are written as JSON (git sha + dataset size in ``meta``) so two
+commits can be compared with ``--compare``, which exits 1 when an endpoint's
+p95 grows past ``--threshold`` or it issues more queries than the baseline.
+
+Needs a database at alembic head with data in it (``--restore-snapshot``
+loads the fixture into an empty one first).
+
+Çalıştır: python scripts/bench_endpoints.py [--runs 30] [--only charts] [--compare base.json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, ".")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.api.main import app  # noqa: E402
+from app.application.services import request_metrics  # noqa: E402
+from app.infrastructure.adapters.security_adapter import SecurityAdapter  # noqa: E402
+from app.infrastructure.database.database import ENGINES, AsyncSessionLocal  # noqa: E402
+from app.infrastructure.database.snapshot_loader import maybe_load_snapshot  # noqa: E402
+
+# (name, path template) — formatted with the ids resolved from the database.
+ENDPOINTS = [
+    ("board.columns", "/api/v1/projects/{pid}/columns"),
+    ("tasks.page", "/api/v1/tasks/project/{pid}?page=1&page_size=100"),
+    ("tasks.open", "/api/v1/tasks/project/{pid}?exclude_done=true"),
+    ("charts.cfd", "/api/v1/projects/{pid}/charts/cfd?range=30"),
+    ("charts.lead_cycle", "/api/v1/projects/{pid}/charts/lead-cycle?range=30"),
+    ("charts.iteration", "/api/v1/projects/{pid}/charts/iteration?count=4"),
+    ("charts.bundle", "/api/v1/projects/{pid}/charts/bundle"),
+    ("reports.summary", "/api/v1/reports/summary?project_id={pid}"),
+    ("reports.burndown", "/api/v1/reports/burndown?project_id={pid}&sprint_id={sprint_id}"),
+    ("reports.performance", "/api/v1/reports/performance?project_id={pid}"),
+    ("reports.excel", "/api/v1/reports/export/excel?project_id={pid}"),
+    ("activity.global", "/api/v1/activity?limit=50"),
+    ("activity.project", "/api/v1/projects/{pid}/activity?limit=50"),
+    ("activity.user", "/api/v1/users/{uid}/activity"),
+    ("admin.audit", "/api/v1/admin/audit"),
+    ("admin.audit_json", "/api/v1/admin/audit.json"),
+    ("admin.users_csv", "/api/v1/admin/users.csv"),
+]
+
+_IDS_SQL = {
+    "admin": (
+        "SELECT u.id, u.email FROM users u JOIN roles r ON r.id = u.role_id "
+        "WHERE lower(r.name) = 'admin' AND u.is_active ORDER BY u.id LIMIT 1"
+    ),
+    "busiest_project": (
+        "SELECT project_id FROM tasks WHERE NOT is_deleted "
+        "GROUP BY project_id ORDER BY count(*) DESC, project_id LIMIT 1"
+    ),
+    "sprint": "SELECT id FROM sprints WHERE project_id = :pid ORDER BY start_date DESC NULLS LAST, id DESC LIMIT 1",
+    "busiest_user": (
+        "SELECT assignee_id FROM tasks WHERE assignee_id IS NOT NULL AND project_id = :pid "
+        "GROUP BY assignee_id ORDER BY count(*) DESC, assignee_id LIMIT 1"
+    ),
+}
+_DATASET_TABLES = ("projects", "users", "tasks", "comments", "audit_log", "notifications")
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+async def _resolve(project_id, restore: bool) -> dict:
+    async with AsyncSessionLocal() as session:
+        if restore and await maybe_load_snapshot(session):
+            print("restored fixtures/simulated_quarter.sql.gz")
+        admin = (await session.execute(text(_IDS_SQL["admin"]))).first()
+        if admin is None:
+            sys.exit("no active Admin user — load a snapshot or seed first")
+        pid = project_id or (await session.execute(text(_IDS_SQL["busiest_project"]))).scalar()
+        if pid is None:
+            sys.exit("no tasks in the database — load a snapshot or run the simulator first")
+        sprint_id = (await session.execute(text(_IDS_SQL["sprint"]), {"pid": pid})).scalar()
+        uid = (await session.execute(text(_IDS_SQL["busiest_user"]), {"pid": pid})).scalar() or admin.id
+        counts = {
+            t: (await session.execute(text(f"SELECT count(*) FROM {t}"))).scalar() for t in _DATASET_TABLES
+        }
+    return {
+        "email": admin.email,
+        "ids": {"pid": pid, "sprint_id": sprint_id if sprint_id is not None else "", "uid": uid},
+        "dataset": counts,
+    }
+
+
+async def _bench(client: AsyncClient, path: str, runs: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        await client.get(path)
+    request_metrics.reset()
+    samples, status, size = [], None, 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        resp = await client.get(path)
+        samples.append((time.perf_counter() - t0) * 1000)
+        status, size = resp.status_code, len(resp.content)
+    samples.sort()
+    # Only this endpoint ran since the reset, whatever its route template is.
+    routes = request_metrics.snapshot()["routes"]
+    count = sum(r["count"] for r in routes) or 1
+    return {
+        "status": status,
+        "bytes": size,
+        "p50_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)], 2),
+        "db_queries": round(sum(r["avg_db_queries"] * r["count"] for r in routes) / count, 2),
+        "db_rows": round(sum(r["avg_db_rows"] * r["count"] for r in routes) / count, 2),
+        "db_time_ms": round(sum(r["avg_db_time_ms"] * r["count"] for r in routes) / count, 2),
+    }
+
+
+def _compare(results: dict, base_path: str, threshold: float) -> int:
+    base = json.loads(Path(base_path).read_text(encoding="utf-8"))
+    print(f"\nvs {base_path} ({base['meta'].get('git_sha') or '?'}):")
+    regressions = 0
+    for name, cur in results.items():
+        old = base["endpoints"].get(name)
+        if old is None:
+            continue
+        slower = cur["p95_ms"] > old["p95_ms"] * (1 + threshold)
+        more_queries = cur["db_queries"] > old["db_queries"]
+        flag = "REGRESSION" if slower or more_queries else ""
+        regressions += bool(flag)
+        print(
+            f"{name:<20} p95 {old['p95_ms']:>8.1f} -> {cur['p95_ms']:>8.1f}ms"
+            f"  queries {old['db_queries']:>5g} -> {cur['db_queries']:<5g} {flag}"
+        )
+    return regressions
+
+
+async def main(args) -> int:
+    ctx = await _resolve(args.project_id, args.restore_snapshot)
+    token = SecurityAdapter().create_access_token({"sub": ctx["email"], "permissions": []})
+    endpoints = [(n, p) for n, p in ENDPOINTS if not args.only or any(o in n for o in args.only)]
+    if not ctx["ids"]["sprint_id"]:
+        endpoints = [(n, p) for n, p in endpoints if "{sprint_id}" not in p]
+
+    print(f"project {ctx['ids']['pid']}  dataset {ctx['dataset']}")
+    print(f"{'endpoint':<20} {'status':>6} {'p50':>9} {'p95':>9} {'queries':>8} {'rows':>9} {'bytes':>10}")
+    results = {}
+    headers = {"Authorization": f"Bearer {token}"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", headers=headers) as client:
+        for name, template in endpoints:
+            r = await _bench(client, template.format(**ctx["ids"]), args.runs, args.warmup)
+            results[name] = r
+            print(
+                f"{name:<20} {r['status']:>6} {r['p50_ms']:>7.1f}ms {r['p95_ms']:>7.1f}ms "
+                f"{r['db_queries']:>8g} {r['db_rows']:>9g} {r['bytes']:>10,}"
+            )
+    for eng in ENGINES.values():
+        await eng.dispose()
+
+    sha = _git("rev-parse", "--short", "HEAD")
+    out = Path(args.out or f"bench-results/endpoints-{sha or 'nogit'}.json")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps({
+        "meta": {
+            "git_sha": sha,
+            "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "runs": args.runs,
+            "warmup": args.warmup,
+            "ids": ctx["ids"],
+            "dataset": ctx["dataset"],
+        },
+        "endpoints": results,
+    }, indent=2), encoding="utf-8")
+    print(f"\nwrote {out}")
+
+    if args.compare:
+        return 1 if _compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--project-id", type=int, help="default: the project with the most tasks")
+    parser.add_argument("--only", nargs="*", help="endpoint name substrings, e.g. charts reports.burndown")
+    parser.add_argument("--restore-snapshot", action="store_true", help="load the fixture if audit_log is empty")
+    parser.add_argument("--out", help="default: bench-results/endpoints-<git sha>.json")
+    parser.add_argument("--compare", metavar="BASE_JSON", help="fail on regressions against an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.20, help="allowed p95 growth (default 0.20)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,139 @@
+"""Task-list serialization benchmark — default response_model path vs fast JSON.
+
+Builds one in-memory project list of N ``TaskResponseDTO`` (default 5,000,
+each with project, assignee and two subtasks) and serves it from a scratch
+FastAPI app twice:
+
+- ``default``: the route returns the ``PaginatedResponse`` and FastAPI
+  re-validates it against ``response_model`` and runs ``jsonable_encoder``;
+- ``fast``: the route returns ``fast_json(...)`` (app/api/fast_json.py).
+
+Prints p50 / p95 per path, the body size with and without gzip, and
+checks that both paths produce the same JSON. No database needed.
+
+Çalıştır: python scripts/bench_fast_json.py [--tasks 5000] [--runs 20]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, ".")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+
+from app.api.fast_json import fast_json  # noqa: E402
+from app.application.dtos.task_dtos import (  # noqa: E402
+    PaginatedResponse,
+    ProjectSummaryDTO,
+    SubTaskSummaryDTO,
+    TaskResponseDTO,
+    UserSummaryDTO,
+)
+from app.domain.entities.task import TaskPriority  # noqa: E402
+
+
+def build_page(n: int) -> PaginatedResponse:
+    now = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    project = ProjectSummaryDTO(id=1, name="Bench", key="BENCH")
+    users = [
+        UserSummaryDTO(id=u, email=f"u{u}@bench.local", username=f"user{u}", avatar_url=None)
+        for u in range(1, 21)
+    ]
+    priorities = list(TaskPriority)
+    items = [
+        TaskResponseDTO(
+            id=i,
+            title=f"Task {i} — payment refund follow-up",
+            description="Lorem ipsum dolor sit amet " * 4,
+            priority=priorities[i % len(priorities)],
+            status=("todo", "in progress", "done")[i % 3],
+            is_done=i % 3 == 2,
+            start_date=now + timedelta(days=i % 30),
+            due_date=now + timedelta(days=i % 30 + 7),
+            points=i % 8,
+            is_recurring=False,
+            task_key=f"BENCH-{i}",
+            project_id=1,
+            project=project,
+            column_id=1 + i % 3,
+            phase_id=f"nd_{i % 5}",
+            assignee_id=users[i % 20].id,
+            assignee=users[i % 20],
+            reporter_id=1,
+            sub_tasks=[
+                SubTaskSummaryDTO(id=n + 2 * i + k, title=f"Sub {k}", key=f"BENCH-{n + 2 * i + k}",
+                                  status="todo", priority=priorities[k])
+                for k in range(2)
+            ],
+            created_at=now - timedelta(days=i % 90),
+            updated_at=now,
+        )
+        for i in range(1, n + 1)
+    ]
+    return PaginatedResponse(items=items, total=n, page=1, page_size=n)
+
+
+def build_app(page: PaginatedResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=PaginatedResponse)
+    async def default():
+        return page
+
+    @app.get("/fast", response_model=PaginatedResponse)
+    async def fast(request: Request):
+        return fast_json(request, page, items_key="items")
+
+    return app
+
+
+async def measure(app: FastAPI, path: str, runs: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        timings, body = [], b""
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            r = await client.get(path, headers={"Accept-Encoding": "identity"})
+            body = r.content
+            timings.append((time.perf_counter() - t0) * 1000)
+    return timings, body
+
+
+async def gzip_wire_size(app: FastAPI, path: str) -> int:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": "gzip"}) as r:
+            return sum([len(chunk) async for chunk in r.aiter_raw()])
+
+
+def _pct(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+async def main(n: int, runs: int) -> None:
+    page = build_page(n)
+    app = build_app(page)
+    results = {}
+    for name in ("default", "fast"):
+        timings, body = await measure(app, f"/{name}", runs)
+        results[name] = body
+        print(f"{name:>8}: p50 {_pct(timings, 50):7.1f} ms   p95 {_pct(timings, 95):7.1f} ms   {len(body) // 1024} KiB")
+    print(f"    gzip: {await gzip_wire_size(app, '/fast') // 1024} KiB on the wire (fast path)")
+    same = json.loads(results["default"]) == json.loads(results["fast"])
+    print(f"identical JSON: {same}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.runs))
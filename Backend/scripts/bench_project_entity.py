@@ -0,0 +1,150 @@
+"""ORM → ``Project`` entity conversion benchmark (process_config fast path).
+
+Builds N transient ``ProjectModel`` rows (default 1,000, five board columns
+each, a realistic V2 process_config) and times ``Project.model_validate``
+over all of them in three modes:
+
+- ``copy``: the previous conversion — every table column copied into a
+  dict and the config run through ``_normalize_process_config`` — kept
+  here as the baseline;
+- ``current``: configs at ``CURRENT_SCHEMA_VERSION``, the state after the
+  ``process_config_schema`` boot write-back — entity fields read from the
+  loaded instance state, migration skipped;
+- ``legacy``: V1 configs that still need migrating.
+
+Prints p50 / p95 per mode and checks that every mode builds the same
+entities. No database needed.
+
+Çalıştır: python scripts/bench_project_entity.py [--rows 1000] [--runs 30]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, ".")
+
+from app.domain.entities.project import (  # noqa: E402
+    CURRENT_SCHEMA_VERSION,
+    Methodology,
+    Project,
+    _normalize_process_config,
+)
+from app.infrastructure.database.models.board_column import BoardColumnModel  # noqa: E402
+from app.infrastructure.database.models.project import ProjectModel  # noqa: E402
+
+
+def _v2_config(i: int) -> dict:
+    nodes = [
+        {"id": f"nd_{i:05d}{k:05d}", "name": f"Phase {k}", "x": 100 * k, "y": 0,
+         "color": "#888", "is_archived": False}
+        for k in range(6)
+    ]
+    edges = [
+        {"id": f"e{k}", "source": nodes[k]["id"], "target": nodes[k + 1]["id"], "type": "flow"}
+        for k in range(5)
+    ]
+    return {
+        "schema_version": CURRENT_SCHEMA_VERSION,
+        "phase_workflow": {
+            "mode": "sequential-flexible",
+            "capabilities": {
+                "enforce_wip_limits": False,
+                "enforce_sequential_dependencies": True,
+                "restrict_expired_sprints": False,
+                "initial_node_id": nodes[0]["id"],
+            },
+            "nodes": nodes, "edges": edges, "groups": [],
+        },
+        "task_workflow": {
+            "capabilities": {"enforce_wip_limits": False, "has_recurring": True, "initial_node_id": None},
+            "edges": [], "groups": [],
+        },
+        "phase_completion_criteria": {nodes[0]["id"]: {"auto": {"all_tasks_done": True}}},
+        "enable_phase_assignment": True,
+        "backlog_definition": "cycle_null",
+        "cycle_label": None,
+    }
+
+
+def _v1_config(i: int) -> dict:
+    cfg = _v2_config(i)
+    workflow = cfg.pop("phase_workflow")
+    caps = workflow.pop("capabilities")
+    cfg.pop("task_workflow")
+    return {**cfg, **caps, "workflow": workflow, "schema_version": 1}
+
+
+def build_rows(n: int, legacy: bool) -> list:
+    rows = []
+    for i in range(1, n + 1):
+        model = ProjectModel(
+            id=i, key=f"B{i}", name=f"Bench {i}", description="Benchmark project",
+            start_date=date(2026, 1, 1), methodology=Methodology.SCRUM, status="ACTIVE",
+            manager_id=1, custom_fields={"team": "core"}, task_seq=i * 10,
+            process_config=_v1_config(i) if legacy else _v2_config(i),
+            version=1, is_deleted=False, change_version=i,
+        )
+        model.columns = [
+            BoardColumnModel(
+                id=i * 10 + k, project_id=i, name=f"Col {k}", order_index=k, wip_limit=0,
+                category="todo", is_initial=k == 0, is_terminal=k == 4,
+                entry_policy="any", exit_policy="any", task_count=0,
+            )
+            for k in range(5)
+        ]
+        rows.append(model)
+    return rows
+
+
+def copy_all_columns(model) -> Project:
+    """The pre-fast-path conversion, inlined as the baseline."""
+    out = {c.name: getattr(model, c.name) for c in model.__table__.columns}
+    out["columns"] = model.columns
+    if out.get("process_config") is not None:
+        out["process_config"] = _normalize_process_config(out["process_config"])
+    return Project.model_validate(out)
+
+
+def time_mode(rows, convert, runs: int):
+    timings, entities = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        entities = [convert(r) for r in rows]
+        timings.append((time.perf_counter() - t0) * 1000)
+    return timings, entities
+
+
+def _pct(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+def main(n: int, runs: int) -> None:
+    current_rows = build_rows(n, legacy=False)
+    legacy_rows = build_rows(n, legacy=True)
+    results = {}
+    for name, rows, convert in (
+        ("copy", current_rows, copy_all_columns),
+        ("current", current_rows, Project.model_validate),
+        ("legacy", legacy_rows, Project.model_validate),
+    ):
+        timings, entities = time_mode(rows, convert, runs)
+        results[name] = entities
+        print(f"{name:>8}: p50 {_pct(timings, 50):7.1f} ms   p95 {_pct(timings, 95):7.1f} ms   ({n} rows)")
+    same = (
+        [e.model_dump() for e in results["copy"]] == [e.model_dump() for e in results["current"]]
+        and all(e.process_config["schema_version"] == CURRENT_SCHEMA_VERSION for e in results["legacy"])
+    )
+    print(f"identical entities: {same}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+    main(args.rows, args.runs)
@@ -0,0 +1,121 @@
+"""Global search benchmark — legacy per-word ILIKE vs SqlAlchemySearchRepository.
+
+Seeds a scratch project with N tasks (default 1,000,000) straight in SQL,
+ANALYZEs, then times both query shapes over a set of typical navbar queries
+and prints p50 / p95 per shape plus the top plan node of each query, so a
+missing index (Seq Scan on tasks) is visible at a glance.
+
+Needs a database at alembic head (019_search_indexes). The scratch project
+is deleted at the end unless --keep is given (re-runs with --keep reuse it).
+
+Çalıştır: python scripts/bench_search.py [--tasks 1000000] [--runs 20] [--keep]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from sqlalchemy import select, text  # noqa: E402
+
+from app.infrastructure.database.database import AsyncSessionLocal  # noqa: E402
+from app.infrastructure.database.models.task import TaskModel  # noqa: E402
+from app.infrastructure.database.repositories.search_repo import (  # noqa: E402
+    SqlAlchemySearchRepository,
+)
+
+PROJECT_KEY = "BENCHSRCH"
+QUERIES = ["login", "payment refund", "dashboard chart", "BENCHSRCH-4242", "zzznomatch"]
+
+_SEED_SQL = """
+INSERT INTO tasks (project_id, task_key, title, description, is_deleted, created_at)
+SELECT :pid,
+       'BENCHSRCH-' || g,
+       initcap(w[1 + (g % 40)]) || ' ' || w[1 + ((g / 40) % 40)] || ' ' || w[1 + ((g / 1600) % 40)] || ' #' || g,
+       'Follow-up on ' || w[1 + ((g * 7) % 40)] || ' and ' || w[1 + ((g * 13) % 40)] || ' for release ' || (g % 97),
+       false,
+       now() - (g % 365) * interval '1 day'
+FROM generate_series(1, :n) AS g,
+     (SELECT string_to_array(
+        'login,logout,payment,refund,invoice,dashboard,chart,report,export,import,'
+        'user,role,permission,audit,search,filter,sprint,board,column,task,'
+        'comment,upload,avatar,email,notify,timeout,cache,index,query,api,'
+        'mobile,desktop,theme,layout,modal,form,button,table,calendar,backup', ',') AS w) words
+"""
+
+
+def _legacy_stmt(words):
+    stmt = select(TaskModel.id).where(
+        TaskModel.is_deleted == False,  # noqa: E712
+        *[TaskModel.title.ilike(f"%{w}%") for w in words],
+    )
+    return stmt.order_by(TaskModel.updated_at.desc().nulls_last()).limit(20)
+
+
+async def _ensure_dataset(session, n: int) -> int:
+    pid = (await session.execute(text("SELECT id FROM projects WHERE key=:k"), {"k": PROJECT_KEY})).scalar()
+    if pid is not None:
+        have = (await session.execute(text("SELECT count(*) FROM tasks WHERE project_id=:p"), {"p": pid})).scalar()
+        if have >= n:
+            return pid
+        await session.execute(text("DELETE FROM projects WHERE id=:p"), {"p": pid})
+    await session.execute(
+        text(
+            "INSERT INTO projects (key, name, start_date, methodology, status) "
+            "VALUES (:k, 'Search benchmark', now(), 'KANBAN', 'ACTIVE')"
+        ),
+        {"k": PROJECT_KEY},
+    )
+    pid = (await session.execute(text("SELECT id FROM projects WHERE key=:k"), {"k": PROJECT_KEY})).scalar()
+    started = time.perf_counter()
+    await session.execute(text(_SEED_SQL), {"pid": pid, "n": n})
+    await session.commit()
+    await session.execute(text("ANALYZE tasks"))
+    print(f"seeded {n:,} tasks in {time.perf_counter() - started:.1f}s")
+    return pid
+
+
+async def _time(fn, runs: int):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[max(0, int(len(samples) * 0.95) - 1)]
+
+
+async def _top_plan_line(session, stmt) -> str:
+    compiled = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = (await session.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    scans = [r.strip() for r in rows if "Scan" in r]
+    return scans[0] if scans else rows[0]
+
+
+async def main(n: int, runs: int, keep: bool) -> None:
+    async with AsyncSessionLocal() as session:
+        pid = await _ensure_dataset(session, n)
+        repo = SqlAlchemySearchRepository(session)
+        print(f"{'query':<20} {'legacy p50':>11} {'legacy p95':>11} {'search p50':>11} {'search p95':>11}")
+        for q in QUERIES:
+            words = q.lower().split()
+            legacy = _legacy_stmt(words)
+            lp50, lp95 = await _time(lambda: session.execute(legacy), runs)
+            sp50, sp95 = await _time(lambda: repo.search(words, ("task",), [pid]), runs)
+            print(f"{q:<20} {lp50:>9.1f}ms {lp95:>9.1f}ms {sp50:>9.1f}ms {sp95:>9.1f}ms")
+            print(f"{'':<20} legacy plan: {await _top_plan_line(session, legacy)}")
+        if not keep:
+            await session.execute(text("DELETE FROM projects WHERE id=:p"), {"p": pid})
+            await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch project for re-runs")
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.runs, args.keep))
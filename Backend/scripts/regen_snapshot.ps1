@@ -102,6 +102,9 @@ try {
 # --- Step 3: pg_dump the data + gzip --------------------------------------
 # --inserts          : portable INSERT statements (vs COPY) so snapshot_loader's
 #                       line-based asyncpg replay works.
+# --load-via-partition-root : audit_log rows INSERT into the parent table,
+#                       so they route to whatever monthly partitions the
+#                       restoring DB has (alembic 020).
 # --data-only        : skip CREATE TABLE etc. — the loader assumes alembic
 #                       already applied the schema.
 # --exclude-table    : skip alembic_version (immutable migration ledger) and
@@ -112,6 +115,7 @@ Write-Host '==> Dumping snapshot...' -ForegroundColor Cyan
     --no-password `
     --dbname=$conn.name `
     --inserts `
+    --load-via-partition-root `
     --data-only `
     --exclude-table=alembic_version `
     --exclude-table=system_config `
@@ -61,6 +61,7 @@ pg_dump \
     --no-password \
     --dbname="$DB_NAME" \
     --inserts \
+    --load-via-partition-root \
     --data-only \
     --exclude-table=alembic_version \
     --exclude-table=system_config \
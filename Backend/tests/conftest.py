@@ -11,7 +11,9 @@ from app.infrastructure.config import settings
 from app.infrastructure.database.models import Base
 # Import all models to ensure metadata is populated
 from app.infrastructure.database.models import *
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_db_session, get_read_session
+from app.infrastructure.database.util.query_metrics import install_query_listeners
+from app.application.services import request_metrics
 
 # --- Database Setup for Integration Tests ---
 
@@ -59,6 +61,8 @@ async def db_engine():
     # 4. Connect to the new TEST database
     test_db_url = original_url.set(database=test_db_name)
     engine = create_async_engine(test_db_url, poolclass=NullPool)
+    # Same statement counters as the app engines (max_queries, request metrics)
+    install_query_listeners(engine)
     
     # 5. Create Tables
     async with engine.begin() as conn:
@@ -102,8 +106,9 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
     Creates a FastAPI test client.
     Overrides the database dependency to use the test session (with rollback).
     """
-    # Override the get_db_session dependency to return our transactional session
+    # Override the session dependencies (OLTP + analytics reads) to return our transactional session
     app.dependency_overrides[get_db_session] = lambda: db_session
+    app.dependency_overrides[get_read_session] = lambda: db_session
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
         yield c
@@ -181,6 +186,7 @@ async def authenticated_client(db_session):
 
         # Override DB dependency so the app uses the same transactional session
         app.dependency_overrides[get_db_session] = lambda: db_session
+        app.dependency_overrides[get_read_session] = lambda: db_session
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", follow_redirects=True) as client:
             client.headers["Authorization"] = f"Bearer {token}"
             yield client
@@ -235,6 +241,7 @@ async def permitted_client(db_session):
         await db_session.flush()
         token = _make_test_jwt(user.email, permissions=perms)
         app.dependency_overrides[get_db_session] = lambda: db_session
+        app.dependency_overrides[get_read_session] = lambda: db_session
         async with AsyncClient(
             transport=ASGITransport(app=app),
             base_url="http://test",
@@ -247,6 +254,46 @@ async def permitted_client(db_session):
     return _builder
 
 
+# ---------------------------------------------------------------------------
+# Query budget guard — app/api/query_budget.py + request_metrics.capture_queries.
+# ---------------------------------------------------------------------------
+from contextlib import contextmanager
+
+
+@pytest.fixture
+def max_queries():
+    """Fail the test when a block runs more SQL than it may.
+
+    Usage::
+
+        async def test_x(authenticated_client, max_queries):
+            async with authenticated_client(role="admin") as client:
+                with max_queries(6):        # explicit ceiling for the block
+                    await client.get(...)
+                with max_queries():         # each request within its route's @query_budget
+                    await client.get(...)
+
+    The failure message lists the statements that repeated (N+1 suspects).
+    """
+
+    @contextmanager
+    def _guard(limit: int | None = None):
+        with request_metrics.capture_queries() as captured:
+            yield captured
+        if limit is not None:
+            assert captured.count <= limit, f"expected at most {limit} statements, ran {captured.report()}"
+            return
+        assert captured.requests, "max_queries() without a limit saw no request"
+        over = [r for r in captured.requests if r[3] is not None and r[2] > r[3]]
+        assert not over, (
+            "over query budget: "
+            + ", ".join(f"{m} {route} ran {n} > {budget}" for m, route, n, budget in over)
+            + f"\n{captured.report()}"
+        )
+
+    return _guard
+
+
 # ---------------------------------------------------------------------------
 # Phase 15 Plan 15-02 TIDY-05 — `requires_db` marker + auto-skip when DB down.
 # Source: 15-RESEARCH.md Pattern 7 (pytest_collection_modifyitems with DB probe).
@@ -291,3 +291,57 @@ async def test_get_columns_returns_all_engine_fields(authenticated_client, db_se
         # Middle column has neither flag set.
         assert cols_sorted[1]["is_initial"] is False
         assert cols_sorted[1]["is_terminal"] is False
+
+
+@pytest.mark.asyncio
+async def test_columns_get_revalidates_until_a_column_write(authenticated_client, db_session):
+    """GET /columns answers a matching If-None-Match with 304 until the board changes."""
+    if not await _db_has_roles(db_session):
+        pytest.skip("DB has no roles — skipping integration test")
+
+    pid, col_ids = await _seed_project_with_columns(db_session, key="ETAGCOL1")
+
+    async with authenticated_client(role="admin") as client:
+        r1 = await client.get(f"/api/v1/projects/{pid}/columns")
+        assert r1.status_code == 200
+        etag = r1.headers["etag"]
+
+        r2 = await client.get(
+            f"/api/v1/projects/{pid}/columns", headers={"If-None-Match": etag}
+        )
+        assert r2.status_code == 304
+        assert r2.content == b""
+
+        r3 = await client.patch(
+            f"/api/v1/projects/{pid}/columns/{col_ids[0]}", json={"wip_limit": 3}
+        )
+        assert r3.status_code == 200, r3.text
+
+        r4 = await client.get(
+            f"/api/v1/projects/{pid}/columns", headers={"If-None-Match": etag}
+        )
+        assert r4.status_code == 200
+        assert r4.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_columns_stays_within_query_budget(authenticated_client, db_session, max_queries):
+    """GET columns runs a fixed number of statements however many columns exist."""
+    if not await _db_has_roles(db_session):
+        pytest.skip("DB has no roles — skipping integration test")
+
+    pid, _ = await _seed_project_with_columns(db_session, key="W2C3COL4")
+    await db_session.execute(
+        text(
+            "INSERT INTO board_columns (project_id, name, order_index, wip_limit) "
+            "SELECT :p, 'Extra ' || g, 2 + g, 0 FROM generate_series(1, 30) AS g"
+        ),
+        {"p": pid},
+    )
+    await db_session.flush()
+
+    async with authenticated_client(role="admin") as client:
+        with max_queries():
+            r = await client.get(f"/api/v1/projects/{pid}/columns")
+    assert r.status_code == 200
+    assert len(r.json()) == 33
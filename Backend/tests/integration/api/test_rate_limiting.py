@@ -17,7 +17,7 @@ import pytest
 from httpx import AsyncClient, ASGITransport
 
 from app.api.main import app
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_db_session, get_read_session
 
 # Plan 15-02 TIDY-05 (CONTEXT D-4.4): auto-skip when DB unreachable.
 pytestmark = pytest.mark.requires_db
@@ -28,6 +28,7 @@ def _client_with_ip(db_session, ip: str) -> AsyncClient:
     gives this test a counter independent of the 127.0.0.1 the rest of the suite
     shares). Routes the app's DB session to the transactional test session."""
     app.dependency_overrides[get_db_session] = lambda: db_session
+    app.dependency_overrides[get_read_session] = lambda: db_session
     transport = ASGITransport(app=app, client=(ip, 9999))
     return AsyncClient(transport=transport, base_url="http://test")
 
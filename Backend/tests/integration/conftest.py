@@ -7,7 +7,8 @@ from app.infrastructure.database.models import Base
 # Import all models to ensure they are registered with Base.metadata
 from app.infrastructure.database.models import * 
 from app.api.main import app
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_db_session, get_read_session
+from app.infrastructure.database.util.query_metrics import install_query_listeners
 from httpx import AsyncClient, ASGITransport
 from typing import AsyncGenerator
 
@@ -24,6 +25,7 @@ async def db_engine():
     """
     # Use NullPool to avoid Asyncio Event Loop issues during tests
     engine = create_async_engine(DB_URL, poolclass=NullPool)
+    install_query_listeners(engine)
     
     async with engine.begin() as conn:
         # Create tables if they don't exist
@@ -75,8 +77,9 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
     Creates a FastAPI test client with dependency overrides.
     Uses the transactional db_session.
     """
-    # Override the get_db_session dependency to return our test session
+    # Override the session dependencies (OLTP + analytics reads) to return our test session
     app.dependency_overrides[get_db_session] = lambda: db_session
+    app.dependency_overrides[get_read_session] = lambda: db_session
     
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
         yield c
@@ -133,3 +133,31 @@ async def test_audit_row_has_user_id(db_session: AsyncSession):
     assert audit_row is not None
     # kills mutation: hard-coding user_id=None / wrong actor fails here.
     assert audit_row.user_id == test_user_id
+
+
+@pytest.mark.asyncio
+async def test_audit_rows_carry_project_id_and_feed_project_activity(db_session: AsyncSession):
+    """ORM inserts get project_id from the before_insert hook (task → tasks lookup);
+    get_project_activity scopes on it."""
+    from app.infrastructure.database.repositories.audit_repo import SqlAlchemyAuditRepository
+
+    pid = await _seed_project(db_session, "AUDT4", "Audit Scope Project")
+    tid = await _seed_task(db_session, pid, "Scoped")
+    db_session.add(AuditLogModel(
+        entity_type="task", entity_id=tid, field_name="status",
+        old_value=None, new_value="Open", user_id=None, action="created",
+    ))
+    await db_session.flush()
+
+    project_ids = (
+        await db_session.execute(
+            select(AuditLogModel.project_id).where(
+                AuditLogModel.entity_type == "task", AuditLogModel.entity_id == tid
+            )
+        )
+    ).scalars().all()
+    assert project_ids == [pid]
+
+    items, total = await SqlAlchemyAuditRepository(db_session).get_project_activity(pid)
+    assert total >= 1
+    assert {i["entity_id"] for i in items if i["entity_type"] == "task"} == {tid}
@@ -0,0 +1,147 @@
+"""project_task_stats — incremental maintenance agrees with a full recompute.
+
+Drives SqlAlchemyTaskRepository create → move → re-phase → soft-delete against
+the real DB and, after each step, asserts that ``task_stats.recompute`` finds
+nothing to repair (the incremental deltas are exact) and that the project row
+carries the expected bucket counts.
+"""
+import pytest
+from sqlalchemy import select, text
+
+from app.domain.entities.task import Task
+from app.infrastructure.database.models.project_task_stats import ProjectTaskStatsModel
+from app.infrastructure.database.repositories.task_repo import SqlAlchemyTaskRepository
+from app.infrastructure.database.util import task_stats
+
+pytestmark = pytest.mark.requires_db
+
+
+async def _scalar(session, sql: str, **params):
+    return (await session.execute(text(sql), params)).scalar()
+
+
+async def _row(session, project_id: int, phase_id: str = task_stats.PROJECT_ROW):
+    return (
+        await session.execute(
+            select(ProjectTaskStatsModel).where(
+                ProjectTaskStatsModel.project_id == project_id,
+                ProjectTaskStatsModel.phase_id == phase_id,
+            )
+        )
+    ).scalar_one_or_none()
+
+
+@pytest.mark.asyncio
+async def test_task_writes_keep_stats_exact(db_session):
+    await db_session.execute(
+        text(
+            "INSERT INTO projects (key, name, start_date, methodology, status) "
+            "VALUES ('PTSTATS1', 'Stats Test', now(), 'KANBAN', 'ACTIVE')"
+        )
+    )
+    await db_session.flush()
+    pid = await _scalar(db_session, "SELECT id FROM projects WHERE key='PTSTATS1'")
+    await db_session.execute(
+        text(
+            "INSERT INTO board_columns (project_id, name, order_index, category, is_terminal) VALUES "
+            "(:p, 'Todo', 0, 'todo', false), (:p, 'Doing', 1, 'in_progress', false), "
+            "(:p, 'Bitti', 2, 'todo', true)"
+        ),
+        {"p": pid},
+    )
+    await db_session.flush()
+    todo_col = await _scalar(db_session, "SELECT id FROM board_columns WHERE project_id=:p AND name='Todo'", p=pid)
+    done_col = await _scalar(db_session, "SELECT id FROM board_columns WHERE project_id=:p AND name='Bitti'", p=pid)
+
+    repo = SqlAlchemyTaskRepository(db_session)
+    created = await repo.create(
+        Task(title="stats-task", project_id=pid, column_id=todo_col, points=5)
+    )
+    assert await task_stats.recompute(db_session, [pid]) == 0
+    row = await _row(db_session, pid)
+    assert (row.total, row.todo, row.done, row.points) == (1, 1, 0, 5)
+
+    # is_terminal wins over category='todo' — the task counts as done.
+    await repo.update(created.id, {"column_id": done_col, "phase_id": "design"}, user_id=None)
+    assert await task_stats.recompute(db_session, [pid]) == 0
+    row = await _row(db_session, pid)
+    assert (row.total, row.todo, row.done) == (1, 0, 1)
+    phase_row = await _row(db_session, pid, "design")
+    assert (phase_row.total, phase_row.done) == (1, 1)
+
+    await repo.delete(created.id)
+    assert await task_stats.recompute(db_session, [pid]) == 0
+    row = await _row(db_session, pid)
+    assert (row.total, row.done, row.points) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_recompute_repairs_rows_written_outside_the_repo(db_session):
+    await db_session.execute(
+        text(
+            "INSERT INTO projects (key, name, start_date, methodology, status) "
+            "VALUES ('PTSTATS2', 'Stats Drift', now(), 'KANBAN', 'ACTIVE')"
+        )
+    )
+    await db_session.flush()
+    pid = await _scalar(db_session, "SELECT id FROM projects WHERE key='PTSTATS2'")
+    # Raw insert bypasses the repository → no counter row yet.
+    await db_session.execute(
+        text("INSERT INTO tasks (title, project_id, priority) VALUES ('raw', :p, 'MEDIUM')"),
+        {"p": pid},
+    )
+    await db_session.flush()
+
+    assert await task_stats.recompute(db_session, [pid]) == 1
+    row = await _row(db_session, pid)
+    assert (row.total, row.todo) == (1, 1)
+    assert await task_stats.recompute(db_session, [pid]) == 0
+
+
+@pytest.mark.asyncio
+async def test_column_task_count_follows_task_writes(db_session):
+    await db_session.execute(
+        text(
+            "INSERT INTO projects (key, name, start_date, methodology, status) "
+            "VALUES ('PTSTATS3', 'Column Counter', now(), 'KANBAN', 'ACTIVE')"
+        )
+    )
+    await db_session.flush()
+    pid = await _scalar(db_session, "SELECT id FROM projects WHERE key='PTSTATS3'")
+    await db_session.execute(
+        text(
+            "INSERT INTO board_columns (project_id, name, order_index, category) VALUES "
+            "(:p, 'Todo', 0, 'todo'), (:p, 'Doing', 1, 'in_progress')"
+        ),
+        {"p": pid},
+    )
+    await db_session.flush()
+    todo_col = await _scalar(db_session, "SELECT id FROM board_columns WHERE project_id=:p AND name='Todo'", p=pid)
+    doing_col = await _scalar(db_session, "SELECT id FROM board_columns WHERE project_id=:p AND name='Doing'", p=pid)
+
+    async def counts():
+        return (
+            await _scalar(db_session, "SELECT task_count FROM board_columns WHERE id=:c", c=todo_col),
+            await _scalar(db_session, "SELECT task_count FROM board_columns WHERE id=:c", c=doing_col),
+        )
+
+    repo = SqlAlchemyTaskRepository(db_session)
+    first = await repo.create(Task(title="c1", project_id=pid, column_id=todo_col))
+    await repo.create(Task(title="c2", project_id=pid, column_id=todo_col))
+    assert await counts() == (2, 0)
+
+    await repo.update(first.id, {"column_id": doing_col}, user_id=None)
+    assert await counts() == (1, 1)
+
+    await repo.delete(first.id)
+    assert await counts() == (1, 0)
+    assert await task_stats.recompute(db_session, [pid]) == 0
+
+    # Raw writes drift the counter; recompute repairs it.
+    await db_session.execute(
+        text("UPDATE tasks SET column_id=:d WHERE project_id=:p AND is_deleted=false"),
+        {"d": doing_col, "p": pid},
+    )
+    # project row (todo → in_progress) + both column counters
+    assert await task_stats.recompute(db_session, [pid]) == 3
+    assert await counts() == (0, 1)
@@ -0,0 +1,56 @@
+"""SqlAlchemySearchRepository against Postgres — matching, ranking, scoping."""
+import pytest
+from sqlalchemy import text
+
+from app.infrastructure.database.repositories.search_repo import SqlAlchemySearchRepository
+
+pytestmark = pytest.mark.requires_db
+
+
+async def _project(session, key: str, name: str) -> int:
+    await session.execute(
+        text(
+            "INSERT INTO projects (key, name, start_date, methodology, status) "
+            "VALUES (:k, :n, now(), 'KANBAN', 'ACTIVE')"
+        ),
+        {"k": key, "n": name},
+    )
+    return (await session.execute(text("SELECT id FROM projects WHERE key=:k"), {"k": key})).scalar()
+
+
+async def _task(session, pid: int, key: str, title: str, description: str = None) -> int:
+    await session.execute(
+        text(
+            "INSERT INTO tasks (project_id, task_key, title, description, is_deleted) "
+            "VALUES (:p, :k, :t, :d, false)"
+        ),
+        {"p": pid, "k": key, "t": title, "d": description},
+    )
+    return (await session.execute(text("SELECT id FROM tasks WHERE task_key=:k"), {"k": key})).scalar()
+
+
+@pytest.mark.asyncio
+async def test_search_matches_title_description_and_scopes_projects(db_session):
+    p1 = await _project(db_session, "SRCHA", "Searchable Alpha")
+    p2 = await _project(db_session, "SRCHB", "Searchable Beta")
+    exact = await _task(db_session, p1, "SRCHA-1", "Zyxwv login flow")
+    body_only = await _task(db_session, p1, "SRCHA-2", "Unrelated", "the zyxwv token expired")
+    await _task(db_session, p2, "SRCHB-1", "Zyxwv in another project")
+    await db_session.flush()
+
+    repo = SqlAlchemySearchRepository(db_session)
+    hits = await repo.search(["zyxwv"], ("task",), accessible_project_ids=[p1])
+
+    assert [h.id for h in hits] == [exact, body_only]  # title hit outranks body hit
+    assert all(h.project_id == p1 for h in hits)
+    assert await repo.search(["zyxwv"], ("task",), accessible_project_ids=[]) == []
+
+
+@pytest.mark.asyncio
+async def test_search_finds_projects_by_name_and_key(db_session):
+    pid = await _project(db_session, "QWERTP", "Qwertyish Portal")
+    await db_session.flush()
+
+    hits = await SqlAlchemySearchRepository(db_session).search(["qwertp"], ("project",), None)
+
+    assert [(h.kind, h.id, h.score >= 1.0) for h in hits] == [("project", pid, True)]
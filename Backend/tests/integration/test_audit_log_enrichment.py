@@ -142,8 +142,8 @@ class FakeCommentRepo:
 class FakeTaskRepo:
     """Returns a stub Task so the use case can read task_key / title.
 
-    Mirrors the ITaskRepository.get_by_id signature. We only implement the
-    method exercised by the comment audit metadata builder.
+    Mirrors the ITaskRepository.get_by_id / get_audit_identity signatures —
+    the methods exercised by the comment audit metadata builder.
     """
 
     def __init__(self, task_key: str = "TEST-1", title: str = "Test task"):
@@ -157,6 +157,9 @@ class FakeTaskRepo:
             "title": self.title,
         })()
 
+    async def get_audit_identity(self, task_id: int):
+        return {"task_key": self.task_key, "title": self.title, "project_id": None}
+
 
 # ---------------------------------------------------------------------------
 # Test 1: post-Plan-14-09 enrichment writes the full D-D2 metadata envelope
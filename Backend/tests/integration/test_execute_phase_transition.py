@@ -52,6 +52,14 @@ class FakeTaskRepo:
     async def list_by_project_and_phase(self, project_id: int, phase_id: str):
         return []  # No tasks → no criteria evaluation, no moves
 
+    async def phase_task_counts(self, project_id, phase_id, include_unphased=False):
+        return {"total": 0, "done": 0, "critical_open": 0, "blocked": 0}
+
+    async def apply_phase_transition_moves(
+        self, project_id, source_phase_id, target_phase_id, action, exceptions,
+    ):
+        return 0
+
 
 class FakeAuditRepo:
     def __init__(self):
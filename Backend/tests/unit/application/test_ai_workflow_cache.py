@@ -0,0 +1,86 @@
+"""ai_workflow_cache — content keys, TTL/LRU bounds, coalesced streams."""
+import asyncio
+
+import pytest
+
+from app.application.dtos.ai_workflow_dto import LifecycleFormDTO, TaskStatusFormDTO
+from app.application.services import ai_workflow_cache
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    ai_workflow_cache.reset_for_tests()
+    yield
+    ai_workflow_cache.reset_for_tests()
+
+
+def test_key_is_canonical_over_field_order_and_defaults():
+    a = LifecycleFormDTO(team_size=5, risk_profile="low")
+    b = LifecycleFormDTO.model_validate({"risk_profile": "low", "team_size": 5, "multi_team": False})
+    assert ai_workflow_cache.make_key(a, "tr", "m") == ai_workflow_cache.make_key(b, "tr", "m")
+
+
+def test_key_separates_form_kind_language_and_model():
+    form = LifecycleFormDTO()
+    keys = {
+        ai_workflow_cache.make_key(form, "tr", "m"),
+        ai_workflow_cache.make_key(form, "en", "m"),
+        ai_workflow_cache.make_key(form, "tr", "other"),
+        ai_workflow_cache.make_key(TaskStatusFormDTO(), "tr", "m"),
+        ai_workflow_cache.make_key(LifecycleFormDTO(team_size=6), "tr", "m"),
+    }
+    assert len(keys) == 5
+
+
+def test_entries_expire_and_evict_least_recently_used(monkeypatch):
+    monkeypatch.setattr(ai_workflow_cache, "MAX_ENTRIES", 2)
+    ai_workflow_cache.store("a", 1)
+    ai_workflow_cache.store("b", 2)
+    assert ai_workflow_cache.lookup("a") == 1  # "b" is now least recent
+    ai_workflow_cache.store("c", 3)
+    assert ai_workflow_cache.lookup("b") is None
+    assert ai_workflow_cache.is_served("a") and ai_workflow_cache.is_served("c")
+
+    monkeypatch.setattr(ai_workflow_cache, "TTL_SECONDS", -1)
+    assert ai_workflow_cache.lookup("a") is None
+    assert not ai_workflow_cache.is_served(None)
+
+
+async def test_concurrent_streams_share_one_producer():
+    calls = []
+    release = asyncio.Event()
+
+    async def produce():
+        calls.append(1)
+        yield "first"
+        await release.wait()
+        yield "second"
+
+    async def consume():
+        return [ev async for ev in ai_workflow_cache.shared_stream("k", produce)]
+
+    first = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    assert ai_workflow_cache.is_served("k")
+    second = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == ["first", "second"]
+    assert calls == [1]
+    assert not ai_workflow_cache.is_served("k")
+
+
+async def test_producer_errors_reach_every_subscriber():
+    async def produce():
+        yield "partial"
+        raise RuntimeError("upstream down")
+
+    async def consume():
+        seen = []
+        with pytest.raises(RuntimeError):
+            async for ev in ai_workflow_cache.shared_stream("k", produce):
+                seen.append(ev)
+        return seen
+
+    assert await asyncio.gather(consume(), consume()) == [["partial"], ["partial"]]
@@ -0,0 +1,145 @@
+"""D-44 ApplyProcessTemplateUseCase — batching, parallel scopes, lock retries."""
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.application.use_cases.apply_process_template import ApplyProcessTemplateUseCase
+from app.domain.exceptions import DomainError
+from app.domain.repositories.project_repository import IProjectRepository
+
+
+TEMPLATE = SimpleNamespace(
+    id=9,
+    default_workflow={"mode": "sequential-locked", "nodes": [], "edges": [], "groups": []},
+    default_phase_criteria={"nd_A": {"auto": {"all_tasks_done": True}}},
+)
+
+
+class FakeTemplateRepo:
+    def __init__(self, template=TEMPLATE):
+        self.template = template
+
+    async def get_by_id(self, template_id):
+        return self.template
+
+
+class FakeProjectRepo:
+    """Applies every batch; ``locked_rounds[pid]`` = passes the lock stays held."""
+
+    def __init__(self, locked_rounds=None, missing=(), fail_on=None):
+        self.locked_rounds = dict(locked_rounds or {})
+        self.missing = set(missing)
+        self.fail_on = fail_on
+        self.batches = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def apply_template_batch(self, template_id, config_patch, lock_keys):
+        self.batches.append((template_id, config_patch, sorted(lock_keys)))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if self.fail_on is not None and self.fail_on in lock_keys:
+            raise RuntimeError("db down")
+        outcome = {"applied": [], "locked": [], "missing": []}
+        for pid in lock_keys:
+            if pid in self.missing:
+                outcome["missing"].append(pid)
+            elif self.locked_rounds.get(pid, 0) > 0:
+                self.locked_rounds[pid] -= 1
+                outcome["locked"].append(pid)
+            else:
+                outcome["applied"].append(pid)
+        return outcome
+
+
+def _use_case(repo, scoped=False, **kw):
+    scope = None
+    if scoped:
+        @asynccontextmanager
+        async def scope():
+            yield repo
+    kw.setdefault("retry_delay_s", 0)
+    return ApplyProcessTemplateUseCase(repo, FakeTemplateRepo(), repo_scope=scope, **kw)
+
+
+async def test_batches_share_one_config_patch():
+    repo = FakeProjectRepo()
+    result = await _use_case(repo, batch_size=2).execute(9, [1, 2, 3, 2])
+    assert result == {"applied": [1, 2, 3], "failed": [], "require_pm_approval": False}
+    assert [ids for _, _, ids in repo.batches] == [[1, 2], [3]]
+    _, patch, _ = repo.batches[0]
+    assert patch == {
+        "phase_workflow": TEMPLATE.default_workflow,
+        "phase_completion_criteria": TEMPLATE.default_phase_criteria,
+        "schema_version": 2,
+    }
+    assert patch["phase_workflow"] is not TEMPLATE.default_workflow
+
+
+async def test_scoped_batches_run_in_parallel_under_the_cap():
+    repo = FakeProjectRepo()
+    uc = _use_case(repo, scoped=True, batch_size=1, concurrency=3)
+    result = await uc.execute(9, list(range(1, 11)))
+    assert sorted(result["applied"]) == list(range(1, 11))
+    assert repo.peak_in_flight == 3
+
+
+async def test_locked_projects_retry_in_a_later_pass():
+    repo = FakeProjectRepo(locked_rounds={2: 1})
+    calls = []
+    result = await _use_case(repo, lock_retries=3).execute(9, [1, 2, 3], progress=calls.append)
+    assert result["applied"] == [1, 3, 2]
+    assert result["failed"] == []
+    assert [ids for _, _, ids in repo.batches] == [[1, 2, 3], [2]]
+    assert calls == [2, 3]
+
+
+async def test_still_locked_after_retries_times_out():
+    repo = FakeProjectRepo(locked_rounds={2: 5})
+    result = await _use_case(repo, lock_retries=2).execute(9, [1, 2])
+    assert result["applied"] == [1]
+    assert result["failed"] == [{"project_id": 2, "error": "advisory_lock_timeout"}]
+
+
+async def test_missing_projects_and_failed_batches_are_reported_per_project():
+    repo = FakeProjectRepo(missing={4}, fail_on=1)
+    result = await _use_case(repo, scoped=True, batch_size=2).execute(9, [1, 2, 3, 4])
+    assert result["applied"] == [3]
+    assert result["failed"] == [
+        {"project_id": 1, "error": "db down"},
+        {"project_id": 2, "error": "db down"},
+        {"project_id": 4, "error": "project_not_found"},
+    ]
+
+
+async def test_unknown_template_raises():
+    uc = ApplyProcessTemplateUseCase(FakeProjectRepo(), FakeTemplateRepo(template=None))
+    with pytest.raises(DomainError):
+        await uc.execute(9, [1])
+
+
+async def test_interface_default_merges_through_update():
+    class EntityRepo:
+        def __init__(self):
+            self.updated = []
+
+        async def get_by_id(self, pid):
+            if pid == 2:
+                return None
+            return SimpleNamespace(id=pid, process_template_id=None, process_config={"keep": 1})
+
+        async def update(self, project):
+            self.updated.append(project)
+
+    repo = EntityRepo()
+    outcome = await IProjectRepository.apply_template_batch(
+        repo, 9, {"schema_version": 2}, {1: 11, 2: 22},
+    )
+    assert outcome == {"applied": [1], "locked": [], "missing": [2]}
+    (project,) = repo.updated
+    assert project.process_template_id == 9
+    assert project.process_config == {"keep": 1, "schema_version": 2}
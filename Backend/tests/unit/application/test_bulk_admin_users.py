@@ -0,0 +1,158 @@
+"""Set-based bulk invite / bulk action — batch I/O shape and per-row outcomes.
+
+Repositories are AsyncMocks; the tests pin that a batch costs a fixed number
+of repository calls (one IN lookup, one multi-row insert per chunk, one
+UPDATE) while per-row failures are still reported individually.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.dtos.admin_user_dtos import BulkActionRequestDTO, BulkInviteRequestDTO
+from app.application.services import bulk_job_registry
+from app.application.use_cases.bulk_action_user import BulkActionUserUseCase
+from app.application.use_cases.bulk_invite_user import BulkInviteUserUseCase
+from app.application.use_cases.invite_user import InviteUserUseCase
+from app.domain.entities.user import User
+
+
+def _invite_uc(existing=()):
+    user_repo = MagicMock()
+    user_repo.get_existing_emails = AsyncMock(return_value=set(existing))
+
+    async def create_many(users):
+        return [u.model_copy(update={"id": 100 + i}) for i, u in enumerate(users)]
+
+    user_repo.create_many = AsyncMock(side_effect=create_many)
+    pwd_repo = MagicMock()
+    pwd_repo.create_many = AsyncMock()
+    audit_repo = MagicMock()
+    audit_repo.create_many_with_metadata = AsyncMock()
+    security = MagicMock()
+    security.get_password_hash = MagicMock(return_value="$2b$hash")
+    return InviteUserUseCase(user_repo, pwd_repo, audit_repo, security)
+
+
+def _rows(*emails):
+    return BulkInviteRequestDTO(rows=[{"email": e, "role": "Member"} for e in emails])
+
+
+@pytest.mark.asyncio
+async def test_bulk_invite_validates_up_front_and_writes_in_chunks():
+    invite = _invite_uc(existing={"taken@example.com"})
+    seen_progress = []
+    resolver = AsyncMock(return_value=3)
+
+    result = await BulkInviteUserUseCase(invite, chunk_size=2).execute(
+        _rows("a@example.com", "taken@example.com", "b@example.com", "a@example.com", "c@example.com"),
+        admin_id=1,
+        role_id_resolver=resolver,
+        progress=seen_progress.append,
+    )
+
+    assert [s.email for s in result.successful] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert [(f.row_number, f.email) for f in result.failed] == [(2, "taken@example.com"), (4, "a@example.com")]
+    invite.user_repo.get_existing_emails.assert_awaited_once()
+    resolver.assert_awaited_once_with("Member")
+    assert invite.security.get_password_hash.call_count == 3
+    # 3 valid rows / chunk_size 2 → two multi-row writes, each committing its audit rows
+    assert invite.user_repo.create_many.await_count == 2
+    assert invite.audit_repo.create_many_with_metadata.await_count == 2
+    assert seen_progress == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_bulk_invite_failed_chunk_reports_every_row():
+    invite = _invite_uc()
+    invite.user_repo.create_many = AsyncMock(side_effect=RuntimeError("duplicate key value\nDETAIL: ..."))
+
+    result = await BulkInviteUserUseCase(invite).execute(_rows("a@example.com", "b@example.com"), admin_id=1)
+
+    assert result.successful == []
+    assert [f.errors for f in result.failed] == [["duplicate key value"]] * 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_invite_rolls_back_a_failed_chunk_before_the_next():
+    invite = _invite_uc()
+    invite.password_reset_repo.create_many = AsyncMock(side_effect=[RuntimeError("boom"), None])
+    rollback = AsyncMock()
+
+    result = await BulkInviteUserUseCase(invite, chunk_size=1, rollback=rollback).execute(
+        _rows("a@example.com", "b@example.com"), admin_id=1,
+    )
+
+    rollback.assert_awaited_once()
+    assert [s.email for s in result.successful] == ["b@example.com"]
+    assert [(f.email, f.errors) for f in result.failed] == [("a@example.com", ["boom"])]
+    assert invite.audit_repo.create_many_with_metadata.await_count == 1
+
+
+def _action_uc(users):
+    user_repo = MagicMock()
+    user_repo.get_by_ids = AsyncMock(return_value=users)
+    user_repo.set_active_many = AsyncMock()
+    user_repo.update_role_many = AsyncMock()
+    audit_repo = MagicMock()
+    audit_repo.create_many_with_metadata = AsyncMock()
+    role_repo = MagicMock()
+    role_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(id=7, name="Project Manager"))
+    return BulkActionUserUseCase(user_repo, role_repo, audit_repo), user_repo, audit_repo
+
+
+def _user(uid):
+    return User(id=uid, email=f"u{uid}@example.com", password_hash="x", full_name=f"U{uid}")
+
+
+@pytest.mark.asyncio
+async def test_bulk_deactivate_is_one_update_and_one_audit_insert():
+    uc, user_repo, audit_repo = _action_uc([_user(2), _user(3)])
+
+    result = await uc.execute(BulkActionRequestDTO(user_ids=[2, 3, 404], action="deactivate"), admin_id=1)
+
+    assert (result.success_count, result.failed_count) == (2, 1)
+    assert result.results[2].status == "failed"
+    user_repo.get_by_ids.assert_awaited_once_with([2, 3, 404])
+    user_repo.set_active_many.assert_awaited_once_with([2, 3], False)
+    entries = audit_repo.create_many_with_metadata.await_args.args[0]
+    assert [(e["entity_id"], e["action"]) for e in entries] == [(2, "deactivated"), (3, "deactivated")]
+
+
+@pytest.mark.asyncio
+async def test_bulk_role_change_skips_self_only():
+    uc, user_repo, audit_repo = _action_uc([_user(1), _user(2)])
+
+    result = await uc.execute(
+        BulkActionRequestDTO(user_ids=[1, 2], action="role_change", payload={"role_id": 7}),
+        admin_id=1,
+    )
+
+    assert [r.status for r in result.results] == ["failed", "success"]
+    user_repo.update_role_many.assert_awaited_once_with([2], 7)
+    assert audit_repo.create_many_with_metadata.await_args.args[0][0]["metadata"]["target_role_name"] == "Project Manager"
+
+
+@pytest.mark.asyncio
+async def test_bulk_role_change_unknown_role_writes_nothing():
+    uc, user_repo, _ = _action_uc([_user(2)])
+    uc.role_repo.get_by_id = AsyncMock(return_value=None)
+
+    result = await uc.execute(
+        BulkActionRequestDTO(user_ids=[2], action="role_change", payload={"role_id": 99}),
+        admin_id=1,
+    )
+
+    assert result.failed_count == 1
+    user_repo.update_role_many.assert_not_called()
+
+
+def test_bulk_job_registry_tracks_progress_and_result():
+    bulk_job_registry.reset_for_tests()
+    job = bulk_job_registry.create("bulk_invite", owner_id=1, total=10)
+    bulk_job_registry.report_progress(job.job_id, 4)
+    assert (bulk_job_registry.get(job.job_id).status, bulk_job_registry.get(job.job_id).processed) == ("running", 4)
+
+    bulk_job_registry.complete(job.job_id, {"successful": [], "failed": []})
+    done = bulk_job_registry.get(job.job_id)
+    assert (done.status, done.processed, done.result) == ("completed", 10, {"successful": [], "failed": []})
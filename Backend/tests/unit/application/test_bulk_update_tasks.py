@@ -0,0 +1,240 @@
+"""BulkUpdateTasksUseCase — one repo write per batch, checks once per target.
+
+Pins the bulk contract: access is checked per project, WIP is evaluated
+against ``current + incoming`` with a single grouped count, edge validation
+runs once per distinct move, and any violation rejects the whole batch before
+``bulk_update`` is reached.
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.dtos.task_dtos import BulkTaskUpdateDTO
+from app.application.services.bulk_task_notifier import BulkTaskNotifier
+from app.application.services.notification_service import (
+    PendingNotification,
+    PollingNotificationService,
+)
+from app.application.use_cases.manage_tasks import BulkUpdateTasksUseCase
+from app.domain.entities.board_column import BoardColumn
+from app.domain.entities.notification import NotificationType
+from app.domain.entities.notification_preference import NotificationPreference
+from app.domain.entities.project import Methodology, Project, ProjectStatus
+from app.domain.entities.task import Task, TaskPriority
+from app.domain.entities.user import User
+from app.domain.exceptions import (
+    InvalidColumnMoveError,
+    ProjectAccessDeniedError,
+    TaskNotFoundError,
+    WipLimitExceededError,
+)
+
+
+TODO = BoardColumn(id=1, project_id=1, name="To Do", order_index=0, exit_policy="edges_only")
+DOING = BoardColumn(id=2, project_id=1, name="Doing", order_index=1, wip_limit=3)
+DONE = BoardColumn(id=3, project_id=1, name="Done", order_index=2, is_terminal=True)
+
+
+def _project(*, enforce_wip=False, enforce_sequential=False, edges=None, doing_count=0) -> Project:
+    return Project(
+        id=1,
+        key="K",
+        name="P",
+        start_date=datetime(2026, 1, 1),
+        methodology=Methodology.KANBAN,
+        status=ProjectStatus.ACTIVE,
+        columns=[TODO, DOING.model_copy(update={"task_count": doing_count}), DONE],
+        process_config={
+            "schema_version": 2,
+            "task_workflow": {
+                "capabilities": {
+                    "enforce_wip_limits": enforce_wip,
+                    "enforce_sequential_dependencies": enforce_sequential,
+                },
+                "edges": edges or [],
+                "groups": [],
+            },
+        },
+    )
+
+
+def _task(task_id: int, column: BoardColumn = TODO) -> Task:
+    return Task(
+        id=task_id,
+        title=f"T{task_id}",
+        priority=TaskPriority.MEDIUM,
+        project_id=1,
+        column_id=column.id,
+        column=column,
+        is_recurring=False,
+        created_at=datetime(2026, 1, 1),
+    )
+
+
+def _moves(*task_ids: int, to: int) -> BulkTaskUpdateDTO:
+    return BulkTaskUpdateDTO(
+        updates=[{"task_id": tid, "changes": {"column_id": to}} for tid in task_ids]
+    )
+
+
+def _wire(tasks: list[Task], project: Project):
+    task_repo = MagicMock()
+    task_repo.get_by_ids = AsyncMock(return_value=tasks)
+
+    async def bulk_update(updates, user_id=None):
+        return [
+            t.model_copy(update=updates[t.id]) for t in tasks if t.id in updates
+        ]
+
+    task_repo.bulk_update = AsyncMock(side_effect=bulk_update)
+    project_repo = MagicMock()
+    project_repo.get_by_id_and_user = AsyncMock(return_value=project)
+    project_repo.get_by_id = AsyncMock(return_value=project)
+    return task_repo, project_repo
+
+
+@pytest.mark.asyncio
+async def test_bulk_move_writes_once_and_loads_project_once():
+    tasks = [_task(i) for i in (10, 11, 12)]
+    task_repo, project_repo = _wire(tasks, _project())
+
+    result = await BulkUpdateTasksUseCase(task_repo, project_repo).execute(
+        _moves(10, 11, 12, to=2), user_id=99
+    )
+
+    assert [r.column_id for r in result] == [2, 2, 2]
+    task_repo.bulk_update.assert_awaited_once()
+    assert task_repo.bulk_update.await_args.args[0] == {
+        10: {"column_id": 2}, 11: {"column_id": 2}, 12: {"column_id": 2}
+    }
+    project_repo.get_by_id_and_user.assert_awaited_once_with(1, 99)
+
+
+@pytest.mark.asyncio
+async def test_bulk_wip_checks_incoming_tasks_against_column_counter():
+    """limit=3, 1 already in Doing: 2 incoming fit, 3 incoming do not."""
+    project = _project(enforce_wip=True, doing_count=1)
+    task_repo, project_repo = _wire([_task(10), _task(11)], project)
+    await BulkUpdateTasksUseCase(task_repo, project_repo).execute(_moves(10, 11, to=2), user_id=99)
+
+    task_repo, project_repo = _wire([_task(10), _task(11), _task(12)], project)
+    with pytest.raises(WipLimitExceededError) as ei:
+        await BulkUpdateTasksUseCase(task_repo, project_repo).execute(
+            _moves(10, 11, 12, to=2), user_id=99
+        )
+    assert (ei.value.column_id, ei.value.limit, ei.value.current) == (2, 3, 1)
+    task_repo.bulk_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_wip_discounts_tasks_leaving_the_target_column():
+    """Doing is full (3/3) but one of its tasks moves to Done in the same batch."""
+    project = _project(enforce_wip=True, doing_count=3)
+    leaving = _task(20, column=DOING)
+    task_repo, project_repo = _wire([leaving, _task(10)], project)
+    dto = BulkTaskUpdateDTO(
+        updates=[
+            {"task_id": 20, "changes": {"column_id": 3}},
+            {"task_id": 10, "changes": {"column_id": 2}},
+        ]
+    )
+    await BulkUpdateTasksUseCase(task_repo, project_repo).execute(dto, user_id=99)
+    task_repo.bulk_update.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_edge_violation_rejects_whole_batch():
+    project = _project(enforce_sequential=True, edges=[{"source": 1, "target": 2}])
+    task_repo, project_repo = _wire([_task(10), _task(11)], project)
+
+    with pytest.raises(InvalidColumnMoveError) as ei:
+        await BulkUpdateTasksUseCase(task_repo, project_repo).execute(_moves(10, 11, to=3), user_id=99)
+
+    assert (ei.value.from_id, ei.value.to_id) == (1, 3)
+    task_repo.bulk_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_missing_task_and_foreign_project_are_rejected():
+    task_repo, project_repo = _wire([_task(10)], _project())
+    with pytest.raises(TaskNotFoundError):
+        await BulkUpdateTasksUseCase(task_repo, project_repo).execute(_moves(10, 404, to=2), user_id=99)
+
+    project_repo.get_by_id_and_user = AsyncMock(return_value=None)
+    with pytest.raises(ProjectAccessDeniedError):
+        await BulkUpdateTasksUseCase(task_repo, project_repo).execute(_moves(10, to=2), user_id=99)
+    task_repo.bulk_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_duplicate_task_ids_rejected():
+    task_repo, project_repo = _wire([_task(10)], _project())
+    with pytest.raises(ValueError):
+        await BulkUpdateTasksUseCase(task_repo, project_repo).execute(_moves(10, 10, to=2), user_id=99)
+
+
+@pytest.mark.asyncio
+async def test_notify_many_batches_preferences_and_insert():
+    notification_repo = MagicMock()
+    notification_repo.create_many = AsyncMock()
+    pref_repo = MagicMock()
+    pref_repo.get_by_users = AsyncMock(return_value={
+        2: NotificationPreference(user_id=2, preferences={"STATUS_CHANGE": {"in_app": False}}),
+    })
+    service = PollingNotificationService(notification_repo, pref_repo)
+
+    await service.notify_many([
+        PendingNotification(user_id=1, type=NotificationType.STATUS_CHANGE, message="a", actor_id=1),
+        PendingNotification(user_id=2, type=NotificationType.STATUS_CHANGE, message="b", actor_id=1),
+        PendingNotification(user_id=3, type=NotificationType.STATUS_CHANGE, message="c", actor_id=1),
+        PendingNotification(user_id=2, type=NotificationType.TASK_ASSIGNED, message="d", actor_id=1),
+    ])
+
+    pref_repo.get_by_users.assert_awaited_once_with([2, 3])
+    rows = notification_repo.create_many.await_args.args[0]
+    assert [(n.user_id, n.message) for n in rows] == [(3, "c"), (2, "d")]
+
+
+@pytest.mark.asyncio
+async def test_bulk_notifier_runs_inside_the_use_case_once_per_batch():
+    task_repo, project_repo = _wire([_task(10), _task(11), _task(12)], _project())
+    notification_service = MagicMock()
+    notification_service.notify_many = AsyncMock()
+    user_repo = MagicMock()
+    user_repo.get_by_id = AsyncMock(
+        return_value=User(id=5, email="ayse@example.com", password_hash="x", full_name="Ayse")
+    )
+    pref_repo = MagicMock()
+    pref_repo.get_by_users = AsyncMock(return_value={})
+    watchers_of = AsyncMock(return_value={10: [7, 99]})
+    send_email = AsyncMock()
+    fire_event = AsyncMock()
+    notifier = BulkTaskNotifier(
+        notification_service, user_repo, pref_repo, project_repo,
+        watchers_of=watchers_of, send_email=send_email, fire_event=fire_event,
+    )
+    actor = User(id=99, email="lead@example.com", password_hash="x", full_name="Lead")
+    dto = BulkTaskUpdateDTO(updates=[
+        {"task_id": 10, "changes": {"column_id": 2}},
+        {"task_id": 11, "changes": {"assignee_id": 5}},
+        {"task_id": 12, "changes": {"assignee_id": 5}},
+    ])
+
+    await BulkUpdateTasksUseCase(task_repo, project_repo, notifier=notifier).execute(
+        dto, user_id=99, actor=actor,
+    )
+    await asyncio.sleep(0)
+
+    watchers_of.assert_awaited_once_with([10])
+    pending = notification_service.notify_many.await_args.args[0]
+    assert [(n.user_id, n.type, n.related_entity_id) for n in pending] == [
+        (5, NotificationType.TASK_ASSIGNED, 11),
+        (5, NotificationType.TASK_ASSIGNED, 12),
+        (7, NotificationType.STATUS_CHANGE, 10),
+    ]
+    send_email.assert_awaited_once()
+    to_email, subject, _, body = send_email.await_args.args
+    assert (to_email, subject, body["task_title"]) == ("ayse@example.com", "SPMS: 2 göreve atandınız", "T11, T12")
+    assert sorted(call.args[1] for call in fire_event.await_args_list) == ["task.assigned", "task.status_changed"]
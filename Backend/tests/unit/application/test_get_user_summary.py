@@ -1,4 +1,4 @@
-"""API-03 / D-48 user summary use case — verify asyncio.gather is used (3 parallel queries)."""
+"""API-03 / D-48 user summary use case — independent reads fanned out via ParallelQueryExecutor."""
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from app.application.use_cases.get_user_summary import GetUserSummaryUseCase
@@ -68,3 +68,36 @@ async def test_exclude_archived_by_default():
     statuses_called = project_repo.list_by_member_and_status.call_args[0][1]
     assert "ARCHIVED" not in statuses_called
     assert "ACTIVE" in statuses_called
+
+
+@pytest.mark.asyncio
+async def test_executor_gives_each_read_its_own_branch_repos():
+    """With an open_branch executor every read runs on a separate repo bundle."""
+    from contextlib import asynccontextmanager
+    from app.application.services.parallel_queries import BranchRepos, ParallelQueryExecutor
+
+    bundles = []
+
+    @asynccontextmanager
+    async def open_branch():
+        project_repo = MagicMock()
+        project_repo.list_by_member_and_status = AsyncMock(return_value=[_mk_project()])
+        project_repo.count_by_member = AsyncMock(return_value=2)
+        task_repo = MagicMock()
+        task_repo.count_active_by_assignee = AsyncMock(return_value=4)
+        task_repo.count_completed_since = AsyncMock(return_value=9)
+        audit_repo = MagicMock()
+        audit_repo.get_recent_by_user = AsyncMock(return_value=[])
+        bundle = BranchRepos(project_repo=project_repo, audit_repo=audit_repo, task_repo=task_repo)
+        bundles.append(bundle)
+        yield bundle
+
+    request_repo = MagicMock()
+    uc = GetUserSummaryUseCase(
+        MagicMock(), request_repo, request_repo, request_repo,
+        executor=ParallelQueryExecutor(open_branch=open_branch),
+    )
+    resp = await uc.execute(user_id=5)
+    assert (resp.stats.active_tasks, resp.stats.completed_last_30d, resp.stats.project_count) == (4, 9, 2)
+    assert len(bundles) == 5
+    assert not request_repo.method_calls
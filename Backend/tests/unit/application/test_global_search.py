@@ -0,0 +1,69 @@
+"""GlobalSearchUseCase — scoping, cross-kind ranking and highlight spans."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.dtos.search_dtos import SearchHitDTO
+from app.application.use_cases.global_search import (
+    GlobalSearchUseCase,
+    highlight_spans,
+    make_snippet,
+)
+
+
+def _wire(hits):
+    search_repo = MagicMock()
+    search_repo.search = AsyncMock(return_value=hits)
+    project_repo = MagicMock()
+    project_repo.get_all = AsyncMock(return_value=[SimpleNamespace(id=3), SimpleNamespace(id=5)])
+    return search_repo, project_repo
+
+
+def test_highlight_spans_are_case_insensitive_and_merged():
+    assert highlight_spans("Login AUTH flow: authentication", ["auth", "login"]) == [(0, 5), (6, 10), (17, 21)]
+    assert highlight_spans("authauth", ["auth"]) == [(0, 8)]
+    assert highlight_spans("", ["auth"]) == []
+
+
+def test_snippet_is_a_window_around_the_first_hit():
+    body = "x " * 200 + "the oauth token expired " + "y " * 200
+    snippet = make_snippet(body, ["oauth"])
+    assert "oauth" in snippet and snippet.startswith("…") and snippet.endswith("…")
+    assert make_snippet("short body", ["oauth"]) == "short body"
+    assert make_snippet(None, ["oauth"]) is None
+
+
+@pytest.mark.asyncio
+async def test_non_admin_search_is_scoped_and_merged_by_score():
+    hits = [
+        SearchHitDTO(kind="task", id=1, title="Fix auth bug", project_id=3, score=0.4),
+        SearchHitDTO(kind="project", id=3, title="Auth service", project_id=3, score=0.9),
+        SearchHitDTO(kind="comment", id=8, title="Other", body="auth is flaky", project_id=5, task_id=2, score=0.1),
+    ]
+    search_repo, project_repo = _wire(hits)
+
+    result = await GlobalSearchUseCase(search_repo, project_repo).execute(
+        "the auth", user_id=7, is_admin=False, limit=2
+    )
+
+    search_repo.search.assert_awaited_once_with(
+        words=["auth"], kinds=("task", "project", "comment"), accessible_project_ids=[3, 5], limit=2
+    )
+    assert [(r.kind, r.id) for r in result.results] == [("project", 3), ("task", 1)]
+    assert result.results[1].title_highlights == [(4, 8)]
+
+
+@pytest.mark.asyncio
+async def test_admin_bypasses_scope_and_stop_words_short_circuit():
+    search_repo, project_repo = _wire([])
+    uc = GlobalSearchUseCase(search_repo, project_repo)
+
+    await uc.execute("deploy", user_id=1, is_admin=True, kinds=["task"])
+    assert search_repo.search.await_args.kwargs["accessible_project_ids"] is None
+    assert search_repo.search.await_args.kwargs["kinds"] == ("task",)
+    project_repo.get_all.assert_not_called()
+
+    search_repo.search.reset_mock()
+    assert (await uc.execute("to a", user_id=1, is_admin=False)).results == []
+    search_repo.search.assert_not_called()
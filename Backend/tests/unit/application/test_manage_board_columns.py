@@ -21,6 +21,7 @@ from app.application.dtos.board_column_dtos import (
 )
 from app.application.use_cases.manage_board_columns import (
     CreateColumnUseCase,
+    ListColumnsUseCase,
     SeedDefaultColumnsUseCase,
     UpdateColumnUseCase,
 )
@@ -66,9 +67,6 @@ class _InMemoryColumnRepo(IBoardColumnRepository):
     async def delete(self, column_id: int) -> None:
         self._rows.pop(column_id, None)
 
-    async def count_tasks(self, column_id: int) -> int:
-        return 0
-
 
 # --------------------------------------------------------------------------- #
 # 1. SeedDefaultColumnsUseCase wires the workflow-engine flags into seeded rows.
@@ -371,3 +369,18 @@ async def test_seed_default_legacy_shape_with_order_key_maps_to_order_index():
     assert by_name["C"].is_terminal is True
     assert by_name["B"].is_initial is False
     assert by_name["B"].is_terminal is False
+
+
+@pytest.mark.asyncio
+async def test_list_columns_reads_counter_and_wip_utilization_from_entities():
+    """task_count comes with the column rows — no per-column count query."""
+    repo = _InMemoryColumnRepo()
+    await repo.create(BoardColumn(project_id=9, name="Todo", order_index=0, task_count=7))
+    await repo.create(BoardColumn(project_id=9, name="Doing", order_index=1, wip_limit=4, task_count=3))
+
+    result = await ListColumnsUseCase(repo).execute(9)
+
+    assert [(c.name, c.task_count, c.wip_utilization) for c in result] == [
+        ("Todo", 7, None),
+        ("Doing", 3, 0.75),
+    ]
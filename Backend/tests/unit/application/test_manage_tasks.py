@@ -15,13 +15,15 @@ import pytest
 
 from app.application.dtos.task_dtos import TaskUpdateDTO
 from app.application.use_cases.manage_tasks import (
+    GetSubtaskSummaryUseCase,
+    GetTaskSubtreeUseCase,
     UpdateTaskUseCase,
     map_task_to_response_dto,
 )
 from app.domain.entities.board_column import BoardColumn
 from app.domain.entities.project import Methodology, Project, ProjectStatus
 from app.domain.entities.task import Task, TaskPriority
-from app.domain.exceptions import InvalidColumnMoveError, WipLimitExceededError
+from app.domain.exceptions import InvalidColumnMoveError, TaskNotFoundError, WipLimitExceededError
 
 
 def _mk_project(columns: list[BoardColumn]) -> Project:
@@ -428,14 +430,14 @@ def _mk_project_with_wip_workflow(
 async def test_wip_enforced_blocks_when_full():
     """Capability ON + wip_limit=2 + current=2 -> WipLimitExceededError, no update."""
     todo = BoardColumn(id=1, project_id=1, name="To Do", order_index=0, is_initial=True)
+    # Target column already holds 2 active tasks (limit reached) — the
+    # maintained counter arrives with project.columns.
     doing = BoardColumn(
-        id=2, project_id=1, name="Doing", order_index=1, wip_limit=2,
+        id=2, project_id=1, name="Doing", order_index=1, wip_limit=2, task_count=2,
     )
     project = _mk_project_with_wip_workflow(columns=[todo, doing], enforce_wip=True)
     existing = _mk_existing_task(column_id=1, column=todo, project=project)
     task_repo, project_repo = _wire_mocks(existing, project, doing)
-    # Target column already holds 2 active tasks (limit reached).
-    task_repo.count_tasks_in_column = AsyncMock(return_value=2)
 
     use_case = UpdateTaskUseCase(task_repo, project_repo)
     dto = TaskUpdateDTO(column_id=2)
@@ -447,30 +449,24 @@ async def test_wip_enforced_blocks_when_full():
     assert ei.value.column_name == "Doing"
     assert ei.value.limit == 2
     assert ei.value.current == 2
-    task_repo.count_tasks_in_column.assert_awaited_once_with(2, exclude_task_id=42)
     task_repo.update.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_wip_disabled_when_capability_off():
-    """Capability OFF -> count_tasks_in_column is NEVER queried; move succeeds.
+    """Capability OFF -> the WIP check is skipped; move succeeds.
 
-    Even with wip_limit=2 and a hypothetical current_count well above the
-    limit, the engine must bypass the WIP branch entirely. This is the
+    Even with wip_limit=2 and a column counter well above the limit, the engine must bypass the WIP branch entirely. This is the
     zero-regression contract that lets existing projects keep working until
     they explicitly opt into WIP enforcement.
     """
     todo = BoardColumn(id=1, project_id=1, name="To Do", order_index=0, is_initial=True)
     doing = BoardColumn(
-        id=2, project_id=1, name="Doing", order_index=1, wip_limit=2,
+        id=2, project_id=1, name="Doing", order_index=1, wip_limit=2, task_count=10,
     )
     project = _mk_project_with_wip_workflow(columns=[todo, doing], enforce_wip=False)
     existing = _mk_existing_task(column_id=1, column=todo, project=project)
     task_repo, project_repo = _wire_mocks(existing, project, doing)
-    # Make count_tasks_in_column return a tripwire value — if the code path
-    # accidentally calls it, this would still let the move through (count=10
-    # is far above the limit) so we additionally assert it was never awaited.
-    task_repo.count_tasks_in_column = AsyncMock(return_value=10)
 
     use_case = UpdateTaskUseCase(task_repo, project_repo)
     dto = TaskUpdateDTO(column_id=2)
@@ -478,7 +474,6 @@ async def test_wip_disabled_when_capability_off():
     result = await use_case.execute(task_id=42, dto=dto, user_id=99)
 
     assert result.column_id == 2
-    task_repo.count_tasks_in_column.assert_not_called()
     task_repo.update.assert_awaited_once()
 
 
@@ -492,12 +487,11 @@ async def test_wip_zero_means_unlimited():
     """
     todo = BoardColumn(id=1, project_id=1, name="To Do", order_index=0, is_initial=True)
     doing = BoardColumn(
-        id=2, project_id=1, name="Doing", order_index=1, wip_limit=0,
+        id=2, project_id=1, name="Doing", order_index=1, wip_limit=0, task_count=100,
     )
     project = _mk_project_with_wip_workflow(columns=[todo, doing], enforce_wip=True)
     existing = _mk_existing_task(column_id=1, column=todo, project=project)
     task_repo, project_repo = _wire_mocks(existing, project, doing)
-    task_repo.count_tasks_in_column = AsyncMock(return_value=100)
 
     use_case = UpdateTaskUseCase(task_repo, project_repo)
     dto = TaskUpdateDTO(column_id=2)
@@ -505,9 +499,8 @@ async def test_wip_zero_means_unlimited():
     result = await use_case.execute(task_id=42, dto=dto, user_id=99)
 
     assert result.column_id == 2
-    # The count IS queried (we entered the capability branch) but the engine
+    # We entered the capability branch with count=100, but the engine
     # short-circuits because limit==0; no exception is raised.
-    task_repo.count_tasks_in_column.assert_awaited_once_with(2, exclude_task_id=42)
     task_repo.update.assert_awaited_once()
 
 
@@ -516,7 +509,7 @@ async def test_wip_excludes_self_when_moving_within():
     """Same-column "move" -> the engine branch is skipped entirely.
 
     When dto.column_id == existing_task.column_id the use case must not
-    consult the engine OR the repo's count helper — otherwise a retitle
+    consult the engine — otherwise a retitle
     PATCH on a task sitting in a full column would fail with 409.
     """
     todo = BoardColumn(id=1, project_id=1, name="To Do", order_index=0, is_initial=True)
@@ -527,7 +520,6 @@ async def test_wip_excludes_self_when_moving_within():
     # Task already sits in "Doing" (the full column).
     existing = _mk_existing_task(column_id=2, column=doing, project=project)
     task_repo, project_repo = _wire_mocks(existing, project, doing)
-    task_repo.count_tasks_in_column = AsyncMock(return_value=1)
 
     use_case = UpdateTaskUseCase(task_repo, project_repo)
     # Same-column "move" — engine block must not be entered.
@@ -536,7 +528,6 @@ async def test_wip_excludes_self_when_moving_within():
     result = await use_case.execute(task_id=42, dto=dto, user_id=99)
 
     assert result.column_id == 2
-    task_repo.count_tasks_in_column.assert_not_called()
     task_repo.update.assert_awaited_once()
 
 
@@ -764,3 +755,51 @@ async def test_recurring_legacy_done_column_still_works():
     created = task_repo.create.await_args.args[0]
     assert created.is_recurring is True
     assert created.title == existing.title
+
+
+# ---------------------------------------------------------------------------
+# Subtask hierarchy — GetTaskSubtreeUseCase / GetSubtaskSummaryUseCase
+# ---------------------------------------------------------------------------
+
+
+async def test_subtree_maps_nested_nodes_with_status_and_done():
+    todo_col = BoardColumn(id=10, project_id=1, name="Todo", order_index=0)
+    done_col = BoardColumn(id=11, project_id=1, name="Bitti", order_index=1, is_terminal=True)
+    project = _mk_project(columns=[todo_col, done_col])
+
+    def node(task_id, column, key=None):
+        return Task(id=task_id, title=f"T{task_id}", project_id=1, column_id=column.id if column else None,
+                    column=column, project=project, task_key=key)
+
+    root = node(1, todo_col, key="K-1")
+    child = node(2, done_col)
+    grandchild = node(3, None, key="K-3")
+    child.subtasks.append(grandchild)
+    root.subtasks.append(child)
+
+    repo = MagicMock()
+    repo.get_subtree = AsyncMock(return_value=root)
+    dto = await GetTaskSubtreeUseCase(repo).execute(1, depth=2)
+
+    repo.get_subtree.assert_awaited_once_with(1, 2)
+    assert (dto.key, dto.status, dto.is_done) == ("K-1", "todo", False)
+    sub = dto.subtasks[0]
+    assert (sub.key, sub.status, sub.is_done) == ("K-2", "bitti", True)
+    assert (sub.subtasks[0].key, sub.subtasks[0].status, sub.subtasks[0].subtasks) == ("K-3", "todo", [])
+
+    repo.get_subtree = AsyncMock(return_value=None)
+    with pytest.raises(TaskNotFoundError):
+        await GetTaskSubtreeUseCase(repo).execute(99)
+
+
+async def test_subtask_summary_keeps_request_order_and_fills_zeros():
+    repo = MagicMock()
+    repo.subtask_summaries = AsyncMock(return_value={7: {"children": 2, "total": 3, "done": 1}})
+
+    rollups = await GetSubtaskSummaryUseCase(repo).execute(1, [5, 7, 5], depth=4)
+
+    repo.subtask_summaries.assert_awaited_once_with(1, [5, 7], 4)
+    assert [(r.parent_id, r.children, r.total, r.done, r.done_ratio) for r in rollups] == [
+        (5, 0, 0, 0, 0.0),
+        (7, 2, 3, 1, 0.3333),
+    ]
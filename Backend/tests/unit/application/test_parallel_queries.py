@@ -0,0 +1,112 @@
+"""ParallelQueryExecutor — per-branch scopes, concurrency cap, shared deadline."""
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.application.services.parallel_queries import ParallelQueryExecutor
+
+
+class _Scopes:
+    """open_branch stand-in recording how many scopes are open at once."""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.open_now = 0
+        self.peak = 0
+
+    @asynccontextmanager
+    async def open(self):
+        self.opened += 1
+        self.open_now += 1
+        self.peak = max(self.peak, self.open_now)
+        try:
+            yield self.opened
+        finally:
+            self.open_now -= 1
+            self.closed += 1
+
+
+@pytest.mark.asyncio
+async def test_shared_mode_runs_sequentially_on_shared_scope():
+    seen = []
+
+    async def branch(value, scope):
+        seen.append(scope)
+        return value
+
+    ex = ParallelQueryExecutor(shared="request-session")
+    result = await ex.run(lambda s: branch(1, s), lambda s: branch(2, s))
+    assert result == (1, 2)
+    assert seen == ["request-session", "request-session"]
+    assert ex.parallel is False
+
+
+@pytest.mark.asyncio
+async def test_branches_overlap_each_on_its_own_scope():
+    scopes = _Scopes()
+    both_started = asyncio.Barrier(2)
+
+    async def branch(scope):
+        await both_started.wait()  # deadlocks unless the branches really overlap
+        return scope
+
+    ex = ParallelQueryExecutor(open_branch=scopes.open, timeout_s=2)
+    first, second = await ex.run(branch, branch)
+    assert {first, second} == {1, 2}
+    assert scopes.closed == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_limits_open_scopes():
+    scopes = _Scopes()
+
+    async def branch(scope):
+        await asyncio.sleep(0.01)
+        return scope
+
+    ex = ParallelQueryExecutor(open_branch=scopes.open, max_concurrency=2)
+    result = await ex.run(*[branch] * 6)
+    assert len(result) == 6
+    assert scopes.peak == 2
+    assert scopes.closed == 6
+
+
+@pytest.mark.asyncio
+async def test_shared_deadline_cancels_and_closes_branches():
+    scopes = _Scopes()
+
+    async def slow(scope):
+        await asyncio.sleep(5)
+
+    ex = ParallelQueryExecutor(open_branch=scopes.open, timeout_s=0.05)
+    with pytest.raises(TimeoutError):
+        await ex.run(slow, slow)
+    assert scopes.open_now == 0
+
+
+@pytest.mark.asyncio
+async def test_first_failure_propagates_and_cancels_siblings():
+    scopes = _Scopes()
+    cancelled = []
+
+    async def boom(scope):
+        raise LookupError("branch failed")
+
+    async def slow(scope):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(scope)
+            raise
+
+    ex = ParallelQueryExecutor(open_branch=scopes.open)
+    with pytest.raises(LookupError, match="branch failed"):
+        await ex.run(slow, boom)
+    assert cancelled and scopes.open_now == 0
+
+
+def test_requires_open_branch_or_shared():
+    with pytest.raises(ValueError):
+        ParallelQueryExecutor()
@@ -55,15 +55,18 @@ def _mk_project(mode="flexible", extra_nodes=None, criteria=None, extra_edges=No
     )
 
 
-def _mk_mocks(project, lock_acquired=True, tasks=None):
+def _counts(total=0, done=0, critical_open=0, blocked=0):
+    return {"total": total, "done": done, "critical_open": critical_open, "blocked": blocked}
+
+
+def _mk_mocks(project, lock_acquired=True, counts=None, moved=0):
     project_repo = MagicMock()
     project_repo.get_by_id = AsyncMock(return_value=project)
     task_repo = MagicMock()
-    task_repo.list_by_project_and_phase = AsyncMock(return_value=tasks or [])
-    # Ayşe's d357b033 rewrote _apply_task_moves to use bulk_stamp_phase SQL
-    # UPDATE instead of per-row in-memory mutation. Stub as awaitable so the
-    # happy-path tests don't hit "MagicMock can't be awaited".
-    task_repo.bulk_stamp_phase = AsyncMock()
+    # Criteria and moves are evaluated in SQL — the use case only sees the
+    # aggregate counts and the moved-row count.
+    task_repo.phase_task_counts = AsyncMock(return_value=counts or _counts())
+    task_repo.apply_phase_transition_moves = AsyncMock(return_value=moved)
     audit_repo = MagicMock()
     audit_repo.create_with_metadata = AsyncMock()
     session = MagicMock()
@@ -135,12 +138,8 @@ async def test_archived_target_node_raises():
 @pytest.mark.asyncio
 async def test_criteria_unmet_raises_422_without_override():
     project = _mk_project(criteria={"nd_Src123DXYZ": {"auto": {"all_tasks_done": True}, "manual": []}})
-    # Set up one incomplete task
-    class FakeTask:
-        def __init__(self, tid, phase_id, status):
-            self.id = tid; self.phase_id = phase_id; self.status = status; self.priority = "MEDIUM"; self.sprint_id = None; self.column = None
-    tasks = [FakeTask(1, "nd_Src123DXYZ", "TODO"), FakeTask(2, "nd_Src123DXYZ", "DONE")]
-    project_repo, task_repo, audit_repo, session = _mk_mocks(project, tasks=tasks)
+    # One of two phase tasks is still open
+    project_repo, task_repo, audit_repo, session = _mk_mocks(project, counts=_counts(total=2, done=1))
     uc = ExecutePhaseTransitionUseCase(project_repo, task_repo, audit_repo, session)
     dto = PhaseTransitionRequestDTO(
         source_phase_id="nd_Src123DXYZ", target_phase_id="nd_Tgt456DXYZ",
@@ -148,18 +147,48 @@ async def test_criteria_unmet_raises_422_without_override():
     )
     with pytest.raises(CriteriaUnmetError) as ei:
         await uc.execute(1, dto, user_id=5)
-    assert any(c["check"] == "all_tasks_done" for c in ei.value.unmet_criteria)
+    assert any(
+        c["check"] == "all_tasks_done" and c["detail"] == "1/2 done"
+        for c in ei.value.unmet_criteria
+    )
+
+
+@pytest.mark.asyncio
+async def test_critical_and_blocker_criteria_use_aggregate_counts():
+    project = _mk_project(criteria={"nd_Src123DXYZ": {"auto": {
+        "all_tasks_done": True, "no_critical_tasks": True, "no_blockers": True,
+    }}})
+    project_repo, task_repo, audit_repo, session = _mk_mocks(
+        project, counts=_counts(total=3, done=3, critical_open=0, blocked=0),
+    )
+    uc = ExecutePhaseTransitionUseCase(project_repo, task_repo, audit_repo, session)
+    dto = PhaseTransitionRequestDTO(source_phase_id="nd_Src123DXYZ", target_phase_id="nd_Tgt456DXYZ")
+    await uc.execute(1, dto, user_id=5)
+    task_repo.phase_task_counts.assert_awaited_once_with(1, "nd_Src123DXYZ")
+
+    task_repo.phase_task_counts.return_value = _counts(total=3, done=1, critical_open=2, blocked=1)
+    with pytest.raises(CriteriaUnmetError) as ei:
+        await uc.execute(1, dto, user_id=5)
+    details = {c["check"]: c["detail"] for c in ei.value.unmet_criteria}
+    assert details["no_critical_tasks"] == "2 critical task(s) still open"
+    assert details["no_blockers"] == "1 task(s) blocked"
+
+
+@pytest.mark.asyncio
+async def test_no_auto_criteria_skips_count_query():
+    project = _mk_project(criteria={"nd_Src123DXYZ": {"auto": {}, "manual": []}})
+    project_repo, task_repo, audit_repo, session = _mk_mocks(project)
+    uc = ExecutePhaseTransitionUseCase(project_repo, task_repo, audit_repo, session)
+    dto = PhaseTransitionRequestDTO(source_phase_id="nd_Src123DXYZ", target_phase_id="nd_Tgt456DXYZ")
+    await uc.execute(1, dto, user_id=5)
+    task_repo.phase_task_counts.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_override_allowed_in_sequential_locked():
     """D-05: allow_override=true works even in sequential-locked mode."""
     project = _mk_project(mode="sequential-locked", criteria={"nd_Src123DXYZ": {"auto": {"all_tasks_done": True}}})
-    class FakeTask:
-        def __init__(self, tid, phase_id, status):
-            self.id = tid; self.phase_id = phase_id; self.status = status; self.priority = "MEDIUM"; self.sprint_id = None; self.column = None
-    tasks = [FakeTask(1, "nd_Src123DXYZ", "TODO")]
-    project_repo, task_repo, audit_repo, session = _mk_mocks(project, tasks=tasks)
+    project_repo, task_repo, audit_repo, session = _mk_mocks(project, counts=_counts(total=1, done=0))
     uc = ExecutePhaseTransitionUseCase(project_repo, task_repo, audit_repo, session)
     dto = PhaseTransitionRequestDTO(
         source_phase_id="nd_Src123DXYZ", target_phase_id="nd_Tgt456DXYZ",
@@ -173,11 +202,7 @@ async def test_override_allowed_in_sequential_locked():
 async def test_open_tasks_move_to_next_with_exceptions():
     """D-04: bulk move_to_next with per-task exception keep_in_source."""
     project = _mk_project()
-    class FakeTask:
-        def __init__(self, tid):
-            self.id = tid; self.phase_id = "nd_Src123DXYZ"; self.status = "DONE"; self.priority = "MEDIUM"; self.sprint_id = None; self.column = None
-    t1 = FakeTask(1); t2 = FakeTask(2)
-    project_repo, task_repo, audit_repo, session = _mk_mocks(project, tasks=[t1, t2])
+    project_repo, task_repo, audit_repo, session = _mk_mocks(project, moved=1)
     uc = ExecutePhaseTransitionUseCase(project_repo, task_repo, audit_repo, session)
     dto = PhaseTransitionRequestDTO(
         source_phase_id="nd_Src123DXYZ", target_phase_id="nd_Tgt456DXYZ",
@@ -185,10 +210,9 @@ async def test_open_tasks_move_to_next_with_exceptions():
         exceptions=[TaskException(task_id=2, action="keep_in_source")],
     )
     resp = await uc.execute(1, dto, user_id=5)
-    # Ayşe's d357b033 replaced in-memory `t.phase_id = target` mutation with a
-    # bulk SQL `task_repo.bulk_stamp_phase(ids, phase_id)` UPDATE, so the
-    # original in-memory assertions (`t1.phase_id == "nd_Tgt456DXYZ"`) no
-    # longer hold — Python objects aren't touched by SQL UPDATE. The bulk
-    # call IS asserted instead: only t1's id was moved (t2 kept by exception).
-    task_repo.bulk_stamp_phase.assert_any_await([1], "nd_Tgt456DXYZ")
+    # The moves are one set-based UPDATE in the repo; the use case passes the
+    # default action plus the per-task exception map straight through.
+    task_repo.apply_phase_transition_moves.assert_awaited_once_with(
+        1, "nd_Src123DXYZ", "nd_Tgt456DXYZ", "move_to_next", {2: "keep_in_source"},
+    )
     assert resp.moved_count == 1
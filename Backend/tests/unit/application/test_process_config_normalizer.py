@@ -1,6 +1,9 @@
 """BACK-03 / D-32 / D-33: process_config schema_version normalizer unit tests."""
 import pytest
 from app.domain.entities.project import (
+    Methodology,
+    Project,
+    ProjectStatus,
     _normalize_process_config,
     CURRENT_SCHEMA_VERSION,
     _MAX_MIGRATION_ITERATIONS,
@@ -402,3 +405,79 @@ def test_v1_to_v2_normalizer_is_strictly_idempotent():
     once = _normalize_process_config(v1)
     twice = _normalize_process_config(once)
     assert once == twice, "normalizer must be strictly idempotent"
+
+
+# ---------------------------------------------------------------------------
+# Persisted normalization: version-keyed fast path + write-back
+# ---------------------------------------------------------------------------
+
+
+def _orm_project(process_config):
+    from datetime import date
+    from app.infrastructure.database.models.project import ProjectModel
+    return ProjectModel(
+        id=7, key="ORM1", name="Orm", start_date=date(2026, 1, 1),
+        methodology=Methodology.SCRUM, status="ACTIVE", process_config=process_config,
+        columns=[],
+    )
+
+
+def test_current_orm_row_takes_the_fast_path(monkeypatch):
+    """A current config skips the migration chain entirely."""
+    import app.domain.entities.project as pmod
+    monkeypatch.setattr(pmod, "_normalize_process_config", lambda c: pytest.fail("migrated"))
+    cfg = {"schema_version": CURRENT_SCHEMA_VERSION, "phase_workflow": {"mode": "flexible"}}
+    project = Project.model_validate(_orm_project(cfg))
+    assert project.process_config == cfg
+    assert project.key == "ORM1" and project.status == ProjectStatus.ACTIVE
+
+
+def test_legacy_orm_row_is_migrated_from_entity_fields_only():
+    from app.infrastructure.database.models.board_column import BoardColumnModel
+    model = _orm_project({"methodology": "SCRUM"})
+    model.columns = [BoardColumnModel(
+        id=1, project_id=7, name="Done", order_index=0, wip_limit=0, category="done",
+        is_initial=False, is_terminal=True, entry_policy="any", exit_policy="any", task_count=0,
+    )]
+    project = Project.model_validate(model)
+    assert project.process_config["schema_version"] == CURRENT_SCHEMA_VERSION
+    assert project.process_config["methodology_legacy"] == "SCRUM"
+    assert project.id == 7
+    assert [(c.name, c.is_terminal, c.category) for c in project.columns] == [("Done", True, "done")]
+
+
+class _StaleConfigRepo:
+    def __init__(self, configs):
+        self.configs = dict(configs)
+        self.reads = []
+        self.writes = []
+
+    async def list_stale_process_configs(self, current_version, after_id=0, limit=500):
+        self.reads.append(after_id)
+        stale = sorted(
+            (pid, cfg) for pid, cfg in self.configs.items()
+            if pid > after_id and cfg.get("schema_version", 0) < current_version
+        )
+        return stale[:limit]
+
+    async def write_process_configs(self, configs, current_version):
+        self.writes.append(sorted(configs))
+        self.configs.update(configs)
+
+
+async def test_migrate_all_projects_writes_back_in_keyset_pages():
+    from app.application.services.process_config_normalizer import (
+        migrate_all_projects_to_current_schema,
+    )
+    repo = _StaleConfigRepo({
+        1: {"methodology": "SCRUM"},
+        2: {"schema_version": CURRENT_SCHEMA_VERSION},
+        3: {"schema_version": 1, "workflow": {"mode": "flexible"}},
+        4: {},
+    })
+    assert await migrate_all_projects_to_current_schema(repo, batch_size=2) == 3
+    assert repo.writes == [[1, 3], [4]]
+    assert repo.reads == [0, 3, 4]
+    assert all(c["schema_version"] == CURRENT_SCHEMA_VERSION for c in repo.configs.values())
+    # Idempotent: nothing left to rewrite.
+    assert await migrate_all_projects_to_current_schema(repo) == 0
@@ -96,7 +96,6 @@ def _wire(existing: Task, project: Project):
     task_repo.get_by_id = AsyncMock(return_value=existing)
     task_repo.update = AsyncMock(return_value=existing)
     task_repo.create = AsyncMock(return_value=existing)
-    task_repo.count_tasks_in_column = AsyncMock(return_value=0)
     task_repo.update_series = AsyncMock()
     project_repo = MagicMock()
     project_repo.get_by_id = AsyncMock(return_value=project)
@@ -5,7 +5,7 @@ from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
 from app.application.ports.security_port import ISecurityService
 from app.domain.exceptions import UserAlreadyExistsError
-from typing import Optional, List
+from typing import Optional, List, Set
 
 # --- Mocks (Test Doubles) ---
 
@@ -61,6 +61,26 @@ class MockUserRepository(IUserRepository):
                     affected.append(u.id)
         return affected
 
+    # Set-based admin operations (bulk invite / bulk action)
+    async def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        return [self.users[i] for i in user_ids if i in self.users]
+
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        known = {u.email for u in self.users.values()}
+        return {e for e in emails if e in known}
+
+    async def create_many(self, users: List[User]) -> List[User]:
+        return [await self.create(u) for u in users]
+
+    async def set_active_many(self, user_ids: List[int], is_active: bool) -> None:
+        for i in user_ids:
+            if i in self.users:
+                self.users[i].is_active = is_active
+
+    async def update_role_many(self, user_ids: List[int], role_id: int) -> None:
+        for i in user_ids:
+            await self.update_role(i, role_id)
+
 class MockSecurityService(ISecurityService):
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return plain_password == hashed_password.replace("hashed_", "")
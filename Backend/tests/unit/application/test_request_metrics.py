@@ -0,0 +1,133 @@
+"""Request instrumentation — route-template histograms, principal reuse, slow log.
+
+Drives RequestMetricsMiddleware through a throwaway FastAPI app (no DB) and
+the engine hook entry point ``record_query`` directly.
+"""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware.request_metrics import RequestMetricsMiddleware
+from app.api.query_budget import query_budget
+from app.application.services import request_metrics
+from app.infrastructure.config import settings
+
+
+def _principal():
+    request_metrics.set_principal(42)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}", dependencies=[Depends(_principal)])
+    async def get_item(item_id: int):
+        request_metrics.record_query("SELECT 1", 3.0, slow_threshold_ms=1000, rows=1)
+        request_metrics.record_query("SELECT\n  slow", 250.0, slow_threshold_ms=200, rows=40)
+        return {"id": item_id}
+
+    @app.get("/projects/{pid}/tasks")
+    @query_budget(3)
+    async def n_plus_one(pid: int):
+        request_metrics.record_query("SELECT * FROM tasks WHERE project_id = $1", 1.0, slow_threshold_ms=200)
+        for _ in range(4):
+            request_metrics.record_query("SELECT * FROM users WHERE id = $1", 1.0, slow_threshold_ms=200)
+        return []
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    request_metrics.reset_for_tests()
+    yield
+    request_metrics.reset_for_tests()
+
+
+def test_requests_are_grouped_by_route_template_with_db_counters():
+    client = TestClient(_app())
+    for item_id in (1, 2, 3):
+        assert client.get(f"/items/{item_id}").status_code == 200
+
+    routes = request_metrics.snapshot()["routes"]
+    assert [(r["method"], r["route"], r["count"]) for r in routes] == [("GET", "/items/{item_id}", 3)]
+    assert routes[0]["avg_db_queries"] == 2
+    assert routes[0]["avg_db_time_ms"] == 253.0
+    assert routes[0]["avg_db_rows"] == 41
+    assert sum(routes[0]["buckets"].values()) == 3
+
+
+def test_slow_queries_carry_route_and_normalised_statement():
+    TestClient(_app()).get("/items/7")
+
+    slow = request_metrics.snapshot()["slow_queries"]
+    assert [(q["route"], q["statement"]) for q in slow] == [("/items/{item_id}", "SELECT slow")]
+
+
+def test_slow_request_records_the_resolved_principal(monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_REQUEST_MS", 0.0)
+    TestClient(_app()).get("/items/7")
+
+    (entry,) = request_metrics.snapshot()["slow_requests"]
+    assert (entry["user_id"], entry["path"], entry["db_queries"], entry["db_rows"]) == (42, "/items/7", 2, 41)
+
+
+def test_errors_and_unmatched_paths_are_counted():
+    client = TestClient(_app(), raise_server_exceptions=False)
+    assert client.get("/boom").status_code == 500
+    assert client.get("/nope/123").status_code == 404
+
+    by_route = {r["route"]: r for r in request_metrics.snapshot()["routes"]}
+    assert by_route["/boom"]["errors"] == 1
+    assert by_route["<unmatched>"]["count"] == 1
+
+
+def test_queries_outside_a_request_use_the_process_counter():
+    request_metrics.record_query("SELECT 1", 1.0, slow_threshold_ms=200)
+    assert request_metrics.snapshot()["db_queries_outside_requests"] == 1
+
+
+def test_over_budget_requests_are_counted_and_sampled_ones_kept(monkeypatch):
+    client = TestClient(_app())
+    monkeypatch.setattr(settings, "QUERY_BUDGET_SAMPLE_RATE", 0.0)
+    client.get("/projects/1/tasks")
+    client.get("/items/1")  # unbudgeted
+    assert request_metrics.snapshot()["budget_violations"] == []
+
+    monkeypatch.setattr(settings, "QUERY_BUDGET_SAMPLE_RATE", 1.0)
+    client.get("/projects/1/tasks")
+
+    snap = request_metrics.snapshot()
+    by_route = {r["route"]: r for r in snap["routes"]}
+    assert by_route["/projects/{pid}/tasks"]["over_budget"] == 2
+    assert by_route["/items/{item_id}"]["over_budget"] == 0
+    (violation,) = snap["budget_violations"]
+    assert (violation["db_queries"], violation["budget"]) == (5, 3)
+    assert violation["repeated"] == [{"count": 4, "statement": "SELECT * FROM users WHERE id = $1"}]
+
+
+def test_default_budget_applies_to_unbudgeted_routes(monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_BUDGET_DEFAULT", 1)
+    monkeypatch.setattr(settings, "QUERY_BUDGET_SAMPLE_RATE", 1.0)
+    TestClient(_app()).get("/items/1")
+    (violation,) = request_metrics.snapshot()["budget_violations"]
+    assert (violation["route"], violation["budget"], violation["repeated"]) == ("/items/{item_id}", 1, [])
+
+
+def test_max_queries_fixture_enforces_route_budgets(max_queries):
+    client = TestClient(_app())
+    with max_queries(2) as captured:
+        client.get("/items/1")
+    assert captured.count == 2
+
+    with pytest.raises(AssertionError, match=r"ran 5 > 3"):
+        with max_queries():
+            client.get("/projects/1/tasks")
+    with pytest.raises(AssertionError, match=r"4x SELECT \* FROM users"):
+        with max_queries(3):
+            client.get("/projects/1/tasks")
@@ -0,0 +1,79 @@
+"""Teams page stats cache — TTL + invalidation on membership changes.
+
+Task-write invalidation lives in the counter path (tests/unit/infrastructure/test_task_stats.py).
+"""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.services import team_stats_cache
+from app.domain.entities.team import Team
+from app.domain.entities.user import User
+
+
+STATS = {
+    "total_teams": 2,
+    "total_members": 5,
+    "active_projects": 3,
+    "active_tasks": 7,
+    "completion_rate": 0.3,
+}
+
+
+def setup_function():
+    team_stats_cache.reset_for_tests()
+
+
+def _user(uid: int = 1) -> User:
+    return User(id=uid, email=f"u{uid}@example.com", password_hash="x", full_name="U")
+
+
+def test_lookup_returns_stored_value():
+    team_stats_cache.store(1, STATS)
+    assert team_stats_cache.lookup(1) == STATS
+
+
+def test_lookup_expires_after_ttl():
+    team_stats_cache.store(1, STATS)
+    team_stats_cache._cache[1].stored_at = datetime.utcnow() - timedelta(
+        seconds=team_stats_cache.TTL_SECONDS + 1
+    )
+    assert team_stats_cache.lookup(1) is None
+
+
+def test_lookup_returns_copy():
+    team_stats_cache.store(1, STATS)
+    team_stats_cache.lookup(1)["total_teams"] = 99
+    assert team_stats_cache.lookup(1)["total_teams"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stats_use_case_hits_repo_once_within_ttl():
+    from app.application.use_cases.manage_teams import GetTeamsStatsUseCase
+
+    team_repo = AsyncMock()
+    team_repo.get_stats_for_user = AsyncMock(return_value=dict(STATS))
+    uc = GetTeamsStatsUseCase(team_repo)
+
+    assert await uc.execute(_user()) == STATS
+    assert await uc.execute(_user()) == STATS
+    team_repo.get_stats_for_user.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_membership_change_invalidates_stats():
+    from app.application.use_cases.manage_teams import (
+        GetTeamsStatsUseCase,
+        RemoveTeamMemberUseCase,
+    )
+
+    team_repo = AsyncMock()
+    team_repo.get_stats_for_user = AsyncMock(return_value=dict(STATS))
+    team_repo.get_by_id = AsyncMock(return_value=Team(id=10, name="A", owner_id=1))
+
+    await GetTeamsStatsUseCase(team_repo).execute(_user())
+    await RemoveTeamMemberUseCase(team_repo).execute(_user(), team_id=10, user_id=2)
+    await GetTeamsStatsUseCase(team_repo).execute(_user())
+
+    assert team_repo.get_stats_for_user.await_count == 2
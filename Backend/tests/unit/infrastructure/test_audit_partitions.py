@@ -0,0 +1,89 @@
+"""audit_log project scope + monthly partition retention.
+
+Pure helpers, plus the partition DDL issued against a recording session.
+"""
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.database.util.audit_partitions import (
+    add_months,
+    ensure_partitions_for_range,
+    expired_partitions,
+    partition_name,
+)
+from app.infrastructure.database.util.audit_scope import project_id_clause, resolve_project_id
+
+
+def test_resolve_project_id_cheap_cases():
+    assert resolve_project_id("project", 7, None) == 7
+    assert resolve_project_id("task", 3, {"project_id": 9}) == 9
+    assert resolve_project_id("task", 3, {"project_id": "12"}) == 12
+    assert resolve_project_id("user", 3, {"project_id": True}) is None
+    assert resolve_project_id("role", 3, {}) is None
+
+
+def test_project_id_clause_embeds_a_lookup_subquery():
+    sql = str(project_id_clause("comment", 5, None).compile(dialect=postgresql.dialect()))
+    assert "FROM tasks JOIN comments ON comments.task_id = tasks.id" in sql
+    assert "milestones" in str(project_id_clause("milestone", 5, {}).compile(dialect=postgresql.dialect()))
+    assert project_id_clause("user", 5, {}) is None
+
+
+def test_partition_month_arithmetic():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2026, 3, 1)) == "audit_log_p202603"
+
+
+def test_expired_partitions_keep_the_retention_window():
+    names = ["audit_log_p202409", "audit_log_p202410", "audit_log_p202411", "audit_log_default"]
+    # 24 months before Oct 2026 → cutoff 2024-10-01: only Sep 2024 has fully expired.
+    assert expired_partitions(names, date(2026, 10, 19), 24) == ["audit_log_p202409"]
+    assert expired_partitions(names, date(2026, 10, 19), 1200) == []
+
+
+class RecordingSession:
+    """Answers the catalog / default-partition lookups, records everything."""
+
+    def __init__(self, attached, default_months=()):
+        self.attached = attached
+        self.default_months = list(default_months)
+        self.sql = []
+
+    async def execute(self, stmt):
+        sql = str(stmt)
+        self.sql.append(sql)
+        result = MagicMock()
+        if "pg_inherits" in sql:
+            result.all.return_value = [(name,) for name in self.attached]
+        elif "date_trunc" in sql:
+            result.all.return_value = [(m,) for m in self.default_months]
+        return result
+
+
+async def test_range_creates_only_missing_months():
+    session = RecordingSession(["audit_log_p202603", "audit_log_default"])
+    created = await ensure_partitions_for_range(session, date(2026, 2, 14), date(2026, 4, 2))
+    assert created == ["audit_log_p202602", "audit_log_p202604"]
+    assert not any("DETACH" in sql for sql in session.sql)
+
+
+async def test_range_moves_rows_stranded_in_the_default_partition():
+    session = RecordingSession(["audit_log_default"], default_months=[date(2025, 11, 1)])
+    created = await ensure_partitions_for_range(session, date(2025, 11, 3), date(2025, 12, 9))
+    assert created == ["audit_log_p202511", "audit_log_p202512"]
+
+    ddl = [sql for sql in session.sql if "pg_inherits" not in sql and "date_trunc" not in sql]
+    assert ddl[0] == "ALTER TABLE audit_log DETACH PARTITION audit_log_default"
+    assert "audit_log_p202511 PARTITION OF audit_log" in ddl[1]
+    moves = [sql for sql in ddl if sql.startswith("WITH moved")]
+    assert len(moves) == 1 and "'2025-11-01'" in moves[0] and "'2025-12-01'" in moves[0]
+    assert ddl[-1] == "ALTER TABLE audit_log ATTACH PARTITION audit_log_default DEFAULT"
+
+
+async def test_range_with_every_month_present_is_a_noop():
+    session = RecordingSession(["audit_log_p202603"])
+    assert await ensure_partitions_for_range(session, date(2026, 3, 1), date(2026, 3, 31)) == []
+    assert len(session.sql) == 1
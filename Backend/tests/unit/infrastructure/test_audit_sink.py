@@ -0,0 +1,184 @@
+"""Audit sink (app/infrastructure/database/util/audit_sink.py) — no DB.
+
+Sessions are AsyncMocks, so these tests cover row normalization, the
+in-transaction single INSERT, and the buffered sink's size / timer / close
+flush triggers and requeue-on-failure behaviour. The commit / rollback
+gating runs on a sync Session over in-memory SQLite (only its events matter).
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.util import audit_sink
+from app.infrastructure.database.util.audit_sink import (
+    BufferedAuditSink,
+    InTransactionAuditSink,
+    audit_values,
+)
+
+
+def _row(i=1, **extra):
+    return {"entity_type": "task", "entity_id": i, "action": "updated", "user_id": 7, **extra}
+
+
+class FakeSessionFactory:
+    """``async with factory() as session`` yielding one recording session."""
+
+    def __init__(self, fail_times=0, project_ids=(1,)):
+        self.session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(project_ids)
+        self.session.execute.return_value = result
+        self.fail_times = fail_times
+        self.opened = 0
+
+    def __call__(self):
+        factory = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                factory.opened += 1
+                if factory.fail_times:
+                    factory.fail_times -= 1
+                    raise ConnectionError("db down")
+                return factory.session
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Ctx()
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    audit_sink.reset_for_tests()
+    yield
+    audit_sink.reset_for_tests()
+
+
+def test_audit_values_normalizes_metadata_alias_and_defaults():
+    values = audit_values({**_row(), "metadata": {"project_id": 9}})
+    assert values["extra_metadata"] == {"project_id": 9}
+    assert values["project_id"] == 9
+    assert values["field_name"] == "transition"
+    assert values["old_value"] is None
+
+
+def test_audit_values_explicit_project_id_wins():
+    values = audit_values(_row(project_id=3, extra_metadata={"project_id": 9}))
+    assert values["project_id"] == 3
+
+
+def test_audit_values_falls_back_to_subquery():
+    values = audit_values(_row(42))
+    # A scalar subquery on tasks, embedded in the VALUES list.
+    assert "tasks" in str(values["project_id"])
+
+
+async def test_in_transaction_sink_issues_one_insert():
+    session = AsyncMock()
+    await InTransactionAuditSink().write(session, [_row(1), _row(2), _row(3)])
+    session.execute.assert_awaited_once()
+    session.commit.assert_not_called()
+
+
+async def test_in_transaction_sink_skips_empty_batches():
+    session = AsyncMock()
+    await InTransactionAuditSink().write(session, [])
+    session.execute.assert_not_called()
+
+
+async def test_buffered_sink_flushes_at_max_rows():
+    factory = FakeSessionFactory()
+    sink = BufferedAuditSink(factory, max_rows=3, max_delay_s=60)
+    await sink.write(None, [_row(1), _row(2)])
+    assert sink.pending == 2 and factory.opened == 0
+    await sink.write(None, [_row(3)])
+    await asyncio.sleep(0)
+    assert sink.pending == 0
+    # INSERT ... RETURNING project_id, then the change_version bump.
+    assert factory.session.execute.await_count == 2
+    factory.session.commit.assert_awaited_once()
+    await sink.close()
+
+
+async def test_buffered_sink_flushes_after_delay():
+    factory = FakeSessionFactory()
+    sink = BufferedAuditSink(factory, max_rows=100, max_delay_s=0.01)
+    await sink.write(None, [_row(1)])
+    await asyncio.sleep(0.05)
+    assert sink.pending == 0
+    factory.session.commit.assert_awaited_once()
+
+
+async def test_buffered_sink_stamps_event_time():
+    sink = BufferedAuditSink(FakeSessionFactory(), max_rows=100, max_delay_s=60)
+    await sink.write(None, [_row(1)])
+    assert sink._buffer[0]["timestamp"] is not None
+    await sink.close()
+
+
+async def test_close_flushes_pending_rows_in_max_row_batches():
+    factory = FakeSessionFactory()
+    sink = BufferedAuditSink(factory, max_rows=2, max_delay_s=60)
+    sink._buffer = [_row(i) for i in range(5)]
+    await sink.close()
+    assert sink.pending == 0
+    assert factory.session.execute.await_count == 3 + 1  # three INSERTs, one bump
+    factory.session.commit.assert_awaited_once()
+
+
+async def test_failed_flush_requeues_rows():
+    factory = FakeSessionFactory(fail_times=1)
+    sink = BufferedAuditSink(factory, max_rows=100, max_delay_s=60)
+    await sink.write(None, [_row(1), _row(2)])
+    assert await sink.flush() == 0
+    assert sink.pending == 2
+    assert await sink.flush() == 2
+    assert sink.pending == 0
+    await sink.close()
+
+
+async def test_shutdown_flushes_process_sink(monkeypatch):
+    factory = FakeSessionFactory()
+    monkeypatch.setattr(audit_sink.settings, "AUDIT_SINK_MODE", "buffered")
+    monkeypatch.setattr(
+        "app.infrastructure.database.database.AsyncSessionLocal", factory, raising=False
+    )
+    sink = audit_sink.get_audit_sink()
+    assert isinstance(sink, BufferedAuditSink)
+    await sink.write(None, [_row(1)])
+    await audit_sink.shutdown()
+    assert sink.pending == 0
+    factory.session.commit.assert_awaited_once()
+
+
+async def test_flush_bumps_change_version_of_flushed_projects():
+    factory = FakeSessionFactory(project_ids=(4, None, 4, 9))
+    sink = BufferedAuditSink(factory, max_rows=100, max_delay_s=60)
+    await sink.write(None, [_row(1), _row(2)])
+    await sink.flush()
+    bump = factory.session.execute.await_args_list[-1].args[0]
+    assert bump.table.name == "projects"
+    assert [4, 9] in bump.compile().params.values()
+    await sink.close()
+
+
+async def test_buffered_rows_wait_for_commit_and_die_with_rollback():
+    sink = BufferedAuditSink(FakeSessionFactory(), max_rows=100, max_delay_s=60)
+    with Session(create_engine("sqlite://")) as session:
+        session.execute(text("SELECT 1"))
+        await sink.write(session, [_row(1)])
+        assert sink.pending == 0
+        session.rollback()
+        assert sink.pending == 0
+
+        session.execute(text("SELECT 1"))
+        await sink.write(session, [_row(2), _row(3)])
+        assert sink.pending == 0
+        session.commit()
+    assert [r["entity_id"] for r in sink._buffer] == [2, 3]
+    await sink.close()
@@ -0,0 +1,67 @@
+"""Unit tests for the projects.change_version flush hooks (no DB).
+
+``_collect`` runs against an unbound ORM Session so session.new / dirty /
+deleted are real; ``_apply`` gets a fake session whose connection captures
+the bump statement.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models.audit_log import AuditLogModel
+from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.models.comment import CommentModel
+from app.infrastructure.database.models.task import TaskModel
+from app.infrastructure.database.util import change_version
+
+
+def _pending(session):
+    return (
+        session.info.get(change_version._PENDING_PROJECTS, set()),
+        session.info.get(change_version._PENDING_TASKS, set()),
+    )
+
+
+def test_collect_records_projects_and_comment_tasks():
+    session = Session()
+    session.add_all([
+        TaskModel(project_id=3, title="t"),
+        BoardColumnModel(project_id=4, name="Doing", order_index=1),
+        CommentModel(task_id=11, content="hi"),
+        AuditLogModel(entity_type="task", entity_id=1, action="created"),
+    ])
+    change_version._collect(session, None, None)
+    assert _pending(session) == ({3, 4}, {11})
+
+
+def test_apply_issues_one_bump_and_clears_pending():
+    session = MagicMock()
+    session.info = {
+        change_version._PENDING_PROJECTS: {5, 2},
+        change_version._PENDING_TASKS: {9},
+    }
+    change_version._apply(session, None)
+    stmt = session.connection.return_value.execute.call_args.args[0]
+    sql = str(stmt.compile())
+    assert sql.startswith("UPDATE projects SET change_version=(projects.change_version +")
+    assert "SELECT tasks.project_id" in sql
+    assert stmt.compile().params["id_1"] == [2, 5]
+    assert session.info == {}
+
+
+def test_apply_without_pending_writes_is_a_noop():
+    session = MagicMock()
+    session.info = {}
+    change_version._apply(session, None)
+    session.connection.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bump_skips_none_and_empty():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    await change_version.bump(session, [None])
+    session.execute.assert_not_awaited()
+    await change_version.bump(session, [7, None])
+    session.execute.assert_awaited_once()
@@ -0,0 +1,113 @@
+"""Workload-class pools (database.py + util/pool_metrics.py) — no Postgres.
+
+Pool counters run against a file-backed aiosqlite engine with a one-slot
+pool. The read-session routing tests swap the session factories for fakes
+to cover the replica fallback and retry window.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infrastructure.config import settings
+from app.infrastructure.database import database
+from app.infrastructure.database.util import pool_metrics
+
+
+@pytest.fixture
+async def one_slot_engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    yield engine
+    await engine.dispose()
+    pool_metrics._counters.pop("test", None)
+
+
+async def test_pool_metrics_report_saturation(one_slot_engine):
+    pool_metrics.install_pool_listeners("test", one_slot_engine)
+    async with one_slot_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        live = pool_metrics.snapshot({"test": one_slot_engine})["test"]
+        assert live["capacity"] == 1
+        assert live["in_use"] == 1
+        assert live["utilization"] == 1.0
+    stats = pool_metrics.snapshot({"test": one_slot_engine})["test"]
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["peak_in_use"] == 1
+    assert stats["saturated_checkouts"] == 1
+
+    pool_metrics.reset()
+    assert pool_metrics.snapshot({"test": one_slot_engine})["test"]["checkouts"] == 0
+
+
+def test_engines_are_split_by_workload():
+    assert database.ENGINES["oltp"] is database.engine
+    assert database.ENGINES["analytics"] is not database.engine
+    assert database.analytics_engine.sync_engine.pool.size() == settings.DB_ANALYTICS_POOL_SIZE
+    assert database.engine.sync_engine.pool.size() == settings.DB_POOL_SIZE
+
+
+class FakeSession:
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+        self.closed = False
+
+    async def connection(self):
+        if self.fail:
+            raise OSError("connection refused")
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def read_routing(monkeypatch):
+    opened = []
+
+    def factory(name, fail=False):
+        def open_session():
+            session = FakeSession(name, fail)
+            opened.append(session)
+            return session
+        return open_session
+
+    monkeypatch.setattr(database, "AnalyticsSessionLocal", factory("analytics"))
+    monkeypatch.setattr(database, "_replica_down_until", 0.0)
+    return factory, opened
+
+
+async def _read_session_name():
+    gen = database.get_read_session()
+    session = await gen.__anext__()
+    await gen.aclose()
+    assert session.closed
+    return session.name
+
+
+async def test_read_session_uses_analytics_pool_without_replica(monkeypatch, read_routing):
+    monkeypatch.setattr(database, "ReplicaSessionLocal", None)
+    assert await _read_session_name() == "analytics"
+
+
+async def test_read_session_prefers_replica(monkeypatch, read_routing):
+    factory, _ = read_routing
+    monkeypatch.setattr(database, "ReplicaSessionLocal", factory("replica"))
+    assert await _read_session_name() == "replica"
+
+
+async def test_unreachable_replica_falls_back_and_is_skipped(monkeypatch, read_routing):
+    factory, opened = read_routing
+    monkeypatch.setattr(database, "ReplicaSessionLocal", factory("replica", fail=True))
+    assert await _read_session_name() == "analytics"
+    assert opened[0].name == "replica" and opened[0].closed
+
+    # Within DB_READ_RETRY_S the replica is not tried again.
+    opened.clear()
+    assert await _read_session_name() == "analytics"
+    assert [s.name for s in opened] == ["analytics"]
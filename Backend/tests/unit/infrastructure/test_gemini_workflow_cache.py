@@ -0,0 +1,135 @@
+"""GeminiWorkflowAdapter generation cache + coalescing, and the quota skip.
+
+The SDK client is replaced by a fake ``aio.models.generate_content`` that
+counts calls; pacing sleeps are recorded instead of awaited.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.genai")
+
+from app.api.middleware import ai_rate_limit  # noqa: E402
+from app.application.dtos.ai_workflow_dto import TaskStatusFormDTO  # noqa: E402
+from app.application.services import ai_workflow_cache  # noqa: E402
+from app.infrastructure.adapters.ai import gemini_workflow_adapter as gemini  # noqa: E402
+
+
+def _response():
+    cols = [
+        gemini._GeminiSuggestedColumn(
+            id=f"c{i}", label=f"Col {i}", description="", color="status-todo",
+            wip_limit=None, is_initial=i == 0, is_final=i == 4, is_special=False,
+        )
+        for i in range(5)
+    ]
+    parsed = gemini._GeminiTaskStatusResponse(
+        methodology_label="Kanban", columns=cols, rationale="Akış odaklı. Detay.",
+    )
+    return SimpleNamespace(parsed=parsed, candidates=[])
+
+
+class FakeModels:
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def generate_content(self, model, contents, config):
+        self.calls += 1
+        await self.release.wait()
+        return _response()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def _sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(gemini, "asyncio", SimpleNamespace(sleep=_sleep))
+    ai_workflow_cache.reset_for_tests()
+    yield recorded
+    ai_workflow_cache.reset_for_tests()
+
+
+def _adapter(replay_paced=True):
+    adapter = gemini.GeminiWorkflowAdapter(api_key="test-key", model="m", replay_paced=replay_paced)
+    models = FakeModels()
+    adapter._client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    return adapter, models
+
+
+async def _collect(adapter, form):
+    return [ev async for ev in adapter.generate_task_status_stream(form, "tr")]
+
+
+async def test_repeat_form_replays_from_cache_without_sleeps(sleeps):
+    adapter, models = _adapter(replay_paced=False)
+    form = TaskStatusFormDTO(has_qa_column=True)
+
+    live = await _collect(adapter, form)
+    paced = len(sleeps)
+    replay = await _collect(adapter, TaskStatusFormDTO(has_qa_column=True))
+
+    assert models.calls == 1
+    assert paced > 0 and len(sleeps) == paced  # fast replay: no pacing
+    # Replay = the live stream minus the cold-start narration.
+    assert [e.model_dump() for e in replay] == [e.model_dump() for e in live[1:]]
+    assert replay[-1].type == "done"
+
+
+async def test_paced_replay_keeps_the_live_cadence(sleeps):
+    adapter, _ = _adapter()
+    form = TaskStatusFormDTO()
+    await _collect(adapter, form)
+    live_sleeps = list(sleeps)
+    sleeps.clear()
+    await _collect(adapter, form)
+    assert sleeps == live_sleeps
+
+
+async def test_concurrent_identical_forms_make_one_call(sleeps):
+    adapter, models = _adapter()
+    models.release.clear()
+    form = TaskStatusFormDTO(work_style="flow")
+
+    first = asyncio.create_task(_collect(adapter, form))
+    second = asyncio.create_task(_collect(adapter, form))
+    await asyncio.sleep(0)
+    assert ai_workflow_cache.is_served(adapter.cache_key(form, "tr"))
+    models.release.set()
+
+    a, b = await asyncio.gather(first, second)
+    assert models.calls == 1
+    assert [e.model_dump() for e in a] == [e.model_dump() for e in b]
+
+
+async def test_errors_are_not_cached(sleeps):
+    adapter, models = _adapter()
+
+    async def boom(**kw):
+        models.calls += 1
+        raise RuntimeError("503 unavailable")
+
+    models.generate_content = boom
+    form = TaskStatusFormDTO()
+    for _ in range(2):
+        events = await _collect(adapter, form)
+        assert events[-1].type == "error"
+    assert models.calls == 2
+
+
+def test_served_requests_skip_the_project_quota(monkeypatch):
+    monkeypatch.setattr(ai_rate_limit, "PROJECT_DAILY_LIMIT", 1)
+    monkeypatch.setattr(ai_rate_limit, "_LIMITER_DISABLED", False)
+    limiter = ai_rate_limit._RateLimiter()
+
+    limiter.check_and_increment("a@x")
+    limiter.check_and_increment("b@x", upstream=False)
+    assert len(limiter.project_day) == 1 and len(limiter.user_day["b@x"]) == 1
+    with pytest.raises(Exception) as exc:
+        limiter.check_and_increment("c@x")
+    assert exc.value.status_code == 503
@@ -0,0 +1,138 @@
+"""Phase gate SQL (task_repo.phase_task_counts / apply_phase_transition_moves).
+
+Runs against a file-backed aiosqlite database holding just the tasks,
+board_columns and task_dependencies tables (plus a bare projects table for
+the change_version listeners). The moves UPDATE returns columns from its
+FROM subquery, which SQLite rejects, so it is checked as compiled Postgres
+SQL against a recording session; counter upserts and the change_version
+bump are recorded instead of executed.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.domain.entities.task import TaskPriority
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.models.task import TaskModel
+from app.infrastructure.database.models.task_dependency import TaskDependencyModel
+from app.infrastructure.database.repositories import task_repo as task_repo_module
+from app.infrastructure.database.repositories.task_repo import SqlAlchemyTaskRepository
+
+SRC, TGT = "nd_Src123DXYZ", "nd_Tgt456DXYZ"
+TODO_COL, DONE_COL = 1, 2
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'gate.db'}")
+    async with engine.begin() as conn:
+        # projects carries JSONB columns; the listeners only touch these.
+        await conn.execute(text(
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY, "
+            "change_version INTEGER NOT NULL DEFAULT 0, updated_at TIMESTAMP)"
+        ))
+        await conn.execute(text("INSERT INTO projects (id) VALUES (1)"))
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            BoardColumnModel.__table__, TaskModel.__table__, TaskDependencyModel.__table__,
+        ])
+    async with async_sessionmaker(engine, expire_on_commit=False)() as s:
+        s.add_all([
+            BoardColumnModel(id=TODO_COL, project_id=1, name="To Do", order_index=0),
+            BoardColumnModel(id=DONE_COL, project_id=1, name="Bitti", order_index=1, is_terminal=True),
+        ])
+        await s.flush()
+        yield s
+    await engine.dispose()
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    calls = {"deltas": [], "bumps": []}
+
+    async def _deltas(session, pairs):
+        calls["deltas"].extend(pairs)
+
+    async def _bump(session, project_ids, task_ids=None):
+        calls["bumps"].append(list(project_ids))
+
+    monkeypatch.setattr(task_repo_module.task_stats, "apply_task_deltas", _deltas)
+    monkeypatch.setattr(task_repo_module.change_version, "bump", _bump)
+    return calls
+
+
+def _task(tid, phase_id, column_id=TODO_COL, priority=TaskPriority.MEDIUM, **kw):
+    return TaskModel(
+        id=tid, project_id=1, title=f"T{tid}", task_key=f"K-{tid}", phase_id=phase_id,
+        column_id=column_id, priority=priority, points=tid, **kw,
+    )
+
+
+async def test_phase_task_counts(session):
+    session.add_all([
+        _task(1, SRC, DONE_COL),
+        _task(2, SRC, priority=TaskPriority.CRITICAL),
+        _task(3, SRC, DONE_COL, priority=TaskPriority.CRITICAL),
+        _task(4, SRC),
+        _task(5, None, DONE_COL),
+        _task(6, SRC, is_deleted=True),
+        # 2 blocks 4 (open blocker); 3 blocks 1 (blocker done; 1 done anyway)
+        TaskDependencyModel(task_id=2, depends_on_id=4, dependency_type="blocks"),
+        TaskDependencyModel(task_id=3, depends_on_id=1, dependency_type="blocks"),
+    ])
+    await session.flush()
+    repo = SqlAlchemyTaskRepository(session)
+
+    assert await repo.phase_task_counts(1, SRC) == {
+        "total": 4, "done": 2, "critical_open": 1, "blocked": 1,
+    }
+    counts = await repo.phase_task_counts(1, SRC, include_unphased=True)
+    assert (counts["total"], counts["done"]) == (5, 3)
+
+
+class RecordingSession:
+    """Captures the UPDATE and answers with canned RETURNING rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = self.rows
+        return result
+
+
+def _returned(tid, old, new):
+    return SimpleNamespace(id=tid, old_phase_id=old, phase_id=new, column_id=TODO_COL, points=tid)
+
+
+async def test_apply_moves_is_one_update_with_returning_deltas(recorded):
+    session = RecordingSession([_returned(1, SRC, TGT), _returned(4, None, SRC)])
+    repo = SqlAlchemyTaskRepository(session)
+
+    moved = await repo.apply_phase_transition_moves(
+        1, SRC, TGT, "move_to_next", {2: "keep_in_source", 3: "move_to_backlog"},
+    )
+
+    assert moved == 2
+    (stmt,) = session.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE tasks SET phase_id=CASE")
+    assert "RETURNING" in sql and "old_phase_id" in sql
+    moves = {(old.phase_id, new.phase_id, new.points) for old, new in recorded["deltas"]}
+    assert moves == {(SRC, TGT, 1), (None, SRC, 4)}
+    assert recorded["bumps"] == [[1]]
+
+
+async def test_apply_moves_without_changes_skips_counters(recorded):
+    session = RecordingSession([])
+    assert await SqlAlchemyTaskRepository(session).apply_phase_transition_moves(
+        1, SRC, TGT, "keep_in_source", {},
+    ) == 0
+    assert recorded["deltas"] == [] and recorded["bumps"] == []
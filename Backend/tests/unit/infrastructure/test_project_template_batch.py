@@ -0,0 +1,94 @@
+"""project_repo.apply_template_batch — statements checked as compiled Postgres SQL.
+
+A recording session answers the try-lock probe and the legacy-config read
+with canned rows; advisory locks and ``jsonb ||`` need a real Postgres.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.database.repositories.project_repo import SqlAlchemyProjectRepository
+
+PATCH = {"phase_workflow": {"mode": "flexible"}, "schema_version": 2}
+
+
+class RecordingSession:
+    def __init__(self, probe_rows, legacy_configs=(), fail_at=None):
+        self.answers = [probe_rows, list(legacy_configs)]
+        self.calls = []
+        self.fail_at = fail_at
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def execute(self, stmt, params=None):
+        self.calls.append((stmt, params))
+        if self.fail_at == len(self.calls):
+            raise RuntimeError("db down")
+        result = MagicMock()
+        result.all.return_value = self.answers.pop(0) if self.answers else []
+        return result
+
+    def sql(self, i):
+        return str(self.calls[i][0].compile(dialect=postgresql.dialect()))
+
+
+def _probe(pid, locked=True, current=True):
+    return SimpleNamespace(id=pid, locked=locked, current=current)
+
+
+async def test_locked_current_configs_merge_in_one_update():
+    session = RecordingSession([_probe(1), _probe(2, locked=False), _probe(3)])
+    outcome = await SqlAlchemyProjectRepository(session).apply_template_batch(
+        9, PATCH, {1: 101, 2: 102, 3: 103, 4: 104},
+    )
+
+    assert outcome == {"applied": [1, 3], "locked": [2], "missing": [4]}
+    assert "pg_try_advisory_xact_lock(requested.lock_key)" in session.sql(0)
+    assert len(session.calls) == 2
+    update_sql = session.sql(1)
+    assert update_sql.startswith("UPDATE projects SET")
+    assert "||" in update_sql and "change_version=(projects.change_version +" in update_sql
+    session.commit.assert_awaited_once()
+
+
+async def test_legacy_configs_are_normalized_before_the_patch():
+    legacy = {"workflow": {"mode": "flexible", "nodes": [], "edges": [], "groups": []}}
+    session = RecordingSession([_probe(5, current=False)], legacy_configs=[(5, legacy)])
+    outcome = await SqlAlchemyProjectRepository(session).apply_template_batch(9, PATCH, {5: 105})
+
+    assert outcome["applied"] == [5]
+    (stmt, params), = [c for c in session.calls if c[1] is not None]
+    (row,) = params
+    assert row["pid"] == 5
+    cfg = row["cfg"]
+    assert "workflow" not in cfg and cfg["phase_workflow"] == {"mode": "flexible"}
+    # V0 → V2 migration ran: engine flags and task_workflow were seeded.
+    assert "task_workflow" in cfg and cfg["schema_version"] == 2
+
+
+async def test_errors_roll_back_and_release_the_batch():
+    session = RecordingSession([_probe(1)], fail_at=2)
+    with pytest.raises(RuntimeError):
+        await SqlAlchemyProjectRepository(session).apply_template_batch(9, PATCH, {1: 101})
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+
+
+async def test_empty_batch_touches_nothing():
+    session = RecordingSession([])
+    assert await SqlAlchemyProjectRepository(session).apply_template_batch(9, PATCH, {}) == {
+        "applied": [], "locked": [], "missing": [],
+    }
+    assert session.calls == []
+
+
+async def test_config_write_back_keeps_updated_at_and_skips_current_rows():
+    session = RecordingSession([])
+    await SqlAlchemyProjectRepository(session).write_process_configs({5: {"schema_version": 2}}, 2)
+    sql = session.sql(0)
+    assert "updated_at=projects.updated_at" in sql
+    assert "coalesce(CAST((projects.process_config ->>" in sql
+    assert session.calls[0][1] == [{"pid": 5, "cfg": {"schema_version": 2}}]
+    session.commit.assert_awaited_once()
@@ -0,0 +1,142 @@
+"""Fingerprinted boot steps (app/infrastructure/database/startup.py) — no DB.
+
+The fingerprint store is replaced by a dict, so these tests cover the skip /
+defer decisions and include the startup-time benchmark: a warm boot (every
+fingerprint matches) must not run any step and becomes ready within a small
+budget, and a cold boot becomes ready without waiting for deferred backfills.
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.api.v1 import health
+from app.infrastructure.database import startup
+from app.infrastructure.database.startup import StartupStep
+
+WARM_BOOT_BUDGET_MS = 250
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch):
+    startup.reset_for_tests()
+    stored = {}
+
+    async def read(engine):
+        return dict(stored)
+
+    async def record(engine, name, value):
+        stored[name] = value
+
+    monkeypatch.setattr(startup, "read_fingerprints", read)
+    monkeypatch.setattr(startup, "record_fingerprint", record)
+    yield stored
+    startup.reset_for_tests()
+
+
+def _steps(runs, seed_delay=0.0, backfill_delay=0.0, fail=None):
+    def make(name, delay):
+        async def run():
+            await asyncio.sleep(delay)
+            if name == fail:
+                raise RuntimeError(f"{name} broke")
+            runs.append(name)
+        return run
+
+    return [
+        StartupStep("seed", make("seed", seed_delay), sources=("app.infrastructure.database.seeder",)),
+        StartupStep("backfill", make("backfill", backfill_delay), extra=("head-1",), deferred=True),
+    ]
+
+
+def test_fingerprint_tracks_sources_and_extra():
+    base = StartupStep("x", None, sources=("app.infrastructure.database.seeder",), extra=("a",))
+    same = StartupStep("y", None, sources=("app.infrastructure.database.seeder",), extra=("a",))
+    other = StartupStep("x", None, sources=("app.infrastructure.database.seeder",), extra=("b",))
+    assert base.fingerprint() == same.fingerprint()
+    assert base.fingerprint() != other.fingerprint()
+
+
+@pytest.mark.asyncio
+async def test_cold_boot_is_ready_before_deferred_backfills_finish(store):
+    runs = []
+    task = await startup.run_startup(None, _steps(runs, backfill_delay=0.05))
+    assert runs == ["seed"]
+    snap = startup.progress.snapshot()
+    assert snap["ready"] and snap["backfills_pending"]
+    assert snap["steps"]["backfill"]["state"] == "pending"
+
+    await task
+    assert runs == ["seed", "backfill"]
+    assert set(store) == {"seed", "backfill"}
+    assert startup.progress.snapshot()["backfills_pending"] is False
+
+
+@pytest.mark.asyncio
+async def test_warm_boot_skips_every_step_within_budget(store):
+    runs = []
+    await (await startup.run_startup(None, _steps(runs)))
+    startup.reset_for_tests()
+    runs.clear()
+
+    t0 = time.perf_counter()
+    task = await startup.run_startup(None, _steps(runs, seed_delay=1.0, backfill_delay=1.0))
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    assert task is None and runs == []
+    assert {s["state"] for s in startup.progress.steps.values()} == {"skipped"}
+    assert elapsed_ms < WARM_BOOT_BUDGET_MS
+    assert startup.progress.snapshot()["startup_ms"] < WARM_BOOT_BUDGET_MS
+
+
+@pytest.mark.asyncio
+async def test_full_mode_runs_everything_inline(store):
+    runs = []
+    await (await startup.run_startup(None, _steps(runs)))
+    runs.clear()
+    task = await startup.run_startup(None, _steps(runs), mode="full")
+    assert task is None and runs == ["seed", "backfill"]
+
+
+@pytest.mark.asyncio
+async def test_failed_backfill_is_not_recorded(store):
+    runs = []
+    await (await startup.run_startup(None, _steps(runs, fail="backfill")))
+    assert "backfill" not in store
+    assert startup.progress.steps["backfill"] == {"state": "failed"}
+
+
+@pytest.mark.asyncio
+async def test_failed_blocking_step_aborts_startup(store):
+    with pytest.raises(RuntimeError, match="seed broke"):
+        await startup.run_startup(None, _steps([], fail="seed"))
+    assert not startup.progress.ready
+
+
+def test_default_steps_seed_blocks_and_backfills_defer():
+    steps = startup.default_steps(engine=None)
+    assert [(s.name, s.deferred) for s in steps] == [
+        ("seed", False), ("migration_007", True), ("migration_008", True),
+        ("process_config_schema", True),
+    ]
+    assert all(len(s.fingerprint()) == 32 for s in steps)
+
+
+@pytest.mark.asyncio
+async def test_ready_endpoint_reports_state_but_not_the_error(caplog):
+    with pytest.raises(RuntimeError):
+        await startup.run_startup(None, [
+            StartupStep("seed", _raiser("password=hunter2 host=db.internal")),
+        ])
+    response = await health.ready()
+
+    assert response.status_code == 503
+    assert b"hunter2" not in response.body
+    assert b'"seed":{"state":"failed"}' in response.body
+    assert "hunter2" in caplog.text
+
+
+def _raiser(message):
+    async def run():
+        raise RuntimeError(message)
+    return run
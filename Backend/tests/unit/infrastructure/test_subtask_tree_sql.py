@@ -0,0 +1,99 @@
+"""Subtask hierarchy SQL (task_repo.get_subtree / subtask_summaries).
+
+Runs the recursive CTEs against a file-backed aiosqlite database. The
+projects table is created by hand (its JSONB columns have no SQLite DDL);
+users / roles / board_columns / tasks come from the models.
+
+Tree of project 1 (DONE_COL is terminal):
+
+    1 ─┬─ 2 (done) ── 4 ── 6 (done)
+       ├─ 3
+       └─ 5 (deleted) ── 7
+    8 (no subtasks)
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.models.role import RoleModel
+from app.infrastructure.database.models.task import TaskModel
+from app.infrastructure.database.models.user import UserModel
+from app.infrastructure.database.repositories.task_repo import SqlAlchemyTaskRepository
+
+TODO_COL, DONE_COL = 1, 2
+
+
+@pytest.fixture
+async def repo(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tree.db'}")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY, key VARCHAR(10), name VARCHAR(150), "
+            "description VARCHAR, start_date DATE, end_date DATE, methodology VARCHAR(20), "
+            "manager_id INTEGER, created_at TIMESTAMP, custom_fields TEXT, process_config TEXT, "
+            "task_seq INTEGER DEFAULT 0, status VARCHAR(20) DEFAULT 'ACTIVE', "
+            "process_template_id INTEGER, change_version INTEGER NOT NULL DEFAULT 0, version INTEGER DEFAULT 1, "
+            "updated_at TIMESTAMP, is_deleted BOOLEAN DEFAULT 0, deleted_at TIMESTAMP)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO projects (id, key, name, start_date, methodology) "
+            "VALUES (1, 'TRE', 'Tree', '2026-01-01', 'KANBAN'), (2, 'OTH', 'Other', '2026-01-01', 'KANBAN')"
+        ))
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            RoleModel.__table__, UserModel.__table__, BoardColumnModel.__table__, TaskModel.__table__,
+        ])
+    async with async_sessionmaker(engine, expire_on_commit=False)() as s:
+        s.add_all([
+            BoardColumnModel(id=TODO_COL, project_id=1, name="To Do", order_index=0),
+            BoardColumnModel(id=DONE_COL, project_id=1, name="Bitti", order_index=1, is_terminal=True),
+        ])
+        for task_id, parent, column, deleted in [
+            (1, None, TODO_COL, False), (2, 1, DONE_COL, False), (3, 1, TODO_COL, False),
+            (4, 2, None, False), (5, 1, TODO_COL, True), (6, 4, DONE_COL, False),
+            (7, 5, TODO_COL, False), (8, None, TODO_COL, False),
+        ]:
+            s.add(TaskModel(
+                id=task_id, project_id=1, title=f"T{task_id}", parent_task_id=parent,
+                column_id=column, is_deleted=deleted, task_key=f"TRE-{task_id}",
+            ))
+        await s.flush()
+        yield SqlAlchemyTaskRepository(s)
+    await engine.dispose()
+
+
+def _shape(task):
+    return {task.id: [_shape(sub) for sub in task.subtasks]}
+
+
+async def test_subtree_nests_to_the_requested_depth(repo):
+    root = await repo.get_subtree(1, max_depth=5)
+    assert _shape(root) == {1: [{2: [{4: [{6: []}]}]}, {3: []}]}
+
+    shallow = await repo.get_subtree(1, max_depth=1)
+    assert _shape(shallow) == {1: [{2: []}, {3: []}]}
+
+
+async def test_subtree_nodes_share_project_and_column_instances(repo):
+    root = await repo.get_subtree(1, max_depth=3)
+    done_child, todo_child = root.subtasks
+    assert done_child.project is root.project
+    assert done_child.column is root.project.columns[1]
+    assert todo_child.column is root.column
+    assert done_child.subtasks[0].column is None
+    assert await repo.get_subtree(5, max_depth=3) is None  # deleted root
+
+
+async def test_summaries_count_descendants_and_done(repo):
+    counts = await repo.subtask_summaries(1, [1, 2, 8], max_depth=5)
+    assert counts == {
+        1: {"children": 2, "total": 4, "done": 2},
+        2: {"children": 1, "total": 2, "done": 1},
+    }
+    assert (await repo.subtask_summaries(1, [1], max_depth=1))[1] == {"children": 2, "total": 2, "done": 1}
+
+
+async def test_summaries_ignore_parents_of_other_projects(repo):
+    assert await repo.subtask_summaries(2, [1], max_depth=3) == {}
+    assert await repo.subtask_summaries(1, [], max_depth=3) == {}
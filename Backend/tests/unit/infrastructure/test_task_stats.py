@@ -0,0 +1,197 @@
+"""Unit tests for the project_task_stats delta builder (no DB).
+
+The session is faked: the column IN lookup returns canned
+(id, category, is_terminal) rows and the upsert statement is captured so its VALUES can be inspected.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.application.services import team_stats_cache
+from app.domain.entities.board_column import BoardColumn
+from app.infrastructure.database.models.board_column import BoardColumnModel
+from app.infrastructure.database.repositories.board_column_repo import SqlAlchemyBoardColumnRepository
+from app.infrastructure.database.util import task_stats
+from app.infrastructure.database.util.task_stats import TaskCounterKey
+
+COLUMNS = {
+    1: SimpleNamespace(id=1, category="todo", is_terminal=False),
+    2: SimpleNamespace(id=2, category="in_progress", is_terminal=False),
+    3: SimpleNamespace(id=3, category="todo", is_terminal=True),
+}
+
+
+def _session():
+    session = MagicMock()
+    captured = []
+
+    async def execute(stmt):
+        captured.append(stmt)
+        result = MagicMock()
+        column_ids = stmt.compile().params.get("id_1") or []
+        result.all.return_value = [COLUMNS[c] for c in column_ids if c in COLUMNS]
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session, captured
+
+
+def _upsert_rows(captured):
+    stmt = captured[-1]
+    rows = {}
+    for params in stmt._multi_values[0]:
+        values = {col.key if hasattr(col, "key") else col: v for col, v in params.items()}
+        rows[(values["project_id"], values["phase_id"])] = {
+            f: values[f] for f in task_stats.COUNTER_FIELDS
+        }
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_create_adds_project_and_phase_rows():
+    session, captured = _session()
+    await task_stats.apply_task_delta(session, None, TaskCounterKey(7, "design", 2, 3))
+    rows = _upsert_rows(captured)
+    expected = {"total": 1, "todo": 0, "in_progress": 1, "done": 0, "points": 3}
+    assert rows == {(7, ""): expected, (7, "design"): expected}
+
+
+@pytest.mark.asyncio
+async def test_move_to_terminal_column_shifts_bucket_only():
+    session, captured = _session()
+    await task_stats.apply_task_delta(
+        session, TaskCounterKey(7, None, 1, 2), TaskCounterKey(7, None, 3, 2)
+    )
+    rows = _upsert_rows(captured)
+    assert rows == {(7, ""): {"total": 0, "todo": -1, "in_progress": 0, "done": 1, "points": 0}}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_key_is_a_noop():
+    session, captured = _session()
+    key = TaskCounterKey(7, None, 1, 2)
+    await task_stats.apply_task_delta(session, key, key)
+    assert captured == []
+
+
+@pytest.mark.asyncio
+async def test_task_write_clears_team_stats_on_commit_only():
+    team_stats_cache.reset_for_tests()
+    sync = Session()
+    session = MagicMock(info=sync.info)
+    key = TaskCounterKey(7, None, 1, 2)
+
+    team_stats_cache.store(1, {"total_teams": 1})
+    # Assignee-only edits (unassign, bulk actions) move no counter but still count.
+    await task_stats.apply_task_deltas(session, [(key, key)])
+    assert team_stats_cache.lookup(1) is not None
+    sync.commit()
+    assert team_stats_cache.lookup(1) is None
+
+    team_stats_cache.store(1, {"total_teams": 1})
+    sync.begin()
+    await task_stats.apply_task_deltas(session, [(key, key)])
+    sync.rollback()
+    sync.commit()
+    assert team_stats_cache.lookup(1) is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_without_column_decrements_todo():
+    session, captured = _session()
+    await task_stats.apply_task_delta(session, TaskCounterKey(7, None, None, None), None)
+    rows = _upsert_rows(captured)
+    assert rows == {(7, ""): {"total": -1, "todo": -1, "in_progress": 0, "done": 0, "points": 0}}
+
+
+@pytest.mark.asyncio
+async def test_batched_deltas_resolve_columns_once_and_net_out():
+    session, captured = _session()
+    await task_stats.apply_task_deltas(
+        session,
+        [
+            (TaskCounterKey(7, None, 1, 1), TaskCounterKey(7, None, 3, 1)),
+            (TaskCounterKey(7, None, 2, 2), TaskCounterKey(7, None, 1, 2)),
+        ],
+    )
+    # advisory locks + one column-counter UPDATE + one column lookup + one upsert
+    assert len(captured) == 4
+    assert "pg_advisory_xact_lock_shared" in str(captured[0])
+    rows = _upsert_rows(captured)
+    assert rows == {(7, ""): {"total": 0, "todo": 0, "in_progress": -1, "done": 1, "points": 0}}
+
+
+def test_column_deltas_net_out_moves_and_skip_columnless_tasks():
+    deltas = task_stats.column_deltas(
+        [
+            (None, TaskCounterKey(7, None, 1, 0)),                        # create in 1
+            (TaskCounterKey(7, None, 1, 0), TaskCounterKey(7, None, 2, 0)),  # 1 → 2
+            (TaskCounterKey(7, None, 2, 0), TaskCounterKey(7, None, 3, 0)),  # 2 → 3
+            (TaskCounterKey(7, None, None, 0), None),                     # delete, no column
+            (TaskCounterKey(7, None, 3, 0), None),                        # delete from 3
+        ]
+    )
+    assert deltas == {}
+    assert task_stats.column_deltas(
+        [(TaskCounterKey(7, None, 1, 0), TaskCounterKey(7, None, 2, 0))]
+    ) == {1: -1, 2: 1}
+
+
+@pytest.mark.asyncio
+async def test_recompute_runs_set_based_with_binds_independent_of_row_count():
+    session = MagicMock()
+    captured = []
+
+    async def execute(stmt):
+        captured.append(stmt)
+        result = MagicMock()
+        result.all.return_value = [(7,), (7,)]
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    assert await task_stats.recompute(session, [7]) == 6
+
+    lock, upsert, stale, columns = (str(stmt) for stmt in captured)
+    assert "pg_advisory_xact_lock" in lock
+    assert upsert.startswith("INSERT INTO project_task_stats") and "SELECT" in upsert
+    assert "ON CONFLICT" in upsert and "IS DISTINCT FROM" in upsert
+    assert stale.startswith("DELETE FROM project_task_stats") and "NOT IN" in stale
+    assert columns.startswith("UPDATE board_columns") and "FROM (SELECT" in columns
+    # No VALUES list: the binds are constants plus the project filter.
+    assert len(captured[1].compile().params) < 40
+
+
+@pytest.mark.asyncio
+async def test_column_rebucket_locks_in_task_write_order(monkeypatch):
+    """projects row (bump) → counter lock → column flush, like a task write."""
+    model = BoardColumnModel(
+        id=5, project_id=7, name="Review", order_index=1, wip_limit=0, task_count=0,
+        category="todo", is_initial=False, is_terminal=False,
+        entry_policy="any", exit_policy="any",
+    )
+    events = []
+    session = MagicMock()
+
+    async def execute(stmt):
+        sql = str(stmt)
+        events.append(
+            "bump" if sql.startswith("UPDATE projects")
+            else "lock" if "pg_advisory_xact_lock" in sql
+            else "select"
+        )
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = model
+        result.scalar_one.return_value = model
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    session.flush = AsyncMock(side_effect=lambda: events.append("flush"))
+    session.commit = AsyncMock()
+    monkeypatch.setattr(task_stats, "recompute", AsyncMock(side_effect=lambda *a: events.append("recompute")))
+
+    await SqlAlchemyBoardColumnRepository(session).update(BoardColumn(
+        id=5, project_id=7, name="Review", order_index=1, category="done", is_terminal=True,
+    ))
+    assert events[:5] == ["select", "bump", "lock", "flush", "recompute"]
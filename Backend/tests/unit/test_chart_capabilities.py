@@ -7,7 +7,9 @@ exercises the rule registry contract.
 Covers:
   - Rule registry resolves correct booleans per project shape.
   - Registry exposes the expected chart name set.
-  - GetChartCapabilitiesUseCase wires repo inputs through the rule registry.
+  - GetChartCapabilitiesUseCase wires repo inputs through the rule registry
+    and caches the flags per project change_version.
+  - GetChartBundleUseCase returns capabilities + only the enabled charts.
   - GetProjectPhaseProgressUseCase zips workflow nodes with task aggregates.
   - GetProjectIterationUseCase is methodology-agnostic (Strategy D refactor).
 """
@@ -18,6 +20,8 @@ from typing import List, Optional
 
 import pytest
 
+from app.application.services import chart_capability_cache
+from app.application.use_cases.get_chart_bundle import GetChartBundleUseCase
 from app.application.use_cases.get_chart_capabilities import GetChartCapabilitiesUseCase
 from app.application.use_cases.get_project_iteration import GetProjectIterationUseCase
 from app.application.use_cases.get_project_phase_progress import (
@@ -48,8 +52,11 @@ class _FakeProjectRepo:
         self,
         project: Optional[_FakeProject],
         capability_inputs: Optional[CapabilityInputs] = None,
+        change_version: Optional[int] = None,
     ):
         self._project = project
+        self.change_version = change_version
+        self.input_calls = 0
         self._capability_inputs = capability_inputs or CapabilityInputs(
             sprint_count=0,
             closed_sprint_count=0,
@@ -65,8 +72,19 @@ class _FakeProjectRepo:
         return self._project
 
     async def get_capability_inputs(self, project_id: int) -> CapabilityInputs:
+        self.input_calls += 1
         return self._capability_inputs
 
+    async def get_change_version(self, project_id: int) -> Optional[int]:
+        return self.change_version
+
+
+@pytest.fixture(autouse=True)
+def _reset_capability_cache():
+    chart_capability_cache.reset_for_tests()
+    yield
+    chart_capability_cache.reset_for_tests()
+
 
 class _FakeAuditRepo:
     def __init__(self, iteration_data: Optional[List[dict]] = None):
@@ -189,6 +207,83 @@ async def test_get_chart_capabilities_raises_on_unknown_project():
         await use_case.execute(project_id=999)
 
 
+@pytest.mark.asyncio
+async def test_get_chart_capabilities_cached_per_change_version():
+    repo = _FakeProjectRepo(_FakeProject(id=42), change_version=7)
+    use_case = GetChartCapabilitiesUseCase(project_repo=repo)
+    first = await use_case.execute(project_id=42)
+    assert await use_case.execute(project_id=42) == first
+    assert repo.input_calls == 1
+
+    # A sprint / column / member / task write bumps the version → recomputed.
+    repo.change_version = 8
+    repo._capability_inputs = CapabilityInputs(
+        sprint_count=1, closed_sprint_count=0, phase_node_count=0,
+        column_count=0, member_count=0, has_all_categories=False,
+    )
+    caps = await use_case.execute(project_id=42)
+    assert repo.input_calls == 2
+    assert caps["burndown"] is True and first["burndown"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_chart_capabilities_without_version_is_not_cached():
+    repo = _FakeProjectRepo(_FakeProject(id=42))
+    use_case = GetChartCapabilitiesUseCase(project_repo=repo)
+    await use_case.execute(project_id=42)
+    await use_case.execute(project_id=42)
+    assert repo.input_calls == 2
+
+
+def test_capability_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(chart_capability_cache, "MAX_ENTRIES", 2)
+    chart_capability_cache.store(1, 1, {"summary": True})
+    chart_capability_cache.store(2, 1, {"summary": True})
+    assert chart_capability_cache.lookup(1, 1) is not None
+    chart_capability_cache.store(3, 1, {"summary": True})
+    assert chart_capability_cache.lookup(2, 1) is None
+    assert chart_capability_cache.lookup(1, 1) is not None
+
+
+# ---------------------------------------------------------------------------
+# GetChartBundleUseCase
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_chart_bundle_fills_only_requested_enabled_charts():
+    process_config = {"phase_workflow": {"nodes": [{"id": "design", "name": "Design"}]}}
+    inputs = CapabilityInputs(
+        sprint_count=1, closed_sprint_count=0, phase_node_count=1,
+        column_count=2, member_count=1, has_all_categories=False,
+    )
+    sprints = [{"id": 1, "name": "Sprint 1", "planned": 10, "completed": 8, "carried": 2}]
+    use_case = GetChartBundleUseCase(
+        project_repo=_FakeProjectRepo(
+            _FakeProject(id=42, process_config=process_config), capability_inputs=inputs,
+        ),
+        audit_repo=_FakeAuditRepo(iteration_data=sprints),
+        report_repo=_FakeReportRepo(),
+    )
+    bundle = await use_case.execute(project_id=42, charts=["iteration", "phase_progress", "cfd"])
+    assert bundle.capabilities.cfd is False
+    assert bundle.cfd is None  # requested but gated off
+    assert bundle.lead_cycle is None  # not requested
+    assert [s.name for s in bundle.iteration.sprints] == ["Sprint 1"]
+    assert [p.id for p in bundle.phase_progress.phases] == ["design"]
+
+
+@pytest.mark.asyncio
+async def test_chart_bundle_rejects_unknown_chart():
+    use_case = GetChartBundleUseCase(
+        project_repo=_FakeProjectRepo(_FakeProject(id=42)),
+        audit_repo=_FakeAuditRepo(),
+        report_repo=_FakeReportRepo(),
+    )
+    with pytest.raises(ValueError):
+        await use_case.execute(project_id=42, charts=["burndown"])
+
+
 # ---------------------------------------------------------------------------
 # GetProjectIterationUseCase — Strategy D: no methodology check
 # ---------------------------------------------------------------------------
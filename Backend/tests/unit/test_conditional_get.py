@@ -0,0 +1,74 @@
+"""Conditional GET dependency (app/api/deps/conditional.py) — weak ETag + 304."""
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps.conditional import build_etag, etag_matches, project_etag
+from app.api.deps.project import get_project_member, get_project_repo
+
+
+class _Repo:
+    def __init__(self, version):
+        self.version = version
+
+    async def get_change_version(self, project_id):
+        return self.version
+
+
+def _client(repo):
+    app = FastAPI()
+    body_runs = []
+
+    @app.get("/projects/{project_id}/things")
+    async def things(project_id: int, _etag=Depends(project_etag)):
+        body_runs.append(project_id)
+        return {"project_id": project_id}
+
+    app.dependency_overrides[get_project_member] = lambda: object()
+    app.dependency_overrides[get_project_repo] = lambda: repo
+    return TestClient(app), body_runs
+
+
+def test_etag_changes_with_version_and_query():
+    base = build_etag(1, 5, "/p/1/tasks", "page=1")
+    assert base.startswith('W/"1.5.')
+    assert build_etag(1, 6, "/p/1/tasks", "page=1") != base
+    assert build_etag(1, 5, "/p/1/tasks", "page=2") != base
+    assert build_etag(1, 5, "/p/1/tasks", "page=1", "2026-10-19") != base
+
+
+def test_if_none_match_uses_weak_comparison():
+    tag = 'W/"1.5.abc"'
+    assert etag_matches('"1.5.abc"', tag)
+    assert etag_matches('W/"0.1.x", W/"1.5.abc"', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('W/"1.4.abc"', tag)
+    assert not etag_matches(None, tag)
+
+
+def test_matching_request_gets_304_without_running_the_route():
+    client, body_runs = _client(_Repo(version=3))
+    first = client.get("/projects/9/things?page=1")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/projects/9/things?page=1", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert body_runs == [9]
+
+
+def test_version_bump_invalidates_the_tag():
+    repo = _Repo(version=3)
+    client, _ = _client(repo)
+    etag = client.get("/projects/9/things").headers["etag"]
+    repo.version = 4
+    response = client.get("/projects/9/things", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_unknown_project_sends_no_etag():
+    client, _ = _client(_Repo(version=None))
+    assert "etag" not in client.get("/projects/9/things").headers
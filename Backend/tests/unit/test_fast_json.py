@@ -0,0 +1,134 @@
+"""Fast JSON list responses (app/api/fast_json.py) — parity with the default path."""
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.api import fast_json as fast_json_module
+from app.api.fast_json import accepts_gzip, fast_json, rows_as
+from app.application.dtos.activity_dtos import ActivityItemDTO, ActivityResponseDTO
+from app.application.dtos.task_dtos import PaginatedResponse, ProjectSummaryDTO, TaskResponseDTO
+from app.domain.entities.task import TaskPriority
+
+NOW = datetime(2026, 10, 19, 9, 30, tzinfo=timezone.utc)
+
+
+def _page(n):
+    project = ProjectSummaryDTO(id=1, name="P", key="P")
+    items = [
+        TaskResponseDTO(
+            id=i, title=f"T{i}", priority=TaskPriority.HIGH, is_recurring=False,
+            project_id=1, project=project, created_at=NOW, due_date=NOW,
+        )
+        for i in range(n)
+    ]
+    return PaginatedResponse(items=items, total=n, page=1, page_size=n)
+
+
+def _client(page, rows=None):
+    app = FastAPI()
+
+    def tag(response: Response):
+        response.headers["ETag"] = 'W/"1.2.abc"'
+
+    @app.get("/default", response_model=PaginatedResponse)
+    async def default():
+        return page
+
+    @app.get("/fast", response_model=PaginatedResponse)
+    async def fast(request: Request, response: Response, _=Depends(tag)):
+        return fast_json(request, page, items_key="items", inherit=response)
+
+    @app.get("/activity", response_model=ActivityResponseDTO)
+    async def activity(request: Request):
+        return fast_json(request, {"items": rows_as(ActivityItemDTO, rows or []), "total": 1}, items_key="items")
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def thresholds(monkeypatch):
+    def set_(stream=1000, gzip_bytes=32 * 1024):
+        monkeypatch.setattr(fast_json_module.settings, "FAST_JSON_STREAM_MIN_ITEMS", stream)
+        monkeypatch.setattr(fast_json_module.settings, "FAST_JSON_GZIP_MIN_BYTES", gzip_bytes)
+    set_()
+    return set_
+
+
+def test_same_json_as_default_path_and_keeps_dependency_headers(thresholds):
+    client = _client(_page(3))
+    default = client.get("/default", headers={"Accept-Encoding": "identity"})
+    fast = client.get("/fast", headers={"Accept-Encoding": "identity"})
+    assert fast.json() == default.json()
+    assert fast.headers["etag"] == 'W/"1.2.abc"'
+    assert fast.headers["content-type"] == "application/json"
+
+
+def test_large_arrays_are_streamed_with_identical_content(thresholds):
+    thresholds(stream=5)
+    client = _client(_page(12))
+    default = client.get("/default", headers={"Accept-Encoding": "identity"}).json()
+    streamed = client.get("/fast", headers={"Accept-Encoding": "identity"})
+    assert "content-length" not in streamed.headers
+    assert streamed.json() == default
+
+
+@pytest.mark.parametrize("stream", [5, 1000])
+def test_gzip_only_when_accepted_and_large(thresholds, stream):
+    thresholds(stream=stream, gzip_bytes=100)
+    client = _client(_page(12))
+    with client.stream("GET", "/fast", headers={"Accept-Encoding": "gzip"}) as r:
+        raw = b"".join(r.iter_raw())
+    assert r.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(raw))["total"] == 12
+    plain = client.get("/fast", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+def test_rows_are_trimmed_to_dto_fields_without_validation(thresholds):
+    row = {"id": 7, "action": "updated", "timestamp": NOW, "metadata": {"k": 1}, "internal": "x"}
+    body = _client(_page(0), rows=[row]).get("/activity").json()
+    item = body["items"][0]
+    assert "internal" not in item
+    assert item == ActivityItemDTO.model_validate(row).model_dump(mode="json")
+
+
+def test_5000_task_list_streams_gzip_with_identical_content(thresholds):
+    """Default thresholds; timings are reported by scripts/bench_fast_json.py."""
+    client = _client(_page(5000))
+    default = client.get("/default", headers={"Accept-Encoding": "identity"}).json()
+    with client.stream("GET", "/fast", headers={"Accept-Encoding": "gzip"}) as r:
+        raw = b"".join(r.iter_raw())
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert "content-length" not in r.headers
+    assert json.loads(gzip.decompress(raw)) == default
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("br, GZIP;q=0.5", True),
+    ("x-gzip", True),
+    ("*", True),
+    ("", False),
+    ("identity", False),
+    ("gzip;q=0", False),
+    ("gzip; q=0.000, br", False),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),
+    ("gzip;q=bogus", False),
+])
+def test_accepts_gzip_honours_q_values(header, expected):
+    headers = [(b"accept-encoding", header.encode())] if header else []
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+    assert accepts_gzip(request) is expected
+
+
+def test_gzip_q_zero_is_served_plain(thresholds):
+    thresholds(gzip_bytes=100)
+    r = _client(_page(12)).get("/fast", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in r.headers
+    assert r.json()["total"] == 12
@@ -0,0 +1,100 @@
+"""Report exports consume ``stream_tasks_for_export`` row by row.
+
+The report repository is a fake that records how many rows were pulled;
+the Excel workbook is read back with openpyxl. No database.
+"""
+import io
+from datetime import datetime
+from types import SimpleNamespace
+
+import openpyxl
+
+from app.api.v1 import reports
+from app.application.dtos.report_dtos import TaskExportRow, TaskExportRowDTO
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+from app.domain.repositories.report_repository import IReportRepository
+
+
+def _row(i: int) -> TaskExportRow:
+    return TaskExportRow(
+        task_id=i, task_key=None if i % 2 else f"EXP-{i}", title=f"Task {i}", status="Todo",
+        assignee="Ayşe", priority="HIGH", sprint=None, points=i, created_at=datetime(2026, 3, i),
+        due_date=None, updated_at=datetime(2026, 3, i), reporter="Can",
+    )
+
+
+class StreamingReports:
+    def __init__(self, n: int):
+        self.rows = [_row(i) for i in range(1, n + 1)]
+        self.pulled = 0
+
+    async def stream_tasks_for_export(self, project_id, assignee_ids, date_from, date_to):
+        for row in self.rows:
+            self.pulled += 1
+            yield row
+
+    async def get_tasks_for_export(self, *args):
+        raise AssertionError("exports must stream, not materialize")
+
+
+class Projects:
+    async def get_by_id(self, project_id):
+        return SimpleNamespace(id=project_id, key="EXP", name="Export")
+
+
+ADMIN = User(email="a@b.com", password_hash="x", full_name="A", role=Role(id=1, name="Admin"))
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+async def test_excel_export_streams_rows_into_a_write_only_sheet():
+    repo = StreamingReports(20)
+    response = await reports.export_excel(
+        project_id=1, assignee_ids=None, date_from=None, date_to=None,
+        current_user=ADMIN, project_repo=Projects(), report_repo=repo,
+    )
+    assert repo.pulled == 20
+
+    ws = openpyxl.load_workbook(io.BytesIO(await _body(response))).active
+    rows = list(ws.iter_rows(values_only=True))
+    assert rows[0][0] == "Gorev Kodu" and len(rows) == 21
+    assert rows[1][:3] == ("EXP-1", "Task 1", "Todo")  # task_key fallback
+    assert rows[2][:2] == ("EXP-2", "Task 2")
+    assert ws.page_setup.orientation == "landscape"
+    assert ws["A2"].alignment.vertical == "center"
+
+
+async def test_pdf_export_consumes_the_stream():
+    repo = StreamingReports(5)
+    response = await reports.export_pdf(
+        project_id=1, assignee_ids=None, date_from=None, date_to=None,
+        current_user=ADMIN, project_repo=Projects(), report_repo=repo,
+    )
+    assert repo.pulled == 5
+    assert (await _body(response)).startswith(b"%PDF")
+
+
+async def test_default_stream_wraps_the_list_query():
+    class ListOnly(IReportRepository):
+        get_summary = get_burndown = get_velocity = get_distribution = get_performance = None  # unused
+
+        async def get_tasks_for_export(self, *args):
+            return [TaskExportRowDTO(**_row(1)._asdict())]
+
+    rows = [r async for r in ListOnly().stream_tasks_for_export(1, None, None, None)]
+    assert rows == [_row(1)]
+
+
+async def test_default_stream_resumes_behind_the_keyset():
+    class ListOnly(IReportRepository):
+        get_summary = get_burndown = get_velocity = get_distribution = get_performance = None  # unused
+
+        async def get_tasks_for_export(self, *args):
+            return [TaskExportRowDTO(**_row(i)._asdict()) for i in (3, 2, 1)]
+
+    after = (datetime(2026, 3, 2), 2)
+    rows = [r async for r in ListOnly().stream_tasks_for_export(1, None, None, None, after=after)]
+    assert [r.task_id for r in rows] == [1]
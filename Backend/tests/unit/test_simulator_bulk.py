@@ -0,0 +1,128 @@
+"""Simulator bulk mode — per-project streams, determinism, global id assembly."""
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from app.dev.simulator import bulk
+from app.dev.simulator.actors import Actor, ROLE_MEMBER, ROLE_PM
+from app.dev.simulator.transitions import SCRUM_PATH
+
+
+def _plan(pid, members=(1, 2, 3)):
+    actors = [
+        Actor(user_id=1, role=ROLE_PM, project_ids=[10, 20], daily_budget=10),
+        Actor(user_id=2, role=ROLE_MEMBER, project_ids=[pid], daily_budget=6),
+        Actor(user_id=3, role=ROLE_MEMBER, project_ids=[10, 20], daily_budget=5),
+    ]
+    return bulk.ProjectPlan(
+        project_id=pid,
+        project_key=f"P{pid}",
+        methodology="SCRUM",
+        column_ids={name: pid * 100 + i for i, name in enumerate(SCRUM_PATH)},
+        path=list(SCRUM_PATH),
+        member_ids=list(members),
+        active_sprint_id=pid * 7,
+        actors=[a for a in actors if a.user_id in members],
+        task_seq=0,
+    )
+
+
+DAYS = [(dt.date(2026, 3, 2) + dt.timedelta(days=i), 1.0) for i in range(20)]
+
+
+def _dump(outputs):
+    rows = bulk.assemble(outputs)
+    return rows.tasks, rows.comments, rows.audits, rows.notifications
+
+
+def test_same_seed_same_rows_and_seed_changes_them():
+    plans = [_plan(10), _plan(20)]
+    first = _dump(bulk.simulate_all(plans, DAYS, seed=42))
+    assert first == _dump(bulk.simulate_all(plans, DAYS, seed=42))
+    assert first != _dump(bulk.simulate_all(plans, DAYS, seed=7))
+    tasks, comments, audits, _ = first
+    assert tasks and comments and audits
+
+
+def test_projects_are_independent_of_each_other_and_of_workers():
+    alone = bulk.simulate_all([_plan(10)], DAYS, seed=42)[0]
+    together = bulk.simulate_all([_plan(10), _plan(20)], DAYS, seed=42)
+    assert together[0] == alone
+    assert bulk.simulate_all([_plan(10), _plan(20)], DAYS, seed=42, workers=2) == together
+
+
+def test_assembly_orders_ids_by_time_and_resolves_references():
+    outputs = bulk.simulate_all([_plan(10), _plan(20)], DAYS, seed=42)
+    rows = bulk.assemble(outputs, task_id_start=100, comment_id_start=50)
+    cols = {name: i for i, name in enumerate(bulk.TASK_COLUMNS)}
+
+    ids = [t[cols["id"]] for t in rows.tasks]
+    assert ids == list(range(101, 101 + len(rows.tasks)))
+    created = [t[cols["created_at"]] for t in rows.tasks]
+    assert created == sorted(created)
+    task_by_id = {t[cols["id"]]: t for t in rows.tasks}
+
+    for project_id, seq in rows.task_seqs.items():
+        keys = sorted(t[cols["task_key"]] for t in rows.tasks if t[cols["project_id"]] == project_id)
+        assert len(keys) == seq and f"P{project_id}-1" in keys
+
+    assert all(c[1] in task_by_id for c in rows.comments)
+    comment_ids = {c[0] for c in rows.comments}
+    a = {name: i for i, name in enumerate(bulk.AUDIT_COLUMNS)}
+    for audit in rows.audits:
+        if audit[a["entity_type"]] == "task":
+            assert task_by_id[audit[a["entity_id"]]][cols["project_id"]] == audit[a["project_id"]]
+        else:
+            assert audit[a["entity_id"]] in comment_ids
+            assert '"task_id": ' in audit[a["metadata"]]
+    timestamps = [audit[a["timestamp"]] for audit in rows.audits]
+    assert timestamps == sorted(timestamps)
+    assert all(n[3] in task_by_id for n in rows.notifications)
+
+
+def test_transitions_follow_the_path_and_keep_final_state():
+    out = bulk.simulate_project(_plan(10), DAYS, seed=3)
+    moves = [a for a in out.audits if a.field_name == "column_id"]
+    assert moves
+    for move in moves:
+        assert move.old_value in SCRUM_PATH and move.new_value in SCRUM_PATH
+        assert move.old_value != SCRUM_PATH[-1]
+    # Each task ends in the column its last move targeted.
+    last = {}
+    for move in moves:
+        last[move.entity_local] = move.new_value
+    for local, column in last.items():
+        assert out.tasks[local].column_name == column
+
+
+async def test_write_rows_partitions_before_the_copy_and_bumps_change_version(monkeypatch):
+    calls = []
+
+    async def is_partitioned(session):
+        return True
+
+    async def ensure(session, first, last):
+        calls.append(("partitions", first, last))
+        return []
+
+    pg = MagicMock()
+    pg.copy_records_to_table = AsyncMock(side_effect=lambda table, **kw: calls.append(("copy", table)))
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=MagicMock(driver_connection=pg))
+    session = MagicMock(scalar=AsyncMock(return_value=0), execute=AsyncMock(), commit=AsyncMock())
+    session.connection = AsyncMock(return_value=conn)
+    monkeypatch.setattr(bulk.audit_partitions, "is_partitioned", is_partitioned)
+    monkeypatch.setattr(bulk.audit_partitions, "ensure_partitions_for_range", ensure)
+    monkeypatch.setattr(bulk.task_stats, "recompute", AsyncMock(side_effect=lambda s: calls.append(("recompute",))))
+    monkeypatch.setattr(
+        bulk.change_version, "bump", AsyncMock(side_effect=lambda s, pids: calls.append(("bump", pids)))
+    )
+
+    rows = await bulk.write_rows(session, bulk.simulate_all([_plan(10)], DAYS, seed=42))
+
+    ts = bulk.AUDIT_COLUMNS.index("timestamp")
+    stamps = [a[ts] for a in rows.audits]
+    assert calls[0] == ("partitions", min(stamps).date(), max(stamps).date())
+    assert ("copy", "audit_log") in calls[1:]
+    # COPY skips the flush hooks — the loaded project's change_version moves.
+    assert calls[-2:] == [("bump", [10]), ("recompute",)]
+    session.commit.assert_awaited_once()
@@ -0,0 +1,129 @@
+"""CSV / NDJSON streamed exports — encoding, gzip and keyset resume.
+
+Row sources are in-memory async generators; the audit route is called with
+its repository scope patched to a fake. No database.
+"""
+import csv
+import gzip
+import io
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.api import streaming_export
+from app.api.streaming_export import decode_cursor, encode_cursor, export_response
+from app.api.v1 import admin_audit
+from app.domain.entities.role import Role
+from app.domain.entities.user import User
+
+ROWS = [
+    {"id": 3, "timestamp": datetime(2026, 3, 3, 9, 0), "action": "task.updated", "metadata": {"k": "ş"}},
+    {"id": 2, "timestamp": datetime(2026, 3, 2, 9, 0), "action": "task.created", "metadata": None},
+]
+COLUMNS = ("id", "timestamp", "action", "metadata")
+
+
+def _request(accept_encoding: str = "") -> Request:
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "query_string": b""})
+
+
+async def _gen(rows):
+    for row in rows:
+        yield row
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def _export(rows, fmt, accept_encoding="", resumed=False):
+    return export_response(
+        _request(accept_encoding), _gen(rows), fmt=fmt, columns=COLUMNS,
+        cursor_of=streaming_export.audit_cursor, filename="audit", resumed=resumed,
+    )
+
+
+async def test_csv_has_bom_header_and_a_cursor_per_row():
+    response = _export(ROWS, "csv")
+    assert response.media_type.startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="audit.csv"'
+
+    text = (await _body(response)).decode("utf-8")
+    assert text.startswith("﻿")
+    header, first, second = list(csv.reader(io.StringIO(text[1:])))
+    assert header == [*COLUMNS, "cursor"]
+    assert first[:3] == ["3", "2026-03-03T09:00:00", "task.updated"]
+    assert json.loads(first[3]) == {"k": "ş"}
+    assert second[3] == ""
+    assert decode_cursor(second[4]) == (datetime(2026, 3, 2, 9, 0), 2)
+
+
+async def test_resumed_csv_appends_without_bom_or_header():
+    text = (await _body(_export(ROWS[1:], "csv", resumed=True))).decode("utf-8")
+    assert list(csv.reader(io.StringIO(text)))[0][:3] == ["2", "2026-03-02T09:00:00", "task.created"]
+
+
+async def test_ndjson_is_one_object_per_line_across_batches(monkeypatch):
+    monkeypatch.setattr(streaming_export, "_BATCH_ROWS", 1)
+    response = _export(ROWS, "ndjson")
+    assert response.media_type == "application/x-ndjson"
+
+    chunks = [chunk async for chunk in response.body_iterator]
+    assert len(chunks) == 2
+    lines = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [line["id"] for line in lines] == [3, 2]
+    assert lines[0]["metadata"] == {"k": "ş"}
+    assert decode_cursor(lines[0]["cursor"]) == (datetime(2026, 3, 3, 9, 0), 3)
+
+
+async def test_gzip_only_when_accepted():
+    response = _export(ROWS, "ndjson", accept_encoding="gzip, br")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(gzip.decompress(await _body(response)).splitlines()) == 2
+
+    assert "content-encoding" not in _export(ROWS, "ndjson").headers
+    assert "content-encoding" not in _export(ROWS, "ndjson", accept_encoding="gzip;q=0").headers
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    at = datetime(2026, 3, 3, 9, 0, 0, 123456)
+    assert decode_cursor(encode_cursor(at, 42)) == (at, 42)
+    assert decode_cursor(None) is None
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("bm90LWEtY3Vyc29y")
+    assert exc.value.status_code == 400
+    assert exc.value.detail["error_code"] == "INVALID_CURSOR"
+
+
+async def test_admin_audit_export_streams_behind_the_cursor(monkeypatch):
+    calls = []
+
+    class Audit:
+        async def stream_audit(self, **filters):
+            calls.append(filters)
+            for row in ROWS:
+                if filters["after"] is None or (row["timestamp"], row["id"]) < filters["after"]:
+                    yield row
+
+    @asynccontextmanager
+    async def scope():
+        yield Audit()
+
+    monkeypatch.setattr(admin_audit, "audit_read_repo_scope", scope)
+    admin = User(email="a@b.com", password_hash="x", full_name="A", role=Role(id=1, name="Admin"))
+    cursor = encode_cursor(ROWS[0]["timestamp"], ROWS[0]["id"])
+    response = await admin_audit.export_admin_audit_stream(
+        fmt="ndjson", request=_request(), date_from=None, date_to=None,
+        actor_id=7, action_prefix="task.", cursor=cursor, admin=admin,
+    )
+
+    lines = [json.loads(line) for line in (await _body(response)).splitlines()]
+    assert [line["id"] for line in lines] == [2]
+    assert set(lines[0]) == {*streaming_export.AUDIT_COLUMNS, "cursor"}
+    assert calls[0]["actor_id"] == 7 and calls[0]["action_prefix"] == "task."